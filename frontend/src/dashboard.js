@@ -13,7 +13,8 @@ export function initializeDashboard() {
   console.log(`${functionName}: Initializing all dashboard interactivity.`);
 
   // --- Constants and Elements ---
-  const POLLING_INTERVAL_MS = 60000;
+  // Polling is cheap: unchanged server lists are answered with "not modified".
+  const POLLING_INTERVAL_MS = 10000;
   const serverSelect = document.getElementById('server-select');
   const globalActionButtons = document.querySelectorAll('.server-selection-section .action-buttons-group button');
   const serverDependentSections = document.querySelectorAll('.server-dependent-actions');
@@ -37,6 +38,10 @@ export function initializeDashboard() {
 
   // --- State Management and UI Updates ---
 
+  // Status revision of the last server list received, sent back to the server
+  // so it can answer with "not modified" if nothing changed.
+  let lastServersRevision = null;
+
   function updateActionStates(selectedServerName) {
     const hasSelection = selectedServerName && selectedServerName !== '';
     const serverNameEncoded = hasSelection ? encodeURIComponent(selectedServerName) : '';
@@ -149,7 +154,12 @@ export function initializeDashboard() {
   async function updateDashboard() {
     try {
       // Use sendServerActionRequest and suppress success pop-up for polling
-      const data = await sendServerActionRequest(null, '/api/servers', 'GET', null, null, true);
+      const url = lastServersRevision === null ? '/api/servers' : `/api/servers?revision=${lastServersRevision}`;
+      const data = await sendServerActionRequest(null, url, 'GET', null, null, true);
+
+      if (data && data.status === 'success' && data.not_modified) {
+        return;
+      }
 
       if (!data || data.status !== 'success' || !Array.isArray(data.servers)) {
         console.warn(
@@ -162,7 +172,18 @@ export function initializeDashboard() {
         return;
       }
 
-      const newServers = data.servers;
+      lastServersRevision = typeof data.revision === 'number' ? data.revision : null;
+      renderServers(data.servers);
+    } catch (error) {
+      console.error(`${functionName}: Client-side error during dashboard update:`, error);
+      if (typeof showStatusMessage === 'function') {
+        showStatusMessage(`Dashboard update error: ${error.message}`, 'error');
+      }
+    }
+  }
+
+  function renderServers(newServers) {
+    try {
       const newServerMap = new Map(newServers.map((s) => [s.name, s]));
       const existingCardElements = serverCardList.querySelectorAll('.server-card');
       const existingServerNames = new Set(Array.from(existingCardElements).map((card) => card.dataset.serverName));
@@ -201,7 +222,7 @@ export function initializeDashboard() {
       updateServerDropdown(newServers);
       noServersMessage.style.display = newServers.length === 0 ? 'block' : 'none';
     } catch (error) {
-      console.error(`${functionName}: Client-side error during dashboard update:`, error);
+      console.error(`${functionName}: Client-side error while rendering servers:`, error);
       if (typeof showStatusMessage === 'function') {
         showStatusMessage(`Dashboard update error: ${error.message}`, 'error');
       }
@@ -225,7 +246,25 @@ export function initializeDashboard() {
     ?.addEventListener('click', (e) => deleteServer(e.currentTarget, serverSelect.value));
 
 
-  updateDashboard();
-  setInterval(updateDashboard, POLLING_INTERVAL_MS);
-  console.log(`${functionName}: Initialization complete. Polling every ${POLLING_INTERVAL_MS}ms.`);
+  // Prefer the server push stream; fall back to polling without EventSource support.
+  if (typeof EventSource !== 'undefined') {
+    const eventSource = new EventSource('/api/events');
+    eventSource.addEventListener('servers', (event) => {
+      const data = JSON.parse(event.data);
+      if (data.revision === lastServersRevision) {
+        return;
+      }
+      lastServersRevision = data.revision;
+      renderServers(data.servers);
+    });
+    eventSource.onerror = () => {
+      console.warn(`${functionName}: Server event stream interrupted. The browser will reconnect.`);
+    };
+    window.addEventListener('beforeunload', () => eventSource.close());
+    console.log(`${functionName}: Initialization complete. Subscribed to server events.`);
+  } else {
+    updateDashboard();
+    setInterval(updateDashboard, POLLING_INTERVAL_MS);
+    console.log(`${functionName}: Initialization complete. Polling every ${POLLING_INTERVAL_MS}ms.`);
+  }
 }
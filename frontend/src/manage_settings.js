@@ -143,8 +143,13 @@ export function initializeManageSettingsPage() {
     return formGroup;
   };
 
-  async function handleInputChange(event) {
-    const input = event.target;
+  // Changed fields are collected for a moment and saved together, so a
+  // burst of edits costs one request and one settings transaction.
+  const SAVE_DELAY_MS = 500;
+  let pendingChanges = {};
+  let saveTimer = null;
+
+  const readInputValue = (input) => {
     let value =
       input.type === 'checkbox' ? input.checked : input.type === 'number' ? parseFloat(input.value) : input.value;
     if (input.placeholder === 'comma, separated, list') {
@@ -153,11 +158,35 @@ export function initializeManageSettingsPage() {
         .map((s) => s.trim())
         .filter(Boolean);
     }
-    await sendServerActionRequest(null, '/api/settings', 'POST', { key: input.name, value }, null);
+    return value;
+  };
+
+  const savePendingChanges = async () => {
+    clearTimeout(saveTimer);
+    saveTimer = null;
+    const settings = pendingChanges;
+    pendingChanges = {};
+    if (Object.keys(settings).length === 0) return;
+    await sendServerActionRequest(null, '/api/settings/batch', 'POST', { settings }, null);
+  };
+
+  function handleInputChange(event) {
+    const input = event.target;
+    pendingChanges[input.name] = readInputValue(input);
+    clearTimeout(saveTimer);
+    saveTimer = setTimeout(savePendingChanges, SAVE_DELAY_MS);
   }
 
+  // Do not lose edits made just before leaving the page.
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') savePendingChanges();
+  });
+
   reloadButton.addEventListener('click', async () => {
     if (confirm('Discard unsaved changes and reload from file?')) {
+      clearTimeout(saveTimer);
+      saveTimer = null;
+      pendingChanges = {};
       const result = await sendServerActionRequest(null, '/api/settings/reload', 'POST', null, reloadButton);
       if (result && result.status === 'success') {
         await loadAndRenderSettings();
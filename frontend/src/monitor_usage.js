@@ -20,18 +20,37 @@ export function initializeMonitorUsagePage() {
   }
 
   let statusIntervalId = null;
+  let historyIntervalId = null;
+  let eventSource = null;
 
-  async function updateStatus() {
-    try {
-      const data = await sendServerActionRequest(serverName, 'process_info', 'GET', null, null, true);
-      if (data && data.status === 'success' && data.data?.process_info) {
-        const info = data.data.process_info;
-        statusElement.textContent = `
+  const historyCharts = document.getElementById('history-charts');
+  const historyRange = document.getElementById('history-range');
+  const HISTORY_REFRESH_MS = 60000;
+  const HISTORY_SERIES = [
+    { field: 'cpu_percent', label: 'CPU', unit: '%' },
+    { field: 'memory_mb', label: 'Memory', unit: ' MB' },
+    { field: 'player_count', label: 'Players', unit: '' },
+    { field: 'latency_ms', label: 'Latency', unit: ' ms' },
+  ];
+
+  function renderProcessInfo(info) {
+    if (info) {
+      statusElement.textContent = `
 PID          : ${info.pid ?? 'N/A'}
 CPU Usage    : ${info.cpu_percent != null ? info.cpu_percent.toFixed(1) + '%' : 'N/A'}
 Memory Usage : ${info.memory_mb != null ? info.memory_mb.toFixed(1) + ' MB' : 'N/A'}
 Uptime       : ${info.uptime ?? 'N/A'}
                 `.trim();
+    } else {
+      statusElement.textContent = 'Server Status: STOPPED or process info not found.';
+    }
+  }
+
+  async function updateStatus() {
+    try {
+      const data = await sendServerActionRequest(serverName, 'process_info', 'GET', null, null, true);
+      if (data && data.status === 'success' && data.data?.process_info) {
+        renderProcessInfo(data.data.process_info);
       } else if (data && data.status === 'error') {
         statusElement.textContent = `Error: ${data.message || 'API error.'}`;
       } else {
@@ -44,14 +63,105 @@ Uptime       : ${info.uptime ?? 'N/A'}
     }
   }
 
-  updateStatus();
-  statusIntervalId = setInterval(updateStatus, 2000);
+  function buildSparkline(points, column, start, end, resolution) {
+    const width = 600;
+    const height = 80;
+    const values = points.map((point) => point[column]).filter((value) => value != null);
+    const max = Math.max(...values, 1);
+    const span = Math.max(end - start, 1);
+    let path = '';
+    let previousTimestamp = null;
+    points.forEach((point) => {
+      const value = point[column];
+      if (value == null) {
+        previousTimestamp = null;
+        return;
+      }
+      const x = ((point[0] - start) / span) * width;
+      const y = height - 2 - (value / max) * (height - 4);
+      // Periods without samples (server stopped) break the line.
+      const connected = previousTimestamp !== null && point[0] - previousTimestamp <= resolution * 2;
+      path += `${connected ? 'L' : 'M'}${x.toFixed(1)},${y.toFixed(1)} `;
+      previousTimestamp = point[0];
+    });
+    return `<svg class="history-sparkline" viewBox="0 0 ${width} ${height}" preserveAspectRatio="none" aria-hidden="true"><path d="${path.trim()}" /></svg>`;
+  }
+
+  function renderHistory(history, start, end) {
+    historyCharts.innerHTML = '';
+    if (!history.points.length) {
+      historyCharts.textContent = 'No resource usage recorded in this period.';
+      return;
+    }
+    HISTORY_SERIES.forEach((series) => {
+      const column = history.fields.indexOf(series.field);
+      if (column < 0) return;
+      const latest = [...history.points].reverse().find((point) => point[column] != null);
+      const chart = document.createElement('div');
+      chart.className = 'history-chart';
+      const title = document.createElement('div');
+      title.className = 'history-chart-title';
+      title.textContent = `${series.label}: ${latest ? latest[column].toFixed(1) + series.unit : 'N/A'}`;
+      chart.appendChild(title);
+      chart.insertAdjacentHTML('beforeend', buildSparkline(history.points, column, start, end, history.resolution_sec));
+      historyCharts.appendChild(chart);
+    });
+  }
+
+  async function loadHistory() {
+    if (!historyCharts || !historyRange) return;
+    const end = Math.floor(Date.now() / 1000);
+    const start = end - Number(historyRange.value);
+    try {
+      const data = await sendServerActionRequest(
+        serverName,
+        `resource_history?start=${start}&end=${end}`,
+        'GET',
+        null,
+        null,
+        true,
+      );
+      if (data && data.status === 'success' && data.data) {
+        renderHistory(data.data, start, end);
+      } else {
+        historyCharts.textContent = 'Resource history is not available.';
+      }
+    } catch (error) {
+      historyCharts.textContent = `Client-side error: ${error.message}`;
+    }
+  }
+
+  if (historyCharts && historyRange) {
+    historyRange.addEventListener('change', loadHistory);
+    loadHistory();
+    historyIntervalId = setInterval(loadHistory, HISTORY_REFRESH_MS);
+  }
 
-  // Cleanup interval on page unload
+  // Prefer the shared server-side sampler via the event stream; fall back to polling.
+  if (typeof EventSource !== 'undefined') {
+    eventSource = new EventSource(`/api/events?server_name=${encodeURIComponent(serverName)}`);
+    eventSource.addEventListener('process_info', (event) => {
+      renderProcessInfo(JSON.parse(event.data).process_info);
+    });
+    eventSource.onerror = () => {
+      console.warn(`Event stream for server '${serverName}' interrupted. The browser will reconnect.`);
+    };
+  } else {
+    updateStatus();
+    statusIntervalId = setInterval(updateStatus, 2000);
+  }
+
+  // Cleanup on page unload
   window.addEventListener('beforeunload', () => {
     if (statusIntervalId) {
       clearInterval(statusIntervalId);
     }
+    if (historyIntervalId) {
+      clearInterval(historyIntervalId);
+    }
+    if (eventSource) {
+      eventSource.close();
+    }
   });
 
   console.log(`Monitoring started for server: ${serverName}`);
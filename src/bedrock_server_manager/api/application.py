@@ -142,7 +142,9 @@ def list_available_addons_api(
 
 @plugin_method("get_all_servers_data")
 def get_all_servers_data(
-    settings=None, app_context: Optional[AppContext] = None
+    settings=None,
+    since_revision: Optional[int] = None,
+    app_context: Optional[AppContext] = None,
 ) -> Dict[str, Any]:
     """Retrieves status and version for all detected servers.
 
@@ -153,11 +155,25 @@ def get_all_servers_data(
     while others fail (errors for individual servers are included in the message).
     The status of each server is also reconciled with its live state during this call.
 
+    When an application context is available, the data is read from the
+    in-memory :class:`~bedrock_server_manager.core.status_registry.ServerStatusRegistry`
+    and the response includes its ``revision``. Clients that pass back the
+    revision they last received as `since_revision` get a short "not modified"
+    response if nothing has changed since.
+
+    Args:
+        settings: The settings instance, used when no `app_context` is given.
+        since_revision (Optional[int], optional): The status revision the
+            caller last received. Defaults to ``None``.
+        app_context (Optional[AppContext], optional): The application context.
+
     Returns:
         Dict[str, Any]: A dictionary with the operation result.
 
+        If nothing changed since `since_revision`:
+          ``{"status": "success", "not_modified": True, "revision": int}``
         On full success (all servers processed without error):
-          ``{"status": "success", "servers": List[ServerDataDict]}``
+          ``{"status": "success", "servers": List[ServerDataDict], "revision": int}``
         On partial success (some individual server errors occurred during scan):
           ``{"status": "success", "servers": List[ServerDataDict], "message": "Completed with errors: <details>"}``
           The ``servers`` list contains data for successfully processed servers.
@@ -173,14 +189,30 @@ def get_all_servers_data(
     logger.debug("API: Getting status for all servers...")
 
     try:
+        revision: Optional[int] = None
+        was_populated = False
         if app_context:
             manager = app_context.manager
+            registry = app_context.status_registry
+            # Read the revision before the data, so a concurrent change can
+            # only cause a redundant refresh, never a missed one.
+            revision = registry.revision
+            was_populated = registry.is_populated
+            if was_populated and since_revision == revision:
+                return {"status": "success", "not_modified": True, "revision": revision}
         else:
             manager = get_manager_instance(settings)
         # Call the core function which returns both data and potential errors.
         servers_data, bsm_error_messages = manager.get_servers_data(
             app_context=app_context
         )
+        if app_context and not was_populated:
+            # This call populated the registry with a full scan.
+            revision = registry.revision
+
+        response: Dict[str, Any] = {"status": "success", "servers": servers_data}
+        if revision is not None:
+            response["revision"] = revision
 
         # Check if the core layer collected any individual server errors.
         if bsm_error_messages:
@@ -190,14 +222,13 @@ def get_all_servers_data(
                     f"API: Individual server error during get_all_servers_data: {err_msg}"
                 )
             # Return a partial success response.
-            return {
-                "status": "success",
-                "servers": servers_data,
-                "message": f"Completed with errors: {'; '.join(bsm_error_messages)}",
-            }
+            response["message"] = (
+                f"Completed with errors: {'; '.join(bsm_error_messages)}"
+            )
+            return response
 
         # If there were no errors, return a full success response.
-        return {"status": "success", "servers": servers_data}
+        return response
 
     except BSMError as e:  # Catch setup or I/O errors from the manager.
         logger.error(
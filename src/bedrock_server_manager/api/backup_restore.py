@@ -13,7 +13,9 @@ Key functionalities include:
       or specific configuration files (:func:`~.backup_config_file`).
     - Performing a comprehensive backup of all standard server data (:func:`~.backup_all`).
     - Restoring all server data from the latest available backups (:func:`~.restore_all`).
-    - Restoring the server world from a specific ``.mcworld`` file (:func:`~.restore_world`).
+    - Restoring the server world from a specific ``.mcworld`` file or incremental
+      snapshot manifest (:func:`~.restore_world`).
+    - Exporting a world backup to a standalone ``.mcworld`` file (:func:`~.export_world_backup`).
     - Restoring a specific configuration file from its backup (:func:`~.restore_config_file`).
     - Pruning old backups based on retention policies (:func:`~.prune_old_backups`).
 
@@ -21,7 +23,10 @@ Operations involving file modifications are thread-safe using a unified lock
 (``_backup_restore_lock``). For actions requiring the server to be offline,
 this module utilizes the
 :func:`~bedrock_server_manager.api.utils.server_lifecycle_manager`
-to safely stop and restart the server. All functions are exposed to the plugin system.
+to safely stop and restart the server. World backups can instead be taken while
+the server keeps running ("hot" backups, see ``backup.hot_backup_enabled``) when
+the server process is driven by this manager. All functions are exposed to the
+plugin system.
 """
 import os
 import logging
@@ -32,16 +37,18 @@ from typing import Dict, Any, Optional
 from ..plugins import plugin_method
 
 # Local application imports.
-from ..instances import get_server_instance
+from ..instances import get_server_instance, get_settings_instance
 from .utils import server_lifecycle_manager
 from ..plugins.event_trigger import trigger_plugin_event
 from ..error import (
     BSMError,
     AppFileNotFoundError,
+    FileOperationError,
     MissingArgumentError,
     InvalidServerNameError,
 )
 from ..context import AppContext
+from ..core.backup_store import MANIFEST_EXTENSION
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +58,31 @@ logger = logging.getLogger(__name__)
 _backup_restore_lock = threading.Lock()
 
 
+def _should_hot_backup(server: Any, hot_backup: Optional[bool]) -> bool:
+    """Decides whether a world backup should be taken without stopping the server.
+
+    Args:
+        server (Any): The :class:`~.core.bedrock_server.BedrockServer` instance.
+        hot_backup (Optional[bool]): The caller's explicit choice, or ``None`` to
+            use the ``backup.hot_backup_enabled`` setting.
+
+    Returns:
+        bool: ``True`` if a hot backup was requested and the server's process
+        can be driven by this manager, ``False`` to use the stop/start path.
+    """
+    if hot_backup is None:
+        hot_backup = bool(server.settings.get("backup.hot_backup_enabled", False))
+    if not hot_backup:
+        return False
+    if server.can_hot_backup():
+        return True
+    logger.info(
+        f"API: Hot backup requested for '{server.server_name}', but its process is not "
+        "running under this manager. Falling back to stop/start backup."
+    )
+    return False
+
+
 @plugin_method("list_backup_files")
 def list_backup_files(
     server_name: str, backup_type: str, app_context: Optional[AppContext] = None
@@ -107,6 +139,7 @@ def list_backup_files(
 def backup_world(
     server_name: str,
     stop_start_server: bool = True,
+    hot_backup: Optional[bool] = None,
     app_context: Optional[AppContext] = None,
 ) -> Dict[str, str]:
     """Creates a backup of the server's world directory.
@@ -115,8 +148,10 @@ def backup_world(
     ``_backup_world_data_internal`` method of the
     :class:`~.core.bedrock_server.BedrockServer` instance, which handles
     determining the active world, exporting it to a ``.mcworld`` file, and
-    pruning old world backups. If `stop_start_server` is ``True``, the
-    :func:`~bedrock_server_manager.api.utils.server_lifecycle_manager`
+    pruning old world backups. If a hot backup is requested and possible, the
+    server keeps running and the world is copied using ``save hold`` /
+    ``save query`` / ``save resume``. Otherwise, if `stop_start_server` is
+    ``True``, the :func:`~bedrock_server_manager.api.utils.server_lifecycle_manager`
     is used to manage the server's state.
     Triggers ``before_backup`` and ``after_backup`` plugin events (with type "world").
 
@@ -124,11 +159,17 @@ def backup_world(
         server_name (str): The name of the server whose world is to be backed up.
         stop_start_server (bool, optional): If ``True``, the server will be
             stopped before the backup and restarted afterwards. Defaults to ``True``.
+        hot_backup (Optional[bool], optional): If ``True``, back up the world
+            without stopping the server when its process is driven by this
+            manager. If ``None``, the ``backup.hot_backup_enabled`` setting is
+            used. Defaults to ``None``.
 
     Returns:
         Dict[str, str]: A dictionary with the operation result.
         Possible statuses: "success", "error", or "skipped" (if lock not acquired).
-        On success: ``{"status": "success", "message": "World backup '<filename>' created..."}``
+        On success: ``{"status": "success", "message": "World backup '<filename>' created...", "stats": {...}}``,
+        where ``"stats"`` holds the backup statistics (e.g. ``"throughput_mb_s"``)
+        if available, or ``None``.
         On error: ``{"status": "error", "message": "<error_message>"}``.
 
     Raises:
@@ -157,18 +198,23 @@ def backup_world(
         )
 
         try:
-            # Use a context manager to handle stopping and starting the server.
-            with server_lifecycle_manager(
-                server_name, stop_start_server, app_context=app_context
-            ):
-                if app_context:
-                    server = app_context.get_server(server_name)
-                else:
-                    server = get_server_instance(server_name)
-                backup_file = server._backup_world_data_internal()
+            if app_context:
+                server = app_context.get_server(server_name)
+            else:
+                server = get_server_instance(server_name)
+
+            if _should_hot_backup(server, hot_backup):
+                backup_file = server._backup_world_data_internal(hot=True)
+            else:
+                # Use a context manager to handle stopping and starting the server.
+                with server_lifecycle_manager(
+                    server_name, stop_start_server, app_context=app_context
+                ):
+                    backup_file = server._backup_world_data_internal()
             return {
                 "status": "success",
                 "message": f"World backup '{os.path.basename(backup_file)}' created successfully for server '{server_name}'.",
+                "stats": getattr(server, "last_world_backup_stats", None),
             }
 
         except BSMError as e:
@@ -294,13 +340,15 @@ def backup_config_file(
 def backup_all(
     server_name: str,
     stop_start_server: bool = True,
+    hot_backup: Optional[bool] = None,
     app_context: Optional[AppContext] = None,
 ) -> Dict[str, Any]:
     """Performs a full backup of the server's world and configuration files.
 
     This operation is thread-safe and guarded by a lock. It calls
     :meth:`~.core.bedrock_server.BedrockServer.backup_all_data`.
-    If `stop_start_server` is ``True``, the
+    If a hot backup is requested and possible, the server keeps running for
+    the whole backup. Otherwise, if `stop_start_server` is ``True``, the
     :func:`~bedrock_server_manager.api.utils.server_lifecycle_manager`
     is used to stop the server before the backup. **Note:** The server is
     **not** automatically restarted by this specific API function after the backup,
@@ -312,6 +360,10 @@ def backup_all(
         server_name (str): The name of the server to back up.
         stop_start_server (bool, optional): If ``True``, the server will be
             stopped before the backup operation begins. Defaults to ``True``.
+        hot_backup (Optional[bool], optional): If ``True``, back up the world
+            without stopping the server when its process is driven by this
+            manager. If ``None``, the ``backup.hot_backup_enabled`` setting is
+            used. Defaults to ``None``.
 
     Returns:
         Dict[str, Any]: A dictionary with the operation result.
@@ -346,15 +398,19 @@ def backup_all(
         )
 
         try:
-            # The server is stopped before the backup but not restarted after.
-            with server_lifecycle_manager(
-                server_name, stop_before=stop_start_server, app_context=app_context
-            ):
-                if app_context:
-                    server = app_context.get_server(server_name)
-                else:
-                    server = get_server_instance(server_name)
-                backup_results = server.backup_all_data()
+            if app_context:
+                server = app_context.get_server(server_name)
+            else:
+                server = get_server_instance(server_name)
+
+            if _should_hot_backup(server, hot_backup):
+                backup_results = server.backup_all_data(hot=True)
+            else:
+                # The server is stopped before the backup but not restarted after.
+                with server_lifecycle_manager(
+                    server_name, stop_before=stop_start_server, app_context=app_context
+                ):
+                    backup_results = server.backup_all_data()
             return {
                 "status": "success",
                 "message": f"Full backup completed successfully for server '{server_name}'.",
@@ -499,7 +555,8 @@ def restore_world(
     :func:`~bedrock_server_manager.api.utils.server_lifecycle_manager`
     to manage the server's state, restarting it only if the restore is successful.
     The core world import is performed by
-    :meth:`~.core.bedrock_server.BedrockServer.import_active_world_from_mcworld`.
+    :meth:`~.core.bedrock_server.BedrockServer.restore_world_from_backup`,
+    which accepts both ``.mcworld`` archives and incremental snapshot manifests.
 
     .. warning::
         This is a **DESTRUCTIVE** operation. The existing active world directory
@@ -510,7 +567,7 @@ def restore_world(
     Args:
         server_name (str): The name of the server.
         backup_file_path (str): The absolute path to the ``.mcworld`` backup file
-            to be restored.
+            or ``.manifest`` snapshot to be restored.
         stop_start_server (bool, optional): If ``True``, the server will be
             stopped before restoring and restarted afterwards only if the restore
             is successful. Defaults to ``True``.
@@ -562,7 +619,7 @@ def restore_world(
                     server = app_context.get_server(server_name)
                 else:
                     server = get_server_instance(server_name)
-                server.import_active_world_from_mcworld(backup_file_path)
+                server.restore_world_from_backup(backup_file_path)
 
             return {
                 "status": "success",
@@ -588,6 +645,92 @@ def restore_world(
         _backup_restore_lock.release()
 
 
+@plugin_method("export_world_backup")
+def export_world_backup(
+    server_name: str,
+    backup_file_path: str,
+    export_dir: Optional[str] = None,
+    app_context: Optional[AppContext] = None,
+) -> Dict[str, str]:
+    """Exports a world backup to a standalone ``.mcworld`` archive.
+
+    This is primarily useful for incremental world backups, which are stored
+    as a small ``.manifest`` file referencing deduplicated blobs in the shared
+    backup store rather than as a self-contained archive. The export is
+    performed by
+    :meth:`~.core.bedrock_server.BedrockServer.export_world_backup_to_mcworld`
+    and does not require stopping the server.
+
+    Args:
+        server_name (str): The name of the server that owns the backup.
+        backup_file_path (str): The absolute path to the ``.manifest`` (or
+            ``.mcworld``) world backup to export.
+        export_dir (Optional[str], optional): The directory to save the
+            ``.mcworld`` file in. If ``None``, it defaults to a "worlds"
+            subdirectory within the application's global content directory
+            (defined by the ``paths.content`` setting). Defaults to ``None``.
+
+    Returns:
+        Dict[str, str]: A dictionary with the operation result.
+        On success: ``{"status": "success", "export_file": "<path_to_mcworld>", "message": "..."}``
+        On error: ``{"status": "error", "message": "<error_message>"}``.
+
+    Raises:
+        MissingArgumentError: If `server_name` or `backup_file_path` is empty.
+    """
+    if not server_name:
+        raise MissingArgumentError("Server name cannot be empty.")
+    if not backup_file_path:
+        raise MissingArgumentError("Backup file path cannot be empty.")
+
+    backup_filename = os.path.basename(backup_file_path)
+    logger.info(
+        f"API: Exporting world backup '{backup_filename}' of server '{server_name}' to .mcworld."
+    )
+
+    try:
+        if export_dir:
+            effective_export_dir = export_dir
+        else:
+            settings = app_context.settings if app_context else get_settings_instance()
+            content_base_dir = settings.get("paths.content")
+            if not content_base_dir:
+                raise FileOperationError(
+                    "CONTENT_DIR setting missing for default export directory."
+                )
+            effective_export_dir = os.path.join(content_base_dir, "worlds")
+
+        if app_context:
+            server = app_context.get_server(server_name)
+        else:
+            server = get_server_instance(server_name)
+
+        export_file_path = os.path.join(
+            effective_export_dir, f"{os.path.splitext(backup_filename)[0]}.mcworld"
+        )
+        server.export_world_backup_to_mcworld(backup_file_path, export_file_path)
+
+        return {
+            "status": "success",
+            "export_file": export_file_path,
+            "message": f"World backup '{backup_filename}' exported to '{os.path.basename(export_file_path)}'.",
+        }
+    except (BSMError, FileNotFoundError) as e:
+        logger.error(
+            f"API: World backup export failed for '{server_name}': {e}", exc_info=True
+        )
+        return {"status": "error", "message": f"World backup export failed: {e}"}
+    except Exception as e:
+        logger.error(
+            f"API: Unexpected error exporting world backup for '{server_name}': {e}",
+            exc_info=True,
+        )
+        return {
+            "status": "error",
+            "message": f"Unexpected error during world backup export: {e}",
+        }
+
+
 @plugin_method("restore_config_file")
 @trigger_plugin_event(before="before_restore", after="after_restore")
 def restore_config_file(
@@ -703,7 +846,8 @@ def prune_old_backups(
 
     This operation is thread-safe and guarded by a lock. It iteratively calls
     :meth:`~.core.bedrock_server.BedrockServer.prune_server_backups`
-    for the server's world (``.mcworld`` files) and standard configuration
+    for the server's world (``.mcworld`` files and incremental snapshot
+    manifests, whose unreferenced blobs are garbage-collected) and standard configuration
     files (``server.properties``, ``allowlist.json``, ``permissions.json``).
     The number of backups to keep is determined by the ``retention.backups``
     application setting.
@@ -765,6 +909,7 @@ def prune_old_backups(
                 world_name = server.get_world_name()
                 world_name_prefix = f"{world_name}_backup_"
                 server.prune_server_backups(world_name_prefix, "mcworld")
+                server.prune_server_backups(world_name_prefix, MANIFEST_EXTENSION)
             except Exception as e:
                 err_msg = f"world backups ({type(e).__name__})"
                 pruning_errors.append(err_msg)
@@ -9,6 +9,7 @@ to expose information such as:
 - Current runtime status (:func:`~.get_server_running_status`).
 - Last known status from configuration (:func:`~.get_server_config_status`).
 - Installed server version (:func:`~.get_server_installed_version`).
+- Recorded resource usage history (:func:`~.get_server_resource_history`).
 
 Each function returns a dictionary suitable for JSON serialization, indicating
 the outcome of the request and the retrieved data. These are exposed to the
@@ -17,16 +18,18 @@ plugin system via
 """
 
 import logging
+import time
 from typing import Dict, Any, Optional
 
 # Plugin system imports to bridge API functionality.
 from ..plugins import plugin_method
 
 # Local application imports.
-from ..instances import get_server_instance
+from ..instances import get_app_context, get_server_instance
 from ..error import (
     BSMError,
     InvalidServerNameError,
+    UserInputError,
 )
 from ..context import AppContext
 
@@ -206,3 +209,64 @@ def get_server_installed_version(
             "status": "error",
             "message": f"Unexpected error getting installed version: {e}",
         }
+
+
+@plugin_method("get_server_resource_history")
+def get_server_resource_history(
+    server_name: str,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    resolution_sec: Optional[float] = None,
+    app_context: Optional[AppContext] = None,
+) -> Dict[str, Any]:
+    """Gets the recorded resource usage of a server over a time range.
+
+    The history is recorded by
+    :class:`~.core.resource_history.ResourceHistoryRecorder` while the web
+    server runs, and kept at decreasing resolutions for longer periods (see
+    :data:`~.core.resource_history.DEFAULT_TIERS`). Only the requested range
+    is read from disk.
+
+    Args:
+        server_name (str): The name of the server.
+        start (Optional[float]): The start of the range, as a Unix timestamp.
+            Defaults to one hour before `end`.
+        end (Optional[float]): The end of the range. Defaults to now.
+        resolution_sec (Optional[float]): The minimum spacing of the returned
+            points, in seconds. Defaults to the finest resolution still
+            covering `start`.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the operation result.
+        On success: ``{"status": "success", "data": {"resolution_sec": int,
+        "fields": ["timestamp", "cpu_percent", "memory_mb", "player_count",
+        "latency_ms"], "points": [[float, ...], ...]}}``.
+        On error: ``{"status": "error", "message": "<error_message>"}``.
+
+    Raises:
+        InvalidServerNameError: If `server_name` is not provided.
+        UserInputError: If `start` is after `end`.
+    """
+    if not server_name:
+        raise InvalidServerNameError("Server name cannot be empty.")
+    if app_context is None:
+        app_context = get_app_context()
+
+    end = time.time() if end is None else end
+    start = end - 3600 if start is None else start
+    if start > end:
+        raise UserInputError("The start of the range must not be after its end.")
+
+    logger.debug(
+        f"API: Getting resource history for '{server_name}' from {start} to {end}."
+    )
+    try:
+        history = app_context.resource_history.get_history(server_name)
+        data = history.query(start, end, resolution_sec)
+        return {"status": "success", "data": data}
+    except (BSMError, OSError) as e:
+        logger.error(
+            f"API: Error reading resource history for '{server_name}': {e}",
+            exc_info=True,
+        )
+        return {"status": "error", "message": f"Error reading resource history: {e}"}
@@ -8,13 +8,14 @@ Operations are designed to be thread-safe.
 
 import logging
 import threading
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 # Plugin system imports to bridge API functionality.
 from ..plugins import plugin_method
 
 # Local application imports.
 from ..core import prune_old_downloads
+from ..core import download_links
 from ..instances import get_settings_instance
 from ..error import (
     BSMError,
@@ -149,3 +150,18 @@ def prune_download_cache(
     finally:
         # Ensure the lock is always released, even if errors occur.
         _misc_lock.release()
+
+
+@plugin_method("get_download_api_stats")
+def get_download_api_stats() -> Dict[str, Any]:
+    """Returns the counters of the cached Minecraft download API lookups.
+
+    Every server version lookup asks
+    :mod:`~bedrock_server_manager.core.download_links` for the download
+    links, which only contacts the API once its cached answer has expired.
+
+    Returns:
+        Dict[str, Any]: ``{"status": "success", "data": {"hits": int,
+        "misses": int, "not_modified": int, "stale_fallbacks": int}}``.
+    """
+    return {"status": "success", "data": download_links.get_stats()}
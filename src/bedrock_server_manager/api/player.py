@@ -12,12 +12,16 @@ to perform operations such as:
   :func:`~.get_all_known_players_api`.
 - Discovering players by scanning server logs and updating the database via
   :func:`~.scan_and_update_player_db_api`.
+- Listing the players currently online via :func:`~.get_online_players_api`
+  and querying the recorded play sessions via
+  :func:`~.get_player_sessions_api`.
 
 These functions are exposed to the plugin system and provide a structured way
 to manage player data globally across all server instances.
 """
 
 import logging
+from datetime import datetime
 from typing import Dict, List, Any, Optional
 
 # Plugin system imports to bridge API functionality.
@@ -148,6 +152,7 @@ def scan_and_update_player_db_api(app_context: AppContext) -> Dict[str, Any]:
         ``"total_entries_in_logs"`` (int),
         ``"unique_players_submitted_for_saving"`` (int),
         ``"actually_saved_or_updated_in_db"`` (int),
+        ``"inserted_in_db"`` (int), ``"updated_in_db"`` (int),
         ``"scan_errors"`` (List[Dict[str, str]]).
         On error: ``{"status": "error", "message": "<error_message>"}``.
 
@@ -194,3 +199,90 @@ def scan_and_update_player_db_api(app_context: AppContext) -> Dict[str, Any]:
             "status": "error",
             "message": f"An unexpected error occurred during player scan: {str(e)}",
         }
+
+
+@plugin_method("get_online_players_api")
+def get_online_players_api(
+    server_name: Optional[str] = None, app_context: Optional[AppContext] = None
+) -> Dict[str, Any]:
+    """Retrieves the players currently online.
+
+    The players are read from the in-memory index of
+    :class:`~bedrock_server_manager.core.player_sessions.PlayerSessionTracker`,
+    which is kept up to date from the server logs by the server monitor.
+
+    Args:
+        server_name (Optional[str], optional): Only return the players of this
+            server. Defaults to ``None`` (all servers).
+
+    Returns:
+        Dict[str, Any]: A dictionary with the operation result.
+        On success: ``{"status": "success", "players": List[OnlinePlayerDict]}``
+        where each ``OnlinePlayerDict`` contains "name", "xuid",
+        "server_name", "joined_at" and "session_id".
+        On unexpected error: ``{"status": "error", "message": "<error_message>"}``.
+    """
+    logger.debug(f"API: Request to get online players (server: {server_name}).")
+    try:
+        players = app_context.player_session_tracker.get_online_players(server_name)
+        return {"status": "success", "players": players}
+    except Exception as e:
+        logger.error(
+            f"API: Unexpected error getting online players: {e}", exc_info=True
+        )
+        return {
+            "status": "error",
+            "message": f"An unexpected error occurred retrieving online players: {str(e)}",
+        }
+
+
+@plugin_method("get_player_sessions_api")
+def get_player_sessions_api(
+    xuid: Optional[str] = None,
+    server_name: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = 100,
+    app_context: Optional[AppContext] = None,
+) -> Dict[str, Any]:
+    """Retrieves recorded play sessions, most recent first.
+
+    Calls :meth:`~bedrock_server_manager.core.player_sessions.PlayerSessionTracker.get_sessions`.
+
+    Args:
+        xuid (Optional[str], optional): Only sessions of this player.
+        server_name (Optional[str], optional): Only sessions on this server.
+        start (Optional[datetime], optional): Only sessions that had not ended
+            before this time.
+        end (Optional[datetime], optional): Only sessions that started before
+            this time.
+        limit (int, optional): The maximum number of sessions. Defaults to 100.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the operation result.
+        On success: ``{"status": "success", "sessions": List[SessionDict]}``
+        where each ``SessionDict`` contains "id", "xuid", "name",
+        "server_name", "join_time", "leave_time" and "duration_sec".
+        On error: ``{"status": "error", "message": "<error_message>"}``.
+    """
+    if start is not None and end is not None and start > end:
+        return {
+            "status": "error",
+            "message": "The start of the time range must not be after its end.",
+        }
+    if limit < 1:
+        return {"status": "error", "message": "Limit must be a positive number."}
+
+    try:
+        sessions = app_context.player_session_tracker.get_sessions(
+            xuid=xuid, server_name=server_name, start=start, end=end, limit=limit
+        )
+        return {"status": "success", "sessions": sessions}
+    except Exception as e:
+        logger.error(
+            f"API: Unexpected error getting player sessions: {e}", exc_info=True
+        )
+        return {
+            "status": "error",
+            "message": f"An unexpected error occurred retrieving player sessions: {str(e)}",
+        }
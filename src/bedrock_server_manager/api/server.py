@@ -16,7 +16,10 @@ APIs for plugins (via :func:`~bedrock_server_manager.plugins.api_bridge.plugin_m
 and by triggering various plugin events during server operations.
 """
 import logging
-from typing import Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional
 import os
 
 
@@ -43,6 +46,9 @@ from ..context import AppContext
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_START_CONCURRENCY = 4
+"""The default number of servers :func:`start_servers` starts at the same time."""
+
 
 @plugin_method("get_server_setting")
 def get_server_setting(
@@ -348,6 +354,7 @@ def stop_server(
 
         server.stop()
         app_context.bedrock_process_manager.remove_server(server.server_name)
+        app_context.bedrock_process_manager.end_player_sessions(server)
         logger.info(f"API: Server '{server_name}' stopped successfully.")
         return {
             "status": "success",
@@ -485,6 +492,145 @@ def restart_server(
         return {"status": "error", "message": f"Unexpected error during restart: {e}"}
 
 
+@plugin_method("start_servers")
+def start_servers(
+    server_names: List[str],
+    max_concurrency: Optional[int] = None,
+    stagger_sec: Optional[float] = None,
+    progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    app_context: Optional[AppContext] = None,
+) -> Dict[str, Any]:
+    """Starts several servers in parallel, optionally spacing out their launches.
+
+    Each server is started with :func:`start_server` (so the usual plugin
+    events are triggered), at most `max_concurrency` at a time. Launches are
+    at least `stagger_sec` seconds apart, so that servers do not all load
+    their worlds at the same moment.
+
+    Args:
+        server_names (List[str]): The servers to start.
+        max_concurrency (Optional[int], optional): The maximum number of
+            servers being started at the same time. Defaults to ``None``,
+            which uses the ``autostart.max_concurrency`` setting
+            (:data:`DEFAULT_START_CONCURRENCY` if unset).
+        stagger_sec (Optional[float], optional): The minimum number of seconds
+            between two launches. Defaults to ``None``, which uses the
+            ``autostart.stagger_sec`` setting (no delay if unset).
+        progress_callback (Optional[Callable[[Dict[str, Any]], None]], optional):
+            Called with a snapshot of the progress each time a server changes
+            state: ``{"total": int, "completed": int, "servers": {name:
+            {"status": str, ...}}}``. A server's status goes from
+            ``"pending"`` through ``"starting"`` to ``"started"`` or
+            ``"error"``.
+        app_context (Optional[AppContext], optional): The application context.
+
+    Returns:
+        Dict[str, Any]: ``{"status": "success" | "error", "started": List[str],
+        "failed": List[str], "servers": Dict[str, Dict], "message": str}``.
+        The status is ``"error"`` if any server failed to start.
+    """
+    if app_context is None:
+        app_context = get_app_context()
+
+    server_names = list(dict.fromkeys(server_names))
+    try:
+        if max_concurrency is None:
+            max_concurrency = app_context.settings.get(
+                "autostart.max_concurrency", DEFAULT_START_CONCURRENCY
+            )
+        if stagger_sec is None:
+            stagger_sec = app_context.settings.get("autostart.stagger_sec", 0)
+        max_concurrency = max(1, int(max_concurrency))
+        stagger_sec = max(0.0, float(stagger_sec))
+    except (TypeError, ValueError) as e:
+        return {"status": "error", "message": f"Invalid start options: {e}"}
+
+    logger.info(
+        f"API: Starting {len(server_names)} server(s), {max_concurrency} at a time, "
+        f"{stagger_sec:g}s apart."
+    )
+    progress: Dict[str, Any] = {
+        "total": len(server_names),
+        "completed": 0,
+        "servers": {name: {"status": "pending"} for name in server_names},
+    }
+    lock = threading.Lock()
+    next_launch_at = time.monotonic()
+
+    def report(server_name: str, **fields: Any) -> None:
+        with lock:
+            progress["servers"][server_name].update(fields)
+            if fields.get("status") in ("started", "error"):
+                progress["completed"] += 1
+            snapshot = {
+                "total": progress["total"],
+                "completed": progress["completed"],
+                "servers": {
+                    name: dict(entry) for name, entry in progress["servers"].items()
+                },
+            }
+        if progress_callback is not None:
+            try:
+                progress_callback(snapshot)
+            except Exception as e:
+                logger.warning(f"API: Start progress callback failed: {e}")
+
+    def start_one(server_name: str) -> None:
+        nonlocal next_launch_at
+        # Reserve the next launch slot, then wait for it outside the lock.
+        with lock:
+            now = time.monotonic()
+            launch_at = max(now, next_launch_at)
+            next_launch_at = launch_at + stagger_sec
+        time.sleep(launch_at - now)
+
+        report(server_name, status="starting")
+        try:
+            result = start_server(server_name, app_context=app_context)
+        except Exception as e:
+            result = {"status": "error", "message": str(e)}
+        if result.get("status") == "success":
+            report(server_name, status="started", message=result.get("message"))
+        else:
+            report(server_name, status="error", message=result.get("message"))
+
+    with ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="ServerStart"
+    ) as executor:
+        for server_name in server_names:
+            executor.submit(start_one, server_name)
+
+    servers = progress["servers"]
+    started = [name for name, entry in servers.items() if entry["status"] == "started"]
+    failed = [name for name, entry in servers.items() if entry["status"] == "error"]
+    message = f"Started {len(started)} of {len(server_names)} server(s)."
+    if failed:
+        message += f" Failed: {', '.join(failed)}."
+    logger.info(f"API: {message}")
+    return {
+        "status": "error" if failed else "success",
+        "started": started,
+        "failed": failed,
+        "servers": servers,
+        "message": message,
+    }
+
+
+def _check_command_allowed(server_name: str, command: str) -> None:
+    """Raises :class:`~.error.BlockedCommandError` if the command is blacklisted."""
+    blacklist = API_COMMAND_BLACKLIST or []
+    command_check = command.lower().lstrip("/")
+    for blocked_cmd_prefix in blacklist:
+        if isinstance(blocked_cmd_prefix, str) and command_check.startswith(
+            blocked_cmd_prefix.lower()
+        ):
+            error_msg = f"Command '{command}' is blocked by configuration."
+            logger.warning(
+                f"API: Blocked command attempt for '{server_name}': {error_msg}"
+            )
+            raise BlockedCommandError(error_msg)
+
+
 @plugin_method("send_command")
 @trigger_plugin_event(before="before_command_send", after="after_command_send")
 def send_command(
@@ -527,18 +673,7 @@ def send_command(
         f"API: Attempting to send command to server '{server_name}': '{command_clean}'"
     )
     try:
-        # Check command against the configured blacklist.
-        blacklist = API_COMMAND_BLACKLIST or []
-        command_check = command_clean.lower().lstrip("/")
-        for blocked_cmd_prefix in blacklist:
-            if isinstance(blocked_cmd_prefix, str) and command_check.startswith(
-                blocked_cmd_prefix.lower()
-            ):
-                error_msg = f"Command '{command_clean}' is blocked by configuration."
-                logger.warning(
-                    f"API: Blocked command attempt for '{server_name}': {error_msg}"
-                )
-                raise BlockedCommandError(error_msg)
+        _check_command_allowed(server_name, command_clean)
 
         if app_context:
             server = app_context.get_server(server_name)
@@ -569,6 +704,89 @@ def send_command(
         raise ServerError(f"Unexpected error sending command: {e}") from e
 
 
+@plugin_method("send_command_and_wait")
+@trigger_plugin_event(before="before_command_send", after="after_command_send")
+def send_command_and_wait(
+    server_name: str,
+    command: str,
+    pattern: Optional[str] = None,
+    timeout: Optional[float] = None,
+    app_context: Optional[AppContext] = None,
+) -> Dict[str, Any]:
+    """Sends a command to a running Bedrock server and returns its reply.
+
+    Like :func:`send_command`, the command is checked against the blacklist
+    first. It is then sent via
+    :meth:`~.core.bedrock_server.BedrockServer.send_command_and_wait`, which
+    collects the server's output until a line matches `pattern` (or, without
+    a pattern, until the output goes quiet). Commands to the same server are
+    serialized, so concurrent callers do not see each other's replies.
+    Triggers ``before_command_send`` and ``after_command_send`` plugin events.
+
+    Args:
+        server_name (str): The name of the server to send the command to.
+        command (str): The command string to send (e.g., "list").
+        pattern (Optional[str], optional): A regular expression matching the
+            last line of the reply.
+        timeout (Optional[float], optional): The maximum number of seconds to
+            wait for the reply. Defaults to
+            :const:`~.core.server.process_mixin.DEFAULT_COMMAND_TIMEOUT_SEC`.
+
+    Returns:
+        Dict[str, Any]: ``{"status": "success", "message": str, "output":
+        List[str]}``. If an error occurs, an exception is raised instead.
+
+    Raises:
+        InvalidServerNameError: If `server_name` is not provided.
+        MissingArgumentError: If `command` is empty.
+        BlockedCommandError: If the command is in the API blacklist.
+        UserInputError: If `pattern` is not a valid regular expression.
+        ServerNotRunningError: If the target server is not running.
+        SendCommandError: If the server's output cannot be read or sending fails.
+        CommandTimeoutError: If the reply did not arrive in time.
+        ServerError: For other unexpected errors during the operation.
+    """
+    if not server_name:
+        raise InvalidServerNameError("Server name cannot be empty.")
+    if not command or not command.strip():
+        raise MissingArgumentError("Command cannot be empty.")
+
+    command_clean = command.strip()
+    logger.info(
+        f"API: Sending command to server '{server_name}' and waiting for the reply: '{command_clean}'"
+    )
+    try:
+        _check_command_allowed(server_name, command_clean)
+
+        if app_context:
+            server = app_context.get_server(server_name)
+        else:
+            server = get_server_instance(server_name)
+        kwargs: Dict[str, Any] = {"pattern": pattern}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        output = server.send_command_and_wait(command_clean, **kwargs)
+
+        return {
+            "status": "success",
+            "message": f"Command '{command_clean}' answered with {len(output)} line(s).",
+            "output": output,
+        }
+
+    except BSMError as e:
+        logger.error(
+            f"API: Failed to get the reply of server '{server_name}' to a command: {e}",
+            exc_info=True,
+        )
+        raise
+    except Exception as e:
+        logger.error(
+            f"API: Unexpected error sending command to '{server_name}': {e}",
+            exc_info=True,
+        )
+        raise ServerError(f"Unexpected error sending command: {e}") from e
+
+
 @trigger_plugin_event(
     before="before_delete_server_data", after="after_delete_server_data"
 )
@@ -9,6 +9,8 @@ handle operations related to:
 - Server software lifecycle:
     - :func:`~.install_new_server`: Installation of new server instances.
     - :func:`~.update_server`: Updating existing servers to target versions.
+    - :func:`~.update_servers`: Updating many servers concurrently, downloading
+      each target version once.
 - Configuration file management:
     - ``server.properties``: Reading and modifying server game settings via
       :func:`~.get_server_properties_api` and :func:`~.modify_server_properties`.
@@ -24,18 +26,23 @@ Functions in this module typically return structured dictionary responses suitab
 use by web routes or CLI commands and integrate with the plugin system for extensibility.
 """
 import os
+import copy
 import logging
 import re
-from typing import Dict, List, Optional, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Any
 
 # Plugin system imports to bridge API functionality.
 from ..plugins import plugin_method
 
 # Local application imports.
 from ..instances import (
+    get_app_context,
     get_server_instance,
     get_settings_instance,
 )
+from ..core.downloader import BedrockDownloader
 from . import player as player_api
 from .utils import (
     server_lifecycle_manager,
@@ -53,6 +60,9 @@ from ..context import AppContext
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_UPDATE_CONCURRENCY = 2
+"""The default number of servers :func:`update_servers` updates at the same time."""
+
 
 from ..plugins.event_trigger import trigger_plugin_event
 
@@ -546,8 +556,8 @@ def modify_server_properties(
     :func:`~.validate_server_property_value`. If all validations pass, it
     then uses the :func:`~bedrock_server_manager.api.utils.server_lifecycle_manager`
     to manage the server's state (stopping it if `restart_after_modify` is ``True``).
-    Within the managed context, it applies each change by calling
-    :meth:`~.core.bedrock_server.BedrockServer.set_server_property`.
+    Within the managed context, it applies all changes with a single write by
+    calling :meth:`~.core.bedrock_server.BedrockServer.set_server_properties`.
     If `restart_after_modify` is ``True``, the server is restarted only if all
     properties are successfully set and the lifecycle manager completes without error.
     Triggers ``before_properties_change`` and ``after_properties_change`` plugin events.
@@ -601,8 +611,7 @@ def modify_server_properties(
                 server = app_context.get_server(server_name)
             else:
                 server = get_server_instance(server_name)
-            for prop_name, prop_value in properties_to_update.items():
-                server.set_server_property(prop_name, prop_value)
+            server.set_server_properties(properties_to_update)
 
         return {
             "status": "success",
@@ -717,6 +726,7 @@ def update_server(
     server_name: str,
     send_message: bool = True,
     app_context: Optional[AppContext] = None,
+    prepared_downloader: Optional[BedrockDownloader] = None,
 ) -> Dict[str, Any]:
     """Updates an existing server to its configured target version.
 
@@ -744,12 +754,21 @@ def update_server(
         send_message (bool, optional): If ``True`` and the server is running,
             attempts to send a notification message to the server console before
             it's stopped for the update. Defaults to ``True``.
+        app_context (Optional[AppContext], optional): The application context.
+        prepared_downloader (Optional[BedrockDownloader], optional): A
+            downloader that already resolved and downloaded the server's target
+            version (as used by :func:`update_servers`). When given, the
+            installed version is compared against it instead of looking up the
+            latest version again. Defaults to ``None``.
 
     Returns:
         Dict[str, Any]: A dictionary with the operation result.
 
         If no update needed: ``{"status": "success", "updated": False, "message": "Server is already up-to-date."}``
-        On successful update: ``{"status": "success", "updated": True, "new_version": "<version>", "message": "Server '<name>' updated..."}``
+        On successful update: ``{"status": "success", "updated": True, "new_version": "<version>", "stats": {...}, "message": "Server '<name>' updated..."}``
+        where ``"stats"`` are the extraction statistics of the update (files and
+        bytes written vs. skipped as unchanged; see
+        :meth:`~.core.downloader.BedrockDownloader.extract_server_files`).
         On error: ``{"status": "error", "message": "<error_message>"}``
 
     Raises:
@@ -776,7 +795,13 @@ def update_server(
             f"API: Updating server '{server_name}'. Send message: {send_message}"
         )
         # Check if an update is actually necessary.
-        if not server.is_update_needed(target_version):
+        if prepared_downloader is not None:
+            update_needed = (
+                server.get_version() != prepared_downloader.get_actual_version()
+            )
+        else:
+            update_needed = server.is_update_needed(target_version)
+        if not update_needed:
             return {
                 "status": "success",
                 "updated": False,
@@ -796,12 +821,15 @@ def update_server(
             logger.info(
                 f"API: Performing update for '{server_name}' to target '{target_version}'..."
             )
-            server.install_or_update(target_version)
+            server.install_or_update(
+                target_version, prepared_downloader=prepared_downloader
+            )
 
         return {
             "status": "success",
             "updated": True,
             "new_version": server.get_version(),
+            "stats": server.last_update_stats,
             "message": f"Server '{server_name}' updated successfully to {server.get_version()}.",
         }
 
@@ -813,3 +841,177 @@ def update_server(
             f"API: Unexpected error updating '{server_name}': {e}", exc_info=True
         )
         return {"status": "error", "message": f"An unexpected error occurred: {e}"}
+
+
+@plugin_method("update_servers")
+def update_servers(
+    server_names: Optional[List[str]] = None,
+    max_concurrency: Optional[int] = None,
+    send_message: bool = True,
+    progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    app_context: Optional[AppContext] = None,
+) -> Dict[str, Any]:
+    """Updates several servers, downloading each target version only once.
+
+    The servers are grouped by their target version (e.g. "LATEST",
+    "PREVIEW" or a specific version). For each group, the version is resolved
+    and its ZIP downloaded once, with a single
+    :class:`~.core.downloader.BedrockDownloader`. The servers are then updated
+    by :func:`update_server`, which stops, backs up, updates and restarts each
+    one, with at most `max_concurrency` servers being updated at a time.
+    Servers targeting a "CUSTOM" ZIP are skipped.
+
+    Args:
+        server_names (Optional[List[str]], optional): The servers to update.
+            Defaults to ``None``, which updates all servers.
+        max_concurrency (Optional[int], optional): The maximum number of
+            servers to update at the same time. Defaults to ``None``, which
+            uses the ``updates.max_concurrency`` setting
+            (:data:`DEFAULT_UPDATE_CONCURRENCY` if unset).
+        send_message (bool, optional): Passed on to :func:`update_server`.
+            Defaults to ``True``.
+        progress_callback (Optional[Callable[[Dict[str, Any]], None]], optional):
+            Called with a snapshot of the progress each time a server changes
+            state: ``{"total": int, "completed": int, "servers": {name:
+            {"status": str, ...}}}``. A server's status goes from
+            ``"pending"`` through ``"downloading"`` and ``"updating"`` to one
+            of ``"updated"``, ``"up_to_date"``, ``"skipped"`` or ``"error"``.
+        app_context (Optional[AppContext], optional): The application context.
+
+    Returns:
+        Dict[str, Any]: ``{"status": "success" | "error", "updated": List[str],
+        "failed": List[str], "servers": Dict[str, Dict], "message": str}``,
+        where ``"servers"`` holds the final progress entry of every server
+        (including the update statistics of updated servers). The status is
+        ``"error"`` if any server failed to update.
+    """
+    if app_context is None:
+        app_context = get_app_context()
+
+    try:
+        if server_names is None:
+            servers_data, _ = app_context.manager.get_servers_data(app_context)
+            server_names = [data["name"] for data in servers_data]
+        server_names = list(dict.fromkeys(server_names))
+        if max_concurrency is None:
+            max_concurrency = app_context.settings.get(
+                "updates.max_concurrency", DEFAULT_UPDATE_CONCURRENCY
+            )
+        max_concurrency = max(1, int(max_concurrency))
+    except (BSMError, TypeError, ValueError) as e:
+        logger.error(f"API: Could not prepare the fleet update: {e}", exc_info=True)
+        return {"status": "error", "message": f"Could not start the update: {e}"}
+
+    logger.info(
+        f"API: Updating {len(server_names)} server(s), {max_concurrency} at a time."
+    )
+    progress: Dict[str, Any] = {
+        "total": len(server_names),
+        "completed": 0,
+        "servers": {name: {"status": "pending"} for name in server_names},
+    }
+    progress_lock = threading.Lock()
+    final_statuses = ("updated", "up_to_date", "skipped", "error")
+
+    def report(server_name: str, **fields: Any) -> None:
+        with progress_lock:
+            progress["servers"][server_name].update(fields)
+            if fields.get("status") in final_statuses:
+                progress["completed"] += 1
+            snapshot = copy.deepcopy(progress)
+        if progress_callback is not None:
+            try:
+                progress_callback(snapshot)
+            except Exception as e:
+                logger.warning(f"API: Update progress callback failed: {e}")
+
+    # 1. Resolve and download each distinct target version once.
+    groups: Dict[str, List[str]] = {}
+    for server_name in server_names:
+        try:
+            target = app_context.get_server(server_name).get_target_version()
+        except Exception as e:
+            report(server_name, status="error", message=str(e))
+            continue
+        target = (target or "LATEST").strip().upper()
+        if target == "CUSTOM":
+            report(
+                server_name,
+                status="skipped",
+                message="Servers installed from a custom ZIP are not updated.",
+            )
+            continue
+        groups.setdefault(target, []).append(server_name)
+
+    downloaders: Dict[str, BedrockDownloader] = {}
+    for target, names in groups.items():
+        for server_name in names:
+            report(server_name, status="downloading", target_version=target)
+        try:
+            downloader = BedrockDownloader(
+                settings_obj=app_context.settings,
+                server_dir=app_context.get_server(names[0]).server_dir,
+                target_version=target,
+            )
+            downloader.prepare_download_assets()
+            downloaders[target] = downloader
+        except Exception as e:
+            logger.error(
+                f"API: Could not download target '{target}': {e}", exc_info=True
+            )
+            for server_name in names:
+                report(
+                    server_name,
+                    status="error",
+                    message=f"Could not download '{target}': {e}",
+                )
+
+    # 2. Update the servers, at most max_concurrency at a time.
+    def update_one(server_name: str, downloader: BedrockDownloader) -> None:
+        report(
+            server_name,
+            status="updating",
+            new_version=downloader.get_actual_version(),
+        )
+        try:
+            result = update_server(
+                server_name,
+                send_message=send_message,
+                app_context=app_context,
+                prepared_downloader=downloader,
+            )
+        except Exception as e:
+            result = {"status": "error", "message": str(e)}
+        if result.get("status") != "success":
+            report(server_name, status="error", message=result.get("message"))
+        elif result.get("updated"):
+            report(
+                server_name,
+                status="updated",
+                message=result.get("message"),
+                stats=result.get("stats"),
+            )
+        else:
+            report(server_name, status="up_to_date", message=result.get("message"))
+
+    with ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="ServerUpdate"
+    ) as executor:
+        for target, downloader in downloaders.items():
+            for server_name in groups[target]:
+                executor.submit(update_one, server_name, downloader)
+
+    servers = progress["servers"]
+    updated = [name for name, entry in servers.items() if entry["status"] == "updated"]
+    failed = [name for name, entry in servers.items() if entry["status"] == "error"]
+    message = f"Updated {len(updated)} of {len(server_names)} server(s)."
+    if failed:
+        message += f" Failed: {', '.join(failed)}."
+    logger.info(f"API: {message}")
+    return {
+        "status": "error" if failed else "success",
+        "updated": updated,
+        "failed": failed,
+        "servers": servers,
+        "message": message,
+    }
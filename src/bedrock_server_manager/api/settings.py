@@ -159,6 +159,59 @@ def set_global_setting(key: str, value: Any, app_context: AppContext) -> Dict[st
         }
 
 
+def set_global_settings(
+    values: Dict[str, Any], app_context: AppContext
+) -> Dict[str, Any]:
+    """Writes several values to the global application settings at once.
+
+    This function uses :meth:`~bedrock_server_manager.config.settings.Settings.set_many`,
+    so all changed values are saved in a single database transaction.
+
+    Args:
+        values (Dict[str, Any]): A mapping of dot-notation keys to their new
+            values. Each value must be JSON-serializable.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the operation result.
+        On success: ``{"status": "success", "message": "...", "changed": [<keys>]}``
+        On error: ``{"status": "error", "message": "<error_message>"}``
+
+    Raises:
+        MissingArgumentError: If `values` is empty or contains an empty key.
+    """
+    if not values or any(not key for key in values):
+        raise MissingArgumentError("At least one non-empty 'key' must be provided.")
+
+    logger.debug(f"API: Writing {len(values)} global setting(s): {list(values)}")
+    try:
+        settings = app_context.settings
+        changed = settings.set_many(values)
+        logger.info(f"API: Successfully wrote {len(changed)} global setting(s).")
+        return {
+            "status": "success",
+            "message": f"{len(changed)} global setting(s) updated successfully.",
+            "changed": changed,
+        }
+    except BSMError as e:
+        logger.error(
+            f"API: Configuration error setting global keys {list(values)}: {e}",
+            exc_info=True,
+        )
+        return {
+            "status": "error",
+            "message": f"Failed to set settings: {e}",
+        }
+    except Exception as e:
+        logger.error(
+            f"API: Unexpected error setting global keys {list(values)}: {e}",
+            exc_info=True,
+        )
+        return {
+            "status": "error",
+            "message": f"An unexpected error occurred while setting values: {e}",
+        }
+
+
 @plugin_method("set_custom_global_setting")
 def set_custom_global_setting(
     key: str, value: Any, app_context: AppContext
@@ -8,7 +8,8 @@ service management capabilities. It primarily orchestrates calls to the
 
 Key functionalities include:
     - Querying server process resource usage (e.g., PID, CPU, memory) via
-      :func:`~.get_bedrock_process_info`.
+      :func:`~.get_bedrock_process_info`, and status ping latencies via
+      :func:`~.get_server_ping_stats`.
     - Managing OS-level services (systemd on Linux, Windows Services on Windows)
       for servers, including creation (:func:`~.create_server_service`),
       enabling (:func:`~.enable_server_service`), and disabling
@@ -40,7 +41,9 @@ logger = logging.getLogger(__name__)
 
 @plugin_method("get_bedrock_process_info")
 def get_bedrock_process_info(
-    server_name: str, app_context: Optional[AppContext] = None
+    server_name: str,
+    app_context: Optional[AppContext] = None,
+    use_sampler: bool = False,
 ) -> Dict[str, Any]:
     """Retrieves resource usage for a running Bedrock server process.
 
@@ -50,6 +53,11 @@ def get_bedrock_process_info(
 
     Args:
         server_name (str): The name of the server to query.
+        use_sampler (bool, optional): If ``True``, the info is taken from the
+            application's shared
+            :class:`~.core.resource_sampler.ServerResourceSampler`, which
+            samples all polled servers in the background, instead of querying
+            the process directly. Requires `app_context`. Defaults to ``False``.
 
     Returns:
         Dict[str, Any]: A dictionary with the operation status and process information.
@@ -71,11 +79,14 @@ def get_bedrock_process_info(
 
     logger.debug(f"API: Getting process info for server '{server_name}'...")
     try:
-        if app_context:
-            server = app_context.get_server(server_name)
+        if app_context and use_sampler:
+            process_info = app_context.resource_sampler.get_latest(server_name)
         else:
-            server = get_server_instance(server_name)
-        process_info = server.get_process_info()
+            if app_context:
+                server = app_context.get_server(server_name)
+            else:
+                server = get_server_instance(server_name)
+            process_info = server.get_process_info()
 
         # If get_process_info returns None, the server is not running or inaccessible.
         if process_info is None:
@@ -102,6 +113,30 @@ def get_bedrock_process_info(
         }
 
 
+@plugin_method("get_server_ping_stats")
+def get_server_ping_stats(app_context: AppContext) -> Dict[str, Any]:
+    """Returns the status ping counters and latency of each monitored server.
+
+    The server monitor pings running servers concurrently, each with its own
+    deadline (``server_monitoring.ping_timeout_sec``); see
+    :meth:`~.core.bedrock_process_manager.BedrockProcessManager.get_ping_stats`.
+
+    Args:
+        app_context (AppContext): The application context.
+
+    Returns:
+        Dict[str, Any]: ``{"status": "success", "data": {<server_name>:
+        {"pings": int, "failures": int, "latency_ms": Optional[float],
+        "last_ping_at": float}}}``. The data is empty if no server is being
+        monitored.
+    """
+    # Do not start the monitor just to report that nothing was pinged.
+    process_manager = getattr(app_context, "_bedrock_process_manager", None)
+    if process_manager is None:
+        return {"status": "success", "data": {}}
+    return {"status": "success", "data": process_manager.get_ping_stats()}
+
+
 from ..plugins.event_trigger import trigger_plugin_event
 
 
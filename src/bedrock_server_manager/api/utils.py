@@ -177,8 +177,9 @@ def update_server_statuses(
             manager = get_manager_instance(settings)
         # get_servers_data() from the manager now handles the reconciliation internally.
         # It returns both the server data and any errors encountered during discovery.
+        # A full scan is forced so that the status registry is resynchronized too.
         all_servers_data, discovery_errors = manager.get_servers_data(
-            app_context=app_context
+            app_context=app_context, refresh=True
         )
         if discovery_errors:
             error_messages.extend(discovery_errors)
@@ -8,7 +8,8 @@ to facilitate tasks such as:
 
     - Retrieving the active world name (:func:`~.get_world_name`).
     - Exporting the active server world to a ``.mcworld`` archive file
-      (:func:`~.export_world`).
+      (:func:`~.export_world`), or streaming the archive without writing a
+      file (:func:`~.stream_world_export`).
     - Importing a world from a ``.mcworld`` file, replacing the active world
       (:func:`~.import_world`).
     - Resetting the active server world, prompting regeneration on next start
@@ -26,7 +27,7 @@ plugin system.
 import os
 import logging
 import threading
-from typing import Dict, Optional, Any
+from typing import Dict, Iterator, Optional, Any
 
 # Plugin system imports to bridge API functionality.
 from ..plugins import plugin_method
@@ -53,6 +54,53 @@ logger = logging.getLogger(__name__)
 _world_lock = threading.Lock()
 
 
+class _WorldExportStream:
+    """The byte stream returned by :func:`stream_world_export`.
+
+    It owns the world lock, which the caller acquired before creating it, and
+    releases it in :meth:`close`. :meth:`close` is called when the stream is
+    exhausted or fails; callers that may stop reading early (e.g. because the
+    HTTP client disconnected) must call it themselves. It is idempotent.
+    """
+
+    def __init__(self, produce: Iterator[bytes], archive: Iterator[bytes]) -> None:
+        self._produce = produce
+        self._archive = archive
+        # Serializes reads and close(), which may run on different threads.
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __iter__(self) -> "_WorldExportStream":
+        return self
+
+    def __next__(self) -> bytes:
+        with self._lock:
+            if self._closed:
+                raise StopIteration
+            try:
+                return next(self._produce)
+            except BaseException:
+                self._close_locked()
+                raise
+
+    def close(self) -> None:
+        """Stops the export, restarts the server if needed and frees the lock."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._produce.close()
+        finally:
+            try:
+                self._archive.close()  # type: ignore[attr-defined]
+            finally:
+                _world_lock.release()
+
+
 @plugin_method("get_world_name")
 def get_world_name(
     server_name: str, app_context: Optional[AppContext] = None
@@ -142,7 +190,8 @@ def export_world(
     Returns:
         Dict[str, Any]: A dictionary with the operation result.
         Possible statuses: "success", "error", or "skipped" (if lock not acquired).
-        On success: ``{"status": "success", "export_file": "<path_to_mcworld>", "message": "World '<name>' exported..."}``
+        On success: ``{"status": "success", "export_file": "<path_to_mcworld>", "message": "World '<name>' exported...", "stats": {...}}``,
+        where ``"stats"`` are the export statistics including ``"throughput_mb_s"``.
         On error: ``{"status": "error", "message": "<error_message>"}``.
 
     Raises:
@@ -205,7 +254,7 @@ def export_world(
                 logger.info(
                     f"API: Exporting world '{world_name_str}' to '{export_file_path}'..."
                 )
-                server.export_world_directory_to_mcworld(
+                stats = server.export_world_directory_to_mcworld(
                     world_name_str, export_file_path
                 )
 
@@ -216,6 +265,7 @@ def export_world(
                 "status": "success",
                 "export_file": export_file_path,
                 "message": f"World '{world_name_str}' exported successfully to {export_filename}.",
+                "stats": stats,
             }
 
         except (BSMError, ValueError) as e:
@@ -237,6 +287,87 @@ def export_world(
         _world_lock.release()
 
 
+def stream_world_export(
+    server_name: str,
+    stop_start_server: bool = True,
+    app_context: Optional[AppContext] = None,
+) -> Dict[str, Any]:
+    """Prepares a streamed export of the server's active world as a ``.mcworld`` archive.
+
+    Unlike :func:`~.export_world`, no file is written: the returned ``stream``
+    produces the archive data as it is read (see
+    :meth:`~.core.bedrock_server.BedrockServer.iter_world_directory_as_mcworld`),
+    e.g. to be sent as an HTTP response. The world lock is taken right away
+    and owned by the stream; if `stop_start_server` is ``True``, the server is
+    stopped only once the stream is first read. The lock is released (and the
+    server restarted) when the stream is exhausted, fails or is closed, so a
+    caller that may stop reading early must call its ``close()`` method.
+    Plugin export events are not triggered.
+
+    Args:
+        server_name (str): The name of the server whose world is to be exported.
+        stop_start_server (bool, optional): If ``True``, the server is stopped
+            while the archive is produced and restarted afterwards. Defaults
+            to ``True``.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the operation result.
+        Possible statuses: "success", "error", or "skipped" (if another world
+        operation is in progress).
+        On success: ``{"status": "success", "filename": "<name>.mcworld", "stream": <Iterator[bytes]>}``,
+        where the stream also has a ``close()`` method.
+        On error: ``{"status": "error", "message": "<error_message>"}``.
+
+    Raises:
+        InvalidServerNameError: If `server_name` is empty.
+    """
+    if not server_name:
+        raise InvalidServerNameError("Server name cannot be empty.")
+    # Taken before the response starts, so a concurrent world operation is
+    # reported as "skipped" instead of breaking off a download already sent.
+    if not _world_lock.acquire(blocking=False):
+        return {
+            "status": "skipped",
+            "message": "A world operation is already in progress.",
+        }
+
+    try:
+        if app_context:
+            server = app_context.get_server(server_name)
+        else:
+            server = get_server_instance(server_name)
+        world_name_str = server.get_world_name()
+        # Nothing is read until the stream is consumed, but the world
+        # directory is validated right away.
+        stats: Dict[str, Any] = {}
+        archive = server.iter_world_directory_as_mcworld(world_name_str, stats)
+    except BSMError as e:
+        _world_lock.release()
+        logger.error(
+            f"API: Cannot stream world export for '{server_name}': {e}", exc_info=True
+        )
+        return {"status": "error", "message": f"Failed to export world: {e}"}
+    except BaseException:
+        _world_lock.release()
+        raise
+
+    def _produce() -> Iterator[bytes]:
+        with server_lifecycle_manager(
+            server_name, stop_before=stop_start_server, app_context=app_context
+        ):
+            yield from archive
+        logger.info(
+            f"API: Streamed world '{world_name_str}' of server '{server_name}': "
+            f"{stats.get('bytes_out')} bytes, {stats.get('throughput_mb_s')} MB/s."
+        )
+
+    return {
+        "status": "success",
+        "filename": f"{world_name_str}_export_{get_timestamp()}.mcworld",
+        "stream": _WorldExportStream(_produce(), archive),
+    }
+
+
 @plugin_method("import_world")
 @trigger_plugin_event(before="before_world_import", after="after_world_import")
 def import_world(
@@ -137,8 +137,17 @@ from ..context import AppContext
 def needs_setup(app_context: AppContext) -> bool:
     """
     Checks if the application needs to be set up by checking if there are any users in the database.
+
+    This runs for every web request, so once a user exists the answer is
+    remembered on the context and the database is not asked again.
     """
     from ..db.models import User
 
+    if app_context.setup_complete is True:
+        return False
+
     with app_context.db.session_manager() as db:
-        return db.query(User).first() is None
+        setup_needed = db.query(User).first() is None
+    if not setup_needed:
+        app_context.setup_complete = True
+    return setup_needed
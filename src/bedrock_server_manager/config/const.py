@@ -84,6 +84,8 @@ EVENT_IDENTITY_KEYS: Dict[str, Tuple[str, ...]] = {
     "after_players_add": (),
     "before_player_db_scan": (),
     "after_player_db_scan": (),
+    "player_join": ("server_name", "xuid"),
+    "player_leave": ("server_name", "xuid"),
     "before_world_export": ("server_name", "export_dir"),
     "after_world_export": ("server_name",),
     "before_world_import": ("server_name", "file_path"),
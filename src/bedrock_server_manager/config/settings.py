@@ -19,8 +19,10 @@ Key components:
 import os
 import json
 import logging
+import threading
+import time
 import collections.abc
-from typing import Any, Dict, TYPE_CHECKING, Optional
+from typing import Any, Dict, Iterable, List, TYPE_CHECKING, Optional
 
 
 if TYPE_CHECKING:
@@ -42,6 +44,18 @@ CONFIG_SCHEMA_VERSION = 2
 NEW_CONFIG_FILE_NAME = "bedrock_server_manager.json"
 OLD_CONFIG_FILE_NAME = "script_config.json"
 
+SETTINGS_REVISION_KEY = "__revision__"
+"""Key of the settings row that records which top-level sections changed when.
+
+Its value is ``{"revision": int, "sections": {section: revision}}``. Every
+write increments the revision and stamps the written sections with it, so a
+process holding settings at revision N only has to reload the sections whose
+stamp is greater than N.
+"""
+
+SETTINGS_REFRESH_INTERVAL_SEC: float = 2.0
+"""Minimum number of seconds between two checks for changes made by other processes."""
+
 
 def deep_merge(source: Dict[Any, Any], destination: Dict[Any, Any]) -> Dict[Any, Any]:
     """Recursively merges the ``source`` dictionary into the ``destination`` dictionary.
@@ -129,6 +143,10 @@ class Settings:
         self._version_val = get_installed_version()
         self._settings: Dict[str, Any] = {}
         self.db = db
+        self._lock = threading.RLock()
+        self._revision = 0
+        self._change_stamp: Any = None
+        self._next_refresh_check = float("inf")
 
     def _determine_app_data_dir(self) -> str:
         """Determines the main application data directory.
@@ -193,15 +211,33 @@ class Settings:
                     "downloads": 3,
                     "logs": 3,
                 },
+                "backup": {
+                    "hot_backup_enabled": False,
+                    "hot_backup_timeout_sec": 60,
+                    "incremental_enabled": False,
+                    "compression_level": 6,
+                    "compression_workers": 0,
+                },
                 "logging": {
                     "file_level": logging.INFO,
                     "cli_level": logging.WARN,
                 },
+                "updates": {
+                    "max_concurrency": 2,
+                    "version_lookup_ttl_sec": 300,
+                },
+                "autostart": {
+                    "max_concurrency": 4,
+                    "stagger_sec": 0,
+                },
                 "web": {
                     "host": "127.0.0.1",
                     "port": 11325,
                     "token_expires_weeks": 4,
                     "threads": 4,
+                    "blocking_threads": 40,
+                    "auth_cache_ttl_sec": 30,
+                    "last_seen_flush_interval_sec": 60,
                 },
                 "custom": {}
             }
@@ -226,6 +262,13 @@ class Settings:
                 "downloads": 3,
                 "logs": 3,
             },
+            "backup": {
+                "hot_backup_enabled": False,
+                "hot_backup_timeout_sec": 60,
+                "incremental_enabled": False,
+                "compression_level": 6,
+                "compression_workers": 0,
+            },
             "logging": {
                 "file_level": logging.INFO,
                 "cli_level": logging.WARN,
@@ -233,12 +276,31 @@ class Settings:
             "server_monitoring": {
                 "player_log_monitoring_enabled": True,
                 "player_log_monitoring_interval_sec": 60,
+                "status_resync_interval_sec": 60,
+                "resource_sample_interval_sec": 2,
+                "player_discovery_workers": 0,
+                "resource_history_enabled": True,
+                "resource_history_interval_sec": 5,
+                "ping_timeout_sec": 3,
+                "restart_backoff_base_sec": 2,
+                "restart_backoff_max_sec": 60,
+            },
+            "updates": {
+                "max_concurrency": 2,
+                "version_lookup_ttl_sec": 300,
+            },
+            "autostart": {
+                "max_concurrency": 4,
+                "stagger_sec": 0,
             },
             "web": {
                 "host": "127.0.0.1",
                 "port": 11325,
                 "token_expires_weeks": 4,
                 "threads": 4,
+                "blocking_threads": 40,
+                "auth_cache_ttl_sec": 30,
+                "last_seen_flush_interval_sec": 60,
             },
             "custom": {},
         }
@@ -272,31 +334,41 @@ class Settings:
         self._config_dir_path = self._determine_app_config_dir()
         self.config_path = os.path.join(self._config_dir_path, self.config_file_name)
 
-        # Always start with a fresh copy of the defaults to build upon.
-        self._settings = self.default_config
-
         assert self.db is not None
-        with self.db.session_manager() as db:
-            # Check if the database is empty
-            if db.query(Setting).count() == 0:
-                logger.info(
-                    "No settings found in the database. Creating with default settings."
-                )
-                self._write_config(db)
-            else:
-                try:
-                    user_config = {}
-                    for setting in db.query(Setting).all():
-                        user_config[setting.key] = setting.value
-
-                    # Deep merge user settings into the default settings.
-                    deep_merge(user_config, self._settings)
-
-                except (ValueError, OSError) as e:
-                    logger.warning(
-                        f"Could not load config from database: {e}. "
-                        "Using default settings. A new config will be saved on the next settings change."
+        with self._lock:
+            # Always start with a fresh copy of the defaults to build upon.
+            self._settings = self.default_config
+            stamp = self._get_db_change_stamp()
+
+            with self.db.session_manager() as db:
+                # Check if the database is empty
+                if db.query(Setting).count() == 0:
+                    logger.info(
+                        "No settings found in the database. Creating with default settings."
                     )
+                    self._write_config(db)
+                else:
+                    try:
+                        user_config = {}
+                        for setting in self._query_global_settings(db):
+                            if setting.key == SETTINGS_REVISION_KEY:
+                                self._revision = self._parse_revision_row(
+                                    setting.value
+                                )[0]
+                            else:
+                                user_config[setting.key] = setting.value
+
+                        # Deep merge user settings into the default settings.
+                        deep_merge(user_config, self._settings)
+
+                    except (ValueError, OSError) as e:
+                        logger.warning(
+                            f"Could not load config from database: {e}. "
+                            "Using default settings. A new config will be saved on the next settings change."
+                        )
+
+            self._change_stamp = stamp
+            self._next_refresh_check = time.monotonic() + SETTINGS_REFRESH_INTERVAL_SEC
 
         self._ensure_dirs_exist()
 
@@ -329,26 +401,92 @@ class Settings:
                         f"Could not create critical directory: {dir_path}"
                     ) from e
 
-    def _write_config(self, db: Any):
-        """Writes the current settings dictionary to the database.
+    @staticmethod
+    def _query_global_settings(db: Any, keys: Optional[Iterable[str]] = None):
+        """Returns a query for the application-wide setting rows, optionally
+        restricted to the given top-level `keys`."""
+        query = db.query(Setting).filter(Setting.server_id.is_(None))
+        if keys is not None:
+            query = query.filter(Setting.key.in_(list(keys)))
+        return query
+
+    @staticmethod
+    def _parse_revision_row(value: Any) -> tuple:
+        """Returns ``(revision, {section: revision})`` from a revision row value."""
+        if not isinstance(value, dict):
+            return 0, {}
+        try:
+            revision = int(value.get("revision", 0))
+        except (TypeError, ValueError):
+            revision = 0
+        sections = value.get("sections")
+        return revision, sections if isinstance(sections, dict) else {}
+
+    def _get_db_change_stamp(self) -> Any:
+        """Returns the database change stamp, or ``None`` if unavailable."""
+        try:
+            return self.db.get_change_stamp()
+        except Exception as e:
+            logger.debug(f"Could not get database change stamp: {e}")
+            return None
+
+    def _write_config(self, db: Any, sections: Optional[Iterable[str]] = None):
+        """Writes top-level sections of the settings dictionary to the database.
+
+        All rows are written in a single transaction, together with the
+        revision row (see :const:`SETTINGS_REVISION_KEY`), so other processes
+        can tell which sections changed.
+
+        Args:
+            db (Any): The database session to use.
+            sections (Optional[Iterable[str]], optional): The top-level keys to
+                write. Defaults to ``None``, which writes all of them.
 
         Raises:
             ConfigurationError: If writing the configuration fails (e.g., due to
                 permission issues or an object that cannot be serialized to JSON).
         """
+        keys = list(self._settings) if sections is None else list(sections)
         try:
-            for key, value in self._settings.items():
-                setting = db.query(Setting).filter_by(key=key).first()
+            existing = {
+                setting.key: setting
+                for setting in self._query_global_settings(
+                    db, keys + [SETTINGS_REVISION_KEY]
+                )
+            }
+            revision_row = existing.pop(SETTINGS_REVISION_KEY, None)
+            for key in keys:
+                value = self._settings[key]
+                setting = existing.get(key)
                 if setting:
                     setting.value = value
                 else:
-                    setting = Setting(key=key, value=value)
-                    db.add(setting)
+                    db.add(Setting(key=key, value=value))
+
+            revision, section_revisions = self._parse_revision_row(
+                revision_row.value if revision_row else None
+            )
+            revision += 1
+            section_revisions = dict(section_revisions)
+            section_revisions.update({key: revision for key in keys})
+            revision_value = {"revision": revision, "sections": section_revisions}
+            if revision_row:
+                revision_row.value = revision_value
+            else:
+                db.add(Setting(key=SETTINGS_REVISION_KEY, value=revision_value))
             db.commit()
         except Exception as e:
             db.rollback()
             raise ConfigurationError(f"Failed to write configuration: {e}") from e
 
+        # Only skip ahead if no other process wrote in between; otherwise the
+        # next refresh picks up the sections it changed.
+        if revision == self._revision + 1:
+            self._revision = revision
+        # Our own commit moved the change stamp; force the next refresh to
+        # consult the revision row instead of trusting a stale stamp.
+        self._change_stamp = None
+
     def get(self, key: str, default: Any = None) -> Any:
         """Retrieves a setting value using dot-notation for nested access.
 
@@ -365,6 +503,8 @@ class Settings:
             Any: The value associated with the key, or the ``default`` value if
             the key is not found or an intermediate key is not a dictionary.
         """
+        if time.monotonic() >= self._next_refresh_check:
+            self.refresh_if_changed()
         d = self._settings
         try:
             for k in key.split("."):
@@ -379,35 +519,120 @@ class Settings:
         Intermediate dictionaries are created if they do not exist along the
         path specified by `key`. The configuration is only written to the database via
         :meth:`_write_config` if the new ``value`` is different from the
-        existing value for the given ``key``.
+        existing value for the given ``key``. See :meth:`set_many`.
 
         Example:
             ``settings.set("retention.backups", 5)``
             This will update the "backups" key within the "retention" dictionary
-            and then save the entire configuration to the database.
+            and then save the "retention" section to the database.
 
         Args:
             key (str): The dot-separated configuration key to set (e.g.,
                 "retention.backups").
             value (Any): The value to associate with the key.
         """
-        # Avoid writing to file if the value hasn't changed.
-        if self.get(key) == value:
-            return
+        self.set_many({key: value})
 
-        keys = key.split(".")
-        d = self._settings
-        for k in keys[:-1]:
-            d = d.setdefault(k, {})
+    def set_many(self, values: Dict[str, Any]) -> List[str]:
+        """Sets several configuration values and saves them in one transaction.
 
-        d[keys[-1]] = value
-        if key != "web.jwt_token_secret":
-            logger.info(f"Setting '{key}' updated to '{value}'. Saving configuration.")
-        else:
-            logger.info(f"Setting '{key}' updated. Saving configuration.")
-        assert self.db is not None
-        with self.db.session_manager() as db:
-            self._write_config(db)
+        Only the top-level sections containing a changed value are written
+        (see :meth:`_write_config`); if no value changed, nothing is written.
+
+        Example:
+            ``settings.set_many({"web.port": 8080, "retention.backups": 5})``
+
+        Args:
+            values (Dict[str, Any]): A mapping of dot-separated keys to values.
+
+        Returns:
+            List[str]: The keys whose value actually changed.
+        """
+        with self._lock:
+            changed: List[str] = []
+            dirty_sections = set()
+            for key, value in values.items():
+                # Avoid writing to the database if the value hasn't changed.
+                if self.get(key) == value:
+                    continue
+
+                keys = key.split(".")
+                d = self._settings
+                for k in keys[:-1]:
+                    d = d.setdefault(k, {})
+                d[keys[-1]] = value
+
+                changed.append(key)
+                dirty_sections.add(keys[0])
+                if key != "web.jwt_token_secret":
+                    logger.info(
+                        f"Setting '{key}' updated to '{value}'. Saving configuration."
+                    )
+                else:
+                    logger.info(f"Setting '{key}' updated. Saving configuration.")
+
+            if dirty_sections:
+                assert self.db is not None
+                with self.db.session_manager() as db:
+                    self._write_config(db, sections=sorted(dirty_sections))
+            return changed
+
+    def refresh_if_changed(self) -> List[str]:
+        """Reloads the top-level sections that other processes have changed.
+
+        The database change stamp is compared first, so as long as nothing
+        wrote to the database this does not run a query. Otherwise the
+        revision row (see :const:`SETTINGS_REVISION_KEY`) is read and only the
+        sections written after this instance's revision are re-read and merged
+        over their defaults. :meth:`get` calls this at most once every
+        :const:`SETTINGS_REFRESH_INTERVAL_SEC` seconds.
+
+        Returns:
+            List[str]: The top-level sections that were reloaded.
+        """
+        if self.db is None or self._config_dir_path is None:
+            return []
+        with self._lock:
+            self._next_refresh_check = time.monotonic() + SETTINGS_REFRESH_INTERVAL_SEC
+            # Take the stamp before reading so a concurrent write is not masked.
+            stamp = self._get_db_change_stamp()
+            if stamp is not None and stamp == self._change_stamp:
+                return []
+
+            reloaded: List[str] = []
+            try:
+                with self.db.session_manager() as db:
+                    revision_row = self._query_global_settings(
+                        db, [SETTINGS_REVISION_KEY]
+                    ).first()
+                    revision, section_revisions = self._parse_revision_row(
+                        revision_row.value if revision_row else None
+                    )
+                    if revision > self._revision:
+                        stale = [
+                            key
+                            for key, section_revision in section_revisions.items()
+                            if section_revision > self._revision
+                        ]
+                        defaults = self.default_config
+                        for setting in self._query_global_settings(db, stale):
+                            value = setting.value
+                            default = defaults.get(setting.key)
+                            if isinstance(value, dict) and isinstance(default, dict):
+                                value = deep_merge(value, default)
+                            self._settings[setting.key] = value
+                            reloaded.append(setting.key)
+                        self._revision = revision
+            except Exception as e:
+                logger.warning(f"Could not check settings for changes: {e}")
+                return []
+
+            self._change_stamp = stamp
+            if reloaded:
+                logger.info(
+                    f"Reloaded settings section(s) changed by another process: {', '.join(sorted(reloaded))}."
+                )
+            return reloaded
 
     def reload(self):
         """Reloads the settings from the database.
@@ -11,6 +11,10 @@ if TYPE_CHECKING:
     from .core.manager import BedrockServerManager
     from .plugins.plugin_manager import PluginManager
     from .core.bedrock_process_manager import BedrockProcessManager
+    from .core.status_registry import ServerStatusRegistry
+    from .core.resource_sampler import ServerResourceSampler
+    from .core.resource_history import ResourceHistoryRecorder
+    from .core.player_sessions import PlayerSessionTracker
     from .db.database import Database
     from .web.tasks import TaskManager
     from fastapi.templating import Jinja2Templates
@@ -36,8 +40,14 @@ class AppContext:
         self._bedrock_process_manager: Optional["BedrockProcessManager"] = None
         self._plugin_manager: Optional["PluginManager"] = None
         self._task_manager: Optional["TaskManager"] = None
+        self._status_registry: Optional["ServerStatusRegistry"] = None
+        self._resource_sampler: Optional["ServerResourceSampler"] = None
+        self._resource_history: Optional["ResourceHistoryRecorder"] = None
+        self._player_session_tracker: Optional["PlayerSessionTracker"] = None
         self._servers: Dict[str, "BedrockServer"] = {}
         self._templates: Optional["Jinja2Templates"] = None
+        # Set by ``bcm_config.needs_setup`` once a user exists.
+        self.setup_complete: bool = False
 
     def load(self):
         """
@@ -134,6 +144,68 @@ class AppContext:
             self._bedrock_process_manager = BedrockProcessManager(app_context=self)
         return self._bedrock_process_manager
 
+    @property
+    def status_registry(self) -> "ServerStatusRegistry":
+        """
+        Lazily loads and returns the ServerStatusRegistry instance.
+        """
+        if self._status_registry is None:
+            from .core.status_registry import ServerStatusRegistry
+
+            self._status_registry = ServerStatusRegistry()
+        return self._status_registry
+
+    @property
+    def resource_sampler(self) -> "ServerResourceSampler":
+        """
+        Lazily loads and returns the ServerResourceSampler instance.
+        """
+        if self._resource_sampler is None:
+            from .core.resource_sampler import (
+                ServerResourceSampler,
+                DEFAULT_SAMPLE_INTERVAL_SEC,
+            )
+
+            interval = self.settings.get(
+                "server_monitoring.resource_sample_interval_sec",
+                DEFAULT_SAMPLE_INTERVAL_SEC,
+            )
+            self._resource_sampler = ServerResourceSampler(
+                app_context=self, interval_sec=interval
+            )
+        return self._resource_sampler
+
+    @property
+    def resource_history(self) -> "ResourceHistoryRecorder":
+        """
+        Lazily loads and returns the ResourceHistoryRecorder instance.
+        """
+        if self._resource_history is None:
+            from .core.resource_history import (
+                ResourceHistoryRecorder,
+                DEFAULT_SAMPLE_INTERVAL_SEC,
+            )
+
+            interval = self.settings.get(
+                "server_monitoring.resource_history_interval_sec",
+                DEFAULT_SAMPLE_INTERVAL_SEC,
+            )
+            self._resource_history = ResourceHistoryRecorder(
+                app_context=self, interval_sec=interval
+            )
+        return self._resource_history
+
+    @property
+    def player_session_tracker(self) -> "PlayerSessionTracker":
+        """
+        Lazily loads and returns the PlayerSessionTracker instance.
+        """
+        if self._player_session_tracker is None:
+            from .core.player_sessions import PlayerSessionTracker
+
+            self._player_session_tracker = PlayerSessionTracker(app_context=self)
+        return self._player_session_tracker
+
     @property
     def templates(self) -> "Jinja2Templates":
         """
@@ -177,9 +249,9 @@ class AppContext:
         from .core.bedrock_server import BedrockServer
 
         if server_name not in self._servers:
-            self._servers[server_name] = BedrockServer(
-                server_name, settings_instance=self.settings
-            )
+            server = BedrockServer(server_name, settings_instance=self.settings)
+            server.status_registry = self.status_registry
+            self._servers[server_name] = server
         return self._servers[server_name]
 
     def remove_server(self, server_name: str):
@@ -199,3 +271,6 @@ class AppContext:
 
             # 3. Remove from the AppContext cache.
             del self._servers[server_name]
+
+        # 4. Drop the server from the status registry.
+        self.status_registry.remove(server_name)
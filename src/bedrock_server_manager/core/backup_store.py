@@ -0,0 +1,599 @@
+# bedrock_server_manager/core/backup_store.py
+"""Provides an incremental, content-addressed store for world backups.
+
+Backing up a world by archiving the whole world directory every time is
+wasteful: a Bedrock world is a LevelDB database, and its ``.ldb`` table files
+are immutable once written. Between two backups, typically only a handful of
+new tables, the LevelDB log and ``MANIFEST`` files, and ``level.dat`` change.
+
+This module stores world data as deduplicated blobs and describes each backup
+with a small manifest:
+
+    - Every world file is split into fixed-size chunks (see
+      :data:`DEFAULT_CHUNK_SIZE`). Each chunk is stored once, named by its
+      SHA-256 digest, under ``<paths.backups>/.store/objects/``. Blobs are
+      shared by all snapshots of all servers.
+    - Each snapshot is a JSON manifest file (extension
+      :data:`MANIFEST_EXTENSION`) saved in the server's backup directory,
+      listing every file of the world with its size, modification time, and
+      the digests of its chunks.
+    - When creating a snapshot, files whose size and modification time match
+      the previous manifest are not read again; their chunk list is reused.
+
+Key Components:
+
+    - :class:`WorldBackupStore`: Creates snapshots, restores them into a world
+      directory, exports them to plain ``.mcworld`` archives, and
+      garbage-collects blobs that are no longer referenced by any manifest.
+    - :func:`is_manifest_file`: Identifies manifest-based backup files.
+"""
+
+import os
+import glob
+import json
+import shutil
+import hashlib
+import logging
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# Local application imports.
+from ..error import (
+    AppFileNotFoundError,
+    BackupRestoreError,
+    MissingArgumentError,
+)
+from .world_archive import make_staging_directory, replace_directory
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_EXTENSION = "manifest"
+"""File extension (without the leading dot) of incremental world backup manifests."""
+
+MANIFEST_FORMAT_VERSION = 1
+"""Version of the manifest JSON layout written by :class:`WorldBackupStore`."""
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+"""Size in bytes of the chunks world files are split into (4 MiB)."""
+
+_STORE_DIR_NAME = ".store"
+_READ_BUFFER_SIZE = 1024 * 1024
+
+_LOCK_FILE_NAME = "lock"
+
+# Guards blob writes against concurrent garbage collection. A snapshot may
+# reference a blob that a concurrent collection considers unreferenced because
+# the snapshot's manifest has not been written yet. This lock covers the
+# threads of this process; WorldBackupStore._locked() adds a lock file in the
+# store directory for other processes (e.g. the CLI next to the web app).
+_store_lock = threading.RLock()
+# How often each store's lock file is held by this process, guarded by
+# _store_lock, so nested _locked() calls do not lock the file twice.
+_file_lock_depth: Dict[str, int] = {}
+
+
+def _lock_file(f: Any) -> None:
+    """Takes an exclusive lock on an open file, waiting until it is free."""
+    if os.name == "nt":
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                return
+            except OSError:
+                time.sleep(0.1)
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_file(f: Any) -> None:
+    """Releases a lock taken by :func:`_lock_file`."""
+    if os.name == "nt":
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def is_manifest_file(path: str) -> bool:
+    """Checks whether a backup file path refers to an incremental world manifest.
+
+    Args:
+        path (str): The path or filename of a backup file.
+
+    Returns:
+        bool: ``True`` if the file has the :data:`MANIFEST_EXTENSION` extension.
+    """
+    return path.lower().endswith(f".{MANIFEST_EXTENSION}")
+
+
+class WorldBackupStore:
+    """Manages deduplicated world snapshots under the global backup directory.
+
+    All servers share one blob store located at
+    ``<backup_base_dir>/.store/objects``. Blobs are laid out as
+    ``objects/<first two hex digits>/<sha256 hex digest>`` to keep directory
+    sizes manageable. Manifests are regular files that live next to the other
+    backups of a server, so existing listing and retention logic applies to
+    them.
+
+    Blob writes are atomic (temporary file plus :func:`os.replace`), and a
+    blob that already exists is never rewritten, so an interrupted snapshot
+    leaves at worst a few unreferenced blobs behind, which the next
+    :meth:`.garbage_collect` removes.
+
+    Snapshots and garbage collection hold the ``.store/lock`` file while they
+    run, so a collection in one process (e.g. the web app) never deletes
+    blobs that a snapshot in another (e.g. the CLI) has stored but not yet
+    listed in its manifest.
+
+    Attributes:
+        backup_base_dir (str): The global backup directory (``paths.backups``).
+        chunk_size (int): The size in bytes of the chunks files are split into.
+    """
+
+    def __init__(
+        self, backup_base_dir: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        """Initializes the WorldBackupStore.
+
+        Args:
+            backup_base_dir (str): The global backup directory under which the
+                shared blob store is kept.
+            chunk_size (int, optional): The size in bytes of file chunks.
+                Defaults to :data:`DEFAULT_CHUNK_SIZE`.
+
+        Raises:
+            MissingArgumentError: If `backup_base_dir` is empty or `chunk_size`
+                is not a positive integer.
+        """
+        if not backup_base_dir:
+            raise MissingArgumentError("Backup base directory cannot be empty.")
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise MissingArgumentError("Chunk size must be a positive integer.")
+        self.backup_base_dir: str = backup_base_dir
+        self.chunk_size: int = chunk_size
+
+    @property
+    def objects_dir(self) -> str:
+        """str: The directory containing all content-addressed blobs."""
+        return os.path.join(self.backup_base_dir, _STORE_DIR_NAME, "objects")
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Holds the store lock, across threads and processes.
+
+        Snapshots and garbage collection of the same store exclude each
+        other, also when they run in different processes. The lock is
+        reentrant within a thread.
+        """
+        with _store_lock:
+            store_dir = os.path.join(self.backup_base_dir, _STORE_DIR_NAME)
+            lock_path = os.path.join(store_dir, _LOCK_FILE_NAME)
+            if _file_lock_depth.get(lock_path, 0) > 0:
+                _file_lock_depth[lock_path] += 1
+                try:
+                    yield
+                finally:
+                    _file_lock_depth[lock_path] -= 1
+                return
+
+            os.makedirs(store_dir, exist_ok=True)
+            with open(lock_path, "a+b") as lock_file:
+                _lock_file(lock_file)
+                _file_lock_depth[lock_path] = 1
+                try:
+                    yield
+                finally:
+                    del _file_lock_depth[lock_path]
+                    _unlock_file(lock_file)
+
+    def _object_path(self, digest: str) -> str:
+        """Returns the path of the blob with the given SHA-256 hex digest."""
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def _put_blob(self, data: bytes) -> Tuple[str, bool]:
+        """Stores a chunk of data, unless a blob with the same content exists.
+
+        Args:
+            data (bytes): The chunk content.
+
+        Returns:
+            Tuple[str, bool]: The SHA-256 hex digest of `data`, and ``True`` if
+            a new blob was written or ``False`` if it was already stored.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self._object_path(digest)
+        if os.path.exists(blob_path):
+            return digest, False
+
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        temp_path = f"{blob_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, blob_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return digest, True
+
+    def _iter_blob(self, digest: str) -> Iterator[bytes]:
+        """Yields the content of a blob, verifying it against its digest.
+
+        Args:
+            digest (str): The SHA-256 hex digest of the blob.
+
+        Yields:
+            bytes: Successive pieces of the blob content.
+
+        Raises:
+            BackupRestoreError: If the blob is missing or its content does not
+                match `digest` (i.e., the store is corrupted).
+        """
+        blob_path = self._object_path(digest)
+        hasher = hashlib.sha256()
+        try:
+            with open(blob_path, "rb") as f:
+                while True:
+                    piece = f.read(_READ_BUFFER_SIZE)
+                    if not piece:
+                        break
+                    hasher.update(piece)
+                    yield piece
+        except FileNotFoundError as e:
+            raise BackupRestoreError(f"Backup store is missing blob '{digest}'.") from e
+        if hasher.hexdigest() != digest:
+            raise BackupRestoreError(f"Backup store blob '{digest}' is corrupted.")
+
+    @staticmethod
+    def _walk_world_files(world_dir: str) -> List[Tuple[str, Optional[int]]]:
+        """Lists all regular files in a world directory.
+
+        Args:
+            world_dir (str): The world directory to scan.
+
+        Returns:
+            List[Tuple[str, Optional[int]]]: ``(relative_path, None)`` entries,
+            with paths using forward slashes, sorted for deterministic manifests.
+        """
+        files: List[Tuple[str, Optional[int]]] = []
+        for root, _, filenames in os.walk(world_dir):
+            for filename in filenames:
+                full_path = os.path.join(root, filename)
+                relative_path = os.path.relpath(full_path, world_dir)
+                files.append((relative_path.replace(os.sep, "/"), None))
+        return sorted(files)
+
+    def load_manifest(self, manifest_path: str) -> Dict[str, Any]:
+        """Reads and validates a snapshot manifest.
+
+        Args:
+            manifest_path (str): The path to the manifest file.
+
+        Returns:
+            Dict[str, Any]: The parsed manifest.
+
+        Raises:
+            AppFileNotFoundError: If `manifest_path` does not exist.
+            BackupRestoreError: If the file is not a valid manifest or uses an
+                unsupported format version.
+        """
+        if not os.path.isfile(manifest_path):
+            raise AppFileNotFoundError(manifest_path, "Backup manifest")
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            raise BackupRestoreError(
+                f"Failed to read backup manifest '{manifest_path}': {e}"
+            ) from e
+
+        if (
+            not isinstance(manifest, dict)
+            or not isinstance(manifest.get("files"), list)
+            or manifest.get("format_version") != MANIFEST_FORMAT_VERSION
+        ):
+            raise BackupRestoreError(
+                f"'{manifest_path}' is not a supported backup manifest."
+            )
+        return manifest
+
+    def create_snapshot(
+        self,
+        world_dir: str,
+        manifest_path: str,
+        files: Optional[List[Tuple[str, Optional[int]]]] = None,
+        previous_manifest_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Stores a snapshot of a world directory and writes its manifest.
+
+        Files that have the same size and modification time as in the
+        previous manifest (and whose blobs still exist) are not read again.
+        All other files are read in :attr:`.chunk_size` pieces, and only chunks
+        not yet present in the store are written.
+
+        Args:
+            world_dir (str): The world directory to snapshot.
+            manifest_path (str): The path of the manifest file to create. It is
+                written atomically once all blobs are stored.
+            files (Optional[List[Tuple[str, Optional[int]]]], optional): An
+                explicit list of ``(path relative to world_dir, length)``
+                entries to store. A length limits how many bytes of the file are
+                stored (as reported by ``save query`` during hot backups), and
+                ``None`` means the whole file. If omitted, every file in
+                `world_dir` is stored. Defaults to ``None``.
+            previous_manifest_path (Optional[str], optional): A previous
+                manifest of the same world whose entries can be reused for
+                unchanged files. Defaults to ``None``.
+
+        Returns:
+            Dict[str, Any]: Statistics about the snapshot, with keys
+            ``"files"``, ``"files_reused"``, ``"total_bytes"``,
+            ``"new_blobs"`` and ``"new_bytes"``.
+
+        Raises:
+            AppFileNotFoundError: If `world_dir` does not exist.
+            BackupRestoreError: If a file path escapes `world_dir`, or if
+                reading a world file or writing to the store fails.
+        """
+        if not os.path.isdir(world_dir):
+            raise AppFileNotFoundError(world_dir, "World directory")
+
+        if files is None:
+            files = self._walk_world_files(world_dir)
+
+        previous_entries: Dict[str, Dict[str, Any]] = {}
+        if previous_manifest_path:
+            try:
+                previous = self.load_manifest(previous_manifest_path)
+                previous_entries = {entry["path"]: entry for entry in previous["files"]}
+            except (AppFileNotFoundError, BackupRestoreError) as e:
+                logger.warning(
+                    f"Ignoring previous manifest '{previous_manifest_path}': {e}"
+                )
+
+        stats = {
+            "files": 0,
+            "files_reused": 0,
+            "total_bytes": 0,
+            "new_blobs": 0,
+            "new_bytes": 0,
+        }
+        entries: List[Dict[str, Any]] = []
+        world_dir_abs = os.path.abspath(world_dir)
+
+        with self._locked():
+            try:
+                for relative_path, length in files:
+                    source_path = os.path.normpath(
+                        os.path.join(world_dir_abs, relative_path)
+                    )
+                    if not source_path.startswith(world_dir_abs + os.sep):
+                        raise BackupRestoreError(
+                            f"File '{relative_path}' is outside of world directory '{world_dir}'."
+                        )
+                    relative_path = os.path.relpath(source_path, world_dir_abs).replace(
+                        os.sep, "/"
+                    )
+
+                    stat_result = os.stat(source_path)
+                    size = (
+                        stat_result.st_size
+                        if length is None
+                        else min(length, stat_result.st_size)
+                    )
+
+                    previous_entry = previous_entries.get(relative_path)
+                    if (
+                        previous_entry is not None
+                        and previous_entry.get("size") == size
+                        and previous_entry.get("mtime_ns") == stat_result.st_mtime_ns
+                        and size == stat_result.st_size
+                        and all(
+                            os.path.exists(self._object_path(d))
+                            for d in previous_entry.get("chunks", [])
+                        )
+                    ):
+                        chunks = list(previous_entry["chunks"])
+                        stats["files_reused"] += 1
+                    else:
+                        chunks = []
+                        with open(source_path, "rb") as f:
+                            remaining = size
+                            while remaining > 0:
+                                data = f.read(min(remaining, self.chunk_size))
+                                if not data:
+                                    break
+                                digest, is_new = self._put_blob(data)
+                                chunks.append(digest)
+                                remaining -= len(data)
+                                if is_new:
+                                    stats["new_blobs"] += 1
+                                    stats["new_bytes"] += len(data)
+
+                    entries.append(
+                        {
+                            "path": relative_path,
+                            "size": size,
+                            "mtime_ns": stat_result.st_mtime_ns,
+                            "chunks": chunks,
+                        }
+                    )
+                    stats["files"] += 1
+                    stats["total_bytes"] += size
+
+                manifest = {
+                    "format_version": MANIFEST_FORMAT_VERSION,
+                    "world_name": os.path.basename(world_dir_abs),
+                    "chunk_size": self.chunk_size,
+                    "stats": stats,
+                    "files": entries,
+                }
+                temp_manifest_path = manifest_path + ".tmp"
+                with open(temp_manifest_path, "w", encoding="utf-8") as f:
+                    json.dump(manifest, f)
+                os.replace(temp_manifest_path, manifest_path)
+            except OSError as e:
+                raise BackupRestoreError(
+                    f"Failed to store snapshot of world '{world_dir}': {e}"
+                ) from e
+
+        logger.info(
+            f"Stored snapshot '{os.path.basename(manifest_path)}': {stats['files']} file(s), "
+            f"{stats['files_reused']} unchanged, {stats['new_blobs']} new blob(s) "
+            f"({stats['new_bytes']} of {stats['total_bytes']} bytes written)."
+        )
+        return stats
+
+    def _write_manifest_file(self, entry: Dict[str, Any], destination: Any) -> None:
+        """Writes the content of one manifest file entry to a binary stream."""
+        for digest in entry["chunks"]:
+            for piece in self._iter_blob(digest):
+                destination.write(piece)
+
+    def restore_snapshot(self, manifest_path: str, target_world_dir: str) -> None:
+        """Restores a snapshot into a world directory, replacing its content.
+
+        The world is first rebuilt in a temporary sibling directory, with every
+        blob verified against its digest. Only once that succeeds is the
+        existing world directory swapped out (see
+        :func:`~.core.world_archive.replace_directory`) and deleted in the
+        background, so a failed restore leaves the current world untouched.
+
+        Args:
+            manifest_path (str): The path to the snapshot manifest.
+            target_world_dir (str): The world directory to restore into.
+
+        Raises:
+            AppFileNotFoundError: If `manifest_path` does not exist.
+            BackupRestoreError: If the manifest is invalid, the store is missing
+                or has corrupted blobs, or a filesystem operation fails.
+        """
+        manifest = self.load_manifest(manifest_path)
+        target_world_dir = os.path.abspath(target_world_dir)
+        staging_dir: Optional[str] = None
+
+        try:
+            staging_dir = make_staging_directory(target_world_dir)
+
+            for entry in manifest["files"]:
+                destination_path = os.path.normpath(
+                    os.path.join(staging_dir, entry["path"])
+                )
+                if not destination_path.startswith(staging_dir + os.sep):
+                    raise BackupRestoreError(
+                        f"Manifest '{manifest_path}' references a path outside of the world: '{entry['path']}'."
+                    )
+                os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+                with open(destination_path, "wb") as f:
+                    self._write_manifest_file(entry, f)
+
+            replace_directory(staging_dir, target_world_dir)
+        except OSError as e:
+            raise BackupRestoreError(
+                f"Failed to restore snapshot '{manifest_path}' to '{target_world_dir}': {e}"
+            ) from e
+        finally:
+            if staging_dir is not None and os.path.isdir(staging_dir):
+                shutil.rmtree(staging_dir, ignore_errors=True)
+
+        logger.info(
+            f"Restored snapshot '{os.path.basename(manifest_path)}' to '{target_world_dir}'."
+        )
+
+    def export_snapshot_to_mcworld(
+        self, manifest_path: str, target_mcworld_file_path: str
+    ) -> None:
+        """Exports a snapshot to a standalone ``.mcworld`` archive.
+
+        Args:
+            manifest_path (str): The path to the snapshot manifest.
+            target_mcworld_file_path (str): The path of the ``.mcworld`` file to
+                create. It is written to a temporary file and renamed into place.
+
+        Raises:
+            AppFileNotFoundError: If `manifest_path` does not exist.
+            BackupRestoreError: If the manifest is invalid, the store is missing
+                or has corrupted blobs, or writing the archive fails.
+        """
+        manifest = self.load_manifest(manifest_path)
+        temp_archive_path = target_mcworld_file_path + ".tmp"
+        try:
+            with zipfile.ZipFile(
+                temp_archive_path, "w", compression=zipfile.ZIP_DEFLATED
+            ) as zf:
+                for entry in manifest["files"]:
+                    with zf.open(entry["path"], "w") as dst:
+                        self._write_manifest_file(entry, dst)
+            os.replace(temp_archive_path, target_mcworld_file_path)
+        except OSError as e:
+            raise BackupRestoreError(
+                f"Failed to export snapshot '{manifest_path}' to '{target_mcworld_file_path}': {e}"
+            ) from e
+        finally:
+            if os.path.exists(temp_archive_path):
+                os.remove(temp_archive_path)
+        logger.info(
+            f"Exported snapshot '{os.path.basename(manifest_path)}' to '{target_mcworld_file_path}'."
+        )
+
+    def _referenced_digests(self) -> Set[str]:
+        """Collects the digests referenced by every manifest of every server.
+
+        Raises:
+            BackupRestoreError: If any manifest cannot be read. Garbage
+                collection must not proceed with an incomplete reference set.
+        """
+        referenced: Set[str] = set()
+        pattern = os.path.join(self.backup_base_dir, "*", f"*.{MANIFEST_EXTENSION}")
+        for manifest_path in glob.glob(pattern):
+            manifest = self.load_manifest(manifest_path)
+            for entry in manifest["files"]:
+                referenced.update(entry.get("chunks", []))
+        return referenced
+
+    def garbage_collect(self) -> Tuple[int, int]:
+        """Deletes blobs that are not referenced by any remaining manifest.
+
+        Returns:
+            Tuple[int, int]: The number of blobs removed and the number of
+            bytes freed.
+
+        Raises:
+            BackupRestoreError: If a manifest cannot be read, in which case no
+                blob is deleted.
+        """
+        if not os.path.isdir(self.objects_dir):
+            return 0, 0
+
+        removed_count = 0
+        removed_bytes = 0
+        with self._locked():
+            referenced = self._referenced_digests()
+            for root, _, filenames in os.walk(self.objects_dir):
+                for filename in filenames:
+                    if filename in referenced:
+                        continue
+                    blob_path = os.path.join(root, filename)
+                    try:
+                        size = os.path.getsize(blob_path)
+                        os.remove(blob_path)
+                        removed_count += 1
+                        removed_bytes += size
+                    except OSError as e:
+                        logger.warning(
+                            f"Failed to remove unreferenced blob '{blob_path}': {e}"
+                        )
+
+        logger.info(
+            f"Backup store garbage collection removed {removed_count} blob(s) ({removed_bytes} bytes)."
+        )
+        return removed_count, removed_bytes
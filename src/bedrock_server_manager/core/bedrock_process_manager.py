@@ -5,7 +5,8 @@ import subprocess
 import threading
 import time
 import logging
-from typing import Dict, Optional, TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Set, TYPE_CHECKING
 
 from mcstatus import BedrockServer as mc
 
@@ -22,6 +23,18 @@ from ..context import AppContext
 if TYPE_CHECKING:
     from .bedrock_server import BedrockServer
 
+DEFAULT_PING_TIMEOUT_SEC = 3.0
+"""The default deadline of a status ping, in seconds."""
+
+PING_WORKERS = 8
+"""The maximum number of status pings running at the same time."""
+
+DEFAULT_RESTART_BACKOFF_BASE_SEC = 2.0
+"""The default wait before the second restart attempt, doubled for each further one."""
+
+DEFAULT_RESTART_BACKOFF_MAX_SEC = 60.0
+"""The default longest wait between two restart attempts."""
+
 
 class BedrockProcessManager:
     """
@@ -39,6 +52,17 @@ class BedrockProcessManager:
         self.settings = self.app_context.settings
         self._shutdown_event = threading.Event()
         self.player_scan_counter = 0
+        self.status_resync_counter = 0
+        # Status pings run in their own threads, so a server that does not
+        # answer never holds up the monitoring loop.
+        self._ping_executor: Optional[ThreadPoolExecutor] = None
+        self._pings_in_flight: Dict[str, Future] = {}
+        self._ping_stats: Dict[str, Dict[str, Any]] = {}
+        self._ping_stats_lock = threading.Lock()
+        # Names of servers whose crash is being handled, so a crash reported
+        # by a waiter thread is not also handled by the monitoring loop.
+        self._crashes_in_progress: Set[str] = set()
+        self._crash_lock = threading.Lock()
         self.monitoring_thread = threading.Thread(
             target=self._monitor_servers, daemon=True
         )
@@ -51,12 +75,18 @@ class BedrockProcessManager:
             f"Adding server '{server.server_name}' to process manager for monitoring."
         )
         self.servers[server.server_name] = server
+        # Be told about a crash as soon as the server's process exits, rather
+        # than on the next monitoring pass.
+        server.on_process_exit = self._on_server_exit
 
     def remove_server(self, server_name: str):
         """Removes a server from the process manager."""
         if server_name in self.servers:
             self.logger.info(f"Removing server '{server_name}' from process manager.")
+            self.servers[server_name].on_process_exit = None
             del self.servers[server_name]
+        with self._ping_stats_lock:
+            self._ping_stats.pop(server_name, None)
 
     def shutdown(self):
         """Signals the monitoring thread to shut down."""
@@ -64,6 +94,8 @@ class BedrockProcessManager:
         self._shutdown_event.set()
         # Optional: wait for the thread to finish
         self.monitoring_thread.join(timeout=5)
+        if self._ping_executor is not None:
+            self._ping_executor.shutdown(wait=False, cancel_futures=True)
 
     def _monitor_servers(self):
         """Monitors server processes and restarts them if they crash."""
@@ -77,10 +109,20 @@ class BedrockProcessManager:
             player_log_monitoring_interval_sec = self.settings.get(
                 "server_monitoring.player_log_monitoring_interval_sec", 60
             )
+            status_resync_interval_sec = self.settings.get(
+                "server_monitoring.status_resync_interval_sec", 60
+            )
+            ping_timeout_sec = float(
+                self.settings.get(
+                    "server_monitoring.ping_timeout_sec", DEFAULT_PING_TIMEOUT_SEC
+                )
+            )
         except Exception:
             monitoring_interval = 10
             player_log_monitoring_enabled = True
             player_log_monitoring_interval_sec = 60
+            status_resync_interval_sec = 60
+            ping_timeout_sec = DEFAULT_PING_TIMEOUT_SEC
 
         self.logger.info(
             f"Server monitoring thread started with a {monitoring_interval} second interval."
@@ -91,44 +133,238 @@ class BedrockProcessManager:
                 break  # Exit if event is set
 
             self.player_scan_counter += monitoring_interval
+            running_servers = []
             for server_name, server in list(self.servers.items()):
                 if not server.is_running():
                     if not server.intentionally_stopped:
-                        self.logger.warning(
-                            f"Monitored server '{server.server_name}' has crashed."
-                        )
-                        server.failure_count += 1
-                        self._try_restart_server(server)
+                        # Servers started by this process are normally handled
+                        # by their waiter thread already; this catches the rest.
+                        self._start_crash_handling(server)
                     else:
                         self.logger.info(
                             f"Server '{server.server_name}' was stopped intentionally. Removing from monitoring."
                         )
+                        self.end_player_sessions(server)
                         self.remove_server(server_name)
-                elif (
-                    player_log_monitoring_enabled
-                    and self.player_scan_counter >= player_log_monitoring_interval_sec
-                ):
-                    try:
-                        bedrock_server = mc.lookup(
-                            f"127.0.0.1:{server.get_server_property('server-port')}"
-                        )
-                        status = bedrock_server.status()
-                        server.player_count = status.players.online
-                        if status.players.online > 0:
-                            self.logger.info(
-                                f"Server '{server.server_name}' has {status.players.online} players online. Scanning for players."
-                            )
-                            players = server.scan_log_for_players()
-                            if players:
-                                self.app_context.manager.save_player_data(players)
-                    except Exception as e:
-                        server.player_count = 0
-                        self.logger.error(
-                            f"Error pinging server '{server.server_name}': {e}"
-                        )
+                    continue
+
+                if player_log_monitoring_enabled:
+                    # Scans are incremental and only parse new log lines, so
+                    # joins and leaves are picked up every monitoring interval.
+                    self._track_player_sessions(server)
+
+                running_servers.append(server)
+
+            if (
+                player_log_monitoring_enabled
+                and self.player_scan_counter >= player_log_monitoring_interval_sec
+            ):
+                self._ping_servers(running_servers, ping_timeout_sec)
             if self.player_scan_counter >= player_log_monitoring_interval_sec:
                 self.player_scan_counter = 0
 
+            # Periodically resynchronize the status registry with a full scan,
+            # to pick up servers changed outside of this process.
+            self.status_resync_counter += monitoring_interval
+            if status_resync_interval_sec and (
+                self.status_resync_counter >= status_resync_interval_sec
+            ):
+                self.status_resync_counter = 0
+                self._resync_server_statuses()
+
+    def _on_server_exit(self, server: "BedrockServer", returncode: int):
+        """Handles the unexpected exit of a server, called by its waiter thread."""
+        if self._shutdown_event.is_set():
+            return
+        if self.servers.get(server.server_name) is not server:
+            return
+        self._handle_crash(server)
+
+    def _start_crash_handling(self, server: "BedrockServer"):
+        """Handles a crash in a new thread, unless it is already being handled."""
+        with self._crash_lock:
+            if server.server_name in self._crashes_in_progress:
+                return
+        threading.Thread(
+            target=self._handle_crash,
+            args=(server,),
+            name=f"ServerRestart-{server.server_name}",
+            daemon=True,
+        ).start()
+
+    def _handle_crash(self, server: "BedrockServer"):
+        """Records a crash and restarts the server after its backoff delay.
+
+        The first restart is attempted immediately; every further attempt waits
+        twice as long as the one before (see :meth:`._restart_delay`).
+        """
+        server_name = server.server_name
+        with self._crash_lock:
+            if server_name in self._crashes_in_progress:
+                return
+            self._crashes_in_progress.add(server_name)
+        try:
+            # The server may have been restarted or stopped in the meantime.
+            if server.intentionally_stopped or server.is_running():
+                return
+
+            self.logger.warning(
+                f"Monitored server '{server_name}' has crashed ({server.describe_last_exit()})."
+            )
+            try:
+                server.set_status_in_config("CRASHED")
+                server.player_count = 0
+            except BSMError as e:
+                self.logger.error(
+                    f"Error writing crash status for server '{server_name}': {e}"
+                )
+            self.end_player_sessions(server)
+            server.failure_count += 1
+            # The crashed process left its PID file behind, which would make
+            # the server refuse to start.
+            try:
+                core_process.remove_pid_file_if_exists(server.get_pid_file_path())
+            except Exception as e:
+                self.logger.warning(
+                    f"Could not remove the PID file of server '{server_name}': {e}"
+                )
+
+            delay = self._restart_delay(server.failure_count)
+            if delay > 0:
+                self.logger.info(
+                    f"Waiting {delay:g} seconds before restarting server '{server_name}'."
+                )
+                if self._shutdown_event.wait(timeout=delay):
+                    return
+                if self.servers.get(server_name) is not server:
+                    return
+                if server.intentionally_stopped or server.is_running():
+                    return
+            self._try_restart_server(server)
+        finally:
+            with self._crash_lock:
+                self._crashes_in_progress.discard(server_name)
+
+    def _restart_delay(self, failure_count: int) -> float:
+        """Returns the seconds to wait before restarting after `failure_count` crashes."""
+        try:
+            base = float(
+                self.settings.get(
+                    "server_monitoring.restart_backoff_base_sec",
+                    DEFAULT_RESTART_BACKOFF_BASE_SEC,
+                )
+            )
+            maximum = float(
+                self.settings.get(
+                    "server_monitoring.restart_backoff_max_sec",
+                    DEFAULT_RESTART_BACKOFF_MAX_SEC,
+                )
+            )
+        except (TypeError, ValueError):
+            base = DEFAULT_RESTART_BACKOFF_BASE_SEC
+            maximum = DEFAULT_RESTART_BACKOFF_MAX_SEC
+        if failure_count <= 1:
+            return 0.0
+        return min(base * 2 ** (failure_count - 2), maximum)
+
+    def _ping_servers(self, servers: Iterable["BedrockServer"], timeout: float):
+        """Starts a status ping of every server, without waiting for the answers.
+
+        A server whose previous ping has not finished yet is skipped, so an
+        unresponsive server never has more than one ping outstanding.
+        """
+        if self._ping_executor is None:
+            self._ping_executor = ThreadPoolExecutor(
+                max_workers=PING_WORKERS, thread_name_prefix="ServerPing"
+            )
+        for server in servers:
+            pending = self._pings_in_flight.get(server.server_name)
+            if pending is not None and not pending.done():
+                continue
+            self._pings_in_flight[server.server_name] = self._ping_executor.submit(
+                self._ping_server, server, timeout
+            )
+
+    def _ping_server(self, server: "BedrockServer", timeout: float):
+        """Pings a server for its player count and records the round-trip time."""
+        try:
+            bedrock_server = mc.lookup(
+                f"127.0.0.1:{server.get_server_property('server-port')}",
+                timeout=timeout,
+            )
+            status = bedrock_server.status()
+            server.player_count = status.players.online
+            server.ping_latency_ms = status.latency
+        except Exception as e:
+            server.player_count = 0
+            server.ping_latency_ms = None
+            self.logger.error(f"Error pinging server '{server.server_name}': {e}")
+
+        with self._ping_stats_lock:
+            stats = self._ping_stats.setdefault(
+                server.server_name, {"pings": 0, "failures": 0}
+            )
+            stats["pings"] += 1
+            if server.ping_latency_ms is None:
+                stats["failures"] += 1
+            stats["latency_ms"] = server.ping_latency_ms
+            stats["last_ping_at"] = time.time()
+
+    def get_ping_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the status ping counters of each monitored server.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Maps server names to ``{"pings": int,
+            "failures": int, "latency_ms": Optional[float], "last_ping_at":
+            float}``, where ``latency_ms`` is ``None`` if the last ping failed.
+        """
+        with self._ping_stats_lock:
+            return {name: dict(stats) for name, stats in self._ping_stats.items()}
+
+    def _track_player_sessions(self, server: "BedrockServer"):
+        """Feeds new player events from a server's log to the session tracker.
+
+        Players seen connecting are also saved to the player database.
+        """
+        try:
+            events = server.scan_log_for_player_events()
+            if not events:
+                return
+            self.app_context.player_session_tracker.process_events(
+                server.server_name, events
+            )
+            players = {
+                event["xuid"]: {"name": event["name"], "xuid": event["xuid"]}
+                for event in events
+                if event["event"] == "connected"
+            }
+            if players:
+                self.logger.info(
+                    f"Found {len(players)} player(s) in new log entries of server '{server.server_name}'."
+                )
+                self.app_context.manager.save_player_data(list(players.values()))
+        except Exception as e:
+            self.logger.error(
+                f"Error tracking player sessions of server '{server.server_name}': {e}"
+            )
+
+    def end_player_sessions(self, server: "BedrockServer"):
+        """Records the last player events of a stopped server and closes its sessions."""
+        self._track_player_sessions(server)
+        try:
+            self.app_context.player_session_tracker.end_all_sessions(server.server_name)
+        except Exception as e:
+            self.logger.error(
+                f"Error ending player sessions of server '{server.server_name}': {e}"
+            )
+
+    def _resync_server_statuses(self):
+        """Refreshes the server status registry with a full scan of all servers."""
+        try:
+            self.app_context.manager.get_servers_data(self.app_context, refresh=True)
+        except Exception as e:
+            self.logger.error(f"Error resynchronizing server statuses: {e}")
+
     def _try_restart_server(self, server: "BedrockServer"):
         """Tries to restart a crashed server."""
         max_retries = self.settings.get("SERVER_MAX_RESTART_RETRIES", 3)
@@ -148,10 +384,11 @@ class BedrockProcessManager:
             server.start()
             self.logger.info(f"Server '{server.server_name}' restarted successfully.")
         except ServerStartError as e:
+            # The monitoring loop notices the server is still down and tries
+            # again, after a longer backoff delay.
             self.logger.critical(
                 f"Failed to restart server '{server.server_name}': {e}", exc_info=True
             )
-            time.sleep(5)
 
     def write_error_status(self, server_name: str):
         """Writes 'ERROR' to server config status."""
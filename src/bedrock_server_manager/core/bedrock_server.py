@@ -114,6 +114,7 @@ class BedrockServer(
             - :meth:`~.core.server.config_management_mixin.ServerConfigManagementMixin.set_player_permission`
             - :meth:`~.core.server.config_management_mixin.ServerConfigManagementMixin.get_server_properties`
             - :meth:`~.core.server.config_management_mixin.ServerConfigManagementMixin.set_server_property`
+            - :meth:`~.core.server.config_management_mixin.ServerConfigManagementMixin.set_server_properties`
 
         Installation & Updates (from :class:`~.core.server.install_update_mixin.ServerInstallUpdateMixin`):
             - :meth:`~.core.server.install_update_mixin.ServerInstallUpdateMixin.is_update_needed`
@@ -0,0 +1,332 @@
+# bedrock_server_manager/core/download_cache.py
+"""Provides resumable, verified downloads for the shared server ZIP cache.
+
+Every server installs and updates from the same ``paths.downloads`` directory
+(with ``stable`` and ``preview`` subdirectories), so a given server version
+only needs to be downloaded once. This module makes that cache reliable:
+
+    - Downloads are written to ``<zip>.part`` and only renamed to their final
+      name once complete. If a download is interrupted, the next attempt sends
+      an HTTP ``Range`` request and continues from the end of the ``.part``
+      file instead of starting from zero.
+    - A download is only accepted if its size matches the ``Content-Length``
+      announced by the server.
+    - The SHA-256 digest and size of every completed download are recorded in
+      a small JSON index (:data:`INDEX_FILENAME`) in the downloads directory.
+      Before a cached ZIP is extracted, it is checked against its recorded
+      digest, so a file that was truncated or corrupted on disk is detected
+      and downloaded again rather than half-extracted.
+    - Downloads of the same file are serialized with a per-file lock, so
+      several servers updating to the same version at once share a single
+      download.
+
+Key Components:
+
+    - :class:`DownloadCache`: Downloads, records, and verifies cached files.
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+
+# Local application imports.
+from ..error import InternetConnectivityError
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".download_index.json"
+"""Name of the JSON file, in the downloads directory, holding file digests."""
+
+PARTIAL_SUFFIX = ".part"
+"""Suffix of incomplete downloads, which are resumed by the next attempt."""
+
+_CHUNK_SIZE = 256 * 1024
+_READ_BUFFER_SIZE = 1024 * 1024
+
+# Per-file download locks, shared by all DownloadCache instances.
+_file_locks: Dict[str, threading.RLock] = {}
+_file_locks_guard = threading.Lock()
+# Guards read-modify-write cycles of index files.
+_index_lock = threading.Lock()
+
+
+def _sha256_of_file(path: str) -> str:
+    """Returns the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_READ_BUFFER_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _make_entry(path: str, url: Optional[str]) -> Dict[str, Any]:
+    """Returns the index entry describing a file's current content."""
+    return {
+        "sha256": _sha256_of_file(path),
+        "size": os.path.getsize(path),
+        "url": url,
+        "recorded_at": int(time.time()),
+    }
+
+
+def _remote_size(
+    response: requests.Response,
+    url: str,
+    headers: Optional[Dict[str, str]],
+    timeout: int,
+) -> Optional[int]:
+    """Returns the size of the remote file after a ``416`` response, if known.
+
+    The size is read from the ``Content-Range: bytes */<size>`` header of the
+    response, or else from the ``Content-Length`` of a ``HEAD`` request.
+    """
+    content_range = response.headers.get("content-range", "")
+    match = re.fullmatch(r"\s*bytes\s+\*/(\d+)\s*", content_range)
+    if match:
+        return int(match.group(1))
+    try:
+        head = requests.head(
+            url, headers=headers, timeout=timeout, allow_redirects=True
+        )
+        head.raise_for_status()
+        content_length = head.headers.get("content-length")
+        return int(content_length) if content_length else None
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.debug(f"Could not get the size of '{url}': {e}")
+        return None
+
+
+class DownloadCache:
+    """Tracks and verifies the files in the shared downloads directory.
+
+    Files are identified in the index by their path relative to
+    :attr:`base_dir` (e.g. ``stable/bedrock-server-1.21.0.03.zip``). Files
+    without an index entry, such as downloads made by older versions, are
+    treated as cached but cannot be verified.
+
+    Attributes:
+        base_dir (str): The downloads directory (``paths.downloads``).
+    """
+
+    def __init__(self, base_dir: str) -> None:
+        """Initializes the DownloadCache.
+
+        Args:
+            base_dir (str): The downloads directory shared by all servers.
+        """
+        self.base_dir: str = os.path.abspath(base_dir)
+
+    @property
+    def index_path(self) -> str:
+        """str: The path of the JSON index of file digests."""
+        return os.path.join(self.base_dir, INDEX_FILENAME)
+
+    @staticmethod
+    def lock_for(path: str) -> threading.RLock:
+        """Returns the process-wide lock that serializes downloads of `path`."""
+        key = os.path.normcase(os.path.abspath(path))
+        with _file_locks_guard:
+            return _file_locks.setdefault(key, threading.RLock())
+
+    def _key(self, path: str) -> Optional[str]:
+        """Returns the index key of `path`, or ``None`` if it is outside the cache."""
+        relative = os.path.relpath(os.path.abspath(path), self.base_dir)
+        if relative.startswith(os.pardir):
+            return None
+        return relative.replace(os.sep, "/")
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Loads the index, returning an empty one if it is missing or invalid."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"Ignoring unreadable download index '{self.index_path}': {e}"
+            )
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _save_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically writes the index, dropping entries of deleted files."""
+        index = {
+            key: entry
+            for key, entry in index.items()
+            if os.path.isfile(os.path.join(self.base_dir, key))
+        }
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.index_path)
+
+    def get_entry(self, path: str) -> Optional[Dict[str, Any]]:
+        """Returns the index entry of `path` (``"sha256"``, ``"size"``, ...), if any."""
+        key = self._key(path)
+        if key is None:
+            return None
+        return self._load_index().get(key)
+
+    def _store_entry(self, path: str, entry: Dict[str, Any]) -> None:
+        """Saves the index entry of `path`, if it is inside the cache."""
+        key = self._key(path)
+        if key is None:
+            return
+        with _index_lock:
+            index = self._load_index()
+            index[key] = entry
+            self._save_index(index)
+
+    def forget(self, path: str) -> None:
+        """Removes the index entry of `path`, if any."""
+        key = self._key(path)
+        if key is None:
+            return
+        with _index_lock:
+            index = self._load_index()
+            if index.pop(key, None) is not None:
+                self._save_index(index)
+
+    def is_cached(self, path: str) -> bool:
+        """Checks whether `path` is present and, if indexed, has its recorded size.
+
+        This is a cheap check made before deciding to download; use
+        :meth:`verify` for a full integrity check.
+        """
+        if not os.path.isfile(path):
+            return False
+        entry = self.get_entry(path)
+        return entry is None or entry.get("size") == os.path.getsize(path)
+
+    def verify(self, path: str) -> bool:
+        """Checks a cached file against the SHA-256 digest recorded for it.
+
+        Args:
+            path (str): The path of the cached file.
+
+        Returns:
+            bool: ``False`` if the file is missing or does not match its index
+            entry; ``True`` otherwise, including for files without an entry.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        if not os.path.isfile(path):
+            return False
+        entry = self.get_entry(path)
+        if entry is None:
+            return True
+        if entry.get("size") != os.path.getsize(path):
+            return False
+        return entry.get("sha256") == _sha256_of_file(path)
+
+    def download(
+        self,
+        url: str,
+        target_path: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 120,
+    ) -> Dict[str, Any]:
+        """Downloads `url` to `target_path`, resuming an earlier partial download.
+
+        The data is written to ``<target_path>.part``. If that file already
+        exists, only the remaining bytes are requested with an HTTP ``Range``
+        header; a server that ignores the header sends the whole file, which
+        then replaces the partial one, and a ``416`` reply means the partial
+        file is either already complete or no longer matches the remote file,
+        which is then downloaded again. Once the announced size has been
+        received, the file is hashed, recorded in the index, and renamed to
+        `target_path`. Callers downloading into a shared cache should hold
+        :meth:`lock_for` of `target_path`.
+
+        Args:
+            url (str): The URL to download.
+            target_path (str): The final path of the downloaded file.
+            headers (Optional[Dict[str, str]]): Extra HTTP request headers.
+            timeout (int, optional): The connect/read timeout in seconds.
+                Defaults to 120.
+
+        Returns:
+            Dict[str, Any]: ``"bytes_downloaded"`` (int, received by this
+            call), ``"resumed_from"`` (int, bytes already present), ``"size"``
+            (int) and ``"sha256"`` (str).
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails. The
+                partial file is kept for the next attempt.
+            InternetConnectivityError: If the connection closed before the
+                whole file was received.
+            OSError: If writing the file or the index fails.
+        """
+        part_path = target_path + PARTIAL_SUFFIX
+        request_headers = dict(headers or {})
+        resumed_from = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+        if resumed_from:
+            request_headers["Range"] = f"bytes={resumed_from}-"
+            logger.info(
+                f"Resuming download of '{os.path.basename(target_path)}' from byte {resumed_from}."
+            )
+
+        bytes_downloaded = 0
+        expected_size = 0
+        with requests.get(
+            url, headers=request_headers, stream=True, timeout=timeout
+        ) as response:
+            if resumed_from and response.status_code == 416:
+                # Nothing is left to send past the end of the file, so the
+                # partial file may already be complete (e.g. an earlier run
+                # stopped before renaming it).
+                remote_size = _remote_size(response, url, headers, timeout)
+                if remote_size != resumed_from:
+                    # It is not a prefix of the remote file (e.g. that was
+                    # replaced upstream); start over.
+                    logger.warning(
+                        f"Server rejected resuming '{os.path.basename(target_path)}'. Restarting download."
+                    )
+                    os.remove(part_path)
+                    return self.download(url, target_path, headers, timeout)
+                logger.info(
+                    f"Partial download of '{os.path.basename(target_path)}' is already complete."
+                )
+            else:
+                response.raise_for_status()
+
+                if response.status_code != 206:
+                    resumed_from = 0
+                content_length = int(response.headers.get("content-length", 0))
+                expected_size = resumed_from + content_length if content_length else 0
+
+                with open(part_path, "ab" if resumed_from else "wb") as f:
+                    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                        f.write(chunk)
+                        bytes_downloaded += len(chunk)
+
+        size = resumed_from + bytes_downloaded
+        if expected_size and size != expected_size:
+            raise InternetConnectivityError(
+                f"Download of '{url}' ended after {size} of {expected_size} bytes. "
+                "It will be resumed on the next attempt."
+            )
+
+        entry = _make_entry(part_path, url)
+        os.replace(part_path, target_path)
+        self._store_entry(target_path, entry)
+
+        logger.info(
+            f"Downloaded {bytes_downloaded} bytes to '{target_path}' "
+            f"(sha256 {entry['sha256'][:12]}...)."
+        )
+        return {
+            "bytes_downloaded": bytes_downloaded,
+            "resumed_from": resumed_from,
+            "size": size,
+            "sha256": entry["sha256"],
+        }
@@ -0,0 +1,284 @@
+# bedrock_server_manager/core/download_links.py
+"""Caches the download links returned by the Minecraft download API.
+
+The download API returns, in one response, the current download URL of every
+server flavour (``serverBedrockLinux``, ``serverBedrockPreviewWindows``, ...).
+Every :class:`~.core.downloader.BedrockDownloader` needs one of those URLs to
+resolve its target version, and downloaders are created often (e.g. by the
+default plugins on every server start). This module shares one answer between
+all of them:
+
+    - The links are kept in memory, per downloads directory, for
+      ``updates.version_lookup_ttl_sec`` seconds. Concurrent lookups wait for
+      a single request instead of each contacting the API.
+    - Once the links are older than that, they are refreshed with a
+      conditional request (``If-None-Match`` / ``If-Modified-Since``), so an
+      unchanged answer costs an empty ``304 Not Modified`` response.
+    - The last good answer is saved to :data:`LINKS_FILENAME` in the downloads
+      directory. If the API cannot be reached or returns malformed data, that
+      answer is used instead, so servers can still be started offline.
+
+Key Components:
+
+    - :class:`DownloadLinksCache`: The cache of one downloads directory.
+    - :func:`get_download_links`: Returns the links, using the shared caches.
+    - :func:`get_stats`: Returns the cache hit and miss counters.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+
+# Local application imports.
+from ..error import DownloadError, InternetConnectivityError
+
+logger = logging.getLogger(__name__)
+
+API_URL = "https://net-secondary.web.minecraft-services.net/api/v1.0/download/links"
+"""The URL of the Minecraft download API."""
+
+LINKS_FILENAME = ".download_links.json"
+"""Name of the file, in the downloads directory, holding the last good links."""
+
+DEFAULT_TTL_SEC = 300
+"""The default number of seconds the links are used without asking the API."""
+
+_caches: Dict[str, "DownloadLinksCache"] = {}
+_caches_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "not_modified": 0, "stale_fallbacks": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(counter: str) -> None:
+    """Increments one of the process-wide lookup counters."""
+    with _stats_lock:
+        _stats[counter] += 1
+
+
+def _parse_links(api_data: Any) -> Dict[str, str]:
+    """Returns the ``{downloadType: downloadUrl}`` mapping of an API response.
+
+    Raises:
+        DownloadError: If the response does not have the expected structure.
+    """
+    try:
+        all_links = api_data.get("result", {}).get("links", [])
+        return {
+            link["downloadType"]: link["downloadUrl"]
+            for link in all_links
+            if link.get("downloadType") and link.get("downloadUrl")
+        }
+    except (AttributeError, KeyError, TypeError) as e:
+        raise DownloadError(
+            "The Minecraft download API returned malformed data."
+        ) from e
+
+
+class DownloadLinksCache:
+    """The download links known for one downloads directory.
+
+    Attributes:
+        state_path (Optional[str]): The file the last good answer is saved to,
+            or ``None`` to keep it in memory only.
+    """
+
+    def __init__(self, state_path: Optional[str] = None) -> None:
+        """Initializes the DownloadLinksCache.
+
+        Args:
+            state_path (Optional[str]): The file the last good answer is saved
+                to and loaded from.
+        """
+        self.state_path: Optional[str] = state_path
+        self._lock = threading.Lock()
+        self._links: Optional[Dict[str, str]] = None
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._fetched_at: float = 0.0
+        self._loaded = False
+
+    def _load_state(self) -> None:
+        """Loads the last good answer from :attr:`state_path`, once."""
+        self._loaded = True
+        if not self.state_path:
+            return
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            links = state["links"]
+            if not isinstance(links, dict):
+                raise ValueError("'links' is not an object")
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                f"Ignoring unreadable download links file '{self.state_path}': {e}"
+            )
+            return
+        self._links = links
+        self._etag = state.get("etag")
+        self._last_modified = state.get("last_modified")
+        self._fetched_at = float(state.get("fetched_at", 0))
+
+    def _save_state(self) -> None:
+        """Atomically saves the current answer to :attr:`state_path`."""
+        if not self.state_path:
+            return
+        state = {
+            "links": self._links,
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "fetched_at": self._fetched_at,
+        }
+        temp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"Could not save download links to '{self.state_path}': {e}")
+
+    def _fetch(self, headers: Dict[str, str], timeout: int) -> None:
+        """Asks the API for the links, conditionally if some are already known.
+
+        Raises:
+            InternetConnectivityError: If the API cannot be reached.
+            DownloadError: If the API returns malformed data.
+        """
+        request_headers = dict(headers)
+        if self._links is not None:
+            if self._etag:
+                request_headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                request_headers["If-Modified-Since"] = self._last_modified
+
+        try:
+            response = requests.get(API_URL, headers=request_headers, timeout=timeout)
+            if self._links is not None and response.status_code == 304:
+                _count("not_modified")
+                logger.debug("Download API links are unchanged (304 Not Modified).")
+                self._fetched_at = time.time()
+                self._save_state()
+                return
+            response.raise_for_status()
+            api_data = response.json()
+            logger.debug(f"Successfully fetched API data: {api_data}")
+        except requests.exceptions.RequestException as e:
+            raise InternetConnectivityError(
+                f"Could not contact the Minecraft download API: {e}"
+            ) from e
+        except json.JSONDecodeError as e:
+            raise DownloadError(
+                "The Minecraft download API returned malformed data."
+            ) from e
+
+        self._links = _parse_links(api_data)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        self._etag = etag if isinstance(etag, str) else None
+        self._last_modified = last_modified if isinstance(last_modified, str) else None
+        self._fetched_at = time.time()
+        self._save_state()
+
+    def get_links(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        ttl_sec: float = DEFAULT_TTL_SEC,
+        timeout: int = 30,
+    ) -> Dict[str, str]:
+        """Returns the current ``{downloadType: downloadUrl}`` mapping.
+
+        Args:
+            headers (Optional[Dict[str, str]]): Extra HTTP request headers
+                (e.g. ``User-Agent``).
+            ttl_sec (float, optional): How many seconds an answer is used
+                without asking the API again. ``0`` always asks (conditionally).
+                Defaults to :data:`DEFAULT_TTL_SEC`.
+            timeout (int, optional): The request timeout in seconds.
+
+        Returns:
+            Dict[str, str]: The download URL of each download type.
+
+        Raises:
+            InternetConnectivityError: If the API cannot be reached and no
+                earlier answer is known.
+            DownloadError: If the API returns malformed data and no earlier
+                answer is known.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load_state()
+
+            age = time.time() - self._fetched_at
+            if self._links is not None and 0 <= age < ttl_sec:
+                _count("hits")
+                return dict(self._links)
+
+            _count("misses")
+            try:
+                self._fetch(headers or {}, timeout)
+            except (InternetConnectivityError, DownloadError) as e:
+                if self._links is None:
+                    raise
+                _count("stale_fallbacks")
+                logger.warning(
+                    f"{e} Using the download links from {int(age)} seconds ago."
+                )
+            return dict(self._links)
+
+    def clear(self) -> None:
+        """Forgets the in-memory answer; the saved one is loaded again on next use."""
+        with self._lock:
+            self._links = None
+            self._etag = None
+            self._last_modified = None
+            self._fetched_at = 0.0
+            self._loaded = False
+
+
+def get_cache(download_dir: Optional[str]) -> DownloadLinksCache:
+    """Returns the process-wide cache of a downloads directory.
+
+    Args:
+        download_dir (Optional[str]): The downloads directory
+            (``paths.downloads``). ``None`` returns a cache that is not saved
+            to disk.
+    """
+    key = os.path.normcase(os.path.abspath(download_dir)) if download_dir else ""
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            state_path = os.path.join(key, LINKS_FILENAME) if key else None
+            cache = _caches[key] = DownloadLinksCache(state_path)
+        return cache
+
+
+def get_download_links(
+    download_dir: Optional[str],
+    headers: Optional[Dict[str, str]] = None,
+    ttl_sec: float = DEFAULT_TTL_SEC,
+    timeout: int = 30,
+) -> Dict[str, str]:
+    """Returns the download links, using the cache of `download_dir`.
+
+    See :meth:`DownloadLinksCache.get_links` for the arguments and errors.
+    """
+    return get_cache(download_dir).get_links(headers, ttl_sec, timeout)
+
+
+def get_stats() -> Dict[str, int]:
+    """Returns the process-wide lookup counters.
+
+    Returns:
+        Dict[str, int]: ``"hits"`` (answered from memory), ``"misses"``
+        (the API was asked), ``"not_modified"`` (the API confirmed the known
+        answer) and ``"stale_fallbacks"`` (the API failed and the last good
+        answer was used).
+    """
+    with _stats_lock:
+        return dict(_stats)
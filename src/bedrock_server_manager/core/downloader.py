@@ -10,8 +10,10 @@ Bedrock server. It provides functionalities to:
       download API as the primary method.
     - Extract the downloaded server files into a designated server directory, with
       options for preserving existing configuration, worlds, and data during updates.
-    - Manage a local cache of downloaded server ZIP files, including pruning old
-      versions to save disk space.
+    - Manage a local cache of downloaded server ZIP files shared by all servers,
+      including resuming interrupted downloads, verifying cached files before
+      extraction (see :mod:`.core.download_cache`), and pruning old versions to
+      save disk space.
 
 Key Components:
 
@@ -32,13 +34,16 @@ import requests
 import platform
 import logging
 import os
+import copy
 import json
+import time
 import zipfile
 from pathlib import Path
-from typing import Tuple, Optional, Set, TYPE_CHECKING
+from typing import Any, Dict, Tuple, Optional, Set, TYPE_CHECKING
 
 # Local application imports.
-from .system import base as system_base
+from .download_cache import DownloadCache
+from . import download_links
 from ..error import (
     DownloadError,
     ExtractError,
@@ -56,6 +61,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+INSTALL_MANIFEST_FILENAME = ".bsm_install_manifest.json"
+"""Name of the file, in a server directory, listing the installed server files.
+
+It maps each file extracted from the server ZIP (except preserved items) to
+the ZIP member's CRC-32 and size and the file's size and modification time
+after extraction, so an update can skip files that did not change.
+"""
+
 
 def prune_old_downloads(download_dir: str, download_keep: int):
     """Removes the oldest downloaded server ZIP files from a directory.
@@ -173,10 +186,12 @@ class BedrockDownloader:
           the correct download URL for the target version and operating system (Linux/Windows).
         - **Downloading**: Downloads the server ZIP archive from the resolved URL,
           saving it to a version-specific (stable/preview) subdirectory within the
-          configured global downloads path. It skips downloading if the file already exists.
+          configured global downloads path. It skips downloading if the file already exists,
+          and resumes an interrupted download (see :class:`~.core.download_cache.DownloadCache`).
         - **Extraction**: Extracts the contents of the downloaded ZIP archive into the
           specified server directory. It supports "fresh install" and "update" modes,
-          where the latter preserves user data like worlds, properties, and allowlists.
+          where the latter preserves user data like worlds, properties, and allowlists,
+          and only rewrites the files that changed since the previous install.
         - **Cache Pruning**: After a download, it can trigger pruning of older ZIP files
           within its specific download subdirectory (stable or preview) based on retention settings.
 
@@ -189,9 +204,13 @@ class BedrockDownloader:
         input_target_version (str): The user-provided version string.
         os_name (str): The name of the current operating system (e.g., "Linux", "Windows").
         base_download_dir (Optional[str]): The root directory for all downloads.
+        download_cache (DownloadCache): Resumes and verifies the downloads in
+            `base_download_dir`.
         resolved_download_url (Optional[str]): The final URL used for downloading.
         actual_version (Optional[str]): The specific version number resolved (e.g., "1.20.10.01").
         zip_file_path (Optional[str]): Full path to the downloaded server ZIP file.
+        last_extract_stats (Optional[Dict[str, Any]]): Statistics of the last
+            :meth:`.extract_server_files` call.
         specific_download_dir (Optional[str]): Path to the subdirectory within
             `base_download_dir` used for this instance's downloads (e.g., ".../downloads/stable").
     """
@@ -267,6 +286,7 @@ class BedrockDownloader:
                 "DOWNLOAD_DIR setting is missing or empty in configuration."
             )
         self.base_download_dir = os.path.abspath(self.base_download_dir)
+        self.download_cache = DownloadCache(self.base_download_dir)
 
         # These attributes are populated during the download process.
         self.resolved_download_url: Optional[str] = None
@@ -275,6 +295,10 @@ class BedrockDownloader:
         )
         self.zip_file_path: Optional[str] = None
         self.specific_download_dir: Optional[str] = None  # e.g., .../downloads/stable
+        self.last_extract_stats: Optional[Dict[str, Any]] = None
+        # Set once prepare_download_assets() has succeeded; later calls reuse
+        # the resolved version and downloaded ZIP.
+        self._assets_prepared: bool = False
 
         # These attributes are derived from the input_target_version.
         self._version_type: str = ""  # "LATEST" or "PREVIEW"
@@ -330,6 +354,9 @@ class BedrockDownloader:
         """Finds the download URL by querying the official Minecraft download API.
 
         This is the most reliable method as it does not rely on web scraping.
+        The API's answer is shared between downloaders and cached for
+        ``updates.version_lookup_ttl_sec`` seconds (see
+        :mod:`.core.download_links`).
 
         Returns:
             The resolved download URL for the specified version and OS.
@@ -343,10 +370,6 @@ class BedrockDownloader:
         self.logger.debug(
             f"Looking up download URL for target: '{self.input_target_version}'"
         )
-        API_URL = (
-            "https://net-secondary.web.minecraft-services.net/api/v1.0/download/links"
-        )
-
         # 1. Determine the API identifier based on OS and version type.
         if self.os_name == "Linux":
             download_type = (
@@ -366,36 +389,22 @@ class BedrockDownloader:
             )
         self.logger.debug(f"Targeting API downloadType identifier: '{download_type}'")
 
-        # 2. Fetch data from the API.
-        try:
-            app_name = self.settings.get("_app_name", "BedrockServerManager")
-            headers = {
-                "User-Agent": f"Python/{platform.python_version()} {app_name}/UnknownVersion"
-            }
-            response = requests.get(API_URL, headers=headers, timeout=30)
-            response.raise_for_status()
-            api_data = response.json()
-            self.logger.debug(f"Successfully fetched API data: {api_data}")
-        except requests.exceptions.RequestException as e:
-            raise InternetConnectivityError(
-                f"Could not contact the Minecraft download API: {e}"
-            ) from e
-        except json.JSONDecodeError as e:
-            raise DownloadError(
-                "The Minecraft download API returned malformed data."
-            ) from e
-
-        # 3. Find the correct download link in the response.
-        all_links = api_data.get("result", {}).get("links", [])
-        base_url = next(
-            (
-                link.get("downloadUrl")
-                for link in all_links
-                if link.get("downloadType") == download_type
+        # 2. Fetch the links from the API, or from the shared cache.
+        app_name = self.settings.get("_app_name", "BedrockServerManager")
+        headers = {
+            "User-Agent": f"Python/{platform.python_version()} {app_name}/UnknownVersion"
+        }
+        links = download_links.get_download_links(
+            self.base_download_dir,
+            headers=headers,
+            ttl_sec=self.settings.get(
+                "updates.version_lookup_ttl_sec", download_links.DEFAULT_TTL_SEC
             ),
-            None,
         )
 
+        # 3. Find the correct download link.
+        base_url = links.get(download_type)
+
         if not base_url:
             self.logger.error(
                 f"API response did not contain a URL for downloadType '{download_type}'."
@@ -498,11 +507,16 @@ class BedrockDownloader:
     def _download_server_zip_file(self):
         """Downloads the server ZIP file from the resolved URL.
 
+        The download goes through :meth:`.DownloadCache.download`, so it is
+        written to a ``.part`` file first, an interrupted download is resumed
+        by the next call, and the SHA-256 of the completed file is recorded.
+
         Raises:
             MissingArgumentError: If the URL or target file path are not set.
             FileOperationError: If directories cannot be created or the file
                 cannot be written.
-            InternetConnectivityError: If the download request fails.
+            InternetConnectivityError: If the download request fails or ends
+                before the whole file was received.
         """
         if not self.resolved_download_url or not self.zip_file_path:
             raise MissingArgumentError(
@@ -528,40 +542,24 @@ class BedrockDownloader:
             headers = {
                 "User-Agent": f"Python Requests/{requests.__version__} ({app_name})"
             }
-            # Use a streaming request to handle large files efficiently.
-            with requests.get(
-                self.resolved_download_url, headers=headers, stream=True, timeout=120
-            ) as response:
-                response.raise_for_status()
-                self.logger.debug(
-                    f"Download request successful (status {response.status_code}). Writing to file."
-                )
-                total_size = int(response.headers.get("content-length", 0))
-                bytes_written = 0
-                with open(self.zip_file_path, "wb") as f:
-                    # Write the file in chunks to avoid high memory usage.
-                    for chunk in response.iter_content(chunk_size=8192 * 4):
-                        f.write(chunk)
-                        bytes_written += len(chunk)
-                self.logger.info(
-                    f"Successfully downloaded {bytes_written} bytes to: {self.zip_file_path}"
+            result = self.download_cache.download(
+                self.resolved_download_url, self.zip_file_path, headers=headers
+            )
+            self.logger.info(
+                f"Successfully downloaded {result['size']} bytes to: {self.zip_file_path}"
+                + (
+                    f" (resumed from byte {result['resumed_from']})"
+                    if result["resumed_from"]
+                    else ""
                 )
-                if total_size != 0 and bytes_written != total_size:
-                    self.logger.warning(
-                        f"Downloaded size ({bytes_written}) does not match content-length ({total_size}). File might be incomplete."
-                    )
+            )
         except requests.exceptions.RequestException as e:
-            # Clean up partial download on failure.
-            if os.path.exists(self.zip_file_path):
-                try:
-                    os.remove(self.zip_file_path)
-                except OSError as rm_err:
-                    self.logger.warning(
-                        f"Could not remove incomplete file '{self.zip_file_path}': {rm_err}"
-                    )
+            # The partial download is kept so the next attempt can resume it.
             raise InternetConnectivityError(
                 f"Download failed for '{self.resolved_download_url}': {e}"
             ) from e
+        except InternetConnectivityError:
+            raise
         except OSError as e:
             raise FileOperationError(
                 f"Cannot write to file '{self.zip_file_path}': {e}"
@@ -666,22 +664,34 @@ class BedrockDownloader:
         This comprehensive method coordinates all steps required to make the server
         ZIP file available locally, prior to extraction. The steps include:
 
-            1.  Checking for internet connectivity using :func:`system_base.check_internet_connectivity`.
-            2.  Ensuring the main server directory (``self.server_dir``) and the base
+            1.  Ensuring the main server directory (``self.server_dir``) and the base
                 download directory (``self.base_download_dir``) exist, creating them
                 if necessary.
-            3.  Resolving the actual version and download URL by calling
+            2.  Resolving the actual version and download URL by calling
                 :meth:`.get_version_for_target_spec()`. This populates
                 ``self.actual_version`` and ``self.resolved_download_url``.
-            4.  Determining the specific download subdirectory (e.g., ``.../downloads/stable``
+                The lookup falls back to the cached download links when the
+                API cannot be reached.
+            3.  Determining the specific download subdirectory (e.g., ``.../downloads/stable``
                 or ``.../downloads/preview``) and ensuring it exists. This sets
                 ``self.specific_download_dir``.
-            5.  Constructing the full path to the target ZIP file (``self.zip_file_path``).
-            6.  If the ZIP file does not already exist at ``self.zip_file_path``, it
+            4.  Constructing the full path to the target ZIP file (``self.zip_file_path``).
+            5.  If the ZIP file does not already exist at ``self.zip_file_path``, it
                 downloads the file using :meth:`._download_server_zip_file()`.
-            7.  Finally, it triggers cache pruning for the specific download directory
+                Concurrent preparations of the same file (e.g. several servers
+                updating to the same version) wait for a single download.
+            6.  Finally, it triggers cache pruning for the specific download directory
                 using :meth:`._execute_instance_pruning()`.
 
+        Once this method has succeeded, calling it again (also on a copy made
+        by :meth:`.for_server_dir`) returns the same assets without any network
+        access.
+
+        There is no separate connectivity check up front: only the requests
+        that are actually needed touch the network, so an install or update
+        from already cached links and ZIP files works offline, and network
+        failures surface from those requests.
+
         Returns:
             Tuple[str, str, str]: A tuple containing:
                 - ``actual_version`` (str): The resolved version string (e.g., "1.20.10.01").
@@ -691,12 +701,19 @@ class BedrockDownloader:
                   download subdirectory used (e.g., ".../downloads/stable").
 
         Raises:
-            InternetConnectivityError: If internet is unavailable or if download fails.
+            InternetConnectivityError: If the download links or the ZIP file
+                must be fetched and the request fails.
             FileOperationError: If directory creation or file writing fails.
             DownloadError: If version/URL resolution fails, or if critical attributes
                            are not set post-preparation.
             SystemError: Propagated from version resolution if OS is unsupported.
         """
+        if self._assets_prepared:
+            self.logger.debug(
+                f"Reusing prepared assets for version {self.actual_version}: '{self.zip_file_path}'."
+            )
+            return self.actual_version, self.zip_file_path, self.specific_download_dir
+
         self.logger.info(
             f"Starting Bedrock server download preparation for directory: '{self.server_dir}'"
         )
@@ -730,10 +747,9 @@ class BedrockDownloader:
                     "Critical state missing after custom ZIP preparation."
                 )
 
+            self._assets_prepared = True
             return self.actual_version, self.zip_file_path, self.specific_download_dir
 
-        system_base.check_internet_connectivity()
-
         try:
             os.makedirs(self.server_dir, exist_ok=True)
             if self.base_download_dir:
@@ -774,16 +790,18 @@ class BedrockDownloader:
             self.specific_download_dir, f"bedrock-server-{self.actual_version}.zip"
         )
 
-        # Download the file only if it doesn't already exist.
-        if not os.path.exists(self.zip_file_path):
-            self.logger.info(
-                f"Server version {self.actual_version} ZIP not found locally. Downloading..."
-            )
-            self._download_server_zip_file()
-        else:
-            self.logger.info(
-                f"Server version {self.actual_version} ZIP already exists at '{self.zip_file_path}'. Skipping download."
-            )
+        # Download the file only if it isn't cached yet. The lock makes other
+        # servers preparing the same version wait for this download.
+        with self.download_cache.lock_for(self.zip_file_path):
+            if not self.download_cache.is_cached(self.zip_file_path):
+                self.logger.info(
+                    f"Server version {self.actual_version} ZIP not found locally. Downloading..."
+                )
+                self._download_server_zip_file()
+            else:
+                self.logger.info(
+                    f"Server version {self.actual_version} ZIP already exists at '{self.zip_file_path}'. Skipping download."
+                )
 
         # Prune the cache after a potential download.
         self._execute_instance_pruning()
@@ -797,8 +815,28 @@ class BedrockDownloader:
             or not self.specific_download_dir
         ):
             raise DownloadError("Critical state missing after download preparation.")
+        self._assets_prepared = True
         return self.actual_version, self.zip_file_path, self.specific_download_dir
 
+    def for_server_dir(self, server_dir: str) -> "BedrockDownloader":
+        """Returns a copy of this downloader that extracts into another server directory.
+
+        The copy shares the resolved version, download URL and, once
+        :meth:`.prepare_download_assets` has succeeded, the downloaded ZIP, so
+        a version can be resolved and downloaded once and then installed into
+        many servers.
+
+        Args:
+            server_dir (str): The target server directory of the copy.
+
+        Returns:
+            BedrockDownloader: The new downloader.
+        """
+        clone = copy.copy(self)
+        clone.server_dir = os.path.abspath(server_dir)
+        clone.last_extract_stats = None
+        return clone
+
     def extract_server_files(self, is_update: bool):
         """Extracts server files from the downloaded ZIP to the target server directory.
 
@@ -806,16 +844,31 @@ class BedrockDownloader:
         successfully called, so that ``self.zip_file_path`` points to a valid
         local ZIP file and ``self.server_dir`` is the target extraction directory.
 
+        A downloaded ZIP is first checked against the SHA-256 recorded when it
+        was downloaded. A cached ZIP that fails that check, or that turns out
+        not to be a valid archive, is deleted so the next attempt downloads it
+        again.
+
         The behavior changes based on the `is_update` flag:
 
             - If `is_update` is ``True``, extraction preserves specific files and
               directories listed in :attr:`.PRESERVED_ITEMS_ON_UPDATE` (e.g., worlds,
               server.properties, allowlist.json, permissions.json). Other files
-              from the ZIP archive will overwrite existing files.
+              from the ZIP archive will overwrite existing files, except files
+              whose CRC-32 and size match the install manifest
+              (:data:`INSTALL_MANIFEST_FILENAME`) written by the previous install
+              and that were not modified on disk since. Files listed in that
+              manifest but no longer in the ZIP are deleted.
             - If `is_update` is ``False`` (fresh install), all files from the ZIP
               archive are extracted, potentially overwriting anything in the
               ``self.server_dir``.
 
+        Both modes write a new install manifest, and store statistics of the
+        extraction in :attr:`last_extract_stats`: ``"extracted_files"``,
+        ``"unchanged_files"``, ``"removed_files"`` and ``"preserved_files"``
+        (int), ``"bytes_written"`` and ``"bytes_skipped"`` (int, uncompressed
+        sizes), and ``"seconds"`` (float).
+
         Args:
             is_update (bool): If ``True``, performs an update extraction, preserving
                 key server files and data. If ``False``, performs a fresh
@@ -828,8 +881,9 @@ class BedrockDownloader:
                 does not exist.
             FileOperationError: If creating the ``self.server_dir`` fails or if
                 there are other filesystem errors during extraction (e.g., permissions).
-            ExtractError: If the ZIP file is invalid, corrupted, or if an
-                unexpected error occurs during the extraction process.
+            ExtractError: If the ZIP file is invalid, corrupted, does not
+                match its recorded checksum, or if an unexpected error occurs
+                during the extraction process.
         """
         if not self.zip_file_path:
             raise MissingArgumentError(
@@ -838,6 +892,19 @@ class BedrockDownloader:
         if not os.path.exists(self.zip_file_path):
             raise AppFileNotFoundError(self.zip_file_path, "ZIP file to extract")
 
+        try:
+            is_intact = self.download_cache.verify(self.zip_file_path)
+        except OSError as e:
+            raise FileOperationError(
+                f"Cannot read '{self.zip_file_path}' to verify it: {e}"
+            ) from e
+        if not is_intact:
+            self._discard_cached_zip()
+            raise ExtractError(
+                f"Invalid ZIP file: '{self.zip_file_path}' does not match the checksum recorded "
+                "when it was downloaded. It was removed and will be downloaded again."
+            )
+
         self.logger.info(
             f"Extracting server files from '{self.zip_file_path}' to '{self.server_dir}'..."
         )
@@ -852,45 +919,174 @@ class BedrockDownloader:
                 f"Cannot create target directory '{self.server_dir}' for extraction: {e}"
             ) from e
 
+        started = time.perf_counter()
         try:
             with zipfile.ZipFile(self.zip_file_path, "r") as zip_ref:
-                # In update mode, skip preserved files.
+                # In update mode, skip preserved and unchanged files.
                 if is_update:
                     self.logger.debug(
                         f"Update mode: Excluding items matching: {self.PRESERVED_ITEMS_ON_UPDATE}"
                     )
-                    extracted_count, skipped_count = 0, 0
-                    for member in zip_ref.infolist():
-                        member_path = member.filename.replace("\\", "/")
-                        should_extract = not any(
-                            member_path == item or member_path.startswith(item)
-                            for item in self.PRESERVED_ITEMS_ON_UPDATE
-                        )
-                        if should_extract:
-                            zip_ref.extract(member, path=self.server_dir)
-                            extracted_count += 1
-                        else:
-                            self.logger.debug(
-                                f"Skipping extraction of preserved item: {member_path}"
-                            )
-                            skipped_count += 1
+                    stats = self._extract_changed_files(zip_ref)
                     self.logger.info(
-                        f"Update extraction complete. Extracted {extracted_count} items, skipped {skipped_count} preserved items."
+                        f"Update extraction complete. Extracted {stats['extracted_files']} files "
+                        f"({stats['bytes_written']} bytes), skipped {stats['unchanged_files']} "
+                        f"unchanged files ({stats['bytes_skipped']} bytes) and "
+                        f"{stats['preserved_files']} preserved items, removed "
+                        f"{stats['removed_files']} obsolete files."
                     )
                 # In fresh install mode, extract everything.
                 else:
                     self.logger.debug("Fresh install mode: Extracting all files...")
                     zip_ref.extractall(self.server_dir)
+                    files = [m for m in zip_ref.infolist() if not m.is_dir()]
+                    stats = {
+                        "extracted_files": len(files),
+                        "unchanged_files": 0,
+                        "removed_files": 0,
+                        "preserved_files": 0,
+                        "bytes_written": sum(m.file_size for m in files),
+                        "bytes_skipped": 0,
+                    }
                     self.logger.info(
                         f"Successfully extracted all files to: {self.server_dir}"
                     )
+                self._write_install_manifest(zip_ref)
+            stats["seconds"] = round(time.perf_counter() - started, 3)
+            self.last_extract_stats = stats
         except zipfile.BadZipFile as e:
+            self._discard_cached_zip()
             raise ExtractError(f"Invalid ZIP file: '{self.zip_file_path}'. {e}") from e
         except (OSError, IOError) as e:
             raise FileOperationError(f"Error during file extraction: {e}") from e
         except Exception as e:
             raise ExtractError(f"Unexpected error during extraction: {e}") from e
 
+    def _is_preserved(self, member_path: str) -> bool:
+        """Checks whether a ZIP member path is one of the preserved items."""
+        return any(
+            member_path == item or member_path.startswith(item)
+            for item in self.PRESERVED_ITEMS_ON_UPDATE
+        )
+
+    def _load_install_manifest(self) -> Dict[str, Dict[str, int]]:
+        """Loads the file list of the install manifest, or ``{}`` if there is none."""
+        manifest_path = os.path.join(self.server_dir, INSTALL_MANIFEST_FILENAME)
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                files = json.load(f).get("files", {})
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, AttributeError) as e:
+            self.logger.warning(
+                f"Ignoring unreadable install manifest '{manifest_path}': {e}. All files will be extracted."
+            )
+            return {}
+        return files if isinstance(files, dict) else {}
+
+    def _write_install_manifest(self, zip_ref: zipfile.ZipFile):
+        """Records the CRC-32, size and on-disk state of the installed files."""
+        files: Dict[str, Dict[str, int]] = {}
+        for member in zip_ref.infolist():
+            member_path = member.filename.replace("\\", "/")
+            if member.is_dir() or self._is_preserved(member_path):
+                continue
+            try:
+                st = os.stat(os.path.join(self.server_dir, member_path))
+            except OSError:
+                continue
+            files[member_path] = {
+                "crc": member.CRC,
+                "size": member.file_size,
+                "mtime_ns": st.st_mtime_ns,
+            }
+        manifest_path = os.path.join(self.server_dir, INSTALL_MANIFEST_FILENAME)
+        temp_path = manifest_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.actual_version, "files": files}, f)
+        os.replace(temp_path, manifest_path)
+
+    def _extract_changed_files(self, zip_ref: zipfile.ZipFile) -> Dict[str, Any]:
+        """Extracts the non-preserved members that differ from the installed files.
+
+        A member is skipped if the install manifest records the same CRC-32 and
+        size for it and the file on disk still has the recorded size and
+        modification time. Files listed in the manifest that the ZIP no longer
+        contains are deleted.
+        """
+        installed = self._load_install_manifest()
+        stats = {
+            "extracted_files": 0,
+            "unchanged_files": 0,
+            "removed_files": 0,
+            "preserved_files": 0,
+            "bytes_written": 0,
+            "bytes_skipped": 0,
+        }
+        member_paths: Set[str] = set()
+
+        for member in zip_ref.infolist():
+            member_path = member.filename.replace("\\", "/")
+            if self._is_preserved(member_path):
+                self.logger.debug(
+                    f"Skipping extraction of preserved item: {member_path}"
+                )
+                stats["preserved_files"] += 1
+                continue
+            if member.is_dir():
+                zip_ref.extract(member, path=self.server_dir)
+                continue
+
+            member_paths.add(member_path)
+            entry = installed.get(member_path)
+            if entry and entry.get("crc") == member.CRC:
+                try:
+                    st = os.stat(os.path.join(self.server_dir, member_path))
+                except OSError:
+                    st = None
+                if (
+                    st is not None
+                    and entry.get("size") == member.file_size == st.st_size
+                    and entry.get("mtime_ns") == st.st_mtime_ns
+                ):
+                    stats["unchanged_files"] += 1
+                    stats["bytes_skipped"] += member.file_size
+                    continue
+
+            zip_ref.extract(member, path=self.server_dir)
+            stats["extracted_files"] += 1
+            stats["bytes_written"] += member.file_size
+
+        # Remove files shipped by the previous version but not by this one.
+        server_root = os.path.abspath(self.server_dir)
+        for old_path in installed:
+            if old_path in member_paths or self._is_preserved(old_path):
+                continue
+            full_path = os.path.normpath(os.path.join(server_root, old_path))
+            if not full_path.startswith(server_root + os.sep):
+                continue
+            if os.path.isfile(full_path):
+                os.remove(full_path)
+                stats["removed_files"] += 1
+                self.logger.debug(f"Removed file no longer shipped: {old_path}")
+        return stats
+
+    def _discard_cached_zip(self):
+        """Deletes a corrupt ZIP from the download cache so it is downloaded again.
+
+        Custom ZIP files provided by the user are never deleted.
+        """
+        if self._version_type == "CUSTOM" or not self.zip_file_path:
+            return
+        try:
+            os.remove(self.zip_file_path)
+            self.download_cache.forget(self.zip_file_path)
+            self.logger.warning(f"Removed corrupt download '{self.zip_file_path}'.")
+        except OSError as e:
+            self.logger.warning(
+                f"Could not remove corrupt download '{self.zip_file_path}': {e}"
+            )
+
     def full_server_setup(self, is_update: bool) -> str:
         """Performs the complete server setup: download and extraction.
 
@@ -910,7 +1106,7 @@ class BedrockDownloader:
             set up (e.g., "1.20.10.01").
 
         Raises:
-            InternetConnectivityError: If internet is unavailable or download fails.
+            InternetConnectivityError: If a required network request fails.
             FileOperationError: If directory/file operations fail during download or extraction.
             DownloadError: If version/URL resolution or download preparation fails.
             ExtractError: If the server archive extraction fails.
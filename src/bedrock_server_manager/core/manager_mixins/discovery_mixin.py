@@ -74,11 +74,19 @@ class DiscoveryMixin:
             return False
 
     def get_servers_data(
-        self, app_context: "AppContext"
+        self, app_context: "AppContext", refresh: bool = False
     ) -> Tuple[List[Dict[str, Any]], List[str]]:
         """Discovers and retrieves status data for all valid server instances.
 
-        This method scans the main server base directory (defined by
+        Server status is tracked by the application's
+        :class:`~.core.status_registry.ServerStatusRegistry`, which is kept up
+        to date as servers start, stop, crash or are updated. Once the registry
+        has been populated by a full scan, this method simply returns its
+        current snapshot without touching the filesystem or the server
+        processes. Pass ``refresh=True`` to force a full scan, which also
+        resynchronizes the registry.
+
+        A full scan looks at the main server base directory (defined by
         ``settings['paths.servers']``) for subdirectories that represent server
         installations. For each potential server, it:
 
@@ -93,6 +101,11 @@ class DiscoveryMixin:
         directories are corrupted or misconfigured. The final list of server
         data is sorted alphabetically by server name.
 
+        Args:
+            app_context (AppContext): The application context.
+            refresh (bool, optional): If ``True``, always perform a full scan
+                instead of reading the status registry. Defaults to ``False``.
+
         Returns:
             Tuple[List[Dict[str, Any]], List[str]]: A tuple containing two lists:
 
@@ -102,6 +115,7 @@ class DiscoveryMixin:
                     - ``"name"`` (str): The name of the server.
                     - ``"status"`` (str): The server's current status (e.g., "RUNNING", "STOPPED").
                     - ``"version"`` (str): The detected version of the server.
+                    - ``"player_count"`` (int): The number of players online.
 
                 - The second list contains string messages describing any errors that
                   occurred while processing specific server candidates.
@@ -110,6 +124,11 @@ class DiscoveryMixin:
             AppFileNotFoundError: If the main server base directory
                 (``settings['paths.servers']``) is not configured or does not exist.
         """
+        registry = app_context.status_registry
+        if not refresh and registry.is_populated:
+            _, snapshot = registry.snapshot()
+            return [dict(entry) for entry in snapshot], []
+
         servers_data: List[Dict[str, Any]] = []
         error_messages: List[str] = []
 
@@ -159,4 +178,7 @@ class DiscoveryMixin:
 
         # Sort the final list alphabetically by server name for consistent output.
         servers_data.sort(key=lambda s: s.get("name", "").lower())
+
+        # Resynchronize the registry so later calls can be served from memory.
+        registry.replace_all(servers_data)
         return servers_data, error_messages
@@ -1,8 +1,17 @@
 import logging
+import multiprocessing
 import os
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import insert, select, update
 
 from bedrock_server_manager.context import AppContext
+from bedrock_server_manager.core.server.player_mixin import (
+    read_player_events_from_log,
+)
 from bedrock_server_manager.db.models import Player
 from bedrock_server_manager.error import (
     AppFileNotFoundError,
@@ -14,6 +23,67 @@ from bedrock_server_manager.instances import get_server_instance
 
 logger = logging.getLogger(__name__)
 
+PLAYER_QUERY_CHUNK_SIZE: int = 500
+"""The maximum number of XUIDs per ``IN`` query when looking up known players.
+
+Kept below SQLite's historical limit of 999 bound parameters per statement."""
+
+
+def _player_upsert_statement(dialect_name: str):
+    """Builds a multi-row insert into ``players`` that renames on XUID conflicts.
+
+    Args:
+        dialect_name (str): The name of the database dialect in use.
+
+    Returns:
+        The insert statement. Dialects without a supported upsert get a plain
+        ``INSERT``.
+    """
+    if dialect_name in ("sqlite", "postgresql"):
+        if dialect_name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+        stmt = dialect_insert(Player)
+        return stmt.on_conflict_do_update(
+            index_elements=[Player.xuid],
+            set_={"player_name": stmt.excluded.player_name},
+        )
+    if dialect_name in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert as dialect_insert
+
+        stmt = dialect_insert(Player)
+        return stmt.on_duplicate_key_update(player_name=stmt.inserted.player_name)
+    return insert(Player)
+
+
+def _scan_server_log_for_players(
+    log_path: str,
+) -> Tuple[List[Tuple[str, str]], float]:
+    """Finds the unique players that connected according to a server log.
+
+    Runs in a worker process of the player discovery pool, so it only takes
+    and returns small, picklable values.
+
+    Args:
+        log_path (str): The path to the server log file.
+
+    Returns:
+        Tuple[List[Tuple[str, str]], float]: The ``(xuid, name)`` pairs of the
+        players found, in order of first connection, and the parse time in
+        seconds.
+
+    Raises:
+        OSError: If the log file cannot be read.
+    """
+    started = time.perf_counter()
+    players: Dict[str, str] = {}
+    for event in read_player_events_from_log(log_path):
+        if event["event"] == "connected" and event["xuid"] not in players:
+            players[event["xuid"]] = event["name"]
+    return list(players.items()), time.perf_counter() - started
+
 
 class PlayerMixin:
     """
@@ -72,6 +142,8 @@ class PlayerMixin:
               their entry (name and XUID) is updated if different.
             - If a player's XUID is new, their entry is added to the database.
 
+        The work is done in bulk by :meth:`.upsert_players`.
+
         Args:
             players_data (List[Dict[str, str]]): A list of player dictionaries.
                 Each dictionary must contain string values for ``"name"`` and ``"xuid"`` keys.
@@ -86,6 +158,35 @@ class PlayerMixin:
                 within it does not conform to the required format (missing keys,
                 non-string values, or empty name/XUID).
         """
+        counts = self.upsert_players(players_data)
+        return counts["inserted"] + counts["updated"]
+
+    def upsert_players(self, players_data: List[Dict[str, str]]) -> Dict[str, int]:
+        """Inserts new players and renames known ones in bulk.
+
+        Instead of one query per player, the existing entries are loaded with
+        ``IN`` queries of up to :const:`PLAYER_QUERY_CHUNK_SIZE` XUIDs, and the
+        differences are written with one multi-row statement each for inserts
+        and updates. Inserts use the dialect's native upsert (``ON CONFLICT``
+        on SQLite and PostgreSQL, ``ON DUPLICATE KEY UPDATE`` on MySQL), so a
+        player added concurrently by another writer is renamed instead of
+        failing the whole batch.
+
+        If the same XUID appears more than once in ``players_data``, the last
+        entry wins.
+
+        Args:
+            players_data (List[Dict[str, str]]): A list of player dictionaries,
+                as for :meth:`.save_player_data`.
+
+        Returns:
+            Dict[str, int]: The counts ``"inserted"``, ``"updated"`` and
+            ``"unchanged"``.
+
+        Raises:
+            UserInputError: If ``players_data`` is malformed (see
+                :meth:`.save_player_data`).
+        """
         if not isinstance(players_data, list):
             raise UserInputError("players_data must be a list.")
         for p_data in players_data:
@@ -100,38 +201,54 @@ class PlayerMixin:
             ):
                 raise UserInputError(f"Invalid player entry format: {p_data}")
 
+        wanted = {p_data["xuid"]: p_data["name"] for p_data in players_data}
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+        if not wanted:
+            return counts
+
         with self.settings.db.session_manager() as db:
             try:
-                updated_count = 0
-                added_count = 0
-                for player_to_add in players_data:
-                    xuid = player_to_add["xuid"]
-                    player = db.query(Player).filter_by(xuid=xuid).first()
-                    if player:
-                        if (
-                            player.player_name != player_to_add["name"]
-                            or player.xuid != player_to_add["xuid"]
-                        ):
-                            player.player_name = player_to_add["name"]
-                            player.xuid = player_to_add["xuid"]
-                            updated_count += 1
-                    else:
-                        player = Player(
-                            player_name=player_to_add["name"],
-                            xuid=player_to_add["xuid"],
+                existing: Dict[str, Any] = {}
+                xuids = list(wanted)
+                for i in range(0, len(xuids), PLAYER_QUERY_CHUNK_SIZE):
+                    chunk = xuids[i : i + PLAYER_QUERY_CHUNK_SIZE]
+                    for row in db.execute(
+                        select(Player.id, Player.xuid, Player.player_name).where(
+                            Player.xuid.in_(chunk)
                         )
-                        db.add(player)
-                        added_count += 1
+                    ):
+                        existing[row.xuid] = row
+
+                to_insert = []
+                to_update = []
+                for xuid, name in wanted.items():
+                    row = existing.get(xuid)
+                    if row is None:
+                        to_insert.append({"xuid": xuid, "player_name": name})
+                    elif row.player_name != name:
+                        to_update.append({"id": row.id, "player_name": name})
+                    else:
+                        counts["unchanged"] += 1
+
+                if to_insert:
+                    db.execute(
+                        _player_upsert_statement(db.get_bind().dialect.name),
+                        to_insert,
+                    )
+                if to_update:
+                    # ORM bulk UPDATE by primary key (executemany).
+                    db.execute(update(Player), to_update)
 
-                if updated_count > 0 or added_count > 0:
+                counts["inserted"] = len(to_insert)
+                counts["updated"] = len(to_update)
+                if to_insert or to_update:
                     db.commit()
                     logger.info(
-                        f"BSM: Saved/Updated players. Added: {added_count}, Updated: {updated_count}."
+                        f"BSM: Saved/Updated players. Added: {counts['inserted']}, Updated: {counts['updated']}."
                     )
-                    return added_count + updated_count
-
-                logger.debug("BSM: No new or updated player data to save.")
-                return 0
+                else:
+                    logger.debug("BSM: No new or updated player data to save.")
+                return counts
             except Exception as e:
                 db.rollback()
                 raise e
@@ -160,12 +277,14 @@ class PlayerMixin:
                directory (defined by ``settings['paths.servers']``).
             2. For each subdirectory, it attempts to instantiate a
                :class:`~.core.bedrock_server.BedrockServer` object.
-            3. If the server instance is valid and installed, it calls the server's
-               :meth:`~.core.server.player_mixin.ServerPlayerMixin.scan_log_for_players`
-               method to extract player names and XUIDs from its logs.
+            3. The logs of all valid, installed servers are then parsed from the
+               beginning, one log per worker of a process pool of up to
+               ``server_monitoring.player_discovery_workers`` processes (``0``
+               means one per CPU), so large logs are parsed in parallel. With
+               a single log or worker, the log is parsed in this process.
             4. All player data discovered from all server logs is aggregated.
             5. Unique player entries (based on XUID) are then saved to the database
-               using :meth:`.save_player_data`.
+               in bulk using :meth:`.upsert_players`.
 
         Args:
             None
@@ -179,32 +298,43 @@ class PlayerMixin:
                 - ``"unique_players_submitted_for_saving"`` (int): The number of unique
                   player entries (by XUID) that were attempted to be saved.
                 - ``"actually_saved_or_updated_in_db"`` (int): The number of players
-                  that were newly added or updated in the database
-                  by the :meth:`.save_player_data` call.
+                  that were newly added or updated in the database.
+                - ``"inserted_in_db"`` (int): The number of players newly added.
+                - ``"updated_in_db"`` (int): The number of known players renamed.
                 - ``"scan_errors"`` (List[Dict[str, str]]): A list of dictionaries,
                   where each entry represents an error encountered while scanning a
                   specific server's logs or saving the global player DB. Each error
                   dictionary contains ``"server"`` (str, server name or "GLOBAL_PLAYER_DB")
                   and ``"error"`` (str, error message).
+                - ``"server_timings"`` (Dict[str, Dict[str, Any]]): Per scanned
+                  server, ``"seconds"`` (float, time spent parsing its log) and
+                  ``"players"`` (int, unique players found).
+                - ``"workers"`` (int): The number of worker processes used
+                  (``0`` if the logs were parsed in this process).
+                - ``"elapsed_sec"`` (float): The total duration of the scan.
 
         Raises:
             AppFileNotFoundError: If the main server base directory
                 (``settings['paths.servers']``) is not configured or does not exist.
             FileOperationError: If the final save operation to the database
-                (via :meth:`.save_player_data`) fails.
+                (via :meth:`.upsert_players`) fails.
                 Note that errors during individual server log scans are caught and
                 reported in the ``"scan_errors"`` part of the return value.
         """
         if not self._base_dir or not os.path.isdir(self._base_dir):
             raise AppFileNotFoundError(str(self._base_dir), "Server base directory")
 
+        started = time.perf_counter()
         all_discovered_from_logs: List[Dict[str, str]] = []
         scan_errors_details: List[Dict[str, str]] = []
+        server_timings: Dict[str, Dict[str, Any]] = {}
 
         logger.info(
             f"BSM: Starting discovery of players from all server logs in '{self._base_dir}'."
         )
 
+        # Collect the logs to scan; instantiating servers stays in this process.
+        log_jobs: List[Tuple[str, str]] = []
         for server_name_candidate in os.listdir(self._base_dir):
             potential_server_path = os.path.join(self._base_dir, server_name_candidate)
             if not os.path.isdir(potential_server_path):
@@ -222,21 +352,13 @@ class PlayerMixin:
                     )
                     continue
 
-                # Use the instance's own method to scan its log file.
-                players_in_log = server_instance.scan_log_for_players()
-                if players_in_log:
-                    all_discovered_from_logs.extend(players_in_log)
+                log_path = server_instance.server_log_path
+                if not os.path.isfile(log_path):
                     logger.debug(
-                        f"BSM: Found {len(players_in_log)} players in log for server '{server_name_candidate}'."
+                        f"BSM: No log file for server '{server_name_candidate}'. Skipping log scan."
                     )
-
-            except FileOperationError as e:
-                logger.warning(
-                    f"BSM: Error scanning log for server '{server_name_candidate}': {e}"
-                )
-                scan_errors_details.append(
-                    {"server": server_name_candidate, "error": str(e)}
-                )
+                    continue
+                log_jobs.append((server_name_candidate, log_path))
             except Exception as e_instantiate:
                 logger.error(
                     f"BSM: Error processing server '{server_name_candidate}' for player discovery: {e_instantiate}",
@@ -249,7 +371,30 @@ class PlayerMixin:
                     }
                 )
 
-        saved_count = 0
+        workers = self._get_player_discovery_workers(len(log_jobs))
+        for server_name, result in self._run_player_log_scans(log_jobs, workers):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"BSM: Error scanning log for server '{server_name}': {result}"
+                )
+                scan_errors_details.append(
+                    {"server": server_name, "error": f"Error reading log: {result}"}
+                )
+                continue
+
+            players, seconds = result
+            server_timings[server_name] = {
+                "seconds": round(seconds, 3),
+                "players": len(players),
+            }
+            all_discovered_from_logs.extend(
+                {"name": name, "xuid": xuid} for xuid, name in players
+            )
+            logger.debug(
+                f"BSM: Found {len(players)} players in log for server '{server_name}' in {seconds:.2f}s."
+            )
+
+        save_counts = {"inserted": 0, "updated": 0}
         unique_players_to_save_map = {}
         if all_discovered_from_logs:
             # Consolidate all found players into a unique set by XUID.
@@ -259,7 +404,7 @@ class PlayerMixin:
             unique_players_to_save_list = list(unique_players_to_save_map.values())
             try:
                 # Save all unique players to the central database.
-                saved_count = self.save_player_data(unique_players_to_save_list)
+                save_counts = self.upsert_players(unique_players_to_save_list)
             except (FileOperationError, Exception) as e_save:
                 logger.error(
                     f"BSM: Critical error saving player data to global DB: {e_save}",
@@ -272,9 +417,77 @@ class PlayerMixin:
                     }
                 )
 
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"BSM: Player discovery scanned {len(server_timings)} log(s) with "
+            f"{workers or 'no'} worker process(es) in {elapsed:.2f}s."
+        )
         return {
             "total_entries_in_logs": len(all_discovered_from_logs),
             "unique_players_submitted_for_saving": len(unique_players_to_save_map),
-            "actually_saved_or_updated_in_db": saved_count,
+            "actually_saved_or_updated_in_db": save_counts["inserted"]
+            + save_counts["updated"],
+            "inserted_in_db": save_counts["inserted"],
+            "updated_in_db": save_counts["updated"],
             "scan_errors": scan_errors_details,
+            "server_timings": server_timings,
+            "workers": workers,
+            "elapsed_sec": round(elapsed, 3),
         }
+
+    def _get_player_discovery_workers(self, job_count: int) -> int:
+        """Returns the number of worker processes to scan `job_count` logs with.
+
+        Returns ``0`` (scan in this process) when a pool would not help.
+        """
+        configured = self.settings.get("server_monitoring.player_discovery_workers", 0)
+        try:
+            configured = int(configured)
+        except (TypeError, ValueError):
+            configured = 0
+        if configured <= 0:
+            configured = os.cpu_count() or 1
+        workers = min(configured, job_count)
+        return workers if workers > 1 else 0
+
+    def _run_player_log_scans(
+        self, log_jobs: List[Tuple[str, str]], workers: int
+    ) -> Iterator[Tuple[str, Any]]:
+        """Parses server logs, in a process pool if `workers` is non-zero.
+
+        Yields:
+            Tuple[str, Any]: The server name and either the result of
+            :func:`_scan_server_log_for_players` or the exception it raised.
+        """
+        if workers:
+            try:
+                # "spawn" avoids forking a process that runs other threads
+                # (the web server, the server monitor).
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as pool:
+                    futures = {
+                        pool.submit(_scan_server_log_for_players, log_path): name
+                        for name, log_path in log_jobs
+                    }
+                    results = []
+                    for future in as_completed(futures):
+                        try:
+                            results.append((futures[future], future.result()))
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as e:
+                            results.append((futures[future], e))
+                yield from results
+                return
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(
+                    f"BSM: Could not scan logs in worker processes ({e}); scanning in this process."
+                )
+
+        for name, log_path in log_jobs:
+            try:
+                yield name, _scan_server_log_for_players(log_path)
+            except Exception as e:
+                yield name, e
@@ -0,0 +1,367 @@
+# bedrock_server_manager/core/player_sessions.py
+"""Tracks which players are online on which server and records their sessions.
+
+The :class:`PlayerSessionTracker` consumes the player events parsed from the
+server logs by
+:meth:`~.core.server.player_mixin.ServerPlayerMixin.scan_log_for_player_events`
+and:
+
+    - Maintains an in-memory index of the players currently online on each
+      server, answering "who is online right now on which server" without
+      touching the database or the server.
+    - Persists every session (XUID, server, join time, leave time) in the
+      ``player_sessions`` table (:class:`~.db.models.PlayerSession`), whose
+      indexes support per-player and per-server time-range queries.
+    - Triggers the ``player_join`` and ``player_leave`` plugin events.
+
+Open sessions (without a leave time) are reloaded into the index on startup,
+so players stay online across application restarts while their server keeps
+running. When a server stops, crashes, or the log shows that it was started
+again, all of its open sessions are closed.
+"""
+
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ..db.models import PlayerSession
+
+if TYPE_CHECKING:
+    from ..context import AppContext
+
+logger = logging.getLogger(__name__)
+
+PLAYER_EVENT_NOTIFY_MAX_AGE_SEC: float = 300.0
+"""Player events older than this are recorded but don't trigger plugin events.
+
+This keeps plugins from being flooded with historical joins and leaves when
+a server log is scanned for the first time."""
+
+_LOG_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _parse_log_timestamp(timestamp: Optional[str]) -> datetime:
+    """Converts a server log timestamp (local time) to an aware UTC datetime.
+
+    Args:
+        timestamp (Optional[str]): A ``"YYYY-MM-DD HH:MM:SS"`` string, or
+            ``None`` to use the current time.
+
+    Returns:
+        datetime: The timestamp in UTC.
+    """
+    if timestamp:
+        try:
+            return (
+                datetime.strptime(timestamp, _LOG_TIMESTAMP_FORMAT)
+                .astimezone()
+                .astimezone(timezone.utc)
+            )
+        except ValueError:
+            pass
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treats naive datetimes read back from the database as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class PlayerSessionTracker:
+    """Keeps the online-player index and the session history up to date.
+
+    An entry of the online index is a dictionary with the keys ``"name"``,
+    ``"xuid"``, ``"server_name"``, ``"joined_at"`` (ISO 8601, UTC) and
+    ``"session_id"`` (the id of the open ``player_sessions`` row).
+    """
+
+    def __init__(self, app_context: "AppContext") -> None:
+        """Initializes the tracker and reloads open sessions from the database.
+
+        Args:
+            app_context (AppContext): The application context, used for the
+                database and the plugin manager.
+        """
+        self.app_context = app_context
+        self._online: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._lock = threading.RLock()
+        self._load_open_sessions()
+
+    def _load_open_sessions(self) -> None:
+        """Rebuilds the online index from sessions that have no leave time."""
+        try:
+            with self.app_context.db.session_manager() as db:
+                open_sessions = (
+                    db.query(PlayerSession)
+                    .filter(PlayerSession.leave_time.is_(None))
+                    .all()
+                )
+                for session in open_sessions:
+                    self._online.setdefault(session.server_name, {})[session.xuid] = (
+                        self._index_entry(session)
+                    )
+        except Exception as e:
+            logger.error(f"Could not load open player sessions: {e}", exc_info=True)
+
+    @staticmethod
+    def _index_entry(session: PlayerSession) -> Dict[str, Any]:
+        """Builds an online index entry from an open session row."""
+        return {
+            "name": session.player_name,
+            "xuid": session.xuid,
+            "server_name": session.server_name,
+            "joined_at": _as_utc(session.join_time).isoformat(),
+            "session_id": session.id,
+        }
+
+    def _notify(
+        self, event: str, server_name: str, player: Dict[str, Any], at: datetime
+    ) -> None:
+        """Triggers a player plugin event unless the event is historical."""
+        age = (datetime.now(timezone.utc) - at).total_seconds()
+        if age > PLAYER_EVENT_NOTIFY_MAX_AGE_SEC:
+            return
+        try:
+            self.app_context.plugin_manager.trigger_guarded_event(
+                event,
+                server_name=server_name,
+                player_name=player["name"],
+                xuid=player["xuid"],
+                timestamp=at.isoformat(),
+            )
+        except Exception as e:
+            logger.error(
+                f"Error triggering '{event}' for '{player['xuid']}' on '{server_name}': {e}",
+                exc_info=True,
+            )
+
+    def process_events(
+        self, server_name: str, events: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Applies player events parsed from a server's log.
+
+        Args:
+            server_name (str): The name of the server the events belong to.
+            events (List[Dict[str, Any]]): Events as returned by
+                :meth:`~.core.server.player_mixin.ServerPlayerMixin.scan_log_for_player_events`.
+
+        Returns:
+            List[Dict[str, Any]]: The resulting joins and leaves, each with the
+            keys ``"event"`` (``"player_join"`` or ``"player_leave"``),
+            ``"name"``, ``"xuid"`` and ``"timestamp"`` (ISO 8601, UTC).
+        """
+        if not events:
+            return []
+
+        changes: List[Dict[str, Any]] = []
+        with self._lock, self.app_context.db.session_manager() as db:
+            online = self._online.setdefault(server_name, {})
+            for event in events:
+                at = _parse_log_timestamp(event.get("timestamp"))
+                kind = event.get("event")
+                if kind == "server_started":
+                    for xuid in list(online):
+                        changes.append(self._close(db, online, xuid, at))
+                elif kind == "connected":
+                    if event["xuid"] in online:
+                        # The disconnect was missed; end the previous session.
+                        changes.append(self._close(db, online, event["xuid"], at))
+                    changes.append(
+                        self._open(
+                            db, server_name, online, event["name"], event["xuid"], at
+                        )
+                    )
+                elif kind == "disconnected":
+                    if event["xuid"] in online:
+                        changes.append(self._close(db, online, event["xuid"], at))
+                    else:
+                        changes.append(
+                            {
+                                "event": "player_leave",
+                                "name": event["name"],
+                                "xuid": event["xuid"],
+                                "timestamp": at.isoformat(),
+                            }
+                        )
+            db.commit()
+            # Session ids are only known after the flush.
+            for entry in online.values():
+                if entry["session_id"] is None and "_row" in entry:
+                    entry["session_id"] = entry.pop("_row").id
+
+        for change in changes:
+            self._notify(
+                change["event"],
+                server_name,
+                change,
+                datetime.fromisoformat(change["timestamp"]),
+            )
+        return changes
+
+    def _open(
+        self,
+        db: Any,
+        server_name: str,
+        online: Dict[str, Dict[str, Any]],
+        name: str,
+        xuid: str,
+        at: datetime,
+    ) -> Dict[str, Any]:
+        """Opens a session and adds the player to the online index."""
+        row = PlayerSession(
+            xuid=xuid, player_name=name, server_name=server_name, join_time=at
+        )
+        db.add(row)
+        online[xuid] = {
+            "name": name,
+            "xuid": xuid,
+            "server_name": server_name,
+            "joined_at": at.isoformat(),
+            "session_id": None,
+            "_row": row,
+        }
+        return {
+            "event": "player_join",
+            "name": name,
+            "xuid": xuid,
+            "timestamp": at.isoformat(),
+        }
+
+    def _close(
+        self, db: Any, online: Dict[str, Dict[str, Any]], xuid: str, at: datetime
+    ) -> Dict[str, Any]:
+        """Closes a player's open session and removes them from the online index."""
+        entry = online.pop(xuid)
+        row = entry.get("_row")
+        if row is None and entry.get("session_id") is not None:
+            row = db.get(PlayerSession, entry["session_id"])
+        if row is not None:
+            row.leave_time = max(at, _as_utc(row.join_time))
+        return {
+            "event": "player_leave",
+            "name": entry["name"],
+            "xuid": xuid,
+            "timestamp": at.isoformat(),
+        }
+
+    def end_all_sessions(
+        self, server_name: str, at: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Closes every open session of a server, e.g. because it stopped.
+
+        Args:
+            server_name (str): The name of the server.
+            at (Optional[datetime], optional): The leave time. Defaults to now.
+
+        Returns:
+            List[Dict[str, Any]]: The resulting ``"player_leave"`` changes.
+        """
+        with self._lock:
+            if not self._online.get(server_name):
+                return []
+            events = [
+                {
+                    "event": "disconnected",
+                    "name": entry["name"],
+                    "xuid": xuid,
+                    "timestamp": None,
+                }
+                for xuid, entry in self._online[server_name].items()
+            ]
+        if at is not None:
+            local = at.astimezone().strftime(_LOG_TIMESTAMP_FORMAT)
+            for event in events:
+                event["timestamp"] = local
+        return self.process_events(server_name, events)
+
+    def get_online_players(
+        self, server_name: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Returns the players currently online.
+
+        Args:
+            server_name (Optional[str], optional): Only return players of this
+                server. Defaults to ``None`` (all servers).
+
+        Returns:
+            List[Dict[str, Any]]: Online index entries, sorted by server name
+            and join time.
+        """
+        with self._lock:
+            if server_name is not None:
+                entries = list(self._online.get(server_name, {}).values())
+            else:
+                entries = [
+                    entry
+                    for players in self._online.values()
+                    for entry in players.values()
+                ]
+            result = [
+                {key: value for key, value in entry.items() if key != "_row"}
+                for entry in entries
+            ]
+        result.sort(key=lambda e: (e["server_name"], e["joined_at"]))
+        return result
+
+    def get_sessions(
+        self,
+        xuid: Optional[str] = None,
+        server_name: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Queries the recorded sessions, most recent first.
+
+        A session matches the time range if it overlaps it, i.e. it started
+        before `end` and had not ended before `start`.
+
+        Args:
+            xuid (Optional[str], optional): Only sessions of this player.
+            server_name (Optional[str], optional): Only sessions on this server.
+            start (Optional[datetime], optional): Start of the time range.
+            end (Optional[datetime], optional): End of the time range.
+            limit (int, optional): The maximum number of sessions to return.
+                Defaults to 100.
+
+        Returns:
+            List[Dict[str, Any]]: Sessions with the keys ``"id"``, ``"xuid"``,
+            ``"name"``, ``"server_name"``, ``"join_time"``, ``"leave_time"``
+            (ISO 8601, UTC; ``None`` while online) and ``"duration_sec"``
+            (up to now for open sessions).
+        """
+        with self.app_context.db.session_manager() as db:
+            query = db.query(PlayerSession)
+            if xuid is not None:
+                query = query.filter(PlayerSession.xuid == xuid)
+            if server_name is not None:
+                query = query.filter(PlayerSession.server_name == server_name)
+            if end is not None:
+                query = query.filter(PlayerSession.join_time < end)
+            if start is not None:
+                query = query.filter(
+                    (PlayerSession.leave_time.is_(None))
+                    | (PlayerSession.leave_time >= start)
+                )
+            rows = query.order_by(PlayerSession.join_time.desc()).limit(limit).all()
+
+            now = datetime.now(timezone.utc)
+            sessions = []
+            for row in rows:
+                join_time = _as_utc(row.join_time)
+                leave_time = _as_utc(row.leave_time) if row.leave_time else None
+                sessions.append(
+                    {
+                        "id": row.id,
+                        "xuid": row.xuid,
+                        "name": row.player_name,
+                        "server_name": row.server_name,
+                        "join_time": join_time.isoformat(),
+                        "leave_time": leave_time.isoformat() if leave_time else None,
+                        "duration_sec": int(
+                            ((leave_time or now) - join_time).total_seconds()
+                        ),
+                    }
+                )
+            return sessions
@@ -0,0 +1,447 @@
+# bedrock_server_manager/core/resource_history.py
+"""Records the resource usage of running servers as an on-disk time series.
+
+:class:`~.core.system.base.ResourceMonitor` only keeps the previous CPU
+reading of each process, so nothing older than the current sample is known.
+This module keeps a history of it, per server, for charts:
+
+    - Each sample holds a timestamp, the CPU usage, the memory (RSS) usage,
+      the player count and the status ping latency of the server.
+    - Samples are averaged into fixed-width buckets of several resolutions
+      (:data:`DEFAULT_TIERS`: 5 seconds kept for 24 hours, 1 minute kept for
+      30 days). Each resolution is stored in its own :class:`RingBufferFile`,
+      a file of fixed-size binary records that overwrites its oldest record
+      once full, so the history never grows beyond a known size.
+    - A range is read with a binary search on the record timestamps followed
+      by one contiguous read, without loading the rest of the file.
+
+Key Components:
+
+    - :class:`RingBufferFile`: A fixed-capacity file of time-ordered records.
+    - :class:`ServerResourceHistory`: The history of one server.
+    - :class:`ResourceHistoryRecorder`: A background thread sampling all
+      running servers into their histories.
+"""
+
+import os
+import math
+import time
+import struct
+import logging
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from ..context import AppContext
+
+logger = logging.getLogger(__name__)
+
+HISTORY_DIRNAME = "resource_history"
+"""Name of the directory, in a server's config directory, holding its history."""
+
+FIELDS: Tuple[str, ...] = ("cpu_percent", "memory_mb", "player_count", "latency_ms")
+"""The sampled values, in record order (after the timestamp)."""
+
+DEFAULT_SAMPLE_INTERVAL_SEC: float = 5.0
+"""The default number of seconds between two samples of a server."""
+
+_RECORD = struct.Struct("<d" + "f" * len(FIELDS))
+_HEADER = struct.Struct("<4sHHIII")
+_MAGIC = b"BSMH"
+_VERSION = 1
+
+
+class Tier(NamedTuple):
+    """A resolution at which the history is kept.
+
+    Attributes:
+        name (str): The name of the tier, used as its file name.
+        resolution_sec (int): The width of one bucket, in seconds.
+        retention_sec (int): How far back the tier reaches, in seconds.
+    """
+
+    name: str
+    resolution_sec: int
+    retention_sec: int
+
+    @property
+    def capacity(self) -> int:
+        """int: The number of records the tier holds."""
+        return max(1, self.retention_sec // self.resolution_sec)
+
+
+DEFAULT_TIERS: Tuple[Tier, ...] = (
+    Tier("5s", 5, 24 * 60 * 60),
+    Tier("1m", 60, 30 * 24 * 60 * 60),
+)
+"""The default tiers, from the finest to the coarsest."""
+
+
+class RingBufferFile:
+    """A file holding up to `capacity` fixed-size, time-ordered records.
+
+    The file starts with a small header (magic, version, record size,
+    capacity, next slot and record count) followed by `capacity` record
+    slots. Records must be appended in increasing timestamp order; once the
+    file is full, each append overwrites the oldest record. A file whose
+    header does not match the expected layout is recreated empty.
+
+    Attributes:
+        path (str): The path of the file.
+        capacity (int): The maximum number of records.
+    """
+
+    def __init__(self, path: str, capacity: int) -> None:
+        """Opens the file at `path`, creating it if necessary.
+
+        Raises:
+            OSError: If the file cannot be created or opened.
+        """
+        self.path = path
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._head = 0
+        self._count = 0
+
+        if os.path.isfile(path):
+            self._file = open(path, "r+b")
+            if not self._read_header():
+                logger.warning(f"Recreating invalid resource history file '{path}'.")
+                self._file.truncate(0)
+                self._write_header()
+        else:
+            self._file = open(path, "w+b")
+            self._write_header()
+
+    def _read_header(self) -> bool:
+        """Loads the header, returning ``False`` if it does not match this layout."""
+        self._file.seek(0)
+        data = self._file.read(_HEADER.size)
+        if len(data) != _HEADER.size:
+            return False
+        magic, version, record_size, capacity, head, count = _HEADER.unpack(data)
+        if (
+            magic != _MAGIC
+            or version != _VERSION
+            or record_size != _RECORD.size
+            or capacity != self.capacity
+            or head >= capacity
+            or count > capacity
+        ):
+            return False
+        self._head, self._count = head, count
+        return True
+
+    def _write_header(self) -> None:
+        self._file.seek(0)
+        self._file.write(
+            _HEADER.pack(
+                _MAGIC, _VERSION, _RECORD.size, self.capacity, self._head, self._count
+            )
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _offset(self, index: int) -> int:
+        """Returns the file offset of the record at logical `index` (0 = oldest)."""
+        slot = (self._head - self._count + index) % self.capacity
+        return _HEADER.size + slot * _RECORD.size
+
+    def _timestamp_at(self, index: int) -> float:
+        self._file.seek(self._offset(index))
+        return struct.unpack("<d", self._file.read(8))[0]
+
+    def _bisect(self, timestamp: float, right: bool) -> int:
+        """Returns the first logical index whose timestamp is >= (or >) `timestamp`."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            ts = self._timestamp_at(mid)
+            if ts < timestamp or (right and ts == timestamp):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def append(self, record: Sequence[float]) -> None:
+        """Appends a record: a timestamp followed by one value per field."""
+        data = _RECORD.pack(*record)
+        with self._lock:
+            self._file.seek(_HEADER.size + self._head * _RECORD.size)
+            self._file.write(data)
+            self._head = (self._head + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+            self._write_header()
+            self._file.flush()
+
+    def last_timestamp(self) -> Optional[float]:
+        """Returns the timestamp of the newest record, if any."""
+        with self._lock:
+            if not self._count:
+                return None
+            return self._timestamp_at(self._count - 1)
+
+    def read_range(self, start: float, end: float) -> List[Tuple[float, ...]]:
+        """Returns the records with ``start <= timestamp <= end``, oldest first."""
+        with self._lock:
+            lo = self._bisect(start, right=False)
+            hi = self._bisect(end, right=True)
+            if lo >= hi:
+                return []
+            # The records are contiguous in the file, or wrap around once.
+            first_slot = (self._head - self._count + lo) % self.capacity
+            first_len = min(hi - lo, self.capacity - first_slot)
+            self._file.seek(self._offset(lo))
+            data = self._file.read(first_len * _RECORD.size)
+            if first_len < hi - lo:
+                self._file.seek(_HEADER.size)
+                data += self._file.read((hi - lo - first_len) * _RECORD.size)
+        return list(_RECORD.iter_unpack(data))
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class ServerResourceHistory:
+    """The resource usage history of one server, kept at several resolutions.
+
+    Each tier averages the samples falling into its current bucket and
+    appends the average once a sample for a later bucket arrives. Values that
+    were not measured (e.g. the latency of a server that has not been pinged)
+    are stored as NaN and returned as ``None``.
+
+    Attributes:
+        directory (str): The directory holding one file per tier.
+        tiers (Tuple[Tier, ...]): The tiers, from the finest to the coarsest.
+    """
+
+    def __init__(self, directory: str, tiers: Sequence[Tier] = DEFAULT_TIERS) -> None:
+        """Opens (or creates) the history files in `directory`.
+
+        Raises:
+            OSError: If the directory or a file cannot be created.
+        """
+        self.directory = directory
+        self.tiers = tuple(sorted(tiers, key=lambda tier: tier.resolution_sec))
+        os.makedirs(directory, exist_ok=True)
+        self._files = {
+            tier.name: RingBufferFile(
+                os.path.join(directory, f"{tier.name}.ring"), tier.capacity
+            )
+            for tier in self.tiers
+        }
+        # Per tier: [bucket, sums, counts] of the bucket being filled.
+        self._pending: Dict[str, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, values: Dict[str, Any], timestamp: Optional[float] = None) -> None:
+        """Adds one sample.
+
+        Args:
+            values (Dict[str, Any]): The sampled values, keyed by the names in
+                :data:`FIELDS`. Missing or ``None`` values are not averaged.
+            timestamp (Optional[float]): The time of the sample. Defaults to now.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        sample = []
+        for field in FIELDS:
+            value = values.get(field)
+            sample.append(math.nan if value is None else float(value))
+
+        with self._lock:
+            for tier in self.tiers:
+                bucket = int(timestamp // tier.resolution_sec)
+                pending = self._pending.get(tier.name)
+                if pending is not None and pending[0] != bucket:
+                    self._flush(tier, pending)
+                    pending = None
+                if pending is None:
+                    pending = [bucket, [0.0] * len(FIELDS), [0] * len(FIELDS)]
+                    self._pending[tier.name] = pending
+                for i, value in enumerate(sample):
+                    if not math.isnan(value):
+                        pending[1][i] += value
+                        pending[2][i] += 1
+
+    def _flush(self, tier: Tier, pending: List[Any]) -> None:
+        """Appends the average of a finished bucket to the tier's file."""
+        bucket, sums, counts = pending
+        ring = self._files[tier.name]
+        bucket_start = float(bucket * tier.resolution_sec)
+        last = ring.last_timestamp()
+        if last is not None and bucket_start <= last:
+            return  # The clock went backwards; keep the file ordered.
+        averages = [
+            total / count if count else math.nan for total, count in zip(sums, counts)
+        ]
+        try:
+            ring.append([bucket_start, *averages])
+        except OSError as e:
+            logger.warning(f"Could not write resource history to '{ring.path}': {e}")
+
+    def select_tier(self, start: float, resolution_sec: Optional[float] = None) -> Tier:
+        """Returns the tier to read a range starting at `start` from.
+
+        This is the finest tier that still reaches back to `start` and is not
+        finer than `resolution_sec`, or the coarsest tier if none does.
+        """
+        now = time.time()
+        for tier in self.tiers:
+            if resolution_sec is not None and tier.resolution_sec < resolution_sec:
+                continue
+            if now - tier.retention_sec <= start:
+                return tier
+        return self.tiers[-1]
+
+    def query(
+        self,
+        start: float,
+        end: Optional[float] = None,
+        resolution_sec: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Returns the samples between `start` and `end`.
+
+        Args:
+            start (float): The start of the range, as a Unix timestamp.
+            end (Optional[float]): The end of the range. Defaults to now.
+            resolution_sec (Optional[float]): The minimum spacing of the
+                returned points. Defaults to the finest tier covering `start`.
+
+        Returns:
+            Dict[str, Any]: ``"resolution_sec"`` (int), ``"fields"`` (the
+            column names, starting with ``"timestamp"``) and ``"points"``
+            (a list of rows, oldest first).
+        """
+        end = time.time() if end is None else end
+        tier = self.select_tier(start, resolution_sec)
+        records = self._files[tier.name].read_range(start, end)
+        points = [
+            [record[0]]
+            + [None if math.isnan(value) else round(value, 2) for value in record[1:]]
+            for record in records
+        ]
+        return {
+            "resolution_sec": tier.resolution_sec,
+            "fields": ["timestamp", *FIELDS],
+            "points": points,
+        }
+
+    def close(self) -> None:
+        """Writes the buckets being filled and closes the files."""
+        with self._lock:
+            for tier in self.tiers:
+                pending = self._pending.pop(tier.name, None)
+                if pending is not None:
+                    self._flush(tier, pending)
+            for ring in self._files.values():
+                ring.close()
+
+
+class ResourceHistoryRecorder:
+    """Samples every server monitored by the process manager into its history.
+
+    Attributes:
+        interval_sec (float): The number of seconds between two samples.
+    """
+
+    def __init__(
+        self,
+        app_context: "AppContext",
+        interval_sec: float = DEFAULT_SAMPLE_INTERVAL_SEC,
+    ) -> None:
+        """Initializes the recorder. Call :meth:`start` to start recording.
+
+        Args:
+            app_context (AppContext): The application context, used to look
+                up the running servers.
+            interval_sec (float, optional): The number of seconds between two
+                samples. Defaults to :const:`DEFAULT_SAMPLE_INTERVAL_SEC`.
+        """
+        self.app_context = app_context
+        self.interval_sec = interval_sec
+        self._histories: Dict[str, ServerResourceHistory] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def get_history(self, server_name: str) -> ServerResourceHistory:
+        """Returns the history of a server, opening it on first use.
+
+        Raises:
+            OSError: If the history files cannot be opened.
+        """
+        with self._lock:
+            history = self._histories.get(server_name)
+            if history is None:
+                server = self.app_context.get_server(server_name)
+                history = ServerResourceHistory(
+                    os.path.join(server.server_config_dir, HISTORY_DIRNAME)
+                )
+                self._histories[server_name] = history
+            return history
+
+    def sample_now(self) -> None:
+        """Records one sample of every running, monitored server.
+
+        The process info comes from the shared
+        :class:`~.core.resource_sampler.ServerResourceSampler`, so recording
+        does not add a second CPU measurement window next to the one of the
+        monitor pages (see :meth:`.ServerResourceSampler.get_latest`).
+        """
+        sampler = self.app_context.resource_sampler
+        servers = list(self.app_context.bedrock_process_manager.servers.items())
+        for server_name, server in servers:
+            try:
+                info = sampler.get_latest(server_name)
+                if info is None:
+                    continue
+                self.get_history(server_name).record(
+                    {
+                        "cpu_percent": info.get("cpu_percent"),
+                        "memory_mb": info.get("memory_mb"),
+                        "player_count": server.player_count,
+                        "latency_ms": getattr(server, "ping_latency_ms", None),
+                    }
+                )
+            except Exception as e:
+                logger.debug(f"Could not record resource usage of '{server_name}': {e}")
+
+    def _run(self) -> None:
+        logger.debug("Resource history recorder started.")
+        while not self._stop.wait(timeout=self.interval_sec):
+            self.sample_now()
+        logger.debug("Resource history recorder stopped.")
+
+    def start(self) -> None:
+        """Starts the recording thread, if it is not running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="ResourceHistoryRecorder", daemon=True
+            )
+            self._thread.start()
+
+    def shutdown(self) -> None:
+        """Stops the recording thread and closes all histories."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5)
+        with self._lock:
+            for history in self._histories.values():
+                history.close()
+            self._histories.clear()
+            self._thread = None
@@ -0,0 +1,242 @@
+# bedrock_server_manager/core/resource_sampler.py
+"""Provides a shared, subscription-based sampler of server resource usage.
+
+Every open monitor page used to poll the process info of its server on its
+own, so N viewers of a server meant N process lookups (and N very short CPU
+measurement windows, which made the reported CPU usage jumpy). The
+:class:`ServerResourceSampler` instead samples each *subscribed* server once
+per interval on a single background thread and keeps the latest sample in
+memory, where any number of readers can pick it up.
+
+Servers are sampled either because something subscribed to them (the
+Server-Sent Events stream of a monitor page) or because their process info was
+recently requested through :meth:`ServerResourceSampler.get_latest` (the
+``/api/server/{server_name}/process_info`` route). A request keeps its server
+in the sampling pass for :const:`DEFAULT_POLL_LEASE_SEC` seconds, so polling
+clients are answered from the latest sample instead of each triggering a
+process lookup of their own.
+
+The sampling thread only runs while at least one server is subscribed or
+polled and exits on its own once there are none left.
+"""
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ..context import AppContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_INTERVAL_SEC: float = 2.0
+"""The default number of seconds between two samples of the same server."""
+
+DEFAULT_POLL_LEASE_SEC: float = 30.0
+"""The default number of seconds a server keeps being sampled after it was polled."""
+
+
+class ServerResourceSampler:
+    """Samples process info of subscribed and polled servers on one shared thread.
+
+    Each sample is the result of
+    :meth:`~.core.server.process_mixin.ServerProcessMixin.get_process_info`
+    (``None`` if the server is not running) and is stored together with a
+    per-server sequence number that is incremented with every new sample, so
+    readers can tell whether they have already seen it.
+
+    Attributes:
+        interval_sec (float): The number of seconds between two samples.
+    """
+
+    def __init__(
+        self,
+        app_context: "AppContext",
+        interval_sec: float = DEFAULT_SAMPLE_INTERVAL_SEC,
+        poll_lease_sec: float = DEFAULT_POLL_LEASE_SEC,
+    ) -> None:
+        """Initializes the sampler. No thread is started until a subscription.
+
+        Args:
+            app_context (AppContext): The application context, used to look
+                up server instances.
+            interval_sec (float, optional): The number of seconds between two
+                samples. Defaults to :const:`DEFAULT_SAMPLE_INTERVAL_SEC`.
+            poll_lease_sec (float, optional): How long a server keeps being
+                sampled after its last :meth:`.get_latest` call. Defaults to
+                :const:`DEFAULT_POLL_LEASE_SEC`.
+        """
+        self.app_context = app_context
+        self.interval_sec = interval_sec
+        self.poll_lease_sec = poll_lease_sec
+        self._subscribers: Dict[str, int] = {}
+        # Monotonic time of the last get_latest() call of each polled server.
+        self._polled: Dict[str, float] = {}
+        self._samples: Dict[str, Tuple[int, Optional[Dict[str, Any]], float]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._shutdown = False
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, server_name: str) -> None:
+        """Registers interest in the resource usage of a server.
+
+        Starts the sampling thread if it is not running. Every call must be
+        paired with a call to :meth:`.unsubscribe`.
+
+        Args:
+            server_name (str): The name of the server.
+        """
+        with self._lock:
+            self._subscribers[server_name] = self._subscribers.get(server_name, 0) + 1
+            if not self._ensure_thread():
+                # Sample a newly subscribed server right away.
+                self._wakeup.set()
+
+    def _ensure_thread(self) -> bool:
+        """Starts the sampling thread if it is not running. Requires the lock.
+
+        Returns:
+            bool: ``True`` if the thread was started by this call.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return False
+        self._shutdown = False
+        self._thread = threading.Thread(
+            target=self._run, name="ServerResourceSampler", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def unsubscribe(self, server_name: str) -> None:
+        """Withdraws interest in the resource usage of a server.
+
+        Args:
+            server_name (str): The name of the server.
+        """
+        with self._lock:
+            count = self._subscribers.get(server_name, 0) - 1
+            if count > 0:
+                self._subscribers[server_name] = count
+            else:
+                self._subscribers.pop(server_name, None)
+                if server_name not in self._polled:
+                    self._samples.pop(server_name, None)
+
+    def subscriber_count(self, server_name: str) -> int:
+        """Returns the number of subscribers of a server.
+
+        Args:
+            server_name (str): The name of the server.
+
+        Returns:
+            int: The number of active subscriptions.
+        """
+        with self._lock:
+            return self._subscribers.get(server_name, 0)
+
+    def get_sample(self, server_name: str) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Returns the latest sample of a server.
+
+        Args:
+            server_name (str): The name of the server.
+
+        Returns:
+            Tuple[int, Optional[Dict[str, Any]]]: The sequence number of the
+            sample (``0`` if the server has not been sampled yet) and the
+            process info, or ``None`` if the server is not running.
+        """
+        with self._lock:
+            seq, info, _ = self._samples.get(server_name, (0, None, 0.0))
+            return seq, info
+
+    def get_latest(self, server_name: str) -> Optional[Dict[str, Any]]:
+        """Returns recent process info of a server, sampling it if necessary.
+
+        The latest sample is returned if it is at most one interval old;
+        otherwise the server is sampled right away. Either way, the server is
+        included in the sampling pass for the next :attr:`poll_lease_sec`
+        seconds, so that repeated calls are answered from memory.
+
+        Args:
+            server_name (str): The name of the server.
+
+        Returns:
+            Optional[Dict[str, Any]]: The process info, or ``None`` if the
+            server is not running.
+        """
+        with self._lock:
+            self._polled[server_name] = time.monotonic()
+            _, info, sampled_at = self._samples.get(server_name, (0, None, 0.0))
+            fresh = 0 <= time.time() - sampled_at <= self.interval_sec
+            self._ensure_thread()
+        if fresh:
+            return info
+        return self._sample_server(server_name)
+
+    def _is_sampled(self, server_name: str, now: float) -> bool:
+        """Checks whether a server is subscribed or polled. Requires the lock."""
+        if server_name in self._subscribers:
+            return True
+        polled_at = self._polled.get(server_name)
+        return polled_at is not None and now - polled_at <= self.poll_lease_sec
+
+    def _expire_polls(self) -> None:
+        """Drops expired poll leases and their samples. Requires the lock."""
+        now = time.monotonic()
+        for server_name, polled_at in list(self._polled.items()):
+            if now - polled_at > self.poll_lease_sec:
+                del self._polled[server_name]
+                if server_name not in self._subscribers:
+                    self._samples.pop(server_name, None)
+
+    def _sample_server(self, server_name: str) -> Optional[Dict[str, Any]]:
+        """Samples one server and stores the result, if it is still sampled."""
+        try:
+            info = self.app_context.get_server(server_name).get_process_info()
+        except Exception as e:
+            logger.debug(f"Could not sample resource usage of '{server_name}': {e}")
+            info = None
+
+        with self._lock:
+            # The last subscriber may have left while sampling.
+            if self._is_sampled(server_name, time.monotonic()):
+                seq = self._samples.get(server_name, (0, None, 0.0))[0]
+                self._samples[server_name] = (seq + 1, info, time.time())
+        return info
+
+    def sample_now(self) -> None:
+        """Samples every subscribed or polled server once."""
+        with self._lock:
+            self._expire_polls()
+            server_names = list(dict.fromkeys([*self._subscribers, *self._polled]))
+
+        for server_name in server_names:
+            self._sample_server(server_name)
+
+    def _run(self) -> None:
+        """The sampling loop. Exits when no server is subscribed or polled."""
+        logger.debug("Resource sampler thread started.")
+        while True:
+            with self._lock:
+                self._expire_polls()
+                if self._shutdown or not (self._subscribers or self._polled):
+                    self._thread = None
+                    break
+            self.sample_now()
+            self._wakeup.wait(timeout=self.interval_sec)
+            self._wakeup.clear()
+        logger.debug("Resource sampler thread stopped.")
+
+    def shutdown(self) -> None:
+        """Stops the sampling thread and drops all subscriptions."""
+        with self._lock:
+            self._shutdown = True
+            self._subscribers.clear()
+            self._polled.clear()
+            self._samples.clear()
+            thread = self._thread
+        self._wakeup.set()
+        if thread is not None:
+            thread.join(timeout=5)
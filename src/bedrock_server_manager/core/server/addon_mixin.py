@@ -31,6 +31,7 @@ from typing import Tuple, List, Dict, Optional, Any
 
 # Local application imports.
 from .base_server_mixin import BedrockServerBaseMixin
+from ..world_archive import extract_archive, make_staging_directory, replace_directory
 from ...error import (
     MissingArgumentError,
     FileOperationError,
@@ -172,8 +173,8 @@ class ServerAddonMixin(BedrockServerBaseMixin):
                 self.logger.info(
                     f"Extracting '{os.path.basename(mcaddon_file_path)}' to temp dir..."
                 )
-                with zipfile.ZipFile(mcaddon_file_path, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
+                _level, workers = self._get_world_archive_options()
+                extract_archive(mcaddon_file_path, temp_dir, workers)
                 self.logger.debug(
                     f"Successfully extracted '{os.path.basename(mcaddon_file_path)}'."
                 )
@@ -328,8 +329,8 @@ class ServerAddonMixin(BedrockServerBaseMixin):
         try:
             try:
                 self.logger.info(f"Extracting '{mcpack_filename}' to temp dir...")
-                with zipfile.ZipFile(mcpack_file_path, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
+                _level, workers = self._get_world_archive_options()
+                extract_archive(mcpack_file_path, temp_dir, workers)
                 self.logger.debug(f"Successfully extracted '{mcpack_filename}'.")
             except zipfile.BadZipFile as e:
                 raise ExtractError(
@@ -464,14 +465,19 @@ class ServerAddonMixin(BedrockServerBaseMixin):
                 f"Installing {pack_type_friendly_name} pack '{addon_name}' v{version_str} into: {target_install_path}"
             )
 
-            # Perform a clean install by removing the old version if it exists.
-            if os.path.isdir(target_install_path):
-                self.logger.debug(
-                    f"Removing existing target directory: {target_install_path}"
-                )
-                shutil.rmtree(target_install_path)
-
-            shutil.copytree(extracted_pack_dir, target_install_path)
+            # Perform a clean install: copy the pack next to the target, then
+            # swap it in place of any old version.
+            staging_dir = make_staging_directory(target_install_path)
+            try:
+                shutil.copytree(extracted_pack_dir, staging_dir, dirs_exist_ok=True)
+                if os.path.isdir(target_install_path):
+                    self.logger.debug(
+                        f"Replacing existing target directory: {target_install_path}"
+                    )
+                replace_directory(staging_dir, target_install_path)
+            finally:
+                if os.path.isdir(staging_dir):
+                    shutil.rmtree(staging_dir, ignore_errors=True)
             self.logger.debug(f"Copied pack contents to '{target_install_path}'.")
 
             # Activate the pack by adding it to the world's JSON file.
@@ -848,7 +854,8 @@ class ServerAddonMixin(BedrockServerBaseMixin):
         installed_packs = []
         for pack_dir_name in os.listdir(pack_base_dir):
             pack_full_path = os.path.join(pack_base_dir, pack_dir_name)
-            if os.path.isdir(pack_full_path):
+            # Hidden directories are staged or replaced versions of a pack.
+            if os.path.isdir(pack_full_path) and not pack_dir_name.startswith("."):
                 try:
                     _pack_type, uuid, version, name = self._extract_manifest_info(
                         pack_full_path
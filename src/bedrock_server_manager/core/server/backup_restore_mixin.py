@@ -5,9 +5,10 @@
 This mixin encapsulates all backup and restore operations for a Bedrock server
 instance. Its responsibilities include:
 
-    - Backing up the server's active world (as a ``.mcworld`` file) and key
-      configuration files (``server.properties``, ``allowlist.json``,
-      ``permissions.json``).
+    - Backing up the server's active world (as a ``.mcworld`` file, or as an
+      incremental snapshot manifest in the shared
+      :class:`~.core.backup_store.WorldBackupStore`) and key configuration
+      files (``server.properties``, ``allowlist.json``, ``permissions.json``).
     - Listing available backups for different components (world, specific configs, or all).
     - Restoring the server's active world and configuration files from the latest
       available backups.
@@ -23,10 +24,13 @@ import os
 import glob
 import re
 import shutil
-from typing import Optional, Dict, List, Union, Any
+import time
+import zipfile
+from typing import Optional, Dict, List, Union, Any, Tuple, Callable
 
 # Local application imports.
 from .base_server_mixin import BedrockServerBaseMixin
+from ..backup_store import WorldBackupStore, MANIFEST_EXTENSION, is_manifest_file
 from ...error import (
     FileOperationError,
     UserInputError,
@@ -34,9 +38,14 @@ from ...error import (
     MissingArgumentError,
     ConfigurationError,
     AppFileNotFoundError,
+    ServerNotRunningError,
 )
 from ...utils import get_timestamp
 
+# Console responses emitted by the Bedrock server for the ``save`` command family.
+_SAVE_QUERY_READY_MARKER = "Files are now ready to be copied"
+_SAVE_QUERY_POLL_INTERVAL_SEC = 1.0
+
 
 class ServerBackupMixin(BedrockServerBaseMixin):
     """Provides methods for backing up, restoring, and pruning server data.
@@ -82,6 +91,10 @@ class ServerBackupMixin(BedrockServerBaseMixin):
         # Dependencies on other mixins' methods are resolved at runtime on the
         # final BedrockServer class instance.
 
+        # Statistics of the last world backup made by this instance (see
+        # _backup_world_data_internal), or None.
+        self.last_world_backup_stats: Optional[Dict[str, Any]] = None
+
     @property
     def server_backup_directory(self) -> Optional[str]:
         """Optional[str]: The absolute path to this server's specific backup directory.
@@ -106,24 +119,54 @@ class ServerBackupMixin(BedrockServerBaseMixin):
             str(backup_base_dir), self.server_name
         )  # Ensure backup_base_dir is str
 
+    @property
+    def incremental_backups_enabled(self) -> bool:
+        """bool: Whether world backups are stored as incremental snapshots.
+
+        Controlled by the ``backup.incremental_enabled`` setting. When enabled,
+        world backups are written to the shared
+        :class:`~.core.backup_store.WorldBackupStore` as ``.manifest`` files
+        instead of full ``.mcworld`` archives.
+        """
+        return bool(self.settings.get("backup.incremental_enabled", False))
+
+    def _get_world_backup_store(self) -> WorldBackupStore:
+        """Returns the content-addressed store used for incremental world backups.
+
+        Returns:
+            WorldBackupStore: A store rooted at the global backup directory
+            (``paths.backups``), shared by all servers.
+
+        Raises:
+            ConfigurationError: If ``paths.backups`` is not configured.
+        """
+        backup_base_dir = self.settings.get("paths.backups")
+        if not backup_base_dir:
+            raise ConfigurationError(
+                f"Cannot access backup store for '{self.server_name}': Backup directory not configured."
+            )
+        return WorldBackupStore(str(backup_base_dir))
+
     @staticmethod
-    def _find_and_sort_backups(pattern: str) -> List[str]:
-        """Finds files matching a glob pattern and sorts them by modification time (newest first).
+    def _find_and_sort_backups(pattern: Union[str, List[str]]) -> List[str]:
+        """Finds files matching glob pattern(s) and sorts them by modification time (newest first).
 
         This static utility method is used to find backup files (e.g., based on
         a pattern like ``*.mcworld`` or ``server_backup_*.properties``) and sort
         them so the most recent backups appear first in the list.
 
         Args:
-            pattern (str): The glob pattern to search for files (e.g.,
-                ``/path/to/backups/MyWorld_backup_*.mcworld``).
+            pattern (Union[str, List[str]]): The glob pattern to search for files
+                (e.g., ``/path/to/backups/MyWorld_backup_*.mcworld``), or a list
+                of patterns whose matches are merged.
 
         Returns:
-            List[str]: A list of absolute file paths matching the pattern, sorted
-            by modification time in descending order (newest first). Returns an
-            empty list if no files match the pattern.
+            List[str]: A list of absolute file paths matching the pattern(s),
+            sorted by modification time in descending order (newest first).
+            Returns an empty list if no files match.
         """
-        files = glob.glob(pattern)
+        patterns = [pattern] if isinstance(pattern, str) else pattern
+        files = [f for p in patterns for f in glob.glob(p)]
         if not files:
             return []
         # Sort by modification time, descending (newest first).
@@ -139,7 +182,8 @@ class ServerBackupMixin(BedrockServerBaseMixin):
 
         Valid ``backup_type`` options (case-insensitive):
 
-            - ``"world"``: Lists ``*.mcworld`` files (world backups).
+            - ``"world"``: Lists ``*.mcworld`` files and ``*.manifest``
+              incremental snapshots (world backups).
             - ``"properties"``: Lists ``server_backup_*.properties`` files.
             - ``"allowlist"``: Lists ``allowlist_backup_*.json`` files.
             - ``"permissions"``: Lists ``permissions_backup_*.json`` files.
@@ -188,9 +232,10 @@ class ServerBackupMixin(BedrockServerBaseMixin):
 
         # Define glob patterns for each type of backup first to validate backup_type.
         patterns = {
-            "world": os.path.join(
-                server_bck_dir, "*.mcworld"
-            ),  # Standard .mcworld extension
+            "world": [
+                os.path.join(server_bck_dir, "*.mcworld"),
+                os.path.join(server_bck_dir, f"*.{MANIFEST_EXTENSION}"),
+            ],
             "properties": os.path.join(server_bck_dir, "server_backup_*.properties"),
             "allowlist": os.path.join(server_bck_dir, "allowlist_backup_*.json"),
             "permissions": os.path.join(server_bck_dir, "permissions_backup_*.json"),
@@ -239,6 +284,11 @@ class ServerBackupMixin(BedrockServerBaseMixin):
         backups than this configured number are found (sorted by modification time),
         the oldest ones are deleted until the retention count is met.
 
+        When pruning incremental world snapshots (``file_extension`` of
+        ``"manifest"``), deleting a manifest only drops the snapshot's file
+        list. The blobs that are no longer referenced by any remaining manifest
+        are then removed by :meth:`~.core.backup_store.WorldBackupStore.garbage_collect`.
+
         Args:
             component_prefix (str): The prefix part of the backup filenames to
                 target (e.g., ``MyActiveWorld_backup_`` for world backups,
@@ -256,6 +306,8 @@ class ServerBackupMixin(BedrockServerBaseMixin):
             FileOperationError: If an ``OSError`` occurs during file listing or deletion
                 (e.g., permission issues), or if not all required old backups
                 could be deleted successfully.
+            BackupRestoreError: If garbage-collecting the backup store after
+                pruning manifests fails (e.g., a manifest is unreadable).
         """
         server_bck_dir = self.server_backup_directory
         if not server_bck_dir:
@@ -344,6 +396,9 @@ class ServerBackupMixin(BedrockServerBaseMixin):
                     self.logger.info(
                         f"Successfully deleted {deleted_count} old backup(s)."
                     )
+                    if cleaned_ext == MANIFEST_EXTENSION:
+                        # Dropped snapshots may leave blobs nothing refers to.
+                        self._get_world_backup_store().garbage_collect()
 
             else:
                 self.logger.info(
@@ -355,7 +410,340 @@ class ServerBackupMixin(BedrockServerBaseMixin):
                 f"Error accessing or processing backup files for pruning for server '{self.server_name}': {e_glob}"
             ) from e_glob
 
-    def _backup_world_data_internal(self) -> str:
+    def can_hot_backup(self) -> bool:
+        """Checks if the active world can be backed up while the server keeps running.
+
+        A hot backup drives the server console (``save hold`` / ``save query`` /
+        ``save resume``), so it is only possible when this instance owns the
+        server's process handle (see
+        :meth:`~.core.server.process_mixin.ServerProcessMixin.has_process_handle`).
+
+        Returns:
+            bool: ``True`` if a hot backup can be performed, ``False`` otherwise.
+        """
+        if not hasattr(self, "has_process_handle") or not hasattr(self, "send_command"):
+            return False
+        return bool(self.has_process_handle())  # type: ignore
+
+    def _read_server_output_from(self, offset: int) -> Tuple[str, int]:
+        """Reads text appended to the server's output log since a byte offset.
+
+        Args:
+            offset (int): The byte offset to start reading from.
+
+        Returns:
+            Tuple[str, int]: The decoded text read and the new end offset. If the
+            log shrank below `offset` (e.g., it was truncated), reading restarts
+            from the beginning of the file.
+        """
+        try:
+            with open(self.server_log_path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                end = f.tell()
+                if end < offset:
+                    offset = 0
+                f.seek(offset)
+                data = f.read(end - offset)
+        except FileNotFoundError:
+            return "", 0
+        return data.decode("utf-8", errors="ignore"), offset + len(data)
+
+    @staticmethod
+    def _parse_save_query_output(output: str) -> Optional[List[Tuple[str, int]]]:
+        """Parses the file list reported by a successful ``save query`` command.
+
+        When the server is ready, it prints a line containing
+        :data:`_SAVE_QUERY_READY_MARKER` followed by a line of comma-separated
+        ``<path>:<length>`` entries, where each path is relative to the server's
+        ``worlds`` directory, for example::
+
+            Data saved. Files are now ready to be copied.
+            MyWorld/db/000005.ldb:1234, MyWorld/db/CURRENT:16, MyWorld/level.dat:2345
+
+        Args:
+            output (str): Server console output captured after ``save query``.
+
+        Returns:
+            Optional[List[Tuple[str, int]]]: A list of ``(relative_path, length)``
+            tuples, or ``None`` if the output does not contain a complete response.
+        """
+        marker_index = output.find(_SAVE_QUERY_READY_MARKER)
+        if marker_index == -1:
+            return None
+
+        # Other log lines may be interleaved, so take the first line after the
+        # marker in which every entry is a well-formed "<path>:<length>" pair.
+        for line in output[marker_index:].splitlines()[1:]:
+            files: List[Tuple[str, int]] = []
+            for entry in line.strip().split(", "):
+                path_part, sep, length_part = entry.rpartition(":")
+                if not sep or not path_part or not length_part.isdigit():
+                    files = []
+                    break
+                files.append((path_part, int(length_part)))
+            if files:
+                return files
+        # The file list has not been flushed to the log yet.
+        return None
+
+    def _write_hot_backup_archive(
+        self,
+        world_dir_name: str,
+        files: List[Tuple[str, int]],
+        target_mcworld_file_path: str,
+    ) -> None:
+        """Writes the files reported by ``save query`` into a ``.mcworld`` archive.
+
+        Each file is copied up to exactly the length reported by the server, as
+        files such as the LevelDB log may still be growing past the consistent
+        snapshot point. The archive is written to a temporary file and renamed
+        into place once complete.
+
+        Args:
+            world_dir_name (str): The name of the world directory being backed up.
+            files (List[Tuple[str, int]]): ``(relative_path, length)`` entries as
+                returned by :meth:`._parse_save_query_output`.
+            target_mcworld_file_path (str): The absolute path of the ``.mcworld``
+                file to create.
+
+        Raises:
+            BackupRestoreError: If a reported path escapes the world directory,
+                or if reading a source file or writing the archive fails.
+        """
+        worlds_dir = os.path.join(self.server_dir, "worlds")
+        world_dir = os.path.join(worlds_dir, world_dir_name)
+        temp_archive_path = target_mcworld_file_path + ".tmp"
+
+        try:
+            with zipfile.ZipFile(
+                temp_archive_path, "w", compression=zipfile.ZIP_DEFLATED
+            ) as zf:
+                for relative_path, length in files:
+                    source_path = os.path.normpath(
+                        os.path.join(worlds_dir, relative_path)
+                    )
+                    arcname = os.path.relpath(source_path, world_dir)
+                    if arcname.startswith(os.pardir):
+                        raise BackupRestoreError(
+                            f"Server reported file '{relative_path}' outside of world '{world_dir_name}'."
+                        )
+                    with (
+                        open(source_path, "rb") as src,
+                        zf.open(arcname.replace(os.sep, "/"), "w") as dst,
+                    ):
+                        remaining = length
+                        while remaining > 0:
+                            chunk = src.read(min(remaining, 1024 * 1024))
+                            if not chunk:
+                                break
+                            dst.write(chunk)
+                            remaining -= len(chunk)
+            os.replace(temp_archive_path, target_mcworld_file_path)
+        except BackupRestoreError:
+            if os.path.exists(temp_archive_path):
+                os.remove(temp_archive_path)
+            raise
+        except OSError as e:
+            if os.path.exists(temp_archive_path):
+                os.remove(temp_archive_path)
+            raise BackupRestoreError(
+                f"Failed to write hot backup archive for server '{self.server_name}', world '{world_dir_name}': {e}"
+            ) from e
+
+    def _copy_world_with_saves_held(
+        self,
+        world_dir_name: str,
+        copy_files: Callable[[List[Tuple[str, int]]], None],
+    ) -> None:
+        """Runs a copy operation against a consistent view of a running world.
+
+        This uses the Bedrock ``save`` command family:
+
+            1. ``save hold`` pauses background saving and compaction.
+            2. ``save query`` is sent repeatedly (polling the server output log)
+               until the server reports that files are ready to be copied,
+               together with the exact file list and lengths to copy.
+            3. `copy_files` is called with that list.
+            4. ``save resume`` is always sent afterwards, even on failure.
+
+        The maximum time to wait for the server is read from the
+        ``backup.hot_backup_timeout_sec`` setting (default 60 seconds).
+
+        Other console commands of this instance wait until ``save resume``
+        was sent (see :meth:`~.ServerProcessMixin.send_command_and_wait`).
+
+        Args:
+            world_dir_name (str): The name of the world directory being copied.
+            copy_files (Callable[[List[Tuple[str, int]]], None]): Called with
+                the ``(relative_path, length)`` entries reported by the server
+                (see :meth:`._parse_save_query_output`). Files must be copied
+                only up to the reported lengths.
+
+        Raises:
+            ServerNotRunningError: If this instance cannot drive the server
+                console (see :meth:`.can_hot_backup`).
+            BackupRestoreError: If the server does not report a file list before
+                the timeout.
+            SendCommandError: If sending a console command fails.
+        """
+        if not self.can_hot_backup():
+            raise ServerNotRunningError(
+                f"Cannot perform hot backup: server '{self.server_name}' is not running under this manager."
+            )
+
+        timeout = float(self.settings.get("backup.hot_backup_timeout_sec", 60))
+        self.logger.info(
+            f"Server '{self.server_name}': Starting hot backup of world '{world_dir_name}'."
+        )
+
+        # Hold the console for the whole sequence, so a concurrent
+        # send_command_and_wait() neither interleaves its command with the
+        # save commands nor takes their output as its reply.
+        with self._command_lock:  # type: ignore
+            self.send_command("save hold")  # type: ignore
+            try:
+                # Only output printed from here on matters; start at the log's end.
+                try:
+                    log_offset = os.path.getsize(self.server_log_path)
+                except OSError:
+                    log_offset = 0
+                deadline = time.monotonic() + timeout
+                files: Optional[List[Tuple[str, int]]] = None
+                captured = ""
+                query_sent_at: Optional[float] = None
+
+                while files is None:
+                    now = time.monotonic()
+                    if now >= deadline:
+                        raise BackupRestoreError(
+                            f"Timed out after {timeout}s waiting for server '{self.server_name}' to prepare files for hot backup."
+                        )
+
+                    # Until the server answers with a file list it replies "A previous
+                    # save has not been completed", so keep re-issuing the query.
+                    if (
+                        query_sent_at is None
+                        or now - query_sent_at >= _SAVE_QUERY_POLL_INTERVAL_SEC
+                    ):
+                        self.send_command("save query")  # type: ignore
+                        query_sent_at = now
+
+                    time.sleep(0.1)
+                    new_output, log_offset = self._read_server_output_from(log_offset)
+                    captured += new_output
+                    files = self._parse_save_query_output(captured)
+
+                self.logger.debug(
+                    f"Server '{self.server_name}': 'save query' reported {len(files)} file(s) to copy."
+                )
+                copy_files(files)
+            finally:
+                try:
+                    self.send_command("save resume")  # type: ignore
+                except Exception as e_resume:
+                    self.logger.error(
+                        f"Server '{self.server_name}': Failed to send 'save resume' after hot backup: {e_resume}",
+                        exc_info=True,
+                    )
+
+    def export_world_hot_to_mcworld(
+        self, world_dir_name: str, target_mcworld_file_path: str
+    ) -> None:
+        """Exports the active world to a ``.mcworld`` file while the server is running.
+
+        Instead of stopping the server, this obtains a consistent snapshot via
+        :meth:`._copy_world_with_saves_held` and copies the reported files,
+        truncated to the reported lengths, into the target archive (see
+        :meth:`._write_hot_backup_archive`).
+
+        Args:
+            world_dir_name (str): The name of the world directory to export.
+            target_mcworld_file_path (str): The absolute path where the resulting
+                ``.mcworld`` archive file should be saved.
+
+        Raises:
+            ServerNotRunningError: If this instance cannot drive the server
+                console (see :meth:`.can_hot_backup`).
+            BackupRestoreError: If the server does not report a file list before
+                the timeout, or if writing the archive fails.
+            SendCommandError: If sending a console command fails.
+        """
+        self._copy_world_with_saves_held(
+            world_dir_name,
+            lambda files: self._write_hot_backup_archive(
+                world_dir_name, files, target_mcworld_file_path
+            ),
+        )
+        self.logger.info(
+            f"Server '{self.server_name}': Hot backup created: {target_mcworld_file_path}"
+        )
+
+    def _snapshot_world_to_store(
+        self, world_dir_name: str, manifest_path: str, hot: bool = False
+    ) -> Dict[str, Any]:
+        """Stores an incremental snapshot of a world in the shared backup store.
+
+        The newest existing manifest of the same world in this server's backup
+        directory is passed to
+        :meth:`~.core.backup_store.WorldBackupStore.create_snapshot` so that
+        unchanged files are not read again.
+
+        Args:
+            world_dir_name (str): The name of the world directory to snapshot.
+            manifest_path (str): The absolute path of the manifest to create.
+            hot (bool, optional): If ``True``, snapshot the world while the
+                server is running, storing exactly the files and lengths
+                reported by ``save query`` (see
+                :meth:`._copy_world_with_saves_held`). Defaults to ``False``.
+
+        Returns:
+            Dict[str, Any]: The snapshot statistics returned by
+            :meth:`~.core.backup_store.WorldBackupStore.create_snapshot`.
+
+        Raises:
+            ConfigurationError: If ``paths.backups`` is not configured.
+            AppFileNotFoundError: If the world directory does not exist.
+            BackupRestoreError: If storing the snapshot fails.
+        """
+        store = self._get_world_backup_store()
+        worlds_dir = os.path.join(self.server_dir, "worlds")
+        world_dir = os.path.join(worlds_dir, world_dir_name)
+
+        manifest_prefix = os.path.basename(manifest_path).rsplit("_backup_", 1)[0]
+        previous_manifests = self._find_and_sort_backups(
+            os.path.join(
+                os.path.dirname(manifest_path),
+                f"{manifest_prefix}_backup_*.{MANIFEST_EXTENSION}",
+            )
+        )
+        previous_manifest = previous_manifests[0] if previous_manifests else None
+
+        if not hot:
+            return store.create_snapshot(
+                world_dir, manifest_path, previous_manifest_path=previous_manifest
+            )
+
+        stats: Dict[str, Any] = {}
+
+        def _store_reported_files(files: List[Tuple[str, int]]) -> None:
+            # 'save query' paths are relative to the worlds directory.
+            world_files = [
+                (os.path.relpath(os.path.join(worlds_dir, path), world_dir), length)
+                for path, length in files
+            ]
+            stats.update(
+                store.create_snapshot(
+                    world_dir,
+                    manifest_path,
+                    files=world_files,
+                    previous_manifest_path=previous_manifest,
+                )
+            )
+
+        self._copy_world_with_saves_held(world_dir_name, _store_reported_files)
+        return stats
+
+    def _backup_world_data_internal(self, hot: bool = False) -> str:
         """Orchestrates the backup of the server's active world to a ``.mcworld`` file.
 
         This internal helper performs the following sequence:
@@ -369,12 +757,29 @@ class ServerBackupMixin(BedrockServerBaseMixin):
                The world name is sanitized for filesystem compatibility.
             4. Invokes ``self.export_world_directory_to_mcworld()`` (from
                :class:`~.core.server.world_mixin.ServerWorldMixin`) to create the
-               ``.mcworld`` archive in the backup directory.
+               ``.mcworld`` archive in the backup directory, or
+               :meth:`.export_world_hot_to_mcworld` if `hot` is ``True``.
             5. After successful archive creation, it calls :meth:`.prune_server_backups`
                to remove older world backups, adhering to the configured retention policy.
 
+        If :attr:`.incremental_backups_enabled` is ``True``, step 4 instead
+        stores an incremental snapshot in the shared backup store and writes a
+        ``<SafeWorldName>_backup_YYYYMMDD_HHMMSS.manifest`` file (see
+        :meth:`._snapshot_world_to_store`), and pruning applies to manifests.
+
+        The statistics reported by the export or snapshot (including the
+        throughput of full exports) are kept in
+        :attr:`last_world_backup_stats`; hot ``.mcworld`` backups report none.
+
+        Args:
+            hot (bool, optional): If ``True``, back up the world while the server
+                is running using :meth:`.export_world_hot_to_mcworld`. The caller
+                is responsible for checking :meth:`.can_hot_backup` first.
+                Defaults to ``False``.
+
         Returns:
-            str: The absolute path to the created ``.mcworld`` backup file.
+            str: The absolute path to the created ``.mcworld`` backup file, or
+            to the snapshot manifest for incremental backups.
 
         Raises:
             ConfigurationError: If the server's backup directory path
@@ -426,20 +831,38 @@ class ServerBackupMixin(BedrockServerBaseMixin):
         timestamp = get_timestamp()
         # Sanitize the world name to ensure it's a valid filename component.
         safe_world_name_for_file = re.sub(r'[:"/\\|?*]', "_", active_world_name)
-        backup_filename = f"{safe_world_name_for_file}_backup_{timestamp}.mcworld"
+        incremental = self.incremental_backups_enabled
+        backup_extension = MANIFEST_EXTENSION if incremental else "mcworld"
+        backup_filename = (
+            f"{safe_world_name_for_file}_backup_{timestamp}.{backup_extension}"
+        )
         backup_file_path = os.path.join(server_bck_dir, backup_filename)
 
         self.logger.info(
             f"Creating world backup: '{backup_filename}' in '{server_bck_dir}'..."
         )
+        self.last_world_backup_stats = None
         try:
-            # This method is expected to be on the final class from WorldMixin.
-            self.export_world_directory_to_mcworld(active_world_name, backup_file_path)  # type: ignore
+            if incremental:
+                self.last_world_backup_stats = self._snapshot_world_to_store(
+                    active_world_name, backup_file_path, hot=hot
+                )
+            elif hot:
+                self.export_world_hot_to_mcworld(active_world_name, backup_file_path)
+            else:
+                # This method is expected to be on the final class from WorldMixin.
+                self.last_world_backup_stats = (
+                    self.export_world_directory_to_mcworld(  # type: ignore
+                        active_world_name, backup_file_path
+                    )
+                )
             self.logger.info(
                 f"World backup for '{self.server_name}' created: {backup_file_path}"
             )
             # Prune old backups after a new one is successfully created.
-            self.prune_server_backups(f"{safe_world_name_for_file}_backup_", "mcworld")
+            self.prune_server_backups(
+                f"{safe_world_name_for_file}_backup_", backup_extension
+            )
             return backup_file_path
         except (
             BackupRestoreError,
@@ -535,7 +958,7 @@ class ServerBackupMixin(BedrockServerBaseMixin):
                 f"Failed to copy config '{config_filename_in_server_dir}' for '{self.server_name}' to backup: {e}"
             ) from e
 
-    def backup_all_data(self) -> Dict[str, Optional[str]]:
+    def backup_all_data(self, hot: bool = False) -> Dict[str, Optional[str]]:
         """Performs a full backup of the server's active world and standard configuration files.
 
         This method orchestrates the backup of the following components:
@@ -551,12 +974,19 @@ class ServerBackupMixin(BedrockServerBaseMixin):
         directory (derived from :attr:`.server_backup_directory`) is created if it
         doesn't already exist.
 
+        If `hot` is ``True``, the world is backed up while the server keeps
+        running (see :meth:`.export_world_hot_to_mcworld`).
+
         If the critical world backup fails, a :class:`~.error.BackupRestoreError`
         is raised *after* attempting to back up all configuration files. Failures
         in backing up individual configuration files are logged as errors, and their
         corresponding entry in the returned dictionary will be ``None``, but they
         do not stop the backup of other components.
 
+        Args:
+            hot (bool, optional): If ``True``, perform a hot world backup without
+                stopping the server. Defaults to ``False``.
+
         Returns:
             Dict[str, Optional[str]]: A dictionary mapping component names
             (e.g., "world", "allowlist.json") to the absolute path of their
@@ -599,7 +1029,7 @@ class ServerBackupMixin(BedrockServerBaseMixin):
         world_backup_failed = False
 
         try:
-            backup_results["world"] = self._backup_world_data_internal()
+            backup_results["world"] = self._backup_world_data_internal(hot=hot)
         except Exception as e_world:  # Catch broadly as world backup is critical
             self.logger.error(
                 f"CRITICAL: World backup failed for server '{self.server_name}': {e_world}",
@@ -635,6 +1065,111 @@ class ServerBackupMixin(BedrockServerBaseMixin):
         )
         return backup_results
 
+    def restore_world_from_backup(self, backup_file_path: str) -> str:
+        """Restores the server's active world from a world backup of either format.
+
+        ``.mcworld`` archives are imported with
+        :meth:`~.core.server.world_mixin.ServerWorldMixin.import_active_world_from_mcworld`.
+        Incremental snapshot manifests are rebuilt from the shared backup store
+        via :meth:`~.core.backup_store.WorldBackupStore.restore_snapshot`. In
+        both cases, the world is restored into the directory of the active world
+        (as determined by ``get_world_name()``).
+
+        .. warning::
+            This operation **overwrites** the active world directory.
+
+        Args:
+            backup_file_path (str): The absolute path to a ``.mcworld`` file or
+                a ``.manifest`` file.
+
+        Returns:
+            str: The name of the world directory that was restored.
+
+        Raises:
+            MissingArgumentError: If `backup_file_path` is empty.
+            AppFileNotFoundError: If `backup_file_path` does not exist.
+            BackupRestoreError: If restoring from the archive or store fails.
+            ExtractError: If extracting a ``.mcworld`` archive fails.
+            AttributeError: If ``get_world_name()`` or
+                ``import_active_world_from_mcworld()`` are not available.
+        """
+        if not backup_file_path:
+            raise MissingArgumentError("Backup file path cannot be empty.")
+        if not os.path.isfile(backup_file_path):
+            raise AppFileNotFoundError(backup_file_path, "World backup file")
+
+        if not is_manifest_file(backup_file_path):
+            return self.import_active_world_from_mcworld(backup_file_path)  # type: ignore
+
+        if not hasattr(self, "get_world_name"):
+            raise AttributeError("Missing get_world_name method for world restore.")
+        active_world_name: str = self.get_world_name()  # type: ignore
+        target_world_dir = os.path.join(self.server_dir, "worlds", active_world_name)
+        os.makedirs(os.path.dirname(target_world_dir), exist_ok=True)
+
+        self.logger.info(
+            f"Server '{self.server_name}': Restoring world '{active_world_name}' "
+            f"from snapshot '{os.path.basename(backup_file_path)}'."
+        )
+        self._get_world_backup_store().restore_snapshot(
+            backup_file_path, target_world_dir
+        )
+        return active_world_name
+
+    def export_world_backup_to_mcworld(
+        self, backup_file_path: str, target_mcworld_file_path: str
+    ) -> str:
+        """Exports a world backup as a standalone ``.mcworld`` archive.
+
+        Incremental snapshot manifests are assembled from the shared backup
+        store (see
+        :meth:`~.core.backup_store.WorldBackupStore.export_snapshot_to_mcworld`).
+        Backups that already are ``.mcworld`` archives are simply copied.
+
+        Args:
+            backup_file_path (str): The absolute path to a ``.manifest`` or
+                ``.mcworld`` world backup.
+            target_mcworld_file_path (str): The path of the ``.mcworld`` file to
+                create.
+
+        Returns:
+            str: The path of the created ``.mcworld`` file.
+
+        Raises:
+            MissingArgumentError: If either path is empty.
+            AppFileNotFoundError: If `backup_file_path` does not exist.
+            BackupRestoreError: If the manifest is invalid or the store is
+                missing or has corrupted blobs.
+            FileOperationError: If copying a ``.mcworld`` backup fails.
+        """
+        if not backup_file_path or not target_mcworld_file_path:
+            raise MissingArgumentError(
+                "Backup file path and target path cannot be empty."
+            )
+        if not os.path.isfile(backup_file_path):
+            raise AppFileNotFoundError(backup_file_path, "World backup file")
+
+        target_dir = os.path.dirname(target_mcworld_file_path)
+        if target_dir:
+            os.makedirs(target_dir, exist_ok=True)
+
+        if is_manifest_file(backup_file_path):
+            self._get_world_backup_store().export_snapshot_to_mcworld(
+                backup_file_path, target_mcworld_file_path
+            )
+        else:
+            try:
+                shutil.copy2(backup_file_path, target_mcworld_file_path)
+            except OSError as e:
+                raise FileOperationError(
+                    f"Failed to copy world backup '{backup_file_path}' to '{target_mcworld_file_path}': {e}"
+                ) from e
+        self.logger.info(
+            f"Server '{self.server_name}': Exported world backup '{os.path.basename(backup_file_path)}' "
+            f"to '{target_mcworld_file_path}'."
+        )
+        return target_mcworld_file_path
+
     def _restore_config_file_internal(self, backup_config_file_path: str) -> str:
         """Restores a single server configuration file from a specific backup file path.
 
@@ -715,9 +1250,9 @@ class ServerBackupMixin(BedrockServerBaseMixin):
         most recent backup file (sorted by modification time) in the server's
         specific backup directory (see :attr:`.server_backup_directory`):
 
-            - The active world: Restored using
-              :meth:`~.core.server.world_mixin.ServerWorldMixin.import_active_world_from_mcworld`
-              after finding the latest ``.mcworld`` backup matching the active world's name.
+            - The active world: Restored using :meth:`.restore_world_from_backup`
+              after finding the latest ``.mcworld`` backup or snapshot manifest
+              matching the active world's name.
             - ``server.properties``: Restored via :meth:`._restore_config_file_internal`.
             - ``allowlist.json``: Restored via :meth:`._restore_config_file_internal`.
             - ``permissions.json``: Restored via :meth:`._restore_config_file_internal`.
@@ -790,7 +1325,10 @@ class ServerBackupMixin(BedrockServerBaseMixin):
                 )
 
             world_backup_files = self._find_and_sort_backups(
-                os.path.join(server_bck_dir, "*.mcworld")
+                [
+                    os.path.join(server_bck_dir, "*.mcworld"),
+                    os.path.join(server_bck_dir, f"*.{MANIFEST_EXTENSION}"),
+                ]
             )  # Newest first
 
             # Filter for backups matching the current active world name.
@@ -814,8 +1352,9 @@ class ServerBackupMixin(BedrockServerBaseMixin):
                 self.logger.info(
                     f"Found latest world backup for '{active_world_name}': {os.path.basename(latest_world_backup_path)}"
                 )
-                # import_active_world_from_mcworld is expected from WorldMixin
-                imported_world_name_check = self.import_active_world_from_mcworld(latest_world_backup_path)  # type: ignore
+                imported_world_name_check = self.restore_world_from_backup(
+                    latest_world_backup_path
+                )
                 # The path stored should be the actual world path in the server directory, not the backup path
                 restore_results["world"] = os.path.join(
                     self.server_dir, "worlds", imported_world_name_check
@@ -825,7 +1364,7 @@ class ServerBackupMixin(BedrockServerBaseMixin):
                 )
             else:
                 self.logger.info(
-                    f"No .mcworld backups found specifically for active world '{active_world_name}' of server '{self.server_name}'. Skipping world restore."
+                    f"No world backups found specifically for active world '{active_world_name}' of server '{self.server_name}'. Skipping world restore."
                 )
                 restore_results["world"] = None
         except Exception as e_world_restore:  # Catch broad exceptions for world restore
@@ -12,10 +12,18 @@ configuration files:
 It offers methods to read, parse, modify, and write these files in a structured
 manner, abstracting direct file I/O and providing error handling for common
 issues like file not found or parsing errors.
+
+Parsed file contents are cached per file and keyed by the file's inode,
+modification time and size, so a file is only parsed again after it changed
+on disk. Writes go to a temporary file that is renamed over the original,
+and refresh the cache in place.
 """
+import copy
 import os
 import json
-from typing import List, Dict, Any, Optional
+import shutil
+import threading
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
 # Local application imports.
 from .base_server_mixin import BedrockServerBaseMixin
@@ -59,6 +67,93 @@ class ServerConfigManagementMixin(BedrockServerBaseMixin):
         """
         super().__init__(*args, **kwargs)
         # Attributes from BedrockServerBaseMixin (e.g., self.server_dir, self.logger) are available.
+        # Maps a file path to its signature and parsed content.
+        self._parsed_file_cache: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+
+    # --- PARSED FILE CACHE ---
+    @staticmethod
+    def _file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+        """Returns the ``(inode, mtime_ns, size)`` of a file, or ``None`` if it is missing."""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _read_parsed(self, path: str, parse: Callable[[str], Any]) -> Any:
+        """Returns the parsed content of a file, parsing it only if it changed.
+
+        Args:
+            path (str): The file to read.
+            parse (Callable[[str], Any]): Turns the file's text into its parsed
+                form. Exceptions it raises are passed on and nothing is cached.
+
+        Returns:
+            Any: A copy of the parsed content, which the caller may modify.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        signature = self._file_signature(path)
+        cached = self._parsed_file_cache.get(path)
+        if signature is not None and cached is not None and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+        parsed = parse(content)
+        if signature is not None:
+            self._parsed_file_cache[path] = (signature, parsed)
+        return copy.deepcopy(parsed)
+
+    def _write_file_atomic(self, path: str, content: str, parsed: Any) -> None:
+        """Replaces a file's content atomically and caches its parsed form.
+
+        The content is written to a temporary file in the same directory, which
+        is then renamed over `path`, so readers (including the server itself)
+        never see a partially written file. A file that exists but is not
+        writable is left alone, as it would be by an in-place write.
+
+        Args:
+            path (str): The file to write.
+            content (str): The new text of the file.
+            parsed (Any): The parsed form of `content`, as the matching read
+                method would produce it.
+
+        Raises:
+            OSError: If the file is read-only or cannot be written.
+        """
+        if os.path.exists(path) and not os.access(path, os.W_OK):
+            raise PermissionError(f"'{path}' is not writable.")
+
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            if os.path.exists(path):
+                shutil.copymode(path, temp_path)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        signature = self._file_signature(path)
+        if signature is not None:
+            self._parsed_file_cache[path] = (signature, copy.deepcopy(parsed))
+
+    @staticmethod
+    def _parse_json_content(content: str) -> Any:
+        """Parses a JSON file's text, treating a blank file as ``None``."""
+        if not content.strip():
+            return None
+        return json.loads(content)
+
+    def _write_json_list(self, path: str, entries: List[Dict[str, Any]]) -> None:
+        """Writes a list as formatted JSON, the layout used for the server's JSON files."""
+        self._write_file_atomic(
+            path, json.dumps(entries, indent=4, sort_keys=True), entries
+        )
 
     # --- ALLOWLIST METHODS ---
     def get_allowlist(self) -> List[Dict[str, Any]]:
@@ -90,16 +185,15 @@ class ServerConfigManagementMixin(BedrockServerBaseMixin):
         allowlist_entries: List[Dict[str, Any]] = []
         if os.path.isfile(self.allowlist_json_path):
             try:
-                with open(self.allowlist_json_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    if content.strip():
-                        loaded_data = json.loads(content)
-                        if isinstance(loaded_data, list):
-                            allowlist_entries = loaded_data
-                        else:
-                            self.logger.warning(
-                                f"Allowlist file '{self.allowlist_json_path}' is not a JSON list. Treating as empty."
-                            )
+                loaded_data = self._read_parsed(
+                    self.allowlist_json_path, self._parse_json_content
+                )
+                if isinstance(loaded_data, list):
+                    allowlist_entries = loaded_data
+                elif loaded_data is not None:
+                    self.logger.warning(
+                        f"Allowlist file '{self.allowlist_json_path}' is not a JSON list. Treating as empty."
+                    )
             except ValueError as e:
                 raise ConfigParseError(
                     f"Invalid JSON in allowlist '{self.allowlist_json_path}': {e}"
@@ -191,8 +285,7 @@ class ServerConfigManagementMixin(BedrockServerBaseMixin):
 
         if added_count > 0:
             try:
-                with open(self.allowlist_json_path, "w", encoding="utf-8") as f:
-                    json.dump(current_allowlist, f, indent=4, sort_keys=True)
+                self._write_json_list(self.allowlist_json_path, current_allowlist)
                 self.logger.info(
                     f"Successfully updated allowlist for '{self.server_name}'. {added_count} players added."
                 )
@@ -254,8 +347,7 @@ class ServerConfigManagementMixin(BedrockServerBaseMixin):
         # If the list length changed, a player was removed.
         if len(updated_allowlist) < len(current_allowlist):
             try:
-                with open(self.allowlist_json_path, "w", encoding="utf-8") as f:
-                    json.dump(updated_allowlist, f, indent=4, sort_keys=True)
+                self._write_json_list(self.allowlist_json_path, updated_allowlist)
                 self.logger.info(
                     f"Successfully removed '{player_name_to_remove}' from allowlist for '{self.server_name}'."
                 )
@@ -326,16 +418,15 @@ class ServerConfigManagementMixin(BedrockServerBaseMixin):
         permissions_list: List[Dict[str, Any]] = []
         if os.path.isfile(self.permissions_json_path):
             try:
-                with open(self.permissions_json_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    if content.strip():
-                        loaded_data = json.loads(content)
-                        if isinstance(loaded_data, list):
-                            permissions_list = loaded_data
-                        else:
-                            self.logger.warning(
-                                f"Permissions file '{self.permissions_json_path}' is not a list. Overwriting."
-                            )
+                loaded_data = self._read_parsed(
+                    self.permissions_json_path, self._parse_json_content
+                )
+                if isinstance(loaded_data, list):
+                    permissions_list = loaded_data
+                elif loaded_data is not None:
+                    self.logger.warning(
+                        f"Permissions file '{self.permissions_json_path}' is not a list. Overwriting."
+                    )
             except ValueError as e:
                 self.logger.warning(
                     f"Invalid JSON in permissions '{self.permissions_json_path}'. Overwriting. Error: {e}"
@@ -370,8 +461,7 @@ class ServerConfigManagementMixin(BedrockServerBaseMixin):
 
         if modified:
             try:
-                with open(self.permissions_json_path, "w", encoding="utf-8") as f:
-                    json.dump(permissions_list, f, indent=4, sort_keys=True)
+                self._write_json_list(self.permissions_json_path, permissions_list)
                 self.logger.info(
                     f"Successfully updated permissions for XUID '{xuid}' for '{self.server_name}'."
                 )
@@ -433,16 +523,13 @@ class ServerConfigManagementMixin(BedrockServerBaseMixin):
 
         raw_permissions: List[Dict[str, Any]] = []
         try:
-            with open(self.permissions_json_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                if content.strip():
-                    loaded_data = json.loads(content)
-                    if isinstance(loaded_data, list):
-                        raw_permissions = loaded_data
-                    else:
-                        raise ConfigParseError(
-                            "Permissions file content is not a list."
-                        )
+            loaded_data = self._read_parsed(
+                self.permissions_json_path, self._parse_json_content
+            )
+            if isinstance(loaded_data, list):
+                raw_permissions = loaded_data
+            elif loaded_data is not None:
+                raise ConfigParseError("Permissions file content is not a list.")
         except ValueError as e:
             raise ConfigParseError(f"Invalid JSON in permissions file: {e}") from e
         except OSError as e:
@@ -476,12 +563,12 @@ class ServerConfigManagementMixin(BedrockServerBaseMixin):
     def set_server_property(self, property_key: str, property_value: Any) -> None:
         """Modifies or adds a property in the server's ``server.properties`` file.
 
-        This method reads the entire ``server.properties`` file line by line.
-        If a line starting with `property_key=` is found, it's replaced with the
-        new `property_key=property_value`. If the key is not found, the new
-        property line is appended to the end of the file. Comments and blank
-        lines are preserved. Duplicate entries for the same key (if any) will
-        result in the first being updated and subsequent ones being commented out.
+        This is :meth:`.set_server_properties` for a single property. If the
+        key is found, its line is replaced with the new
+        `property_key=property_value`; otherwise the property is appended to
+        the end of the file. Comments and blank lines are preserved. Duplicate
+        entries for the same key (if any) will result in the first being
+        updated and subsequent ones being commented out.
 
         The `property_value` is converted to a string before writing.
 
@@ -499,24 +586,52 @@ class ServerConfigManagementMixin(BedrockServerBaseMixin):
                 :attr:`.ServerStateMixin.server_properties_path`) does not exist.
             FileOperationError: If reading from or writing to ``server.properties`` fails.
         """
-        if not isinstance(property_key, str) or not property_key:
-            raise MissingArgumentError(
-                "Property key cannot be empty and must be a string."
-            )
+        self.set_server_properties({property_key: property_value})
 
-        str_value = str(property_value)
-        # Check for invalid control characters that can corrupt the properties file.
-        if any(ord(c) < 32 for c in str_value if c != "\t"):
-            raise UserInputError(
-                f"Property value for '{property_key}' contains invalid control characters."
-            )
+    def set_server_properties(self, properties: Dict[str, Any]) -> None:
+        """Modifies or adds several properties in ``server.properties`` at once.
+
+        All values are validated first, then the file is read once, every
+        given property is updated in place (or appended if missing), and the
+        result is written back once. Comments and blank lines are preserved,
+        and duplicate entries for a key are commented out. The write replaces
+        the file atomically, so the server never reads a partial file.
+
+        Args:
+            properties (Dict[str, Any]): The property keys and their new values.
+                Values are converted to strings.
+
+        Raises:
+            MissingArgumentError: If a key is empty or not a string.
+            UserInputError: If a value, when converted to a string, contains
+                invalid control characters (excluding tab).
+            AppFileNotFoundError: If the ``server.properties`` file (at
+                :attr:`.ServerStateMixin.server_properties_path`) does not exist.
+            FileOperationError: If reading from or writing to ``server.properties`` fails.
+        """
+        str_properties: Dict[str, str] = {}
+        for property_key, property_value in properties.items():
+            if not isinstance(property_key, str) or not property_key:
+                raise MissingArgumentError(
+                    "Property key cannot be empty and must be a string."
+                )
+            str_value = str(property_value)
+            # Check for invalid control characters that can corrupt the properties file.
+            if any(ord(c) < 32 for c in str_value if c != "\t"):
+                raise UserInputError(
+                    f"Property value for '{property_key}' contains invalid control characters."
+                )
+            str_properties[property_key] = str_value
+
+        if not str_properties:
+            return
 
         server_properties_path = self.server_properties_path
         if not os.path.isfile(server_properties_path):
             raise AppFileNotFoundError(server_properties_path, "Server properties file")
 
         self.logger.debug(
-            f"Server '{self.server_name}': Setting property '{property_key}' to '{str_value}' in {server_properties_path}"
+            f"Server '{self.server_name}': Setting properties {str_properties} in {server_properties_path}"
         )
 
         try:
@@ -528,8 +643,7 @@ class ServerConfigManagementMixin(BedrockServerBaseMixin):
             ) from e
 
         output_lines = []
-        property_found_and_set = False
-        new_property_line = f"{property_key}={str_value}\n"
+        keys_set = set()
 
         for line_content in lines:
             stripped_line = line_content.strip()
@@ -538,41 +652,66 @@ class ServerConfigManagementMixin(BedrockServerBaseMixin):
                 output_lines.append(line_content)
                 continue
 
-            # If the line starts with the key we're looking for, replace it.
-            if stripped_line.startswith(property_key + "="):
+            # If the line sets one of the keys we're updating, replace it.
+            line_key = stripped_line.split("=", 1)[0]
+            if "=" in stripped_line and line_key in str_properties:
                 # Only replace the first occurrence to handle malformed files.
-                if not property_found_and_set:
-                    output_lines.append(new_property_line)
-                    property_found_and_set = True
+                if line_key not in keys_set:
+                    output_lines.append(f"{line_key}={str_properties[line_key]}\n")
+                    keys_set.add(line_key)
                 else:
                     # Comment out any duplicate entries.
                     output_lines.append("# DUPLICATE IGNORED: " + line_content)
             else:
                 output_lines.append(line_content)
 
-        # If the property was not found in the file, add it to the end.
-        if not property_found_and_set:
+        # Add the properties that were not found in the file to the end.
+        for property_key, str_value in str_properties.items():
+            if property_key in keys_set:
+                continue
             if output_lines and not output_lines[-1].endswith("\n"):
                 output_lines[-1] += "\n"
-            output_lines.append(new_property_line)
+            output_lines.append(f"{property_key}={str_value}\n")
 
+        content = "".join(output_lines)
         try:
-            with open(server_properties_path, "w", encoding="utf-8") as f:
-                f.writelines(output_lines)
+            self._write_file_atomic(
+                server_properties_path,
+                content,
+                self._parse_server_properties(content, server_properties_path),
+            )
             self.logger.info(
-                f"Successfully set property '{property_key}' for '{self.server_name}'."
+                f"Successfully set properties {list(str_properties)} for '{self.server_name}'."
             )
         except OSError as e:
             raise FileOperationError(
                 f"Failed to write '{server_properties_path}': {e}"
             ) from e
 
+    def _parse_server_properties(self, content: str, path: str) -> Dict[str, str]:
+        """Parses the text of a ``server.properties`` file into a dictionary."""
+        properties: Dict[str, str] = {}
+        for line_num, line_content in enumerate(content.splitlines(), 1):
+            line = line_content.strip()
+            # Ignore comments and empty lines.
+            if not line or line.startswith("#"):
+                continue
+            parts = line.split("=", 1)
+            if len(parts) == 2 and parts[0].strip():
+                properties[parts[0].strip()] = parts[1].strip()
+            else:
+                self.logger.warning(
+                    f"Skipping malformed line {line_num} in '{path}': \"{line}\""
+                )
+        return properties
+
     def get_server_properties(self) -> Dict[str, str]:
         """Reads and parses the server's ``server.properties`` file into a dictionary.
 
         Each line in the format ``key=value`` is parsed. Lines starting with ``#``
         (comments) and blank lines are ignored. If a line is malformed (e.g.,
         does not contain an "="), a warning is logged, and the line is skipped.
+        The file is only parsed again once it changed on disk.
 
         Returns:
             Dict[str, str]: A dictionary where keys are property names and values
@@ -590,31 +729,18 @@ class ServerConfigManagementMixin(BedrockServerBaseMixin):
         if not os.path.isfile(server_properties_path):
             raise AppFileNotFoundError(server_properties_path, "Server properties file")
 
-        self.logger.debug(
-            f"Server '{self.server_name}': Parsing {server_properties_path}"
-        )
-        properties: Dict[str, str] = {}
         try:
-            with open(server_properties_path, "r", encoding="utf-8") as f:
-                for line_num, line_content in enumerate(f, 1):
-                    line = line_content.strip()
-                    # Ignore comments and empty lines.
-                    if not line or line.startswith("#"):
-                        continue
-                    parts = line.split("=", 1)
-                    if len(parts) == 2 and parts[0].strip():
-                        properties[parts[0].strip()] = parts[1].strip()
-                    else:
-                        self.logger.warning(
-                            f"Skipping malformed line {line_num} in '{server_properties_path}': \"{line}\""
-                        )
+            return self._read_parsed(
+                server_properties_path,
+                lambda content: self._parse_server_properties(
+                    content, server_properties_path
+                ),
+            )
         except OSError as e:
             raise ConfigParseError(
                 f"Failed to read '{server_properties_path}': {e}"
             ) from e
 
-        return properties
-
     def get_server_property(
         self, property_key: str, default: Optional[Any] = None
     ) -> Optional[Any]:
@@ -0,0 +1,199 @@
+# bedrock_server_manager/core/server/console.py
+"""Provides the :class:`.ServerConsole`, which follows a server's console output.
+
+A server started by :class:`~.core.server.process_mixin.ServerProcessMixin`
+writes its output straight to its output log (``server_output.txt``), so it
+keeps running if the manager exits. The console follows that file from a
+thread, like ``tail -f``, and keeps the most recent lines in an in-memory ring
+buffer. Callers can then wait for the reply to a command without re-reading
+the log file.
+"""
+import collections
+import logging
+import os
+import threading
+import time
+from typing import BinaryIO, Deque, List, Optional, Pattern, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUFFER_LINES = 1000
+"""The default number of output lines kept in memory."""
+
+DEFAULT_QUIET_PERIOD_SEC = 0.5
+"""How long the output must be silent before a reply without a pattern is complete."""
+
+DEFAULT_POLL_INTERVAL_SEC = 0.1
+"""How often the output log is checked for new lines."""
+
+
+class ServerConsole:
+    """Follows a server's output log into a ring buffer of lines.
+
+    Every line read gets a sequence number. :attr:`position` is the number the
+    next line will get, so a caller records it before sending a command and
+    passes it to :meth:`wait_for` to collect only the lines that follow.
+
+    Attributes:
+        log_path (str): The output log being followed.
+        closed (bool): ``True`` once :meth:`close` was called and the last
+            output was read, i.e. no more lines will arrive.
+    """
+
+    def __init__(
+        self,
+        log_path: str,
+        offset: int = 0,
+        capacity: int = DEFAULT_BUFFER_LINES,
+        name: str = "server",
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SEC,
+    ) -> None:
+        """Initializes the console.
+
+        Args:
+            log_path (str): The output log to follow.
+            offset (int, optional): The byte offset to start reading at,
+                usually the size of the log before the server was started.
+            capacity (int, optional): The number of lines kept in memory.
+            name (str, optional): The server's name, used in thread names and
+                log messages.
+            poll_interval (float, optional): The number of seconds between two
+                checks for new output.
+        """
+        self.log_path = log_path
+        self.closed = False
+        self.poll_interval = poll_interval
+        self._offset = offset
+        self._name = name
+        self._lines: Deque[Tuple[int, str]] = collections.deque(maxlen=capacity)
+        self._next_seq = 0
+        self._last_line_at = 0.0
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._follow, name=f"ServerConsole-{name}", daemon=True
+        )
+
+    def start(self) -> None:
+        """Starts following the output log in a daemon thread."""
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stops following the output log after reading what was written so far.
+
+        Waiters of :meth:`wait_for` return once the remaining output is read.
+        """
+        self._stop.set()
+
+    def _follow(self) -> None:
+        """Reads lines appended to the output log until :meth:`close` is called."""
+        log_file: Optional[BinaryIO] = None
+        partial = b""
+        try:
+            while True:
+                # Read once more after close() so the last output is not lost.
+                stopping = self._stop.is_set()
+                if log_file is None:
+                    try:
+                        log_file = open(self.log_path, "rb")
+                    except FileNotFoundError:
+                        log_file = None
+                if log_file is not None:
+                    if os.fstat(log_file.fileno()).st_size < self._offset:
+                        # The log was truncated; start over from its beginning.
+                        self._offset = 0
+                        partial = b""
+                    log_file.seek(self._offset)
+                    data = log_file.read()
+                    self._offset += len(data)
+                    *raw_lines, partial = (partial + data).split(b"\n")
+                    self._append(raw_lines)
+                if stopping:
+                    break
+                self._stop.wait(self.poll_interval)
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"Stopped following the output log of server '{self._name}': {e}"
+            )
+        finally:
+            if log_file is not None:
+                log_file.close()
+            with self._condition:
+                self.closed = True
+                self._condition.notify_all()
+
+    def _append(self, raw_lines: List[bytes]) -> None:
+        """Adds complete lines to the ring buffer and wakes up the waiters."""
+        if not raw_lines:
+            return
+        with self._condition:
+            for raw_line in raw_lines:
+                line = raw_line.decode("utf-8", errors="replace").rstrip("\r")
+                self._lines.append((self._next_seq, line))
+                self._next_seq += 1
+            self._last_line_at = time.monotonic()
+            self._condition.notify_all()
+
+    @property
+    def position(self) -> int:
+        """int: The sequence number the next output line will get."""
+        with self._condition:
+            return self._next_seq
+
+    def lines_since(self, position: int) -> List[str]:
+        """Returns the buffered lines from sequence number `position` on.
+
+        Lines that already dropped out of the ring buffer are skipped.
+        """
+        with self._condition:
+            return [line for seq, line in self._lines if seq >= position]
+
+    def wait_for(
+        self,
+        position: int,
+        pattern: Optional[Pattern[str]] = None,
+        timeout: float = 10.0,
+        quiet_period: float = DEFAULT_QUIET_PERIOD_SEC,
+    ) -> Tuple[List[str], bool]:
+        """Collects the output that follows `position` until a reply is complete.
+
+        With a `pattern`, the reply is complete at the first line the pattern
+        matches (searched with :meth:`re.Pattern.search`). Without one, it is
+        complete once no output arrived for `quiet_period` seconds.
+
+        Args:
+            position (int): The :attr:`position` recorded before the command
+                was sent.
+            pattern (Optional[Pattern[str]], optional): The line that ends the
+                reply.
+            timeout (float, optional): The maximum number of seconds to wait.
+            quiet_period (float, optional): See above.
+
+        Returns:
+            Tuple[List[str], bool]: The collected lines (up to and including
+            the matching one) and whether the reply completed before the
+            timeout or the end of the output.
+        """
+        started_at = time.monotonic()
+        deadline = started_at + timeout
+        with self._condition:
+            while True:
+                lines = [line for seq, line in self._lines if seq >= position]
+                if pattern is not None:
+                    for index, line in enumerate(lines):
+                        if pattern.search(line):
+                            return lines[: index + 1], True
+
+                now = time.monotonic()
+                wake_at = deadline
+                if pattern is None:
+                    quiet_since = started_at
+                    if self._next_seq > position:
+                        quiet_since = max(quiet_since, self._last_line_at)
+                    if now - quiet_since >= quiet_period:
+                        return lines, True
+                    wake_at = min(deadline, quiet_since + quiet_period)
+
+                if self.closed or now >= deadline:
+                    return lines, False
+                self._condition.wait(wake_at - now)
@@ -21,7 +21,7 @@ Key functionalities include:
 
 """
 import os
-from typing import Optional, Any
+from typing import Optional, Any, Dict
 
 # Local application imports.
 from .base_server_mixin import BedrockServerBaseMixin
@@ -92,6 +92,9 @@ class ServerInstallUpdateMixin(BedrockServerBaseMixin):
         super().__init__(*args, **kwargs)
         # Dependencies on other mixins' methods are resolved at runtime on the
         # final BedrockServer class instance.
+        # Extraction statistics of the last install or update made by this
+        # instance (see BedrockDownloader.extract_server_files), or None.
+        self.last_update_stats: Optional[Dict[str, Any]] = None
 
     def _perform_server_files_setup(
         self, downloader: BedrockDownloader, is_update_operation: bool
@@ -139,6 +142,7 @@ class ServerInstallUpdateMixin(BedrockServerBaseMixin):
         try:
             # Delegate the extraction logic to the downloader.
             downloader.extract_server_files(is_update_operation)
+            self.last_update_stats = downloader.last_extract_stats
             self.logger.info(
                 f"Server file extraction completed for '{self.server_name}'."
             )
@@ -329,6 +333,7 @@ class ServerInstallUpdateMixin(BedrockServerBaseMixin):
         target_version_specification: str,
         force_reinstall: bool = False,
         server_zip_path: Optional[str] = None,
+        prepared_downloader: Optional[BedrockDownloader] = None,
     ) -> None:
         """Installs or updates the Bedrock server to a specified version or dynamic target.
 
@@ -360,6 +365,14 @@ class ServerInstallUpdateMixin(BedrockServerBaseMixin):
             force_reinstall (bool, optional): If ``True``, the server software will
                 be reinstalled/extracted even if :meth:`.is_update_needed` reports
                 that the current version matches the target. Defaults to ``False``.
+            server_zip_path (Optional[str], optional): The path to a custom
+                server ZIP, for the "CUSTOM" target. Defaults to ``None``.
+            prepared_downloader (Optional[BedrockDownloader], optional): A
+                downloader whose assets were already prepared for
+                `target_version_specification` (see
+                :meth:`BedrockDownloader.prepare_download_assets`), e.g. once for
+                a whole fleet of servers. Its resolved version and ZIP are used
+                instead of looking them up again. Defaults to ``None``.
 
         Raises:
             MissingArgumentError: If `target_version_specification` is empty.
@@ -404,9 +417,14 @@ class ServerInstallUpdateMixin(BedrockServerBaseMixin):
         is_currently_installed: bool = self.is_installed()  # type: ignore
 
         if not force_reinstall and is_currently_installed:
-            if not self.is_update_needed(
-                target_version_specification
-            ):  # Already checks target_version_specification
+            if prepared_downloader is not None:
+                installed_version = self.get_version()  # type: ignore
+                update_needed = (
+                    installed_version != prepared_downloader.get_actual_version()
+                )
+            else:
+                update_needed = self.is_update_needed(target_version_specification)
+            if not update_needed:
                 self.logger.info(
                     f"Server '{self.server_name}' is already at the target version or latest for '{target_version_specification}'. No action taken."
                 )
@@ -441,12 +459,15 @@ class ServerInstallUpdateMixin(BedrockServerBaseMixin):
                 f"Could not set target version for '{self.server_name}': {e_set_target}"
             )
 
-        downloader = BedrockDownloader(
-            settings_obj=self.settings,
-            server_dir=self.server_dir,
-            target_version=target_version_specification,
-            server_zip_path=server_zip_path,
-        )
+        if prepared_downloader is not None:
+            downloader = prepared_downloader.for_server_dir(self.server_dir)
+        else:
+            downloader = BedrockDownloader(
+                settings_obj=self.settings,
+                server_dir=self.server_dir,
+                target_version=target_version_specification,
+                server_zip_path=server_zip_path,
+            )
         actual_version_downloaded: Optional[str] = None
 
         try:
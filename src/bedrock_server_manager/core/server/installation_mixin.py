@@ -356,3 +356,7 @@ class ServerInstallationMixin(BedrockServerBaseMixin):
                 self.set_status_in_config("DELETED")  # Or "UNKNOWN"
             if hasattr(self, "set_version"):
                 self.set_version("UNKNOWN")  # type: ignore
+            # The server no longer exists, so drop it from server listings.
+            registry = getattr(self, "status_registry", None)
+            if registry is not None:
+                registry.remove(self.server_name)
@@ -5,13 +5,23 @@ Provides the :class:`.ServerPlayerMixin` for the
 
 This mixin is responsible for scanning a server's log files (typically
 ``server_output.txt``) to identify and extract player connection information.
-Specifically, it looks for lines indicating a player connection to parse out
-player gamertags and their corresponding XUIDs. This information can be used,
-for example, to populate a player database or track server activity.
+Specifically, it looks for lines indicating a player connection or
+disconnection to parse out player gamertags and their corresponding XUIDs.
+This information can be used, for example, to populate a player database or
+track server activity.
+
+The server log is opened in append mode and never rotated, so it grows for
+the lifetime of the installation. Scans are therefore incremental: a
+persistent read cursor (the file's inode, a byte offset and a fingerprint of
+the start of the file) is kept in the server's config, and each scan only
+parses the bytes appended since the previous one. If the log was truncated,
+replaced or rewritten, the cursor is detected as stale and the scan starts
+over from the beginning of the file.
 """
+import hashlib
 import os
 import re
-from typing import List, Dict, TYPE_CHECKING, Any
+from typing import List, Dict, TYPE_CHECKING, Any, Iterator, Optional, Tuple
 
 # Local application imports.
 from .base_server_mixin import BedrockServerBaseMixin
@@ -20,6 +30,23 @@ from ...error import FileOperationError
 if TYPE_CHECKING:
     pass
 
+PLAYER_EVENT_PATTERN = re.compile(
+    r"^(?:\[(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})[^\]\n]*\])?"
+    r"[^\n]*?(?:Player (?P<event>connected|disconnected):\s*(?P<name>[^,\n]+),\s*xuid:\s*(?P<xuid>\d+)"
+    r"|(?P<server_started>Server started\.))",
+    re.IGNORECASE | re.MULTILINE,
+)
+"""Matches player connection and disconnection lines of the server log, e.g.
+``[2024-01-01 12:00:00:123 INFO] Player connected: Steve, xuid: 2535...``,
+as well as the ``Server started.`` line, which marks that every player of a
+previous run is gone. The leading timestamp is optional."""
+
+PLAYER_LOG_CURSOR_KEY: str = "server_info.player_log_cursor"
+"""The server config key under which the log read cursor is persisted."""
+
+_LOG_FINGERPRINT_BYTES: int = 256
+_LOG_READ_CHUNK_BYTES: int = 1024 * 1024
+
 
 class ServerPlayerMixin(BedrockServerBaseMixin):
     """Provides methods for discovering player information by scanning server logs.
@@ -49,18 +76,250 @@ class ServerPlayerMixin(BedrockServerBaseMixin):
         super().__init__(*args, **kwargs)
         # Attributes from BedrockServerBaseMixin are available.
 
-    def scan_log_for_players(self) -> List[Dict[str, str]]:
+    def _log_fingerprint(self, f: Any, length: int) -> str:
+        """Returns a hash of the first `length` bytes of an open log file."""
+        f.seek(0)
+        return hashlib.sha256(f.read(length)).hexdigest()
+
+    def _get_player_log_cursor(self) -> Optional[Dict[str, Any]]:
+        """Reads the persisted log read cursor from the server's config."""
+        if not hasattr(self, "_manage_json_config"):
+            return None
+        try:
+            cursor = self._manage_json_config(PLAYER_LOG_CURSOR_KEY, "read")  # type: ignore
+        except Exception as e:
+            self.logger.warning(
+                f"Could not read player log cursor for '{self.server_name}': {e}"
+            )
+            return None
+        return cursor if isinstance(cursor, dict) else None
+
+    def _set_player_log_cursor(self, cursor: Optional[Dict[str, Any]]) -> None:
+        """Persists the log read cursor in the server's config."""
+        if not hasattr(self, "_manage_json_config"):
+            return
+        try:
+            self._manage_json_config(PLAYER_LOG_CURSOR_KEY, "write", cursor)  # type: ignore
+        except Exception as e:
+            self.logger.warning(
+                f"Could not save player log cursor for '{self.server_name}': {e}"
+            )
+
+    def reset_player_log_cursor(self) -> None:
+        """Forgets the log read cursor, so the next incremental scan reads the whole log."""
+        self._set_player_log_cursor(None)
+
+    def _resolve_log_start_offset(
+        self, f: Any, st: os.stat_result, cursor: Optional[Dict[str, Any]]
+    ) -> int:
+        """Determines where an incremental scan of an open log file starts.
+
+        The cursor is only trusted if it refers to the same file (inode), the
+        file has not shrunk below the saved offset, and the start of the file
+        is unchanged. Otherwise the scan starts from the beginning.
+
+        Args:
+            f: The log file, opened in binary mode.
+            st (os.stat_result): The result of ``os.fstat`` for `f`.
+            cursor (Optional[Dict[str, Any]]): The persisted cursor.
+
+        Returns:
+            int: The byte offset to start reading from.
+        """
+        if not cursor:
+            return 0
+        try:
+            offset = int(cursor.get("offset", 0))
+            head_len = int(cursor.get("head_len", 0))
+        except (TypeError, ValueError):
+            return 0
+
+        if cursor.get("inode") != st.st_ino:
+            self.logger.info(
+                f"Server log of '{self.server_name}' was replaced. Rescanning from the start."
+            )
+            return 0
+        if st.st_size < offset:
+            self.logger.info(
+                f"Server log of '{self.server_name}' was truncated. Rescanning from the start."
+            )
+            return 0
+        if self._log_fingerprint(f, head_len) != cursor.get("head_hash"):
+            self.logger.info(
+                f"Server log of '{self.server_name}' was rewritten. Rescanning from the start."
+            )
+            return 0
+        return offset
+
+    @staticmethod
+    def _iter_log_text(f: Any, offset: int, end: int) -> Iterator[Tuple[str, int]]:
+        """Yields complete lines of an open log file in chunks.
+
+        Reading stops at the last newline before `end`, so a line the server
+        is still writing is left for the next scan.
+
+        Args:
+            f: The log file, opened in binary mode.
+            offset (int): The byte offset to start reading from.
+            end (int): The byte offset to stop reading at.
+
+        Yields:
+            Tuple[str, int]: The decoded text of a chunk of complete lines and
+            the byte offset just past it.
+        """
+        f.seek(offset)
+        pending = b""
+        position = offset
+        while position < end:
+            data = f.read(min(_LOG_READ_CHUNK_BYTES, end - position))
+            if not data:
+                break
+            position += len(data)
+            data = pending + data
+            last_newline = data.rfind(b"\n")
+            if last_newline < 0:
+                pending = data
+                continue
+            pending = data[last_newline + 1 :]
+            yield (
+                data[: last_newline + 1].decode("utf-8", errors="ignore"),
+                position - len(pending),
+            )
+
+    @staticmethod
+    def _parse_player_events(text: str) -> List[Dict[str, Any]]:
+        """Extracts player connection events from server log text.
+
+        Args:
+            text (str): The log text to parse.
+
+        Returns:
+            List[Dict[str, Any]]: The events in log order, each with the keys
+            ``"event"`` (``"connected"``, ``"disconnected"`` or
+            ``"server_started"``), ``"name"``, ``"xuid"`` (both ``None`` for
+            ``"server_started"``) and ``"timestamp"`` (``None`` if the line
+            has none).
+        """
+        events: List[Dict[str, Any]] = []
+        for match in PLAYER_EVENT_PATTERN.finditer(text):
+            if match.group("server_started"):
+                events.append(
+                    {
+                        "event": "server_started",
+                        "name": None,
+                        "xuid": None,
+                        "timestamp": match.group("timestamp"),
+                    }
+                )
+                continue
+            name = match.group("name").strip()
+            xuid = match.group("xuid").strip()
+            if not name or not xuid:
+                continue
+            events.append(
+                {
+                    "event": match.group("event").lower(),
+                    "name": name,
+                    "xuid": xuid,
+                    "timestamp": match.group("timestamp"),
+                }
+            )
+        return events
+
+    def scan_log_for_player_events(self) -> List[Dict[str, Any]]:
+        """Parses player connections and disconnections appended to the server log since the last call.
+
+        Only the bytes written after the persisted read cursor are parsed; the
+        cursor is then advanced to the end of the last complete line. If the
+        log was truncated, replaced or rewritten since the last scan, it is
+        parsed from the beginning.
+
+        The cursor is shared with the player session tracking of the process
+        manager, which relies on seeing every event once. This is the only
+        method that advances it.
+
+        Returns:
+            List[Dict[str, Any]]: The new events in log order. Each event has
+            the keys ``"event"`` (``"connected"``, ``"disconnected"`` or
+            ``"server_started"``), ``"name"`` (gamertag), ``"xuid"`` (both
+            ``None`` for ``"server_started"``) and ``"timestamp"`` (the log
+            line's timestamp as ``"YYYY-MM-DD HH:MM:SS"``, or ``None``).
+            Returns an empty list if the log file doesn't exist.
+
+        Raises:
+            FileOperationError: If an OS-level error occurs while reading the
+                log file (e.g., permission issues).
+        """
+        return self._read_player_events_since_cursor(advance=True)
+
+    def _read_player_events_since_cursor(self, advance: bool) -> List[Dict[str, Any]]:
+        """Parses the log after the persisted cursor, optionally advancing it.
+
+        See :meth:`.scan_log_for_player_events`.
+        """
+        log_file = self.server_log_path
+        if not os.path.isfile(log_file):
+            self.logger.debug(
+                f"Log file not found or is not a file: {log_file} for server '{self.server_name}'."
+            )
+            return []
+
+        cursor = self._get_player_log_cursor()
+        events: List[Dict[str, Any]] = []
+        try:
+            with open(log_file, "rb") as f:
+                st = os.fstat(f.fileno())
+                start = self._resolve_log_start_offset(f, st, cursor)
+                offset = start
+                for text, offset in self._iter_log_text(f, start, st.st_size):
+                    events.extend(self._parse_player_events(text))
+
+                head_len = min(offset, _LOG_FINGERPRINT_BYTES)
+                new_cursor = {
+                    "inode": st.st_ino,
+                    "offset": offset,
+                    "head_len": head_len,
+                    "head_hash": self._log_fingerprint(f, head_len),
+                }
+        except OSError as e:
+            self.logger.error(
+                f"Error reading log file '{log_file}' for server '{self.server_name}': {e}",
+                exc_info=True,
+            )
+            raise FileOperationError(
+                f"Error reading log file '{log_file}' for server '{self.server_name}': {e}"
+            ) from e
+
+        if advance and new_cursor != cursor:
+            self._set_player_log_cursor(new_cursor)
+
+        self.logger.debug(
+            f"Server '{self.server_name}': Scanned {offset - start} new log bytes, "
+            f"found {len(events)} player event(s)."
+        )
+        return events
+
+    def scan_log_for_players(self, incremental: bool = False) -> List[Dict[str, str]]:
         """Scans the server's log file for player connection entries to extract gamertags and XUIDs.
 
-        This method reads the server's primary output log file (obtained via
-        :attr:`~.BedrockServerBaseMixin.server_log_path`) line by line. It uses a
-        regular expression to find lines matching the standard Bedrock server
-        message for player connections, which typically looks like:
-        "Player connected: <Gamertag>, xuid: <XUID>".
+        This method looks for lines in the server's primary output log file
+        (obtained via :attr:`~.BedrockServerBaseMixin.server_log_path`) matching
+        the standard Bedrock server message for player connections, which
+        typically looks like: "Player connected: <Gamertag>, xuid: <XUID>".
+
+        By default the whole log is read. Pass ``incremental=True`` to only
+        read the lines appended since the read cursor of
+        :meth:`.scan_log_for_player_events`. Either way this method never
+        moves the cursor, so it does not take events away from the player
+        session tracking.
 
         It collects unique players based on their XUID to avoid duplicates from
         multiple connections by the same player within the log.
 
+        Args:
+            incremental (bool, optional): Whether to only scan the log lines
+                after the read cursor. Defaults to ``False``.
+
         Returns:
             List[Dict[str, str]]: A list of unique player data dictionaries found
             in the log. Each dictionary has two keys:
@@ -86,40 +345,31 @@ class ServerPlayerMixin(BedrockServerBaseMixin):
             )
             return []
 
+        if incremental:
+            events = self._read_player_events_since_cursor(advance=False)
+        else:
+            try:
+                events = read_player_events_from_log(log_file)
+            except OSError as e:
+                self.logger.error(
+                    f"Error reading log file '{log_file}' for server '{self.server_name}': {e}",
+                    exc_info=True,
+                )
+                raise FileOperationError(
+                    f"Error reading log file '{log_file}' for server '{self.server_name}': {e}"
+                ) from e
+
         players_data: List[Dict[str, str]] = []
         # Use a set to track XUIDs and ensure each player is only added once per scan.
         unique_xuids = set()
-
-        try:
-            # Open the log file with error handling for encoding issues.
-            with open(log_file, "r", encoding="utf-8", errors="ignore") as f:
-                for line_number, line_content in enumerate(f, 1):
-                    # Regex to find the "Player connected" line and capture name and XUID.
-                    match = re.search(
-                        r"Player connected:\s*([^,]+),\s*xuid:\s*(\d+)",
-                        line_content,
-                        re.IGNORECASE,
-                    )
-                    if match:
-                        player_name, xuid = (
-                            match.group(1).strip(),
-                            match.group(2).strip(),
-                        )
-                        # Only add the player if they haven't been found in this scan yet.
-                        if xuid and player_name and xuid not in unique_xuids:
-                            players_data.append({"name": player_name, "xuid": xuid})
-                            unique_xuids.add(xuid)
-                            self.logger.debug(
-                                f"Found player in log: Name='{player_name}', XUID='{xuid}'"
-                            )
-        except OSError as e:
-            self.logger.error(
-                f"Error reading log file '{log_file}' for server '{self.server_name}': {e}",
-                exc_info=True,
+        for event in events:
+            if event["event"] != "connected" or event["xuid"] in unique_xuids:
+                continue
+            players_data.append({"name": event["name"], "xuid": event["xuid"]})
+            unique_xuids.add(event["xuid"])
+            self.logger.debug(
+                f"Found player in log: Name='{event['name']}', XUID='{event['xuid']}'"
             )
-            raise FileOperationError(
-                f"Error reading log file '{log_file}' for server '{self.server_name}': {e}"
-            ) from e
 
         num_found = len(players_data)
         if num_found > 0:
@@ -132,3 +382,28 @@ class ServerPlayerMixin(BedrockServerBaseMixin):
             )
 
         return players_data
+
+
+def read_player_events_from_log(log_path: str) -> List[Dict[str, Any]]:
+    """Parses all player events of a server log file, from the beginning.
+
+    Unlike :meth:`ServerPlayerMixin.scan_log_for_player_events`, this needs no
+    server instance and doesn't touch the read cursor, so it can run in a
+    worker process.
+
+    Args:
+        log_path (str): The path to the log file.
+
+    Returns:
+        List[Dict[str, Any]]: The events in log order, as returned by
+        :meth:`ServerPlayerMixin.scan_log_for_player_events`.
+
+    Raises:
+        OSError: If the log file cannot be read.
+    """
+    events: List[Dict[str, Any]] = []
+    with open(log_path, "rb") as f:
+        end = os.fstat(f.fileno()).st_size
+        for text, _ in ServerPlayerMixin._iter_log_text(f, 0, end):
+            events.extend(ServerPlayerMixin._parse_player_events(text))
+    return events
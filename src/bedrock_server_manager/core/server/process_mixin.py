@@ -7,7 +7,11 @@ system process. Its responsibilities include:
     - Starting the server process directly in the foreground (blocking call).
     - Stopping the server process, attempting graceful shutdown before force-killing.
     - Checking the current running status of the server process.
-    - Sending commands to a running server (platform-specific IPC mechanisms).
+    - Watching a started process in a waiter thread, so an unexpected exit is
+      noticed (and its exit code recorded) the moment it happens.
+    - Sending commands to a running server (platform-specific IPC mechanisms),
+      optionally waiting for the reply, which the :class:`.ServerConsole`
+      reads from the server's output log.
     - Retrieving process resource information (CPU, memory, uptime) if ``psutil``
       is available.
 
@@ -21,9 +25,12 @@ is indicated by the :const:`.PSUTIL_AVAILABLE` flag defined in this module.
 """
 import os
 import platform
+import re
+import signal
 import subprocess
+import threading
 import time
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from typing import Callable, List, Optional, Dict, Any, Pattern, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # This helps type checkers understand psutil types without making it a hard dependency.
@@ -34,15 +41,21 @@ if TYPE_CHECKING:
 from ..system import base as system_base
 from ..system import process as system_process
 from .base_server_mixin import BedrockServerBaseMixin
+from .console import ServerConsole
 from ...error import (
     MissingArgumentError,
     ServerNotRunningError,
     ServerStopError,
     SendCommandError,
+    CommandTimeoutError,
     ServerStartError,
     BSMError,
+    UserInputError,
 )
 
+DEFAULT_COMMAND_TIMEOUT_SEC = 10.0
+"""The default number of seconds :meth:`.ServerProcessMixin.send_command_and_wait` waits."""
+
 
 class ServerProcessMixin(BedrockServerBaseMixin):
     """Provides methods for managing the Bedrock server's system process.
@@ -82,9 +95,23 @@ class ServerProcessMixin(BedrockServerBaseMixin):
         """
         super().__init__(*args, **kwargs)
         self._process: Optional[subprocess.Popen] = None
+        # Captures the output of the process started by this instance.
+        self._console: Optional[ServerConsole] = None
+        # Held while a command is sent (and its reply awaited), so replies to
+        # concurrent commands do not interleave.
+        self._command_lock = threading.RLock()
+        # The last process verified by get_process_info, reused until it exits.
+        self._verified_process: Optional["psutil_for_types.Process"] = None
         self.intentionally_stopped: bool = True
         self.failure_count: int = 0
         self.start_time: float = 0
+        # Called with the server and the exit code when a process started by
+        # this instance exits without being stopped; set by the process manager.
+        self.on_process_exit: Optional[Callable[[Any, int], None]] = None
+        # How the last process started by this instance ended.
+        self.last_exit_code: Optional[int] = None
+        self.last_exit_signal: Optional[str] = None
+        self.last_exit_time: Optional[float] = None
 
     def is_running(self) -> bool:
         """Checks if the Bedrock server process is currently running and verified."""
@@ -95,6 +122,21 @@ class ServerProcessMixin(BedrockServerBaseMixin):
             self.server_name, self.server_dir, self.app_config_dir
         )
 
+    def has_process_handle(self) -> bool:
+        """Checks if this instance owns a live ``Popen`` handle for the server.
+
+        A server that was started by another manager process (or before this
+        application restarted) can still be running, but its stdin is not
+        reachable from here. Operations that need to drive the server console
+        interactively (e.g., hot backups) use this to decide whether they can
+        proceed or must fall back to a stop/start cycle.
+
+        Returns:
+            bool: ``True`` if :meth:`.start` launched the process in this
+            instance and it has not exited yet, ``False`` otherwise.
+        """
+        return self._process is not None and self._process.poll() is None
+
     def send_command(self, command: str) -> None:
         """Sends a command string to the running Bedrock server process."""
         if not command:
@@ -115,8 +157,9 @@ class ServerProcessMixin(BedrockServerBaseMixin):
         )
 
         try:
-            self._process.stdin.write(f"{command}\n".encode())
-            self._process.stdin.flush()
+            with self._command_lock:
+                self._process.stdin.write(f"{command}\n".encode())
+                self._process.stdin.flush()
             self.logger.info(
                 f"Command '{command}' sent successfully to server '{self.server_name}'."
             )
@@ -125,6 +168,67 @@ class ServerProcessMixin(BedrockServerBaseMixin):
                 f"An unexpected error occurred while sending command to '{self.server_name}': {e_unexp}"
             ) from e_unexp
 
+    def send_command_and_wait(
+        self,
+        command: str,
+        pattern: Optional[Union[str, Pattern[str]]] = None,
+        timeout: float = DEFAULT_COMMAND_TIMEOUT_SEC,
+    ) -> List[str]:
+        """Sends a command and returns the output lines the server replied with.
+
+        The reply is read from the in-memory buffer of the server's console
+        output. Commands sent to the same server are serialized, so the lines
+        returned belong to this command only (as long as nothing else, like a
+        player joining, prints at the same time).
+
+        Args:
+            command (str): The command to send.
+            pattern (Optional[Union[str, Pattern[str]]], optional): A regular
+                expression matching the last line of the reply. If ``None``,
+                the reply is everything printed until the output goes quiet.
+            timeout (float, optional): The maximum number of seconds to wait
+                for the reply.
+
+        Returns:
+            List[str]: The lines printed after the command was sent, up to and
+            including the line matching `pattern`.
+
+        Raises:
+            MissingArgumentError: If `command` is empty.
+            UserInputError: If `pattern` is not a valid regular expression.
+            ServerNotRunningError: If the server is not running.
+            SendCommandError: If the server was not started by this instance,
+                so its output cannot be read, or sending fails.
+            CommandTimeoutError: If no line matched `pattern` within `timeout`
+                seconds, or the server exited first.
+        """
+        if not command:
+            raise MissingArgumentError("Command cannot be empty.")
+        try:
+            regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        except re.error as e:
+            raise UserInputError(f"Invalid reply pattern '{pattern}': {e}") from e
+
+        with self._command_lock:
+            console = self._console
+            if console is None or not self.has_process_handle():
+                if not self.is_running():
+                    raise ServerNotRunningError(
+                        f"Cannot send command: Server '{self.server_name}' is not running."
+                    )
+                raise SendCommandError(
+                    f"Cannot read the reply of server '{self.server_name}': it was not started by this manager."
+                )
+            position = console.position
+            self.send_command(command)
+            lines, completed = console.wait_for(position, regex, timeout)
+
+        if not completed:
+            raise CommandTimeoutError(
+                f"Server '{self.server_name}' did not answer '{command}' within {timeout:g} seconds."
+            )
+        return lines
+
     def start(self) -> None:
         """Starts the Bedrock server process."""
         if not hasattr(self, "is_installed") or not self.is_installed():
@@ -159,6 +263,12 @@ class ServerProcessMixin(BedrockServerBaseMixin):
             raise ServerStartError(f"Server '{self.server_name}' has a stale PID file.")
 
         try:
+            try:
+                log_offset = os.path.getsize(output_file)
+            except OSError:
+                log_offset = 0
+            # The output goes straight to the log file rather than through a
+            # pipe, so the server keeps running if this process exits.
             with open(output_file, "ab") as f:
                 self._process = subprocess.Popen(
                     [self.bedrock_executable_path],
@@ -172,10 +282,22 @@ class ServerProcessMixin(BedrockServerBaseMixin):
                         else 0
                     ),
                 )
+            # The console follows the log and keeps the latest lines in
+            # memory for command replies.
+            self._console = ServerConsole(
+                output_file, offset=log_offset, name=self.server_name
+            )
+            self._console.start()
 
             system_process.write_pid_to_file(pid_file_path, self._process.pid)
             self.intentionally_stopped = False
             self.start_time = time.time()
+            threading.Thread(
+                target=self._watch_process,
+                args=(self._process,),
+                name=f"ServerWaiter-{self.server_name}",
+                daemon=True,
+            ).start()
 
             if hasattr(self, "set_status_in_config"):
                 self.set_status_in_config("RUNNING")
@@ -238,6 +360,10 @@ class ServerProcessMixin(BedrockServerBaseMixin):
 
         self.logger.info(f"Attempting to stop server '{self.server_name}'...")
 
+        # Mark the stop before the process exits, so its waiter thread does
+        # not report the exit as a crash.
+        self.intentionally_stopped = True
+
         try:
             self.logger.info(f"Sending 'stop' command to server '{self.server_name}'.")
             self._process.stdin.write(b"stop\n")
@@ -258,6 +384,10 @@ class ServerProcessMixin(BedrockServerBaseMixin):
             self._process.kill()
 
         self._process = None
+        if self._console is not None:
+            self._console.close()
+            self._console = None
+        self._verified_process = None
         self.intentionally_stopped = True
 
         pid_file_path = self.get_pid_file_path()
@@ -265,14 +395,75 @@ class ServerProcessMixin(BedrockServerBaseMixin):
 
         if hasattr(self, "set_status_in_config"):
             self.set_status_in_config("STOPPED")
+        if hasattr(self, "player_count"):
+            self.player_count = 0
         self.logger.info(f"Server '{self.server_name}' stopped successfully.")
 
+    def _watch_process(self, process: subprocess.Popen) -> None:
+        """Waits for a started server process to exit and records how it ended.
+
+        Runs in a daemon thread started by :meth:`.start`. If the process
+        exits while it is still this instance's process and was not stopped
+        through :meth:`.stop`, :attr:`on_process_exit` is called right away,
+        instead of the exit being noticed on the monitor's next poll.
+
+        Args:
+            process (subprocess.Popen): The process to wait for.
+        """
+        returncode = process.wait()
+        console = self._console
+        if process is self._process and console is not None:
+            # No more output will follow; let waiting callers return.
+            console.close()
+        self.last_exit_code = returncode
+        self.last_exit_time = time.time()
+        self.last_exit_signal = None
+        if returncode < 0:
+            # On POSIX, a negative code is the signal that ended the process.
+            try:
+                self.last_exit_signal = signal.Signals(-returncode).name
+            except ValueError:
+                self.last_exit_signal = str(-returncode)
+
+        if process is not self._process or self.intentionally_stopped:
+            return
+
+        self.logger.warning(
+            f"Server '{self.server_name}' exited unexpectedly "
+            f"({self.describe_last_exit()})."
+        )
+        callback = self.on_process_exit
+        if callback is not None:
+            try:
+                callback(self, returncode)
+            except Exception as e:
+                self.logger.error(
+                    f"Error handling the exit of server '{self.server_name}': {e}",
+                    exc_info=True,
+                )
+
+    def describe_last_exit(self) -> str:
+        """Describes how the last process started by this instance ended.
+
+        Returns:
+            str: E.g. ``"exit code 1"`` or ``"killed by SIGSEGV"``, or
+            ``"exit status unknown"`` if no exit was observed.
+        """
+        if self.last_exit_signal is not None:
+            return f"killed by {self.last_exit_signal}"
+        if self.last_exit_code is not None:
+            return f"exit code {self.last_exit_code}"
+        return "exit status unknown"
+
     def get_process_info(self) -> Optional[Dict[str, Any]]:
         """Gets resource usage information (PID, CPU, Memory, Uptime) for the running server process.
 
         This method first uses
         :func:`~.core.system.process.get_verified_bedrock_process` to locate and
         verify the Bedrock server process associated with this server instance.
+        The verified process is kept and reused by later calls for as long as
+        it is running, so the PID file is read and the executable and working
+        directory are checked only once per process.
         If a valid process is found, it then uses the :attr:`._resource_monitor`
         (an instance of :class:`~.core.system.base.ResourceMonitor` from the base
         mixin) to calculate its current resource statistics.
@@ -280,19 +471,24 @@ class ServerProcessMixin(BedrockServerBaseMixin):
         Returns:
             Optional[Dict[str, Any]]: A dictionary containing process information
             if the server is running, verified, and ``psutil`` is available.
-            The dictionary has keys: "pid", "cpu_percent", "memory_mb", "uptime".
+            The dictionary has keys: "pid", "cpu_percent", "memory_mb", "uptime",
+            "num_threads" and, where the platform reports them, "io_read_mb" and
+            "io_write_mb".
             Returns ``None`` if the server is not running, cannot be verified,
             ``psutil`` is unavailable, or if an error occurs during statistics retrieval.
-            Example: ``{"pid": 1234, "cpu_percent": 15.2, "memory_mb": 256.5, "uptime": "0:10:30"}``
+            Example: ``{"pid": 1234, "cpu_percent": 15.2, "memory_mb": 256.5, "uptime": "0:10:30", "num_threads": 40}``
+            (see :meth:`~.core.system.base.ResourceMonitor.get_stats`).
         """
         try:
-            # 1. Find and verify the process.
+            # 1. Find and verify the process, unless the one verified last is
+            # still running. psutil's is_running() also detects PID reuse.
             # get_verified_bedrock_process handles cases where psutil might not be available.
-            process_obj: Optional["psutil_for_types.Process"] = (
-                system_process.get_verified_bedrock_process(
+            process_obj = self._verified_process
+            if process_obj is None or not process_obj.is_running():
+                process_obj = system_process.get_verified_bedrock_process(
                     self.server_name, self.server_dir, self.app_config_dir
                 )
-            )
+                self._verified_process = process_obj
 
             if process_obj is None:
                 self.logger.debug(
@@ -303,11 +499,16 @@ class ServerProcessMixin(BedrockServerBaseMixin):
             # 2. Delegate the measurement of the found process to the resource monitor.
             # _resource_monitor is initialized in BedrockServerBaseMixin.
             # It also checks for PSUTIL_AVAILABLE.
-            return self._resource_monitor.get_stats(process_obj)
+            stats = self._resource_monitor.get_stats(process_obj)
+            if stats is None:
+                # The process exited between the check and the measurement.
+                self._verified_process = None
+            return stats
 
         except (
             BSMError
         ) as e_bsm:  # Catch known BSM errors, e.g. from get_verified_bedrock_process
+            self._verified_process = None
             self.logger.warning(
                 f"Known error while trying to get process info for '{self.server_name}': {e_bsm}"
             )
@@ -17,7 +17,9 @@ Additionally, this mixin handles reading essential dynamic properties from the
 server's live ``server.properties`` file, such as the world name (`level-name`).
 
 Key functionalities:
-    - Loading and saving the server-specific JSON configuration.
+    - Loading and saving the server-specific JSON configuration, through an
+      in-memory write-through cache so repeated reads (status, version,
+      autostart lookups) do not query the database.
     - Migrating older server configuration formats to the current schema.
     - Providing getter and setter methods for various state attributes like
       installed version, target version, status, and custom key-value pairs.
@@ -26,7 +28,10 @@ Key functionalities:
 
 """
 import os
+import copy
 import json
+import threading
+import time
 from typing import Optional, Any, Dict, TYPE_CHECKING
 
 from sqlalchemy.orm import Session
@@ -42,6 +47,9 @@ from ...error import (
     AppFileNotFoundError,
 )
 
+if TYPE_CHECKING:
+    from ..status_registry import ServerStatusRegistry
+
 
 # Version for the server-specific JSON config schema
 SERVER_CONFIG_SCHEMA_VERSION: int = 2
@@ -55,6 +63,18 @@ Currently, version 2 represents a nested structure, while older (v1) configs
 were flat and lacked a version key.
 """
 
+SERVER_CONFIG_CACHE_MAX_AGE_SEC: float = 30.0
+"""Maximum age of the in-memory server config before it is re-read from the database.
+
+Changes made by other processes are normally detected immediately through
+:meth:`~bedrock_server_manager.db.database.Database.get_change_stamp`; this
+bounds staleness if a change is missed (e.g., due to coarse file timestamps).
+"""
+
+SERVER_CONFIG_CACHE_TTL_NO_STAMP_SEC: float = 2.0
+"""Lifetime of the in-memory server config when the database cannot provide a
+change stamp (non-SQLite databases)."""
+
 
 class ServerStateMixin(BedrockServerBaseMixin):
     """Manages persistent state and configuration for a Bedrock server instance.
@@ -94,7 +114,58 @@ class ServerStateMixin(BedrockServerBaseMixin):
         initialized or will be by a preceding class in the MRO.
         """
         super().__init__(*args, **kwargs)
-        self.player_count = 0
+        # Set by AppContext.get_server(); receives status changes as they happen.
+        self.status_registry: Optional["ServerStatusRegistry"] = None
+        self._player_count: int = 0
+        # Round-trip time of the last status ping by the monitor, if any.
+        self.ping_latency_ms: Optional[float] = None
+
+        # In-memory write-through cache of the server's config row.
+        self._config_cache: Optional[Dict[str, Any]] = None
+        self._config_cache_stamp: Any = None
+        self._config_cache_loaded_at: float = 0.0
+        self._config_cache_lock = threading.RLock()
+        self.config_cache_hits: int = 0
+        self.config_cache_misses: int = 0
+
+    @property
+    def player_count(self) -> int:
+        """int: The number of players online, as last reported by the monitor."""
+        return self._player_count
+
+    @player_count.setter
+    def player_count(self, value: int) -> None:
+        self._player_count = value
+        self._publish_status(player_count=value)
+
+    def _publish_status(self, **fields: Any) -> None:
+        """Publishes changed status fields to the attached status registry.
+
+        Does nothing if no :class:`~.core.status_registry.ServerStatusRegistry`
+        is attached. If the registry has no entry for this server yet, the
+        entry is only created for installed servers and is filled in with the
+        remaining fields from the server's config, so that partially known
+        servers never appear in server listings.
+
+        Args:
+            **fields (Any): The changed fields (``status``, ``version``,
+                ``player_count``).
+        """
+        registry = self.status_registry
+        if registry is None:
+            return
+        try:
+            if not registry.contains(self.server_name):
+                if not (hasattr(self, "is_installed") and self.is_installed()):
+                    return
+                fields.setdefault("status", self.get_status_from_config())
+                fields.setdefault("version", self.get_version())
+                fields.setdefault("player_count", self._player_count)
+            registry.update(self.server_name, **fields)
+        except Exception as e:
+            self.logger.debug(
+                f"Could not publish status of '{self.server_name}' to the registry: {e}"
+            )
 
     def _get_default_server_config(self) -> Dict[str, Any]:
         """Returns the default structure and values for a server's JSON config file.
@@ -123,28 +194,86 @@ class ServerStateMixin(BedrockServerBaseMixin):
             "custom": {},
         }
 
-    def _load_server_config(self) -> Dict[str, Any]:
-        """Loads the server-specific JSON configuration.
-
-        This method handles:
-            -   Ensuring the server's configuration directory exists.
-            -   Creating a default configuration file (using :meth:`._get_default_server_config`)
-                if one does not exist.
-            -   Reading the JSON content if the file exists.
-            -   Handling empty or malformed JSON files by initializing with defaults
-                and attempting migration if necessary.
-            -   Checking the ``config_schema_version`` and triggering migration
-                (via :meth:`._migrate_server_config_v1_to_v2`) if an older schema
-                (specifically v1, identified by lack of version key) is detected.
-                The migrated configuration is then saved.
+    def _get_db_change_stamp(self) -> Any:
+        """Returns the database change stamp, or ``None`` if unavailable."""
+        try:
+            return self.settings.db.get_change_stamp()
+        except Exception as e:
+            self.logger.debug(f"Could not get database change stamp: {e}")
+            return None
+
+    def _is_config_cache_valid(self) -> bool:
+        """Checks whether the cached server config can be used without a query.
+
+        The cache is valid if it is populated, younger than
+        :const:`.SERVER_CONFIG_CACHE_MAX_AGE_SEC`, and the database change
+        stamp has not moved since it was loaded (i.e., no process has written
+        to the database). Without a change stamp, the shorter
+        :const:`.SERVER_CONFIG_CACHE_TTL_NO_STAMP_SEC` applies instead.
+        """
+        if self._config_cache is None:
+            return False
+        age = time.monotonic() - self._config_cache_loaded_at
+        if self._config_cache_stamp is None:
+            return age < SERVER_CONFIG_CACHE_TTL_NO_STAMP_SEC
+        return (
+            age < SERVER_CONFIG_CACHE_MAX_AGE_SEC
+            and self._get_db_change_stamp() == self._config_cache_stamp
+        )
+
+    def _store_config_cache(self, config_data: Dict[str, Any], stamp: Any) -> None:
+        """Replaces the cached server config (the cache keeps its own copy)."""
+        self._config_cache = copy.deepcopy(config_data)
+        self._config_cache_stamp = stamp
+        self._config_cache_loaded_at = time.monotonic()
+
+    def invalidate_config_cache(self) -> None:
+        """Discards the cached server config so the next access re-reads the database.
+
+        Call this after modifying the server's row in the database directly
+        (i.e., not through this instance).
+        """
+        with self._config_cache_lock:
+            self._config_cache = None
+
+    def get_config_cache_stats(self) -> Dict[str, Any]:
+        """Returns hit/miss counters for the in-memory server config cache.
 
         Returns:
-            Dict[str, Any]: The loaded (and potentially migrated) server configuration
-            as a dictionary.
+            Dict[str, Any]: A dictionary with keys ``"hits"``, ``"misses"`` and
+            ``"hit_rate"`` (a float between 0 and 1, or 0.0 before any access).
+        """
+        total = self.config_cache_hits + self.config_cache_misses
+        return {
+            "hits": self.config_cache_hits,
+            "misses": self.config_cache_misses,
+            "hit_rate": (self.config_cache_hits / total) if total else 0.0,
+        }
 
-        Raises:
-            FileOperationError: If directory creation or file reading fails due
-                to ``OSError``.
+    def _get_cached_server_config(self) -> Dict[str, Any]:
+        """Returns the cached server config, reloading it from the database if stale.
+
+        The returned dictionary is the cache itself and must not be mutated;
+        use :meth:`._load_server_config` to get a private copy.
+        """
+        with self._config_cache_lock:
+            if self._is_config_cache_valid():
+                self.config_cache_hits += 1
+                return self._config_cache  # type: ignore[return-value]
+
+            self.config_cache_misses += 1
+            # Take the stamp before reading so a concurrent write is not masked.
+            stamp = self._get_db_change_stamp()
+            self._store_config_cache(self._read_server_config_from_db(), stamp)
+            return self._config_cache  # type: ignore[return-value]
+
+    def _read_server_config_from_db(self) -> Dict[str, Any]:
+        """Reads the server's config row from the database, creating it if missing.
+
+        Returns:
+            Dict[str, Any]: The server configuration stored in the database, or
+            the defaults from :meth:`._get_default_server_config` for a newly
+            created row.
         """
         with self.settings.db.session_manager() as db:
             server = (
@@ -164,19 +293,49 @@ class ServerStateMixin(BedrockServerBaseMixin):
             db.refresh(server)
             return server.config
 
+    def _load_server_config(self) -> Dict[str, Any]:
+        """Loads the server-specific configuration.
+
+        The configuration is served from an in-memory cache that is kept in
+        sync by :meth:`._save_server_config` (write-through) and revalidated
+        against the database change stamp, so that changes made by other
+        processes are picked up (see :meth:`._is_config_cache_valid`). On a
+        cache miss the row is read from the database, and created with the
+        defaults from :meth:`._get_default_server_config` if it does not exist.
+
+        Returns:
+            Dict[str, Any]: A copy of the server configuration that the caller
+            may freely modify.
+
+        Raises:
+            FileOperationError: If directory creation or file reading fails due
+                to ``OSError``.
+        """
+        return copy.deepcopy(self._get_cached_server_config())
+
     def _save_server_config(self, config_data: Dict[str, Any]) -> None:
         """Saves the server configuration data to the database.
 
+        The in-memory cache is updated with `config_data` after the write
+        commits (write-through).
+
         Args:
             config_data (Dict[str, Any]): The server configuration dictionary to save.
         """
-        with self.settings.db.session_manager() as db:
-            server = (
-                db.query(Server).filter(Server.server_name == self.server_name).first()
-            )
+        with self._config_cache_lock:
+            with self.settings.db.session_manager() as db:
+                server = (
+                    db.query(Server)
+                    .filter(Server.server_name == self.server_name)
+                    .first()
+                )
+                if server:
+                    server.config = config_data
+                    db.commit()
             if server:
-                server.config = config_data
-                db.commit()
+                self._store_config_cache(config_data, self._get_db_change_stamp())
+            else:
+                self._config_cache = None
 
     def _manage_json_config(
         self,
@@ -194,7 +353,9 @@ class ServerStateMixin(BedrockServerBaseMixin):
         the dot-separated `key` (e.g., "server_info.status").
         For "write" operations, it sets the `value` at the location specified by `key`,
         creating intermediate dictionaries if they don't exist. After a "write",
-        the entire configuration is saved back to the file via :meth:`._save_server_config`.
+        the entire configuration is saved back to the database via
+        :meth:`._save_server_config`, unless the key already holds `value`.
+        Reads are served from the in-memory config cache.
 
         Args:
             key (str): The dot-separated key indicating the path to the value within
@@ -225,10 +386,8 @@ class ServerStateMixin(BedrockServerBaseMixin):
                 f"Invalid operation: '{operation}'. Must be 'read' or 'write'."
             )
 
-        current_config = self._load_server_config()
-
         if operation_lower == "read":
-            d = current_config
+            d = self._get_cached_server_config()
             try:
                 for k_part in key.split("."):
                     if not isinstance(d, dict):  # Ensure intermediate path is dict
@@ -240,7 +399,8 @@ class ServerStateMixin(BedrockServerBaseMixin):
                 self.logger.debug(
                     f"Server Config Read: Key='{key}', Value='{d}' for '{self.server_name}'"
                 )
-                return d
+                # Do not hand out references into the cache.
+                return copy.deepcopy(d) if isinstance(d, (dict, list)) else d
             except KeyError:  # Key part not found
                 self.logger.debug(
                     f"Server Config Read: Key='{key}' not found for '{self.server_name}'. Returning None."
@@ -257,29 +417,36 @@ class ServerStateMixin(BedrockServerBaseMixin):
             f"Server Config Write: Key='{key}', New Value='{value}' for '{self.server_name}'"
         )
 
-        d = current_config
-        keys_list = key.split(".")
-        for k_part in keys_list[:-1]:  # Navigate to the parent dictionary
-            # Ensure d is a dict before calling setdefault. If not, it's an error.
-            if not isinstance(d, dict):
-                raise ConfigParseError(
-                    f"Cannot create nested key '{key}': part '{k_part}' conflicts with existing non-dictionary value in config for '{self.server_name}'."
-                )
-            d = d.setdefault(k_part, {})
-            # After setdefault, if the new d is not a dict (e.g. if setdefault returned a non-dict default, though it shouldn't here), error out.
+        # Hold the cache lock across read-modify-write so concurrent writers in
+        # this process do not overwrite each other's changes.
+        with self._config_cache_lock:
+            current_config = self._load_server_config()
+            d = current_config
+            keys_list = key.split(".")
+            for k_part in keys_list[:-1]:  # Navigate to the parent dictionary
+                # Ensure d is a dict before calling setdefault. If not, it's an error.
+                if not isinstance(d, dict):
+                    raise ConfigParseError(
+                        f"Cannot create nested key '{key}': part '{k_part}' conflicts with existing non-dictionary value in config for '{self.server_name}'."
+                    )
+                d = d.setdefault(k_part, {})
+                # After setdefault, if the new d is not a dict (e.g. if setdefault returned a non-dict default, though it shouldn't here), error out.
+                if not isinstance(d, dict):
+                    raise ConfigParseError(
+                        f"Cannot create nested key '{key}': part '{k_part}' resulted in a non-dictionary in config for '{self.server_name}'."
+                    )
+
+            # Ensure the final parent is a dictionary before setting the key
             if not isinstance(d, dict):
                 raise ConfigParseError(
-                    f"Cannot create nested key '{key}': part '{k_part}' resulted in a non-dictionary in config for '{self.server_name}'."
+                    f"Cannot set key '{keys_list[-1]}' in path '{'.'.join(keys_list[:-1])}': parent is not a dictionary in config for '{self.server_name}'."
                 )
+            if keys_list[-1] in d and d[keys_list[-1]] == value:
+                # Nothing changed; avoid a database write.
+                return None
+            d[keys_list[-1]] = value
 
-        # Ensure the final parent is a dictionary before setting the key
-        if not isinstance(d, dict):
-            raise ConfigParseError(
-                f"Cannot set key '{keys_list[-1]}' in path '{'.'.join(keys_list[:-1])}': parent is not a dictionary in config for '{self.server_name}'."
-            )
-        d[keys_list[-1]] = value
-
-        self._save_server_config(current_config)
+            self._save_server_config(current_config)
         return None  # Explicitly return None for write operations
 
     def get_version(self) -> str:
@@ -323,6 +490,7 @@ class ServerStateMixin(BedrockServerBaseMixin):
         self._manage_json_config(
             key="server_info.installed_version", operation="write", value=version_string
         )
+        self._publish_status(version=version_string)
         self.logger.info(f"Version for '{self.server_name}' set to '{version_string}'.")
 
     def get_autoupdate(self) -> bool:
@@ -475,6 +643,7 @@ class ServerStateMixin(BedrockServerBaseMixin):
         self._manage_json_config(
             key="server_info.status", operation="write", value=status_string
         )
+        self._publish_status(status=status_string)
         self.logger.info(
             f"Status in JSON config for '{self.server_name}' set to '{status_string}'."
         )
@@ -713,4 +882,5 @@ class ServerStateMixin(BedrockServerBaseMixin):
         self.logger.debug(
             f"Final determined status for '{self.server_name}': {final_status}"
         )
+        self._publish_status(status=final_status)
         return final_status
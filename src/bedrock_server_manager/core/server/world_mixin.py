@@ -23,11 +23,19 @@ with the filesystem within the server's ``worlds`` subdirectory.
 import os
 import shutil
 import zipfile
-from typing import Optional, Any
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 # Local application imports.
 from .base_server_mixin import BedrockServerBaseMixin
 from ..system import base as system_base_utils
+from ..world_archive import (
+    DEFAULT_COMPRESSION_LEVEL,
+    extract_archive,
+    iter_world_archive,
+    make_staging_directory,
+    replace_directory,
+    write_world_archive,
+)
 from ...error import (
     MissingArgumentError,
     ExtractError,
@@ -124,9 +132,15 @@ class ServerWorldMixin(BedrockServerBaseMixin):
         The extraction target is a subdirectory named `target_world_dir_name`
         within the server's main "worlds" folder (see :attr:`._worlds_base_dir_in_server`).
 
+        The archive is extracted with :func:`~.core.world_archive.extract_archive`
+        (in parallel, on ``backup.compression_workers`` threads, with every file
+        checked against its CRC) into a staging directory next to the target.
+        Only once that succeeds is the staging directory renamed into place, so
+        a failed extraction leaves any existing world untouched.
+
         .. warning::
-            If the `target_world_dir_name` directory already exists, **it will be
-            deleted** before extraction to ensure a clean import.
+            If the `target_world_dir_name` directory already exists, **it is
+            replaced** by the extracted world and deleted in the background.
 
         Args:
             mcworld_file_path (str): The absolute path to the ``.mcworld`` file
@@ -144,11 +158,11 @@ class ServerWorldMixin(BedrockServerBaseMixin):
                 are empty or not strings.
             AppFileNotFoundError: If the source `mcworld_file_path` does not exist
                 or is not a file.
-            FileOperationError: If creating the target directory structure or
-                clearing a pre-existing target directory fails (e.g., due to
+            FileOperationError: If creating the staging directory, extracting
+                into it or swapping it into place fails (e.g., due to
                 permissions or other ``OSError``).
             ExtractError: If the ``.mcworld`` file is not a valid ZIP archive or
-                if an error occurs during the extraction process itself.
+                one of its files fails the CRC check.
         """
         if not isinstance(mcworld_file_path, str) or not mcworld_file_path:
             raise MissingArgumentError(
@@ -169,43 +183,33 @@ class ServerWorldMixin(BedrockServerBaseMixin):
         if not os.path.isfile(mcworld_file_path):
             raise AppFileNotFoundError(mcworld_file_path, ".mcworld file")
 
-        # Ensure a clean target directory by removing it if it exists.
-        if os.path.exists(full_target_extract_dir):
-            self.logger.warning(
-                f"Target world directory '{full_target_extract_dir}' already exists. Removing its contents."
-            )
-            try:
-                shutil.rmtree(full_target_extract_dir)
-            except OSError as e:
-                raise FileOperationError(
-                    f"Failed to clear target world directory '{full_target_extract_dir}': {e}"
-                ) from e
-
-        # Recreate the empty target directory.
         try:
-            os.makedirs(full_target_extract_dir, exist_ok=True)
+            staging_dir = make_staging_directory(full_target_extract_dir)
         except OSError as e:
             raise FileOperationError(
-                f"Failed to create target world directory '{full_target_extract_dir}': {e}"
+                f"Failed to create a staging directory for world '{full_target_extract_dir}': {e}"
             ) from e
 
-        # Extract the world archive.
+        # Extract the world archive next to the target, then swap it in.
+        _level, workers = self._get_world_archive_options()
         self.logger.info(
             f"Server '{self.server_name}': Extracting '{mcworld_filename}'..."
         )
         try:
-            with zipfile.ZipFile(mcworld_file_path, "r") as zip_ref:
-                zip_ref.extractall(full_target_extract_dir)
+            stats = extract_archive(mcworld_file_path, staging_dir, workers)
+            if os.path.exists(full_target_extract_dir):
+                self.logger.warning(
+                    f"Target world directory '{full_target_extract_dir}' already exists. Replacing it."
+                )
+            replace_directory(staging_dir, full_target_extract_dir)
             self.logger.info(
-                f"Server '{self.server_name}': Successfully extracted world to '{full_target_extract_dir}'."
+                f"Server '{self.server_name}': Successfully extracted world to '{full_target_extract_dir}' "
+                f"({stats['files']} files, {stats['throughput_mb_s']} MB/s on {stats['workers']} threads)."
             )
             return full_target_extract_dir
         except zipfile.BadZipFile as e:
-            # Clean up the partially created directory on failure.
-            if os.path.exists(full_target_extract_dir):
-                shutil.rmtree(full_target_extract_dir, ignore_errors=True)
             raise ExtractError(
-                f"Invalid .mcworld file (not a valid zip): {mcworld_filename}"
+                f"Invalid .mcworld file (not a valid zip): {mcworld_filename}: {e}"
             ) from e
         except OSError as e:
             raise FileOperationError(
@@ -215,21 +219,45 @@ class ServerWorldMixin(BedrockServerBaseMixin):
             raise FileOperationError(
                 f"Unexpected error extracting world '{mcworld_filename}' for server '{self.server_name}': {e_unexp}"
             ) from e_unexp
+        finally:
+            # Nothing is left to clean up once the swap succeeded.
+            if os.path.isdir(staging_dir):
+                shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def _get_world_archive_options(self) -> Tuple[int, int]:
+        """Returns the ``(compression_level, workers)`` to archive and extract worlds with.
+
+        Read from the ``backup.compression_level`` (0-9, default 6) and
+        ``backup.compression_workers`` (``0`` = one per CPU) settings.
+        """
+        try:
+            level = int(
+                self.settings.get("backup.compression_level", DEFAULT_COMPRESSION_LEVEL)
+            )
+        except (TypeError, ValueError):
+            level = DEFAULT_COMPRESSION_LEVEL
+        try:
+            workers = int(self.settings.get("backup.compression_workers", 0))
+        except (TypeError, ValueError):
+            workers = 0
+        return max(0, min(9, level)), workers
 
     def export_world_directory_to_mcworld(
         self, world_dir_name: str, target_mcworld_file_path: str
-    ) -> None:
+    ) -> Dict[str, Any]:
         """Exports a specified world directory into a ``.mcworld`` archive file.
 
         This method takes the name of a world directory (located within the server's
-        "worlds" folder), archives its entire contents into a ZIP file, and then
-        renames this ZIP file to have a ``.mcworld`` extension, saving it to
-        `target_mcworld_file_path`.
+        "worlds" folder) and archives its entire contents into
+        `target_mcworld_file_path` using
+        :func:`~.core.world_archive.write_world_archive`: already-compressed
+        files such as LevelDB tables are stored as-is and the rest is
+        compressed in parallel, at the level set by ``backup.compression_level``.
 
         The parent directory for `target_mcworld_file_path` will be created if
         it does not exist. If `target_mcworld_file_path` itself already exists,
-        it will be overwritten. A temporary ``.zip`` file is created during the
-        process and is cleaned up.
+        it will be overwritten. The archive is written to a temporary file next
+        to the target and renamed into place once complete.
 
         Args:
             world_dir_name (str): The name of the world directory to export,
@@ -237,6 +265,11 @@ class ServerWorldMixin(BedrockServerBaseMixin):
             target_mcworld_file_path (str): The absolute path where the resulting
                 ``.mcworld`` archive file should be saved.
 
+        Returns:
+            Dict[str, Any]: The export statistics (file counts, sizes, duration
+            and ``"throughput_mb_s"``), as returned by
+            :func:`~.core.world_archive.write_world_archive`.
+
         Raises:
             MissingArgumentError: If `world_dir_name` or `target_mcworld_file_path`
                 are empty or not strings.
@@ -244,10 +277,9 @@ class ServerWorldMixin(BedrockServerBaseMixin):
                 (``<server_dir>/worlds/<world_dir_name>``) does not exist or is not a directory.
             FileOperationError: If creating the parent directory for the
                 `target_mcworld_file_path` fails due to an ``OSError``.
-            BackupRestoreError: If creating the ZIP archive (via ``shutil.make_archive``)
-                or renaming it to ``.mcworld`` fails, or for other unexpected errors
-                during the export process. This can wrap underlying ``OSError`` or
-                other exceptions.
+            BackupRestoreError: If writing the archive fails, or for other
+                unexpected errors during the export process. This can wrap
+                underlying ``OSError`` or other exceptions.
         """
         if not isinstance(world_dir_name, str) or not world_dir_name:
             raise MissingArgumentError(
@@ -278,57 +310,79 @@ class ServerWorldMixin(BedrockServerBaseMixin):
                     f"Cannot create target directory '{target_parent_dir}': {e}"
                 ) from e
 
-        archive_base_name_no_ext = os.path.splitext(target_mcworld_file_path)[0]
-        temp_zip_path = archive_base_name_no_ext + ".zip"
-
+        level, workers = self._get_world_archive_options()
         try:
-            self.logger.debug(
-                f"Creating temporary ZIP archive at '{archive_base_name_no_ext}' for world '{world_dir_name}'."
-            )
-            # Create a zip archive of the world directory's contents.
-            shutil.make_archive(
-                base_name=archive_base_name_no_ext,
-                format="zip",
-                root_dir=full_source_world_dir,
-                base_dir=".",
+            stats = write_world_archive(
+                full_source_world_dir,
+                target_mcworld_file_path,
+                compression_level=level,
+                workers=workers,
             )
-            self.logger.debug(f"Successfully created temporary ZIP: {temp_zip_path}")
-
-            if not os.path.exists(temp_zip_path):
-                raise BackupRestoreError(
-                    f"Archive process completed but temp zip '{temp_zip_path}' not found."
-                )
-
-            # Rename the .zip to .mcworld, overwriting if necessary.
-            if os.path.exists(target_mcworld_file_path):
-                self.logger.warning(
-                    f"Target file '{target_mcworld_file_path}' exists. Overwriting."
-                )
-                os.remove(target_mcworld_file_path)
-            os.rename(temp_zip_path, target_mcworld_file_path)
-            self.logger.info(
-                f"Server '{self.server_name}': World export successful. Created: {target_mcworld_file_path}"
-            )
-
+        except BackupRestoreError:
+            raise
         except OSError as e:
-            if os.path.exists(temp_zip_path):
-                os.remove(temp_zip_path)  # Clean up temporary file on failure.
             raise BackupRestoreError(
                 f"Failed to create .mcworld for server '{self.server_name}', world '{world_dir_name}': {e}"
             ) from e
         except Exception as e_unexp:
-            if os.path.exists(temp_zip_path):
-                os.remove(temp_zip_path)  # Clean up temporary file on failure.
             raise BackupRestoreError(
                 f"Unexpected error exporting world for server '{self.server_name}', world '{world_dir_name}': {e_unexp}"
             ) from e_unexp
 
+        self.logger.info(
+            f"Server '{self.server_name}': World export successful. Created: {target_mcworld_file_path} "
+            f"({stats['bytes_in']} bytes in {stats['seconds']}s, {stats['throughput_mb_s']} MB/s)."
+        )
+        return stats
+
+    def iter_world_directory_as_mcworld(
+        self, world_dir_name: str, stats: Optional[Dict[str, Any]] = None
+    ) -> Iterator[bytes]:
+        """Yields a ``.mcworld`` archive of a world directory as byte chunks.
+
+        This is the streaming counterpart of
+        :meth:`.export_world_directory_to_mcworld`, for sending an export
+        directly (e.g., as an HTTP response) without writing a file. The
+        archive is produced lazily, so the world must stay unchanged while the
+        returned iterator is consumed.
+
+        Args:
+            world_dir_name (str): The name of the world directory to export,
+                relative to the server's "worlds" folder.
+            stats (Optional[Dict[str, Any]], optional): If given, updated with
+                the export statistics once the archive is complete.
+
+        Returns:
+            Iterator[bytes]: The archive data.
+
+        Raises:
+            MissingArgumentError: If `world_dir_name` is empty.
+            AppFileNotFoundError: If the world directory does not exist.
+        """
+        if not isinstance(world_dir_name, str) or not world_dir_name:
+            raise MissingArgumentError(
+                "Source world directory name cannot be empty and must be a string."
+            )
+        full_source_world_dir = os.path.join(
+            self._worlds_base_dir_in_server, world_dir_name
+        )
+        if not os.path.isdir(full_source_world_dir):
+            raise AppFileNotFoundError(full_source_world_dir, "Source world directory")
+
+        level, workers = self._get_world_archive_options()
+        return iter_world_archive(
+            full_source_world_dir,
+            compression_level=level,
+            workers=workers,
+            stats=stats,
+        )
+
     def import_active_world_from_mcworld(self, mcworld_backup_file_path: str) -> str:
         """Imports a ``.mcworld`` file, replacing the server's currently active world.
 
         .. warning::
             This is a **DESTRUCTIVE** operation. The existing active world directory
-            will be deleted before the new world is imported.
+            is replaced by the imported world once it has been fully extracted.
 
         This method first determines the name of the server's active world by
         calling ``self.get_world_name()`` (expected from
@@ -0,0 +1,211 @@
+# bedrock_server_manager/core/status_registry.py
+"""Provides an in-memory, event-driven registry of server status.
+
+Listing servers used to mean scanning the servers directory and querying
+every server (process check, PID file, database) on each request. Instead,
+the :class:`ServerStatusRegistry` holds the latest known summary of every
+installed server and is updated as things happen:
+
+    - :class:`~.core.server.state_mixin.ServerStateMixin` publishes status,
+      version, and player count changes as they are written (start, stop,
+      status reconciliation, updates).
+    - :class:`~.core.bedrock_process_manager.BedrockProcessManager` publishes
+      crashes and player counts from its monitoring loop, and periodically
+      resynchronizes the registry with a full scan to pick up changes made
+      outside this process.
+
+Reading the registry is O(1): the sorted snapshot list is rebuilt only when an
+entry actually changes, and every change increments a monotonically
+increasing revision number. Clients can send back the revision they last saw
+to cheaply learn that nothing has changed, or block on
+:meth:`ServerStatusRegistry.wait_for_change` to be notified of the next change.
+"""
+
+import threading
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_ENTRY: Dict[str, Any] = {
+    "status": "UNKNOWN",
+    "version": "UNKNOWN",
+    "player_count": 0,
+}
+
+
+class ServerStatusRegistry:
+    """A thread-safe registry of server summaries with a change revision.
+
+    Each entry is a dictionary with the keys ``"name"``, ``"status"``,
+    ``"version"`` and ``"player_count"``, matching the items returned by
+    :meth:`~.core.manager.BedrockServerManager.get_servers_data`.
+
+    The registry starts empty and unpopulated; it becomes populated once a
+    full scan has been loaded with :meth:`.replace_all`. Until then, readers
+    should fall back to scanning servers themselves.
+
+    Snapshot lists and the entries in them are shared between readers and
+    must be treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty, unpopulated registry."""
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._snapshot: List[Dict[str, Any]] = []
+        self._revision: int = 0
+        self._populated: bool = False
+        self._condition = threading.Condition()
+
+    @property
+    def revision(self) -> int:
+        """int: The current revision, incremented on every change."""
+        return self._revision
+
+    @property
+    def is_populated(self) -> bool:
+        """bool: Whether a full scan has been loaded into the registry."""
+        return self._populated
+
+    def contains(self, server_name: str) -> bool:
+        """Checks whether the registry has an entry for a server.
+
+        Args:
+            server_name (str): The name of the server.
+
+        Returns:
+            bool: ``True`` if the server is in the registry.
+        """
+        return server_name in self._entries
+
+    def _commit_change(self) -> None:
+        """Rebuilds the snapshot, bumps the revision and wakes waiters.
+
+        Must be called with ``self._condition`` held.
+        """
+        self._snapshot = sorted(
+            (dict(entry) for entry in self._entries.values()),
+            key=lambda s: s["name"].lower(),
+        )
+        self._revision += 1
+        self._condition.notify_all()
+
+    def update(self, server_name: str, **fields: Any) -> bool:
+        """Creates or updates the entry of a server.
+
+        Only ``"status"``, ``"version"`` and ``"player_count"`` are recorded.
+        The revision changes only if a value actually changed.
+
+        Args:
+            server_name (str): The name of the server.
+            **fields (Any): The fields to set.
+
+        Returns:
+            bool: ``True`` if the registry changed.
+        """
+        with self._condition:
+            entry = self._entries.get(server_name)
+            if entry is None:
+                entry = {"name": server_name, **_DEFAULT_ENTRY}
+                changed = True
+            else:
+                entry = dict(entry)
+                changed = False
+
+            for key, value in fields.items():
+                if key not in _DEFAULT_ENTRY:
+                    continue
+                if entry.get(key) != value:
+                    entry[key] = value
+                    changed = True
+
+            if changed:
+                self._entries[server_name] = entry
+                self._commit_change()
+                logger.debug(
+                    f"Status registry: '{server_name}' updated to {entry} (revision {self._revision})."
+                )
+            return changed
+
+    def remove(self, server_name: str) -> bool:
+        """Removes the entry of a server, e.g. after it was deleted.
+
+        Args:
+            server_name (str): The name of the server.
+
+        Returns:
+            bool: ``True`` if an entry was removed.
+        """
+        with self._condition:
+            if self._entries.pop(server_name, None) is None:
+                return False
+            self._commit_change()
+            return True
+
+    def replace_all(self, servers: Iterable[Dict[str, Any]]) -> bool:
+        """Replaces all entries with the result of a full scan.
+
+        Marks the registry as populated. The revision changes only if the
+        scan differs from the current content.
+
+        Args:
+            servers (Iterable[Dict[str, Any]]): Server summaries, each with a
+                ``"name"`` key and optionally the other entry fields.
+
+        Returns:
+            bool: ``True`` if the registry changed.
+        """
+        new_entries: Dict[str, Dict[str, Any]] = {}
+        for server in servers:
+            name = server.get("name")
+            if not name:
+                continue
+            new_entries[name] = {
+                "name": name,
+                **{
+                    key: server.get(key, default)
+                    for key, default in _DEFAULT_ENTRY.items()
+                },
+            }
+
+        with self._condition:
+            self._populated = True
+            if new_entries == self._entries:
+                return False
+            self._entries = new_entries
+            self._commit_change()
+            return True
+
+    def invalidate(self) -> None:
+        """Marks the registry as unpopulated so the next reader performs a full scan."""
+        with self._condition:
+            self._populated = False
+
+    def snapshot(self) -> Tuple[int, List[Dict[str, Any]]]:
+        """Returns the current revision and the list of server summaries.
+
+        Returns:
+            Tuple[int, List[Dict[str, Any]]]: The revision and the server
+            summaries sorted by name. The list must not be modified.
+        """
+        with self._condition:
+            return self._revision, self._snapshot
+
+    def wait_for_change(
+        self, since_revision: int, timeout: Optional[float] = None
+    ) -> int:
+        """Blocks until the revision differs from `since_revision` or the timeout expires.
+
+        Args:
+            since_revision (int): The revision the caller last saw.
+            timeout (Optional[float], optional): The maximum number of seconds
+                to wait, or ``None`` to wait indefinitely. Defaults to ``None``.
+
+        Returns:
+            int: The current revision (equal to `since_revision` on timeout).
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._revision != since_revision, timeout=timeout
+            )
+            return self._revision
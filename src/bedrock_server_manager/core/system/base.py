@@ -445,7 +445,10 @@ class ResourceMonitor:
                     "pid": int,          # Process ID
                     "cpu_percent": float, # CPU usage percentage (e.g., 12.3)
                     "memory_mb": float,  # Resident Set Size (RSS) memory in megabytes
-                    "uptime": str        # Process uptime formatted as "HH:MM:SS"
+                    "uptime": str,       # Process uptime formatted as "HH:MM:SS"
+                    "num_threads": int,  # Number of threads
+                    "io_read_mb": float, # Total MB read (if the platform reports I/O)
+                    "io_write_mb": float # Total MB written (if the platform reports I/O)
                 }
 
         Raises:
@@ -502,12 +505,27 @@ class ResourceMonitor:
                 uptime_seconds = current_timestamp - create_time
                 uptime_str = str(timedelta(seconds=int(uptime_seconds)))
 
-                return {
+                stats = {
                     "pid": pid,
                     "cpu_percent": round(cpu_percent, 1),
                     "memory_mb": round(memory_mb, 1),
                     "uptime": uptime_str,
+                    "num_threads": process.num_threads(),
                 }
+
+                # I/O counters are not available on every platform (e.g. macOS).
+                try:
+                    io_counters = process.io_counters()
+                except (AttributeError, NotImplementedError, psutil.AccessDenied):
+                    io_counters = None
+                if io_counters is not None:
+                    stats["io_read_mb"] = round(
+                        io_counters.read_bytes / (1024 * 1024), 1
+                    )
+                    stats["io_write_mb"] = round(
+                        io_counters.write_bytes / (1024 * 1024), 1
+                    )
+                return stats
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             # If process disappears or access is denied, remove its last reading
             if pid in self._last_readings:
@@ -0,0 +1,655 @@
+# bedrock_server_manager/core/world_archive.py
+"""Provides a streaming, multi-threaded writer and a parallel extractor for
+``.mcworld`` archives.
+
+Archiving a world with :func:`shutil.make_archive` deflates every file on a
+single thread, including LevelDB ``.ldb`` tables, which are already
+compressed, and always writes a temporary ``.zip`` first. This module instead:
+
+    - Stores already-compressed files (see :data:`STORED_EXTENSIONS`) without
+      compression, and also falls back to storing any file that deflate would
+      not make smaller.
+    - Deflates the remaining files on a pool of worker threads (:mod:`zlib`
+      releases the GIL while compressing), with a configurable compression
+      level. At most a few files per worker are prepared ahead of the writer,
+      and compressed data is spooled to a temporary file once it exceeds
+      :data:`SPOOL_MAX_SIZE`, so memory use stays bounded.
+    - Emits the archive as a stream of byte chunks in a fixed order, so it can
+      be written to a file or sent as an HTTP response without a temporary
+      file. The ZIP container (including ZIP64 records for large worlds) is
+      written by hand because :mod:`zipfile` cannot add pre-compressed data.
+
+Importing is the reverse: instead of clearing the target world and running
+:meth:`zipfile.ZipFile.extractall` on a single thread, the archive is extracted
+by several threads into a staging directory next to the target, with every
+member checked against its CRC-32. Only then is the staging directory renamed
+into place, and the replaced directory is deleted in the background, so the
+target is missing only for the duration of two renames.
+
+Key Components:
+
+    - :func:`iter_world_archive`: Yields the archive of a directory as bytes.
+    - :func:`write_world_archive`: Writes the archive to a file and returns
+      throughput statistics.
+    - :func:`make_staging_directory`: Creates an empty sibling of a directory
+      to prepare its replacement in.
+    - :func:`extract_archive`: Extracts an archive in parallel, verifying CRCs.
+    - :func:`replace_directory`: Swaps a staging directory into place.
+"""
+
+import os
+import time
+import uuid
+import zlib
+import glob
+import shutil
+import struct
+import logging
+import zipfile
+import tempfile
+import threading
+import collections
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from dataclasses import dataclass
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+# Local application imports.
+from ..error import AppFileNotFoundError, BackupRestoreError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPRESSION_LEVEL = 6
+"""The default deflate level (0-9) for world archives, as used by :mod:`zlib`."""
+
+STORED_EXTENSIONS = frozenset(
+    {".ldb", ".jpeg", ".jpg", ".png", ".zip", ".mcpack", ".mcworld", ".gz"}
+)
+"""File extensions that are already compressed and are archived as-is."""
+
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+"""Compressed data larger than this many bytes is spooled to a temporary file."""
+
+_READ_BUFFER_SIZE = 1024 * 1024
+_ZIP64_LIMIT = 0xFFFFFFFF
+_ZIP_STORED = 0
+_ZIP_DEFLATED = 8
+_FLAG_UTF8 = 0x0800
+
+
+@dataclass
+class _PreparedEntry:
+    """A file ready to be written to the archive."""
+
+    arcname: str
+    source_path: str
+    method: int
+    crc: int
+    size: int
+    compressed_size: int
+    mtime: float
+    # Compressed data for deflated entries; stored entries are re-read.
+    data: Optional[IO[bytes]] = None
+
+    def close(self) -> None:
+        if self.data is not None:
+            self.data.close()
+            self.data = None
+
+
+def _dos_date_time(mtime: float) -> Tuple[int, int]:
+    """Converts a timestamp to the ``(date, time)`` pair used in ZIP headers."""
+    t = time.localtime(mtime)
+    if t.tm_year < 1980:
+        return (1 << 5) | 1, 0  # 1980-01-01 00:00:00
+    date = ((min(t.tm_year, 2107) - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    return date, dos_time
+
+
+def _list_world_files(source_dir: str) -> List[Tuple[str, str]]:
+    """Returns ``(absolute_path, arcname)`` for every file below `source_dir`, sorted."""
+    files: List[Tuple[str, str]] = []
+    for root, dirs, filenames in os.walk(source_dir):
+        dirs.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(root, filename)
+            if not os.path.isfile(path):
+                continue
+            arcname = os.path.relpath(path, source_dir).replace(os.sep, "/")
+            files.append((path, arcname))
+    return files
+
+
+def _crc_of_file(path: str, size: int) -> int:
+    """Computes the CRC-32 of the first `size` bytes of a file."""
+    crc = 0
+    remaining = size
+    with open(path, "rb") as f:
+        while remaining > 0:
+            chunk = f.read(min(remaining, _READ_BUFFER_SIZE))
+            if not chunk:
+                break
+            crc = zlib.crc32(chunk, crc)
+            remaining -= len(chunk)
+    return crc
+
+
+def _prepare_entry(path: str, arcname: str, level: int) -> _PreparedEntry:
+    """Compresses (or checksums) one file. Runs on a worker thread."""
+    st = os.stat(path)
+    size = st.st_size
+    ext = os.path.splitext(arcname)[1].lower()
+
+    if level > 0 and size > 0 and ext not in STORED_EXTENSIONS:
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        try:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+            crc = 0
+            read = 0
+            with open(path, "rb") as f:
+                while read < size:
+                    chunk = f.read(min(size - read, _READ_BUFFER_SIZE))
+                    if not chunk:
+                        break
+                    crc = zlib.crc32(chunk, crc)
+                    read += len(chunk)
+                    spool.write(compressor.compress(chunk))
+            spool.write(compressor.flush())
+            compressed_size = spool.tell()
+        except BaseException:
+            spool.close()
+            raise
+        if compressed_size < read:
+            spool.seek(0)
+            return _PreparedEntry(
+                arcname,
+                path,
+                _ZIP_DEFLATED,
+                crc,
+                read,
+                compressed_size,
+                st.st_mtime,
+                spool,
+            )
+        # Deflate did not help; store the file instead.
+        spool.close()
+        return _PreparedEntry(arcname, path, _ZIP_STORED, crc, read, read, st.st_mtime)
+
+    crc = _crc_of_file(path, size)
+    return _PreparedEntry(arcname, path, _ZIP_STORED, crc, size, size, st.st_mtime)
+
+
+def _local_header(entry: _PreparedEntry) -> bytes:
+    """Builds the local file header of an entry, with a ZIP64 extra field if needed."""
+    name = entry.arcname.encode("utf-8")
+    zip64 = entry.size >= _ZIP64_LIMIT or entry.compressed_size >= _ZIP64_LIMIT
+    extra = b""
+    size = entry.size
+    compressed_size = entry.compressed_size
+    if zip64:
+        extra = struct.pack("<HHQQ", 0x0001, 16, entry.size, entry.compressed_size)
+        size = compressed_size = _ZIP64_LIMIT
+    date, dos_time = _dos_date_time(entry.mtime)
+    header = struct.pack(
+        "<IHHHHHIIIHH",
+        0x04034B50,
+        45 if zip64 else 20,
+        _FLAG_UTF8,
+        entry.method,
+        dos_time,
+        date,
+        entry.crc,
+        compressed_size,
+        size,
+        len(name),
+        len(extra),
+    )
+    return header + name + extra
+
+
+def _central_directory_header(entry: _PreparedEntry, offset: int) -> bytes:
+    """Builds the central directory record of an entry written at `offset`."""
+    name = entry.arcname.encode("utf-8")
+    fields = []
+    size = entry.size
+    compressed_size = entry.compressed_size
+    header_offset = offset
+    if size >= _ZIP64_LIMIT:
+        fields.append(size)
+        size = _ZIP64_LIMIT
+    if compressed_size >= _ZIP64_LIMIT:
+        fields.append(compressed_size)
+        compressed_size = _ZIP64_LIMIT
+    if header_offset >= _ZIP64_LIMIT:
+        fields.append(header_offset)
+        header_offset = _ZIP64_LIMIT
+    extra = b""
+    if fields:
+        extra = struct.pack(f"<HH{len(fields)}Q", 0x0001, 8 * len(fields), *fields)
+    version = 45 if fields else 20
+    date, dos_time = _dos_date_time(entry.mtime)
+    header = struct.pack(
+        "<IHHHHHHIIIHHHHHII",
+        0x02014B50,
+        (3 << 8) | version,  # Made by: Unix
+        version,
+        _FLAG_UTF8,
+        entry.method,
+        dos_time,
+        date,
+        entry.crc,
+        compressed_size,
+        size,
+        len(name),
+        len(extra),
+        0,  # Comment length
+        0,  # Disk number start
+        0,  # Internal attributes
+        (0o100644 << 16),  # External attributes: regular file, rw-r--r--
+        header_offset,
+    )
+    return header + name + extra
+
+
+def _end_of_central_directory(count: int, cd_offset: int, cd_size: int) -> bytes:
+    """Builds the end of central directory records, with ZIP64 records if needed."""
+    records = b""
+    if count >= 0xFFFF or cd_offset >= _ZIP64_LIMIT or cd_size >= _ZIP64_LIMIT:
+        zip64_eocd_offset = cd_offset + cd_size
+        records += struct.pack(
+            "<IQHHIIQQQQ",
+            0x06064B50,
+            44,
+            (3 << 8) | 45,
+            45,
+            0,
+            0,
+            count,
+            count,
+            cd_size,
+            cd_offset,
+        )
+        records += struct.pack("<IIQI", 0x07064B50, 0, zip64_eocd_offset, 1)
+        count = min(count, 0xFFFF)
+        cd_offset = min(cd_offset, _ZIP64_LIMIT)
+        cd_size = min(cd_size, _ZIP64_LIMIT)
+    records += struct.pack(
+        "<IHHHHIIH", 0x06054B50, 0, 0, count, count, cd_size, cd_offset, 0
+    )
+    return records
+
+
+def _iter_entry_data(entry: _PreparedEntry) -> Iterator[bytes]:
+    """Yields the (possibly compressed) data of an entry."""
+    if entry.data is not None:
+        while True:
+            chunk = entry.data.read(_READ_BUFFER_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    # Stored entries are read again and checked against the CRC computed by
+    # the worker, so a file changing in between cannot go unnoticed.
+    crc = 0
+    remaining = entry.size
+    with open(entry.source_path, "rb") as f:
+        while remaining > 0:
+            chunk = f.read(min(remaining, _READ_BUFFER_SIZE))
+            if not chunk:
+                break
+            crc = zlib.crc32(chunk, crc)
+            remaining -= len(chunk)
+            yield chunk
+    if remaining or crc != entry.crc:
+        raise BackupRestoreError(
+            f"File '{entry.arcname}' changed while it was being archived."
+        )
+
+
+def _resolve_workers(workers: int) -> int:
+    """Returns the number of worker threads to use for a configured value (0 = auto)."""
+    if workers <= 0:
+        workers = min(8, os.cpu_count() or 1)
+    return max(1, workers)
+
+
+def iter_world_archive(
+    source_dir: str,
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+    workers: int = 0,
+    stats: Optional[Dict[str, Any]] = None,
+) -> Iterator[bytes]:
+    """Yields a ZIP (``.mcworld``) archive of a directory's contents as byte chunks.
+
+    Files are prepared by a pool of worker threads and written in sorted path
+    order. Closing the generator early stops the workers and releases any
+    spooled data.
+
+    Args:
+        source_dir (str): The directory to archive (e.g., a world directory).
+        compression_level (int, optional): The deflate level, from 0 (store
+            everything) to 9. Defaults to :data:`DEFAULT_COMPRESSION_LEVEL`.
+        workers (int, optional): The number of worker threads. ``0`` uses one
+            per CPU, up to 8. Defaults to 0.
+        stats (Optional[Dict[str, Any]], optional): If given, it is updated
+            with the statistics described in :func:`write_world_archive` once
+            the archive is complete.
+
+    Yields:
+        bytes: Consecutive chunks of the archive.
+
+    Raises:
+        AppFileNotFoundError: If `source_dir` is not a directory.
+        BackupRestoreError: If a stored file changed while being archived.
+        OSError: If reading a source file fails.
+    """
+    if not os.path.isdir(source_dir):
+        raise AppFileNotFoundError(source_dir, "Source directory")
+
+    level = max(0, min(9, int(compression_level)))
+    workers = _resolve_workers(workers)
+    started = time.perf_counter()
+    files = _list_world_files(source_dir)
+
+    offset = 0
+    central_directory: List[bytes] = []
+    bytes_in = 0
+    stored_files = 0
+    pending: Deque[Future] = collections.deque()
+    next_file = 0
+    executor = ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="WorldArchiveWorker"
+    )
+    try:
+        while next_file < len(files) or pending:
+            # Keep a bounded number of files prepared ahead of the writer.
+            while next_file < len(files) and len(pending) < workers * 2:
+                path, arcname = files[next_file]
+                pending.append(executor.submit(_prepare_entry, path, arcname, level))
+                next_file += 1
+
+            entry: _PreparedEntry = pending.popleft().result()
+            try:
+                header = _local_header(entry)
+                central_directory.append(_central_directory_header(entry, offset))
+                yield header
+                for chunk in _iter_entry_data(entry):
+                    yield chunk
+            finally:
+                entry.close()
+            offset += len(header) + entry.compressed_size
+            bytes_in += entry.size
+            if entry.method == _ZIP_STORED:
+                stored_files += 1
+
+        cd_offset = offset
+        cd = b"".join(central_directory)
+        yield cd
+        eocd = _end_of_central_directory(len(central_directory), cd_offset, len(cd))
+        yield eocd
+        offset += len(cd) + len(eocd)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+        for future in pending:
+            if future.done() and not future.cancelled() and not future.exception():
+                future.result().close()
+
+    seconds = time.perf_counter() - started
+    if stats is not None:
+        stats.update(
+            {
+                "files": len(files),
+                "stored_files": stored_files,
+                "deflated_files": len(files) - stored_files,
+                "bytes_in": bytes_in,
+                "bytes_out": offset,
+                "seconds": round(seconds, 3),
+                "throughput_mb_s": (
+                    round(bytes_in / (1024 * 1024) / seconds, 2) if seconds > 0 else 0.0
+                ),
+                "compression_level": level,
+                "workers": workers,
+            }
+        )
+
+
+def write_world_archive(
+    source_dir: str,
+    target_path: str,
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+    workers: int = 0,
+) -> Dict[str, Any]:
+    """Writes a ZIP (``.mcworld``) archive of a directory's contents to a file.
+
+    The archive is written to ``<target_path>.tmp`` and renamed into place
+    once complete, replacing any existing file.
+
+    Args:
+        source_dir (str): The directory to archive.
+        target_path (str): The path of the archive to create.
+        compression_level (int, optional): The deflate level (0-9). Defaults
+            to :data:`DEFAULT_COMPRESSION_LEVEL`.
+        workers (int, optional): The number of worker threads (``0`` = auto).
+            Defaults to 0.
+
+    Returns:
+        Dict[str, Any]: Statistics of the export: ``"files"``,
+        ``"stored_files"`` and ``"deflated_files"`` (int), ``"bytes_in"`` (int,
+        total size of the source files), ``"bytes_out"`` (int, archive size),
+        ``"seconds"`` (float), ``"throughput_mb_s"`` (float, source MiB
+        archived per second), ``"compression_level"`` and ``"workers"`` (int).
+
+    Raises:
+        AppFileNotFoundError: If `source_dir` is not a directory.
+        BackupRestoreError: If a stored file changed while being archived.
+        OSError: If reading a source file or writing the archive fails.
+    """
+    stats: Dict[str, Any] = {}
+    temp_path = target_path + ".tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            for chunk in iter_world_archive(
+                source_dir, compression_level, workers, stats
+            ):
+                f.write(chunk)
+        os.replace(temp_path, target_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    logger.debug(
+        f"Archived '{source_dir}' to '{target_path}': {stats['bytes_in']} -> "
+        f"{stats['bytes_out']} bytes in {stats['seconds']}s ({stats['throughput_mb_s']} MB/s)."
+    )
+    return stats
+
+
+def _sibling_path(target_dir: str, tag: str) -> str:
+    """Returns a unique, hidden path next to `target_dir` (e.g. ``.world.old-1a2b``)."""
+    parent, name = os.path.split(os.path.abspath(target_dir))
+    return os.path.join(parent, f".{name}.{tag}-{uuid.uuid4().hex[:8]}")
+
+
+def _remove_replaced_directories(target_dir: str) -> None:
+    """Deletes replaced copies of `target_dir` an earlier run left behind."""
+    parent, name = os.path.split(os.path.abspath(target_dir))
+    pattern = os.path.join(parent, glob.escape(f".{name}") + ".old-*")
+    for leftover in glob.glob(pattern):
+        shutil.rmtree(leftover, ignore_errors=True)
+
+
+def make_staging_directory(target_dir: str) -> str:
+    """Creates an empty staging directory next to `target_dir`.
+
+    The staging directory is on the same filesystem as `target_dir`, so
+    :func:`replace_directory` can move it into place with a rename. Replaced
+    directories left behind by an earlier, interrupted deletion are removed
+    first.
+
+    Args:
+        target_dir (str): The directory that is going to be replaced.
+
+    Returns:
+        str: The absolute path of the new staging directory.
+
+    Raises:
+        OSError: If the directory cannot be created.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(target_dir)), exist_ok=True)
+    _remove_replaced_directories(target_dir)
+    staging_dir = _sibling_path(target_dir, "staging")
+    os.makedirs(staging_dir)
+    return staging_dir
+
+
+def _member_destination(root: str, filename: str) -> str:
+    """Returns where a ZIP member is extracted to, refusing paths outside `root`."""
+    parts = [p for p in filename.replace("\\", "/").split("/") if p not in ("", ".")]
+    destination = os.path.normpath(os.path.join(root, *parts))
+    if destination != root and not destination.startswith(root + os.sep):
+        raise zipfile.BadZipFile(
+            f"Archive member '{filename}' points outside of the target directory."
+        )
+    return destination
+
+
+def _extract_batch(archive_path: str, batch: List[Tuple[zipfile.ZipInfo, str]]) -> int:
+    """Extracts members with a private archive handle; runs on a worker thread."""
+    total = 0
+    with zipfile.ZipFile(archive_path, "r") as zf:
+        for info, destination in batch:
+            # ZipExtFile raises BadZipFile once the data read does not match
+            # the member's CRC-32.
+            with zf.open(info) as src, open(destination, "wb") as dst:
+                shutil.copyfileobj(src, dst, _READ_BUFFER_SIZE)
+            total += info.file_size
+    return total
+
+
+def extract_archive(
+    archive_path: str, target_dir: str, workers: int = 0
+) -> Dict[str, Any]:
+    """Extracts a ZIP archive into a directory on a pool of worker threads.
+
+    Directories are created up front, then the files are split, largest
+    first, into one batch per worker. Each worker reads from its own handle
+    on the archive, so inflating (which releases the GIL) runs in parallel.
+    Every member is checked against its CRC-32.
+
+    Args:
+        archive_path (str): The path of the ZIP (``.mcworld``, ``.mcpack``)
+            archive.
+        target_dir (str): The directory to extract into, normally a fresh
+            directory from :func:`make_staging_directory`.
+        workers (int, optional): The number of worker threads (``0`` = auto).
+            Defaults to 0.
+
+    Returns:
+        Dict[str, Any]: Statistics of the extraction: ``"files"`` (int),
+        ``"bytes_out"`` (int, total extracted size), ``"seconds"`` (float),
+        ``"throughput_mb_s"`` (float) and ``"workers"`` (int).
+
+    Raises:
+        zipfile.BadZipFile: If the file is not a valid ZIP archive, a member
+            fails its CRC check, or a member path points outside `target_dir`.
+        OSError: If reading the archive or writing a file fails.
+    """
+    workers = _resolve_workers(workers)
+    started = time.perf_counter()
+    root = os.path.abspath(target_dir)
+
+    with zipfile.ZipFile(archive_path, "r") as zf:
+        infos = zf.infolist()
+
+    files: List[Tuple[zipfile.ZipInfo, str]] = []
+    for info in infos:
+        destination = _member_destination(root, info.filename)
+        if info.is_dir():
+            os.makedirs(destination, exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            files.append((info, destination))
+
+    files.sort(key=lambda item: item[0].file_size, reverse=True)
+    batch_count = max(1, min(workers, len(files)))
+    batches = [files[i::batch_count] for i in range(batch_count)]
+    with ThreadPoolExecutor(
+        max_workers=batch_count, thread_name_prefix="world-extract"
+    ) as executor:
+        bytes_out = sum(executor.map(partial(_extract_batch, archive_path), batches))
+
+    seconds = time.perf_counter() - started
+    stats = {
+        "files": len(files),
+        "bytes_out": bytes_out,
+        "seconds": round(seconds, 3),
+        "throughput_mb_s": (
+            round(bytes_out / (1024 * 1024) / seconds, 2) if seconds > 0 else 0.0
+        ),
+        "workers": batch_count,
+    }
+    logger.debug(
+        f"Extracted '{archive_path}' to '{target_dir}': {bytes_out} bytes in "
+        f"{stats['seconds']}s ({stats['throughput_mb_s']} MB/s)."
+    )
+    return stats
+
+
+def replace_directory(
+    staging_dir: str, target_dir: str, background_delete: bool = True
+) -> Optional[threading.Thread]:
+    """Swaps a fully prepared staging directory into the place of `target_dir`.
+
+    The existing `target_dir`, if any, is renamed aside and `staging_dir` is
+    renamed to `target_dir`; if that second rename fails, the original is
+    renamed back. The replaced directory is then deleted, on a background
+    thread by default so the caller does not wait for it.
+
+    The background thread is not a daemon, so the interpreter finishes the
+    deletion before it exits. If the process is killed first, the hidden
+    ``.<name>.old-*`` copy stays behind; such leftovers are removed before
+    the next swap of the same directory (and by
+    :func:`make_staging_directory`).
+
+    Args:
+        staging_dir (str): The directory holding the new content, on the same
+            filesystem as `target_dir` (see :func:`make_staging_directory`).
+        target_dir (str): The directory to replace. It need not exist.
+        background_delete (bool, optional): Whether to delete the replaced
+            directory on a background thread. Defaults to ``True``.
+
+    Returns:
+        Optional[threading.Thread]: The thread deleting the replaced
+        directory, or ``None`` if there was nothing to delete in the
+        background.
+
+    Raises:
+        OSError: If a rename fails. `target_dir` is left as it was.
+    """
+    _remove_replaced_directories(target_dir)
+    old_dir: Optional[str] = None
+    if os.path.lexists(target_dir):
+        old_dir = _sibling_path(target_dir, "old")
+        os.rename(target_dir, old_dir)
+    try:
+        os.rename(staging_dir, target_dir)
+    except OSError:
+        if old_dir is not None:
+            os.rename(old_dir, target_dir)
+        raise
+
+    if old_dir is None:
+        return None
+    if not background_delete:
+        shutil.rmtree(old_dir, ignore_errors=True)
+        return None
+    thread = threading.Thread(
+        target=shutil.rmtree,
+        args=(old_dir,),
+        kwargs={"ignore_errors": True},
+        name="world-delete",
+    )
+    thread.start()
+    return thread
@@ -1,5 +1,6 @@
 """Database abstraction layer for Bedrock Server Manager."""
 
+import os
 import warnings
 from contextlib import contextmanager
 from sqlalchemy import create_engine
@@ -79,6 +80,42 @@ class Database:
         finally:
             db.close()
 
+    def get_change_stamp(self):
+        """Returns a cheap fingerprint that changes whenever the database is written.
+
+        For file-based SQLite databases this is built from the "file change
+        counter" in the database header (incremented by every commit in
+        rollback-journal mode) and the size and modification time of the
+        database file and its ``-wal`` file, so any commit, from this or another
+        process, yields a different stamp. It is used to validate in-memory
+        caches of database rows without running a query.
+
+        Returns:
+            Optional[tuple]: The stamp, or ``None`` if the database is not a
+            file-based SQLite database (callers must then fall back to
+            time-based expiry).
+        """
+        if not self.engine:
+            self.initialize()
+        url = self.engine.url
+        if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+            return None
+
+        stamp = []
+        try:
+            with open(url.database, "rb") as f:
+                f.seek(24)  # 4-byte big-endian file change counter.
+                stamp.append(f.read(4))
+        except OSError:
+            stamp.append(None)
+        for path in (url.database, f"{url.database}-wal"):
+            try:
+                st = os.stat(path)
+                stamp.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
     def close(self):
         """Closes the database connection engine."""
         if self.engine:
@@ -0,0 +1,67 @@
+"""Add player_sessions table
+
+Revision ID: 3c9d2b7e41a5
+Revises: f2a7eb2d7c36
+Create Date: 2026-10-16 10:12:31.482113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9d2b7e41a5"
+down_revision: Union[str, Sequence[str], None] = "f2a7eb2d7c36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The application creates missing tables on startup, so the table may
+    # already exist when this migration runs.
+    if sa.inspect(op.get_bind()).has_table("player_sessions"):
+        return
+    op.create_table(
+        "player_sessions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("xuid", sa.String(length=20), nullable=False),
+        sa.Column("player_name", sa.String(length=80), nullable=True),
+        sa.Column("server_name", sa.String(length=255), nullable=False),
+        sa.Column("join_time", sa.DateTime(), nullable=False),
+        sa.Column("leave_time", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_player_sessions_id"), "player_sessions", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_player_sessions_leave_time"),
+        "player_sessions",
+        ["leave_time"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_player_sessions_xuid_join_time",
+        "player_sessions",
+        ["xuid", "join_time"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_player_sessions_server_name_join_time",
+        "player_sessions",
+        ["server_name", "join_time"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_player_sessions_server_name_join_time", table_name="player_sessions"
+    )
+    op.drop_index("ix_player_sessions_xuid_join_time", table_name="player_sessions")
+    op.drop_index(op.f("ix_player_sessions_leave_time"), table_name="player_sessions")
+    op.drop_index(op.f("ix_player_sessions_id"), table_name="player_sessions")
+    op.drop_table("player_sessions")
@@ -1,7 +1,16 @@
 """Database models for Bedrock Server Manager."""
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, JSON, ForeignKey, DateTime, Boolean
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    JSON,
+    ForeignKey,
+    DateTime,
+    Boolean,
+    Index,
+)
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -70,6 +79,21 @@ class Player(Base):
     xuid = Column(String(20), unique=True, index=True)
 
 
+class PlayerSession(Base):
+    __tablename__ = "player_sessions"
+    __table_args__ = (
+        Index("ix_player_sessions_xuid_join_time", "xuid", "join_time"),
+        Index("ix_player_sessions_server_name_join_time", "server_name", "join_time"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    xuid = Column(String(20), nullable=False)
+    player_name = Column(String(80))
+    server_name = Column(String(255), nullable=False)
+    join_time = Column(DateTime, nullable=False)
+    leave_time = Column(DateTime, nullable=True, index=True)
+
+
 class AuditLog(Base):
     __tablename__ = "audit_logs"
 
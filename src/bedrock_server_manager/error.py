@@ -143,6 +143,12 @@ class SendCommandError(ServerError):
     pass
 
 
+class CommandTimeoutError(SendCommandError):
+    """Raised when the server does not answer a command in time."""
+
+    pass
+
+
 # Configuration Errors
 class ConfigParseError(ConfigurationError, ValueError):
     """
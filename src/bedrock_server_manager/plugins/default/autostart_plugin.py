@@ -6,9 +6,14 @@ from typing import Any
 class AutostartServers(PluginBase):
     """
     Starts all servers with the autostart setting set to true on manager startup.
+
+    The servers are started in a background task (see ``api.start_servers``),
+    so the manager is responsive while they launch. The
+    ``autostart.max_concurrency`` and ``autostart.stagger_sec`` settings
+    control how many servers start at once and how far apart they launch.
     """
 
-    version = "1.0.0"
+    version = "1.1.0"
 
     def on_load(self):
         """
@@ -21,13 +26,22 @@ class AutostartServers(PluginBase):
     def on_manager_startup(self, **kwargs: Any):
         result = self.api.get_all_servers_data()
         servers = result["servers"]
+        server_names = []
         for server in servers:
             server_name = server["name"]
             result = self.api.get_server_setting(server_name, "settings.autostart")
             server_settings = result["value"]
 
             if server_settings:
-                self.logger.info(
-                    f"Server '{server_name}' has autostart enabled, starting it now."
-                )
-                self.api.start_server(server_name)
+                self.logger.info(f"Server '{server_name}' has autostart enabled.")
+                server_names.append(server_name)
+
+        if not server_names:
+            return
+
+        task_id = self.api.app_context.task_manager.run_task(
+            self.api.start_servers, server_names, report_progress=True
+        )
+        self.logger.info(
+            f"Starting {len(server_names)} server(s) in the background (task {task_id})."
+        )
@@ -428,6 +428,33 @@ class PluginBase(ABC):
         """
         pass
 
+    # --- Player Session Event Hooks ---
+
+    def player_join(self, **kwargs: Any):
+        """Called by the :class:`~bedrock_server_manager.plugins.plugin_manager.PluginManager`
+        when a player connects to a server, as detected from the server log.
+
+        Args:
+            server_name (str): The name of the server the player joined.
+            player_name (str): The player's gamertag.
+            xuid (str): The player's XUID.
+            timestamp (str): The time of the join (ISO 8601, UTC).
+        """
+        pass
+
+    def player_leave(self, **kwargs: Any):
+        """Called by the :class:`~bedrock_server_manager.plugins.plugin_manager.PluginManager`
+        when a player disconnects from a server, or their session ends because
+        the server stopped or crashed.
+
+        Args:
+            server_name (str): The name of the server the player left.
+            player_name (str): The player's gamertag.
+            xuid (str): The player's XUID.
+            timestamp (str): The time of the leave (ISO 8601, UTC).
+        """
+        pass
+
     # --- World Management Event Hooks ---
 
     def before_world_export(self, **kwargs: Any):
@@ -4,11 +4,15 @@ import sys
 import atexit
 from pathlib import Path
 import os
+import time
 from contextlib import asynccontextmanager
 
+from anyio import to_thread
+
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.authentication import AuthenticationMiddleware
 
 from ..context import AppContext
@@ -16,6 +20,13 @@ from ..config import get_installed_version
 from . import routers
 from ..config import bcm_config
 from .auth_utils import CustomAuthBackend, get_current_user_optional
+from .auth_cache import (
+    DEFAULT_IDENTITY_TTL_SEC,
+    DEFAULT_LAST_SEEN_FLUSH_SEC,
+    LastSeenBuffer,
+    identity_cache,
+)
+from .metrics import EventLoopLagMonitor, RequestMetrics
 
 
 def create_web_app(app_context: AppContext) -> FastAPI:
@@ -28,12 +39,45 @@ def create_web_app(app_context: AppContext) -> FastAPI:
 
     plugin_manager.load_plugins()
 
+    request_metrics = RequestMetrics()
+    lag_monitor = EventLoopLagMonitor(request_metrics)
+
+    try:
+        identity_cache.ttl_sec = float(
+            settings.get("web.auth_cache_ttl_sec", DEFAULT_IDENTITY_TTL_SEC)
+        )
+    except (TypeError, ValueError):
+        identity_cache.ttl_sec = DEFAULT_IDENTITY_TTL_SEC
+    identity_cache.clear()
+    try:
+        last_seen_flush_sec = float(
+            settings.get(
+                "web.last_seen_flush_interval_sec", DEFAULT_LAST_SEEN_FLUSH_SEC
+            )
+        )
+    except (TypeError, ValueError):
+        last_seen_flush_sec = DEFAULT_LAST_SEEN_FLUSH_SEC
+    last_seen_buffer = LastSeenBuffer(app_context.db, last_seen_flush_sec)
+
     @asynccontextmanager
     async def lifespan(app: FastAPI):
-        # Startup logic goes here
+        # Blocking work (sync route handlers, DB lookups in the middlewares)
+        # runs in AnyIO's default thread pool; bound it by the configured size.
+        try:
+            blocking_threads = int(settings.get("web.blocking_threads", 40))
+        except (TypeError, ValueError):
+            blocking_threads = 40
+        if blocking_threads > 0:
+            to_thread.current_default_thread_limiter().total_tokens = blocking_threads
+        lag_monitor.start()
+        if settings.get("server_monitoring.resource_history_enabled", True):
+            app.state.app_context.resource_history.start()
         yield
         # Shutdown logic goes here
+        await lag_monitor.stop()
         logger.info("Running web app shutdown hooks...")
+        # Write the buffered last seen times before the database is closed.
+        await run_in_threadpool(last_seen_buffer.flush)
         app_context = app.state.app_context
         # Shut down the task manager gracefully
         if (
@@ -41,6 +85,16 @@ def create_web_app(app_context: AppContext) -> FastAPI:
             and app_context._task_manager is not None
         ):
             app_context.task_manager.shutdown()
+        if (
+            hasattr(app_context, "_resource_sampler")
+            and app_context._resource_sampler is not None
+        ):
+            app_context.resource_sampler.shutdown()
+        if (
+            hasattr(app_context, "_resource_history")
+            and app_context._resource_history is not None
+        ):
+            app_context.resource_history.shutdown()
         api.utils.stop_all_servers(app_context=app_context)
         app_context.plugin_manager.unload_plugins()
         app_context.db.close()
@@ -67,6 +121,8 @@ def create_web_app(app_context: AppContext) -> FastAPI:
         lifespan=lifespan,
     )
     app.state.app_context = app_context
+    app.state.request_metrics = request_metrics
+    app.state.last_seen_buffer = last_seen_buffer
 
     app_context.plugin_manager.trigger_guarded_event("on_manager_startup")
 
@@ -90,9 +146,11 @@ def create_web_app(app_context: AppContext) -> FastAPI:
             "/openapi.json",
         ]
 
-        if bcm_config.needs_setup(
-            request.app.state.app_context
-        ) and not any(request.url.path.startswith(p) for p in allowed_paths):
+        if not any(
+            request.url.path.startswith(p) for p in allowed_paths
+        ) and await run_in_threadpool(
+            bcm_config.needs_setup, request.app.state.app_context
+        ):
             return RedirectResponse(url="/setup")
 
         # Manually handle authentication to bypass it for static files
@@ -115,6 +173,21 @@ def create_web_app(app_context: AppContext) -> FastAPI:
         response = await call_next(request)
         return response
 
+    @app.middleware("http")
+    async def record_request_latency(request: Request, call_next):
+        # Registered last, so it is the outermost middleware and times the
+        # whole request, including the authentication middlewares.
+        started = time.perf_counter()
+        try:
+            return await call_next(request)
+        finally:
+            route = request.scope.get("route")
+            route_path = getattr(route, "path", None) or "other"
+            request_metrics.observe_request(
+                f"{request.method} {route_path}",
+                (time.perf_counter() - started) * 1000,
+            )
+
     app.include_router(routers.setup_router)
     app.include_router(routers.auth_router)
     app.include_router(routers.users_router)
@@ -125,6 +198,7 @@ def create_web_app(app_context: AppContext) -> FastAPI:
     app.include_router(routers.content_router)
     app.include_router(routers.settings_router)
     app.include_router(routers.api_info_router)
+    app.include_router(routers.events_router)
     app.include_router(routers.plugin_router)
     app.include_router(routers.tasks_router)
     app.include_router(routers.main_router)
@@ -0,0 +1,229 @@
+# bedrock_server_manager/web/auth_cache.py
+"""Caches authenticated identities and buffers ``last_seen`` updates.
+
+Resolving the user of a request means decoding its JWT, loading the user row
+and recording when the user was last seen. Doing all of that for every
+request costs a query and a write transaction each time, so this module
+provides:
+
+- :class:`IdentityCache`: Remembers, for a short time, which user a token
+  belongs to. Entries are dropped when the user is changed through the web
+  application (see :func:`invalidate_user`), so deactivations and role
+  changes take effect immediately, and otherwise expire after
+  :const:`DEFAULT_IDENTITY_TTL_SEC` seconds.
+- :class:`LastSeenBuffer`: Collects ``last_seen`` timestamps in memory and
+  writes them in one transaction at most every
+  :const:`DEFAULT_LAST_SEEN_FLUSH_SEC` seconds.
+"""
+import datetime
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from sqlalchemy import bindparam, update
+
+from ..db.models import User as UserModel
+from .schemas import User
+
+if TYPE_CHECKING:
+    from ..db.database import Database
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDENTITY_TTL_SEC: float = 30.0
+"""The default number of seconds a token's identity is remembered."""
+
+DEFAULT_LAST_SEEN_FLUSH_SEC: float = 60.0
+"""The default number of seconds between two writes of ``last_seen`` values."""
+
+MAX_LAST_SEEN_FLUSH_ATTEMPTS: int = 3
+"""How many failed writes a buffered ``last_seen`` value survives before it is dropped."""
+
+
+class IdentityCache:
+    """A thread-safe map of tokens to the users they authenticate.
+
+    Attributes:
+        ttl_sec (float): How long an entry is used before the token is
+            resolved again.
+    """
+
+    def __init__(self, ttl_sec: float = DEFAULT_IDENTITY_TTL_SEC) -> None:
+        self.ttl_sec = ttl_sec
+        self._entries: Dict[str, Tuple[User, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[User]:
+        """Returns the user of `token`, or ``None`` if it is not cached."""
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[1]:
+                del self._entries[token]
+                return None
+            return entry[0]
+
+    def put(self, token: str, user: User, token_expires_at: Optional[float]) -> None:
+        """Remembers the user of `token`, but never past the token's expiry.
+
+        Args:
+            token (str): The raw JWT.
+            user (User): The user it authenticates.
+            token_expires_at (Optional[float]): The token's ``exp`` claim, as
+                a Unix timestamp.
+        """
+        ttl = self.ttl_sec
+        if token_expires_at is not None:
+            ttl = min(ttl, token_expires_at - time.time())
+        if ttl <= 0:
+            return
+        with self._lock:
+            # Expired entries are only dropped on lookup; sweep them here so
+            # tokens that are never presented again do not pile up.
+            if len(self._entries) >= 1024:
+                now = time.monotonic()
+                self._entries = {
+                    key: entry for key, entry in self._entries.items() if entry[1] > now
+                }
+            self._entries[token] = (user, time.monotonic() + ttl)
+
+    def invalidate_user(self, username: str) -> None:
+        """Drops every entry of a user."""
+        with self._lock:
+            self._entries = {
+                key: entry
+                for key, entry in self._entries.items()
+                if entry[0].username != username
+            }
+
+    def clear(self) -> None:
+        """Drops all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+identity_cache = IdentityCache()
+"""The identity cache shared by the web application."""
+
+
+def invalidate_user(username: str) -> None:
+    """Forgets the cached identity of a user after it was changed or deleted.
+
+    Args:
+        username (str): The name of the user.
+    """
+    identity_cache.invalidate_user(username)
+
+
+class LastSeenBuffer:
+    """Buffers ``last_seen`` timestamps and writes them to the database in batches.
+
+    Attributes:
+        flush_interval_sec (float): The minimum number of seconds between two
+            writes.
+    """
+
+    def __init__(
+        self,
+        db: "Database",
+        flush_interval_sec: float = DEFAULT_LAST_SEEN_FLUSH_SEC,
+    ) -> None:
+        self.db = db
+        self.flush_interval_sec = flush_interval_sec
+        self._pending: Dict[int, datetime.datetime] = {}
+        # Failed writes per user, for values put back after a failed flush.
+        self._failed_attempts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def touch(self, user_id: int) -> None:
+        """Records that a user was seen now."""
+        with self._lock:
+            self._pending[user_id] = datetime.datetime.now(datetime.timezone.utc)
+
+    def discard(self, user_id: int) -> None:
+        """Drops the buffered timestamp of a user, e.g. after it was deleted."""
+        with self._lock:
+            self._pending.pop(user_id, None)
+            self._failed_attempts.pop(user_id, None)
+
+    def flush_due(self) -> bool:
+        """Checks whether there are timestamps waiting for longer than the interval."""
+        with self._lock:
+            return (
+                bool(self._pending)
+                and time.monotonic() - self._last_flush >= self.flush_interval_sec
+            )
+
+    def flush(self) -> int:
+        """Writes all buffered timestamps in one transaction.
+
+        Timestamps of users that no longer exist are skipped. If the write
+        fails, the timestamps are kept for the next flush, but dropped after
+        :const:`MAX_LAST_SEEN_FLUSH_ATTEMPTS` failed writes.
+
+        Returns:
+            int: The number of timestamps written.
+        """
+        # Only one flush at a time; a concurrent caller has nothing left to do.
+        if not self._flush_lock.acquire(blocking=False):
+            return 0
+        try:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._last_flush = time.monotonic()
+            if not pending:
+                return 0
+            # A Core executemany on the table, unlike the ORM bulk update, does
+            # not check that each row still exists, so a deleted user cannot
+            # fail the whole batch.
+            users = UserModel.__table__
+            statement = (
+                update(users)
+                .where(users.c.id == bindparam("b_id"))
+                .values(last_seen=bindparam("b_last_seen"))
+            )
+            try:
+                with self.db.session_manager() as db:
+                    db.execute(
+                        statement,
+                        [
+                            {"b_id": user_id, "b_last_seen": last_seen}
+                            for user_id, last_seen in pending.items()
+                        ],
+                    )
+                    db.commit()
+            except Exception as e:
+                self._requeue(pending, e)
+                return 0
+            with self._lock:
+                for user_id in pending:
+                    self._failed_attempts.pop(user_id, None)
+            return len(pending)
+        finally:
+            self._flush_lock.release()
+
+    def _requeue(self, pending: Dict[int, datetime.datetime], error: Exception) -> None:
+        """Puts timestamps back after a failed write, unless they failed too often."""
+        dropped = 0
+        with self._lock:
+            for user_id, last_seen in pending.items():
+                attempts = self._failed_attempts.get(user_id, 0) + 1
+                if attempts >= MAX_LAST_SEEN_FLUSH_ATTEMPTS:
+                    self._failed_attempts.pop(user_id, None)
+                    dropped += 1
+                    continue
+                self._failed_attempts[user_id] = attempts
+                # Keep newer timestamps recorded while writing.
+                self._pending.setdefault(user_id, last_seen)
+        logger.warning(
+            f"Could not save last seen times of users: {error}"
+            + (
+                f" Dropped {dropped} of them after repeated failures."
+                if dropped
+                else ""
+            )
+        )
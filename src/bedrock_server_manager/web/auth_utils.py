@@ -14,7 +14,6 @@ including:
 The JWT secret key and token expiration are configurable via environment variables.
 """
 import datetime
-from datetime import timezone
 import logging
 from typing import Optional, Dict, Any
 import secrets
@@ -23,10 +22,12 @@ from jose import JWTError, jwt
 from fastapi import HTTPException, Security, Request, status
 from fastapi.security import OAuth2PasswordBearer, APIKeyCookie
 from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
 from starlette.authentication import AuthCredentials, AuthenticationBackend, SimpleUser
 
 from ..error import MissingArgumentError
 from .schemas import User
+from .auth_cache import identity_cache
 from ..db.models import User as UserModel
 from ..context import AppContext
 from ..config import Settings
@@ -112,6 +113,12 @@ async def get_current_user_optional(
     containing the username (from the "sub" claim) and an identity type.
     Otherwise, it returns ``None``.
 
+    The result is stored on ``request.state``, so it is resolved only once per
+    request. Identities are also kept for a short time in the
+    :data:`~.auth_cache.identity_cache`, and the user's ``last_seen`` time is
+    written in batches by the application's
+    :class:`~.auth_cache.LastSeenBuffer`.
+
     This is typically used for routes that can be accessed by both authenticated
     and unauthenticated users, or as a helper for other dependencies like
     :func:`~.get_current_user`.
@@ -123,6 +130,18 @@ async def get_current_user_optional(
         Optional[User]: A dictionary ``{"username": str, "identity_type": "jwt"}``
         if authentication is successful, otherwise ``None``.
     """
+    # The middlewares and the route dependencies all ask for the user; resolve
+    # it once per request.
+    if getattr(request.state, "auth_user_resolved", False):
+        return request.state.auth_user
+    user = await _resolve_user(request)
+    request.state.auth_user = user
+    request.state.auth_user_resolved = True
+    return user
+
+
+async def _resolve_user(request: Request) -> Optional[User]:
+    """Resolves the user of a request's token, using the identity cache."""
     token = request.cookies.get("access_token_cookie")
     if not token:
         auth_header = request.headers.get("Authorization")
@@ -134,6 +153,20 @@ async def get_current_user_optional(
     if not token:
         return None
 
+    last_seen_buffer = getattr(request.app.state, "last_seen_buffer", None)
+
+    async def mark_seen(user: User) -> None:
+        if last_seen_buffer is None:
+            return
+        last_seen_buffer.touch(user.id)
+        if last_seen_buffer.flush_due():
+            await run_in_threadpool(last_seen_buffer.flush)
+
+    cached_user = identity_cache.get(token)
+    if cached_user is not None:
+        await mark_seen(cached_user)
+        return cached_user
+
     try:
         app_context = request.app.state.app_context
         settings = app_context.settings
@@ -152,9 +185,6 @@ async def get_current_user_optional(
             if not user or not user.is_active:
                 return None
 
-            user.last_seen = datetime.datetime.now(timezone.utc)
-            db_session.commit()
-
             return User(
                 id=user.id,
                 username=user.username,
@@ -164,12 +194,21 @@ async def get_current_user_optional(
                 theme=user.theme,
             )
 
-        with app_context.db.session_manager() as db:
-            return get_user_from_db(db)
+        def load_user():
+            with app_context.db.session_manager() as db:
+                return get_user_from_db(db)
+
+        # The lookup hits the database; keep it off the event loop.
+        user = await run_in_threadpool(load_user)
 
     except JWTError:
         return None
 
+    if user is not None:
+        identity_cache.put(token, user, payload.get("exp"))
+        await mark_seen(user)
+    return user
+
 
 async def get_current_user(
     user: Optional[User] = Security(get_current_user_optional),
@@ -227,7 +266,7 @@ from ..config import bcm_config
 
 class CustomAuthBackend(AuthenticationBackend):
     async def authenticate(self, conn):
-        if bcm_config.needs_setup(conn.app.state.app_context):
+        if await run_in_threadpool(bcm_config.needs_setup, conn.app.state.app_context):
             return AuthCredentials(["unauthenticated"]), SimpleUser("guest")
 
         user = await get_current_user_optional(conn)
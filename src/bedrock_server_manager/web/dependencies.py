@@ -16,6 +16,7 @@ from ..db.models import User
 from ..api import utils as utils_api
 from ..error import InvalidServerNameError
 from fastapi import Request
+from starlette.concurrency import run_in_threadpool
 
 from ..context import AppContext
 
@@ -73,8 +74,10 @@ async def validate_server_exists(
         if name_validation_result.get("status") != "success":
             raise InvalidServerNameError(name_validation_result.get("message"))
 
-        validation_result = utils_api.validate_server_exist(
-            server_name=server_name, app_context=app_context
+        validation_result = await run_in_threadpool(
+            utils_api.validate_server_exist,
+            server_name=server_name,
+            app_context=app_context,
         )
         if validation_result.get("status") != "success":
             logger.warning(
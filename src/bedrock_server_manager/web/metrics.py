@@ -0,0 +1,175 @@
+# bedrock_server_manager/web/metrics.py
+"""Request latency and event loop lag metrics for the web application.
+
+The web server runs a single Uvicorn worker, so any blocking call made on the
+event loop delays every other request. Blocking work is run in a bounded
+thread pool instead (route handlers are plain ``def`` functions, which FastAPI
+runs in that pool), and this module provides the means to verify it:
+
+- :class:`LatencyHistogram`: A fixed-bucket histogram of durations.
+- :class:`RequestMetrics`: One latency histogram per route, filled by an HTTP
+  middleware, plus a histogram of event loop lag.
+- :class:`EventLoopLagMonitor`: An asyncio task that repeatedly sleeps for a
+  short interval and records how late it wakes up. A lag of more than a few
+  milliseconds means something blocked the loop.
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS_MS: Sequence[float] = (
+    1,
+    2,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+"""The default upper bounds, in milliseconds, of the histogram buckets."""
+
+DEFAULT_LAG_CHECK_INTERVAL_SEC: float = 0.1
+"""The default number of seconds the lag monitor sleeps between checks."""
+
+
+class LatencyHistogram:
+    """A thread-safe histogram of durations with fixed bucket bounds.
+
+    Attributes:
+        buckets_ms (Sequence[float]): The inclusive upper bounds of the buckets,
+            in milliseconds. Durations above the last bound are counted in an
+            overflow bucket.
+    """
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS) -> None:
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self._counts = [0] * (len(self.buckets_ms) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, duration_ms: float) -> None:
+        """Records one duration, in milliseconds."""
+        index = len(self.buckets_ms)
+        for i, bound in enumerate(self.buckets_ms):
+            if duration_ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._total_ms += duration_ms
+            if duration_ms > self._max_ms:
+                self._max_ms = duration_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns the histogram as a JSON-serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: ``"count"``, ``"mean_ms"`` and ``"max_ms"``, and
+            ``"buckets"``, which maps each upper bound (``"+Inf"`` for the
+            overflow bucket) to the number of durations at or below it that
+            did not fit a smaller bucket.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            count = self._count
+            total_ms = self._total_ms
+            max_ms = self._max_ms
+        labels = [f"{bound:g}" for bound in self.buckets_ms] + ["+Inf"]
+        return {
+            "count": count,
+            "mean_ms": round(total_ms / count, 3) if count else 0.0,
+            "max_ms": round(max_ms, 3),
+            "buckets": dict(zip(labels, counts)),
+        }
+
+
+class RequestMetrics:
+    """Collects per-route request latencies and event loop lag."""
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS) -> None:
+        self._buckets_ms = buckets_ms
+        self._routes: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self.event_loop_lag = LatencyHistogram(buckets_ms)
+
+    def observe_request(self, route: str, duration_ms: float) -> None:
+        """Records the duration of a request to `route` (e.g. ``"GET /api/servers"``)."""
+        histogram = self._routes.get(route)
+        if histogram is None:
+            with self._lock:
+                histogram = self._routes.setdefault(
+                    route, LatencyHistogram(self._buckets_ms)
+                )
+        histogram.observe(duration_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns all histograms as a JSON-serializable dictionary."""
+        with self._lock:
+            routes = dict(self._routes)
+        return {
+            "routes": {
+                route: histogram.snapshot()
+                for route, histogram in sorted(routes.items())
+            },
+            "event_loop_lag": self.event_loop_lag.snapshot(),
+        }
+
+
+class EventLoopLagMonitor:
+    """Measures how late the event loop wakes up a sleeping task.
+
+    Attributes:
+        interval_sec (float): The number of seconds to sleep between checks.
+        warn_threshold_ms (float): Lags above this are logged as warnings.
+    """
+
+    def __init__(
+        self,
+        metrics: RequestMetrics,
+        interval_sec: float = DEFAULT_LAG_CHECK_INTERVAL_SEC,
+        warn_threshold_ms: float = 250.0,
+    ) -> None:
+        self.metrics = metrics
+        self.interval_sec = interval_sec
+        self.warn_threshold_ms = warn_threshold_ms
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Starts monitoring on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops monitoring and waits for the task to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval_sec)
+            lag_ms = max(
+                0.0, (time.perf_counter() - started - self.interval_sec) * 1000
+            )
+            self.metrics.event_loop_lag.observe(lag_ms)
+            if lag_ms > self.warn_threshold_ms:
+                logger.warning(f"Web: The event loop was blocked for {lag_ms:.0f} ms.")
@@ -5,6 +5,7 @@ from .api_info import router as api_info_router
 from .auth import router as auth_router
 from .backup_restore import router as backup_restore_router
 from .content import router as content_router
+from .events import router as events_router
 from .main import router as main_router
 from .plugin import router as plugin_router
 from .server_actions import router as server_actions_router
@@ -24,6 +25,7 @@ __all__ = [
     "auth_router",
     "backup_restore_router",
     "content_router",
+    "events_router",
     "main_router",
     "plugin_router",
     "server_actions_router",
@@ -10,6 +10,7 @@ from fastapi.templating import Jinja2Templates
 
 from bedrock_server_manager.db.models import User as UserModel
 from ..dependencies import get_templates, get_app_context
+from ..auth_cache import invalidate_user
 from pydantic import BaseModel
 from ..schemas import User as UserSchema, BaseApiResponse
 from ...context import AppContext
@@ -36,7 +37,7 @@ class ChangePasswordRequest(BaseModel):
     response_class=HTMLResponse,
     include_in_schema=False,
 )
-async def account_page(
+def account_page(
     request: Request,
     user: UserSchema = Depends(get_current_user),
     templates: Jinja2Templates = Depends(get_templates),
@@ -45,12 +46,12 @@ async def account_page(
 
 
 @router.get("/api/account", response_model=UserSchema)
-async def account_api(user: UserSchema = Depends(get_current_user)):
+def account_api(user: UserSchema = Depends(get_current_user)):
     return user
 
 
 @router.post("/api/account/theme", response_model=BaseApiResponse)
-async def update_theme(
+def update_theme(
     theme_update: ThemeUpdate,
     user: UserSchema = Depends(get_current_user),
     app_context: AppContext = Depends(get_app_context),
@@ -62,6 +63,7 @@ async def update_theme(
         if db_user:
             db_user.theme = theme_update.theme
             db.commit()
+            invalidate_user(user.username)
             return BaseApiResponse(
                 status="success", message="Theme updated successfully"
             )
@@ -69,7 +71,7 @@ async def update_theme(
 
 
 @router.post("/api/account/profile", response_model=BaseApiResponse)
-async def update_profile(
+def update_profile(
     profile_update: ProfileUpdate,
     user: UserSchema = Depends(get_current_user),
     app_context: AppContext = Depends(get_app_context),
@@ -89,7 +91,7 @@ async def update_profile(
 
 
 @router.post("/api/account/change-password", response_model=BaseApiResponse)
-async def change_password(
+def change_password(
     data: ChangePasswordRequest,
     user: UserSchema = Depends(get_current_user),
     app_context: AppContext = Depends(get_app_context),
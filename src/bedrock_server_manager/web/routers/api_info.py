@@ -57,6 +57,8 @@ class GeneralApiResponse(BaseApiResponse):
     players: Optional[List[Dict[str, Any]]] = None  # For player lists
     files_deleted: Optional[int] = None  # For prune operations
     files_kept: Optional[int] = None  # For prune operations
+    revision: Optional[int] = None  # Server status revision for /api/servers
+    not_modified: Optional[bool] = None  # True if unchanged since the given revision
 
 
 class PruneDownloadsPayload(BaseModel):
@@ -92,7 +94,7 @@ class AddPlayersPayload(BaseModel):
     response_model=GeneralApiResponse,
     tags=["Server Info API"],
 )
-async def get_server_running_status_api_route(
+def get_server_running_status_api_route(
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_current_user),
     app_context: AppContext = Depends(get_app_context),
@@ -143,7 +145,7 @@ async def get_server_running_status_api_route(
     response_model=GeneralApiResponse,
     tags=["Server Info API"],
 )
-async def get_server_config_status_api_route(
+def get_server_config_status_api_route(
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_current_user),
     app_context: AppContext = Depends(get_app_context),
@@ -196,7 +198,7 @@ async def get_server_config_status_api_route(
     response_model=GeneralApiResponse,
     tags=["Server Info API"],
 )
-async def get_server_version_api_route(
+def get_server_version_api_route(
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_current_user),
     app_context: AppContext = Depends(get_app_context),
@@ -247,12 +249,50 @@ async def get_server_version_api_route(
         )
 
 
+@router.get(
+    "/api/server/{server_name}/resource_history",
+    response_model=GeneralApiResponse,
+    tags=["Server Info API"],
+)
+def get_server_resource_history_api_route(
+    server_name: str = Depends(validate_server_exists),
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    resolution_sec: Optional[float] = None,
+    current_user: User = Depends(get_current_user),
+    app_context: AppContext = Depends(get_app_context),
+):
+    """
+    Retrieves the recorded CPU, memory, player count and latency history of a
+    server between the Unix timestamps `start` and `end`, for charts.
+    """
+    logger.debug(
+        f"API: Resource history request for '{server_name}' by user '{current_user.username}'."
+    )
+    try:
+        result = info_api.get_server_resource_history(
+            server_name=server_name,
+            start=start,
+            end=end,
+            resolution_sec=resolution_sec,
+            app_context=app_context,
+        )
+    except UserInputError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if result.get("status") != "success":
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=result.get("message", "Failed to get resource history."),
+        )
+    return GeneralApiResponse(status="success", data=result["data"])
+
+
 @router.get(
     "/api/server/{server_name}/validate",
     response_model=GeneralApiResponse,
     tags=["Server Info API"],
 )
-async def validate_server_api_route(
+def validate_server_api_route(
     server_name: str,
     current_user: User = Depends(get_current_user),
     app_context: AppContext = Depends(get_app_context),
@@ -299,19 +339,22 @@ async def validate_server_api_route(
     response_model=GeneralApiResponse,
     tags=["Server Info API"],
 )
-async def server_process_info_api_route(
+def server_process_info_api_route(
     server_name: str,
     current_user: User = Depends(get_current_user),
     app_context: AppContext = Depends(get_app_context),
 ):
     """
     Retrieves resource usage information for a running server process.
+
+    The information comes from the shared resource sampler, so any number of
+    clients polling this route cause a single process sample per interval.
     """
     identity = current_user.username
     logger.debug(f"API: Process info request for '{server_name}' by user '{identity}'.")
     try:
         result = system_api.get_bedrock_process_info(
-            server_name=server_name, app_context=app_context
+            server_name=server_name, app_context=app_context, use_sampler=True
         )
 
         if result.get("status") == "success":
@@ -348,7 +391,7 @@ async def server_process_info_api_route(
 @router.post(
     "/api/players/scan", response_model=GeneralApiResponse, tags=["Global Players API"]
 )
-async def scan_players_api_route(
+def scan_players_api_route(
     current_user: User = Depends(get_moderator_user),
     app_context: AppContext = Depends(get_app_context),
 ):
@@ -386,7 +429,7 @@ async def scan_players_api_route(
 @router.get(
     "/api/players/get", response_model=GeneralApiResponse, tags=["Global Players API"]
 )
-async def get_all_players_api_route(
+def get_all_players_api_route(
     current_user: User = Depends(get_moderator_user),
     app_context: AppContext = Depends(get_app_context),
 ):
@@ -444,7 +487,7 @@ async def get_all_players_api_route(
     response_model=GeneralApiResponse,
     tags=["Global Actions API"],
 )
-async def prune_downloads_api_route(
+def prune_downloads_api_route(
     payload: PruneDownloadsPayload,
     current_user: User = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
@@ -524,19 +567,37 @@ async def prune_downloads_api_route(
 
 
 @router.get("/api/servers", response_model=GeneralApiResponse, tags=["Global Info API"])
-async def get_servers_list_api_route(
+def get_servers_list_api_route(
+    revision: Optional[int] = None,
     current_user: User = Depends(get_current_user),
     app_context: AppContext = Depends(get_app_context),
 ):
     """
     Retrieves a list of all detected server instances with their status and version.
+
+    The response includes the current status ``revision``. If the client passes
+    the revision it last received as the ``revision`` query parameter and
+    nothing has changed since, the response only contains ``not_modified: true``
+    and the revision, without the server list.
     """
     identity = current_user.username
     logger.debug(f"API: Request for all servers list by user '{identity}'.")
     try:
-        result = app_api.get_all_servers_data(app_context=app_context)
+        result = app_api.get_all_servers_data(
+            since_revision=revision, app_context=app_context
+        )
         if result.get("status") == "success":
-            return GeneralApiResponse(status="success", servers=result.get("servers"))
+            if result.get("not_modified"):
+                return GeneralApiResponse(
+                    status="success",
+                    not_modified=True,
+                    revision=result.get("revision"),
+                )
+            return GeneralApiResponse(
+                status="success",
+                servers=result.get("servers"),
+                revision=result.get("revision"),
+            )
         else:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -551,7 +612,7 @@ async def get_servers_list_api_route(
 
 
 @router.get("/api/info", response_model=GeneralApiResponse, tags=["Global Info API"])
-async def get_system_info_api_route(
+def get_system_info_api_route(
     app_context: AppContext = Depends(get_app_context),
 ):
     """
@@ -576,10 +637,40 @@ async def get_system_info_api_route(
         )
 
 
+@router.get(
+    "/api/info/web_metrics",
+    response_model=GeneralApiResponse,
+    tags=["Global Info API"],
+)
+def get_web_metrics_api_route(
+    request: Request,
+    current_user: User = Depends(get_admin_user),
+    app_context: AppContext = Depends(get_app_context),
+):
+    """
+    Retrieves the request latency histogram of each route, the event loop lag
+    histogram, the download API lookup cache counters, and the status ping
+    latency of each monitored server.
+    """
+    logger.debug(f"API: Request for web metrics by user '{current_user.username}'.")
+    request_metrics = getattr(request.app.state, "request_metrics", None)
+    if request_metrics is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Web metrics are not being collected.",
+        )
+    data = request_metrics.snapshot()
+    data["download_api"] = misc_api.get_download_api_stats()["data"]
+    data["server_pings"] = system_api.get_server_ping_stats(app_context=app_context)[
+        "data"
+    ]
+    return GeneralApiResponse(status="success", data=data)
+
+
 @router.post(
     "/api/players/add", response_model=GeneralApiResponse, tags=["Global Players API"]
 )
-async def add_players_api_route(
+def add_players_api_route(
     payload: AddPlayersPayload,
     current_user: User = Depends(get_moderator_user),
     app_context: AppContext = Depends(get_app_context),
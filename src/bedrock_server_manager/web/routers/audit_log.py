@@ -32,7 +32,7 @@ def create_audit_log(app_context, user_id: int, action: str, details: dict = Non
 
 
 @router.get("", response_class=HTMLResponse, include_in_schema=False)
-async def audit_log_page(
+def audit_log_page(
     request: Request,
     current_user: UserSchema = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
@@ -70,7 +70,7 @@ class UserLogin(BaseModel):
 
 # --- Web UI Login Page Route ---
 @router.get("/login", response_class=HTMLResponse, include_in_schema=False)
-async def login_page(
+def login_page(
     request: Request,
     user: Optional[User] = Depends(get_current_user_optional),
     templates: Jinja2Templates = Depends(get_templates),
@@ -86,7 +86,7 @@ async def login_page(
 
 # --- API Login Route ---
 @router.post("/token", response_model=Token)
-async def api_login_for_access_token(
+def api_login_for_access_token(
     response: FastAPIResponse,
     form_data: OAuth2PasswordRequestForm = Depends(),
     app_context: AppContext = Depends(get_app_context),
@@ -139,7 +139,7 @@ async def api_login_for_access_token(
 
 # --- Logout Route ---
 @router.get("/logout")
-async def logout(
+def logout(
     response: FastAPIResponse,
     current_user: User = Depends(get_current_user),
 ):
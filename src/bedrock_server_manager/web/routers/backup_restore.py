@@ -105,7 +105,7 @@ class BackupRestoreResponse(BaseApiResponse):
     name="backup_menu_page",
     include_in_schema=False,
 )
-async def backup_menu_page(
+def backup_menu_page(
     request: Request,
     server_name: str,
     current_user: User = Depends(get_moderator_user),
@@ -129,7 +129,7 @@ async def backup_menu_page(
     name="backup_config_select_page",
     include_in_schema=False,
 )
-async def backup_config_select_page(
+def backup_config_select_page(
     request: Request,
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_moderator_user),
@@ -156,7 +156,7 @@ async def backup_config_select_page(
     name="restore_menu_page",
     include_in_schema=False,
 )
-async def restore_menu_page(
+def restore_menu_page(
     request: Request,
     server_name: str,
     current_user: User = Depends(get_moderator_user),
@@ -180,7 +180,7 @@ async def restore_menu_page(
     name="select_backup_file_page",
     include_in_schema=False,
 )
-async def show_select_backup_file_page(
+def show_select_backup_file_page(
     request: Request,
     restore_type: str,
     server_name: str = Depends(validate_server_exists),
@@ -279,7 +279,7 @@ async def show_select_backup_file_page(
     response_model=BackupRestoreResponse,
     tags=["Backup & Restore API"],
 )
-async def handle_restore_select_backup_type_api(
+def handle_restore_select_backup_type_api(
     request: Request,
     payload: RestoreTypePayload,
     server_name: str = Depends(validate_server_exists),
@@ -333,7 +333,7 @@ async def handle_restore_select_backup_type_api(
     status_code=status.HTTP_202_ACCEPTED,
     tags=["Backup & Restore API"],
 )
-async def prune_backups_api_route(
+def prune_backups_api_route(
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_moderator_user),
     app_context: AppContext = Depends(get_app_context),
@@ -365,7 +365,7 @@ async def prune_backups_api_route(
     response_model=BackupRestoreResponse,
     tags=["Backup & Restore API"],
 )
-async def list_server_backups_api_route(
+def list_server_backups_api_route(
     backup_type: str,
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_moderator_user),
@@ -453,7 +453,7 @@ async def list_server_backups_api_route(
     status_code=status.HTTP_202_ACCEPTED,
     tags=["Backup & Restore API"],
 )
-async def backup_action_api_route(
+def backup_action_api_route(
     server_name: str = Depends(validate_server_exists),
     payload: BackupActionPayload = Body(...),
     current_user: User = Depends(get_moderator_user),
@@ -512,7 +512,7 @@ async def backup_action_api_route(
     status_code=status.HTTP_202_ACCEPTED,
     tags=["Backup & Restore API"],
 )
-async def restore_action_api_route(
+def restore_action_api_route(
     payload: RestoreActionPayload,
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_moderator_user),
@@ -1,6 +1,6 @@
 import os
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 
 import os
 import logging
@@ -14,9 +14,16 @@ from fastapi import (
     status,
     Path,
 )
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from fastapi.responses import (
+    HTMLResponse,
+    RedirectResponse,
+    JSONResponse,
+    StreamingResponse,
+)
 from pydantic import BaseModel, Field
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
+from starlette.types import Receive, Scope, Send
 
 from ..schemas import ActionResponse, BaseApiResponse, User
 from ..dependencies import get_templates, get_app_context, validate_server_exists
@@ -46,6 +53,30 @@ class ContentListResponse(BaseApiResponse):
     files: Optional[List[str]] = None
 
 
+class _ClosingStreamingResponse(StreamingResponse):
+    """A streaming response that closes its iterator however the response ends.
+
+    Starlette does not close an unfinished iterator when the client
+    disconnects, so resources the iterator owns (such as the world lock held
+    by a world export stream) would otherwise never be released.
+    """
+
+    def __init__(self, content: Iterator[bytes], *args: Any, **kwargs: Any) -> None:
+        super().__init__(content, *args, **kwargs)
+        self._stream_source = content
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await run_in_threadpool(self._close_iterator)
+
+    def _close_iterator(self) -> None:
+        close = getattr(self._stream_source, "close", None)
+        if close is not None:
+            close()
+
+
 # --- HTML Routes ---
 @router.get(
     "/server/{server_name}/install_world",
@@ -53,7 +84,7 @@ class ContentListResponse(BaseApiResponse):
     name="install_world_page",
     include_in_schema=False,
 )
-async def install_world_page(
+def install_world_page(
     request: Request,
     server_name: str,
     current_user: User = Depends(get_admin_user),
@@ -109,7 +140,7 @@ async def install_world_page(
     name="install_addon_page",
     include_in_schema=False,
 )
-async def install_addon_page(
+def install_addon_page(
     request: Request,
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_admin_user),
@@ -165,7 +196,7 @@ async def install_addon_page(
     response_model=ContentListResponse,
     tags=["Content API"],
 )
-async def list_worlds_api_route(
+def list_worlds_api_route(
     current_user: User = Depends(get_moderator_user),
     app_context: AppContext = Depends(get_app_context),
 ):
@@ -203,7 +234,7 @@ async def list_worlds_api_route(
     response_model=ContentListResponse,
     tags=["Content API"],
 )
-async def list_addons_api_route(
+def list_addons_api_route(
     current_user: User = Depends(get_moderator_user),
     app_context: AppContext = Depends(get_app_context),
 ):
@@ -242,7 +273,7 @@ async def list_addons_api_route(
     status_code=status.HTTP_202_ACCEPTED,
     tags=["Content API"],
 )
-async def install_world_api_route(
+def install_world_api_route(
     payload: FileNamePayload,
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_admin_user),
@@ -334,7 +365,8 @@ async def install_world_api_route(
     status_code=status.HTTP_202_ACCEPTED,
     tags=["Content API"],
 )
-async def export_world_api_route(
+def export_world_api_route(
+    stream: bool = False,
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
@@ -344,10 +376,14 @@ async def export_world_api_route(
 
     The exported file will be saved in the application's content/worlds directory.
     The server will be stopped before export and restarted after.
+
+    With ``stream=true``, the ``.mcworld`` archive is instead sent as the
+    response body while it is being created, without writing a file; the
+    server is stopped for the duration of the download.
     """
     identity = current_user.username
     logger.info(
-        f"API: World export requested for '{server_name}' by user '{identity}'."
+        f"API: World export requested for '{server_name}' by user '{identity}' (stream: {stream})."
     )
     try:
         if not utils_api.validate_server_exist(
@@ -358,6 +394,27 @@ async def export_world_api_route(
                 detail=f"Server '{server_name}' not found.",
             )
 
+        if stream:
+            result = world_api.stream_world_export(
+                server_name=server_name, app_context=app_context
+            )
+            if result.get("status") == "skipped":
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT, detail=result.get("message")
+                )
+            if result.get("status") != "success":
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=result.get("message", "Failed to export world."),
+                )
+            return _ClosingStreamingResponse(
+                result["stream"],
+                media_type="application/octet-stream",
+                headers={
+                    "Content-Disposition": f'attachment; filename="{result["filename"]}"'
+                },
+            )
+
         task_id = app_context.task_manager.run_task(
             world_api.export_world,
             server_name=server_name,
@@ -389,7 +446,7 @@ async def export_world_api_route(
     status_code=status.HTTP_202_ACCEPTED,
     tags=["Content API"],
 )
-async def reset_world_api_route(
+def reset_world_api_route(
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
@@ -444,7 +501,7 @@ async def reset_world_api_route(
     status_code=status.HTTP_202_ACCEPTED,
     tags=["Content API"],
 )
-async def install_addon_api_route(
+def install_addon_api_route(
     payload: FileNamePayload,
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_admin_user),
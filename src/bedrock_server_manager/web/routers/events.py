@@ -0,0 +1,134 @@
+# bedrock_server_manager/web/routers/events.py
+"""
+FastAPI router for pushing live server updates to the browser.
+
+The dashboard and monitor pages used to poll ``/api/servers`` and
+``/api/server/{server_name}/process_info``, each poll going through the HTTP
+middlewares, a JWT decode and a database user lookup. This module provides a
+single `Server-Sent Events <https://html.spec.whatwg.org/multipage/server-sent-events.html>`_
+endpoint instead: the client authenticates once when it connects and then
+receives the following events as they happen:
+
+- ``servers``: The server list (status, version, player count) and its status
+  revision, sent on connect and whenever the
+  :class:`~bedrock_server_manager.core.status_registry.ServerStatusRegistry`
+  changes.
+- ``process_info``: The resource usage of the server given by the
+  ``server_name`` query parameter, taken from the shared
+  :class:`~bedrock_server_manager.core.resource_sampler.ServerResourceSampler`,
+  so any number of viewers cause only one sample per interval.
+
+Both sources are in-memory; the stream only compares revision and sequence
+numbers between sends and emits a comment line periodically to keep idle
+connections open through proxies.
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from ..auth_utils import get_current_user
+from ..schemas import User
+from ..dependencies import get_app_context
+from ...context import AppContext
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+STREAM_POLL_INTERVAL_SEC: float = 0.5
+KEEPALIVE_INTERVAL_SEC: float = 15.0
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Formats a Server-Sent Event message with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def server_event_stream(
+    request: Request,
+    app_context: AppContext,
+    server_name: Optional[str] = None,
+    poll_interval: float = STREAM_POLL_INTERVAL_SEC,
+) -> AsyncIterator[str]:
+    """
+    Yields Server-Sent Events until the client disconnects.
+
+    Args:
+        request: The streaming request, used to detect disconnects.
+        app_context: The application context.
+        server_name: If given, also stream resource samples of this server.
+        poll_interval: Seconds between checks for new data.
+    """
+    registry = app_context.status_registry
+    sampler = app_context.resource_sampler if server_name else None
+
+    if not registry.is_populated:
+        await run_in_threadpool(app_context.manager.get_servers_data, app_context)
+
+    last_revision: Optional[int] = None
+    last_sample_seq = 0
+    last_sent = time.monotonic()
+
+    if sampler is not None:
+        sampler.subscribe(server_name)
+    try:
+        while not await request.is_disconnected():
+            revision, servers = registry.snapshot()
+            if revision != last_revision:
+                last_revision = revision
+                last_sent = time.monotonic()
+                yield format_sse("servers", {"revision": revision, "servers": servers})
+
+            if sampler is not None:
+                seq, info = sampler.get_sample(server_name)
+                if seq != last_sample_seq:
+                    last_sample_seq = seq
+                    last_sent = time.monotonic()
+                    yield format_sse(
+                        "process_info",
+                        {"server_name": server_name, "process_info": info},
+                    )
+
+            if time.monotonic() - last_sent >= KEEPALIVE_INTERVAL_SEC:
+                last_sent = time.monotonic()
+                yield ": keepalive\n\n"
+
+            await asyncio.sleep(poll_interval)
+    finally:
+        if sampler is not None:
+            sampler.unsubscribe(server_name)
+
+
+@router.get("/api/events", tags=["Global Info API"])
+def server_events_route(
+    request: Request,
+    server_name: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    app_context: AppContext = Depends(get_app_context),
+):
+    """
+    Streams server status changes and, for ``server_name``, resource usage as Server-Sent Events.
+    """
+    identity = current_user.username
+    logger.debug(
+        f"API: Event stream opened by user '{identity}' (server: {server_name})."
+    )
+    if server_name and not app_context.manager.validate_server(
+        server_name, app_context
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Server '{server_name}' not found.",
+        )
+
+    return StreamingResponse(
+        server_event_stream(request, app_context, server_name),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -35,7 +35,7 @@ router = APIRouter()
 
 # --- Route: Main Dashboard ---
 @router.get("/", response_class=HTMLResponse, name="index", include_in_schema=False)
-async def index(
+def index(
     request: Request,
     current_user: Optional[User] = Depends(get_current_user_optional),
     app_context: AppContext = Depends(get_app_context),
@@ -74,7 +74,7 @@ async def index(
     name="monitor_server",
     include_in_schema=False,
 )
-async def monitor_server_route(
+def monitor_server_route(
     request: Request,
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_current_user),
@@ -101,7 +101,7 @@ async def monitor_server_route(
     name="server_settings_page",
     include_in_schema=False,
 )
-async def server_settings_page_route(
+def server_settings_page_route(
     request: Request,
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_admin_user),
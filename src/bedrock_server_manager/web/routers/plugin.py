@@ -82,7 +82,7 @@ class PluginApiResponse(BaseApiResponse):
     name="manage_plugins_page",
     include_in_schema=False,
 )
-async def manage_plugins_page_route(
+def manage_plugins_page_route(
     request: Request,
     current_user: User = Depends(get_admin_user),
     templates: Jinja2Templates = Depends(get_templates),
@@ -101,7 +101,7 @@ async def manage_plugins_page_route(
 
 # --- API Route ---
 @router.get("/api/plugins", response_model=PluginApiResponse, tags=["Plugin API"])
-async def get_plugins_status_api_route(
+def get_plugins_status_api_route(
     current_user: User = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
 ):
@@ -132,7 +132,7 @@ async def get_plugins_status_api_route(
     response_model=PluginApiResponse,
     tags=["Plugin API"],
 )
-async def trigger_event_api_route(
+def trigger_event_api_route(
     payload: TriggerEventPayload,
     current_user: User = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
@@ -187,7 +187,7 @@ async def trigger_event_api_route(
     response_model=PluginApiResponse,
     tags=["Plugin API"],
 )
-async def set_plugin_status_api_route(
+def set_plugin_status_api_route(
     plugin_name: str,
     payload: PluginStatusSetPayload,
     current_user: User = Depends(get_admin_user),
@@ -239,7 +239,7 @@ async def set_plugin_status_api_route(
 @router.put(
     "/api/plugins/reload", response_model=PluginApiResponse, tags=["Plugin API"]
 )
-async def reload_plugins_api_route(
+def reload_plugins_api_route(
     current_user: User = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
 ):
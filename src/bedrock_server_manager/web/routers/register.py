@@ -37,7 +37,7 @@ class GenerateTokenRequest(BaseModel):
 
 
 @router.post("/generate-token", include_in_schema=False)
-async def generate_token(
+def generate_token(
     request: Request,
     data: GenerateTokenRequest,
     current_user: UserSchema = Depends(get_admin_user),
@@ -70,7 +70,7 @@ async def generate_token(
 
 
 @router.get("/{token}", response_class=HTMLResponse, include_in_schema=False)
-async def registration_page(
+def registration_page(
     request: Request,
     token: str,
     current_user: UserSchema = Depends(get_current_user_optional),
@@ -103,7 +103,7 @@ class RegisterUserRequest(BaseModel):
 
 
 @router.post("/{token}", include_in_schema=False)
-async def register_user(
+def register_user(
     token: str,
     data: RegisterUserRequest,
     app_context: AppContext = Depends(get_app_context),
@@ -4,8 +4,8 @@ FastAPI router for server lifecycle actions and command execution.
 
 This module defines API endpoints for managing the operational state of
 Bedrock server instances, including starting, stopping, restarting, updating,
-and deleting servers. It also provides an endpoint for sending commands to
-a running server.
+and deleting servers. It also provides endpoints for sending commands to
+a running server, optionally waiting for the server's reply.
 
 Most long-running operations (start, stop, restart, update, delete) are
 executed as background tasks to provide immediate API responses.
@@ -14,7 +14,7 @@ FastAPI dependencies.
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from fastapi import (
     APIRouter,
@@ -35,6 +35,7 @@ from ...error import (
     UserInputError,
     ServerNotRunningError,
     BlockedCommandError,
+    CommandTimeoutError,
 )
 from ...context import AppContext
 
@@ -52,6 +53,38 @@ class CommandPayload(BaseModel):
     )
 
 
+class CommandReplyPayload(BaseModel):
+    """Request model for sending a command to a server and waiting for its reply."""
+
+    command: str = Field(
+        ..., min_length=1, description="The command to send to the server."
+    )
+    pattern: Optional[str] = Field(
+        default=None,
+        description="A regular expression matching the last line of the reply. Omit to collect output until the server goes quiet.",
+    )
+    timeout_sec: float = Field(
+        default=10,
+        gt=0,
+        le=120,
+        description="How many seconds to wait for the reply.",
+    )
+
+
+class FleetUpdatePayload(BaseModel):
+    """Request model for updating several servers at once."""
+
+    server_names: Optional[List[str]] = Field(
+        default=None,
+        description="The servers to update. Omit to update all servers.",
+    )
+    max_concurrency: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="How many servers to update at the same time. Defaults to the 'updates.max_concurrency' setting.",
+    )
+
+
 # --- API Route: Start Server ---
 @router.post(
     "/api/server/{server_name}/start",
@@ -60,7 +93,7 @@ class CommandPayload(BaseModel):
     summary="Start a server instance",
     tags=["Server Actions API"],
 )
-async def start_server_route(
+def start_server_route(
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_moderator_user),
     app_context: AppContext = Depends(get_app_context),
@@ -97,7 +130,7 @@ async def start_server_route(
     summary="Stop a running server instance",
     tags=["Server Actions API"],
 )
-async def stop_server_route(
+def stop_server_route(
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_moderator_user),
     app_context: AppContext = Depends(get_app_context),
@@ -130,7 +163,7 @@ async def stop_server_route(
     summary="Restart a server instance",
     tags=["Server Actions API"],
 )
-async def restart_server_route(
+def restart_server_route(
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_moderator_user),
     app_context: AppContext = Depends(get_app_context),
@@ -164,7 +197,7 @@ async def restart_server_route(
     summary="Send a command to a running server instance",
     tags=["Server Actions API"],
 )
-async def send_command_route(
+def send_command_route(
     server_name: str,
     payload: CommandPayload,
     current_user: User = Depends(get_moderator_user),
@@ -243,6 +276,81 @@ async def send_command_route(
         )
 
 
+@router.post(
+    "/api/server/{server_name}/send_command_and_wait",
+    response_model=ActionResponse,
+    summary="Send a command to a running server and return its reply",
+    tags=["Server Actions API"],
+)
+def send_command_and_wait_route(
+    server_name: str,
+    payload: CommandReplyPayload,
+    current_user: User = Depends(get_moderator_user),
+    app_context: AppContext = Depends(get_app_context),
+):
+    """
+    Sends a command to a running Bedrock server and returns the output lines
+    it replied with in ``details``.
+
+    The server must have been started by this manager, so its output can be
+    read. Replies that do not arrive within ``timeout_sec`` result in a 504.
+    """
+    identity = current_user.username
+    logger.info(
+        f"API: Send command and wait request for '{server_name}' by user '{identity}'. Command: {payload.command}"
+    )
+
+    if not payload.command.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Request must contain a non-empty 'command'.",
+        )
+
+    try:
+        result = server_api.send_command_and_wait(
+            server_name=server_name,
+            command=payload.command.strip(),
+            pattern=payload.pattern,
+            timeout=payload.timeout_sec,
+            app_context=app_context,
+        )
+        return ActionResponse(
+            status="success",
+            message=result.get("message", "Command answered."),
+            details=result.get("output", []),
+        )
+
+    except BlockedCommandError as e:
+        logger.warning(
+            f"API Send Command '{server_name}': Blocked command attempt. {e}"
+        )
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except ServerNotRunningError as e:
+        logger.warning(f"API Send Command '{server_name}': Server not running. {e}")
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except CommandTimeoutError as e:
+        logger.warning(f"API Send Command '{server_name}': No reply. {e}")
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=str(e))
+    except UserInputError as e:
+        logger.warning(f"API Send Command '{server_name}': Input error. {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except BSMError as e:
+        logger.error(
+            f"API Send Command '{server_name}': Application error. {e}", exc_info=True
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
+    except Exception as e:
+        logger.error(
+            f"API Send Command '{server_name}': Unexpected error. {e}", exc_info=True
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while sending the command.",
+        )
+
+
 @router.post(
     "/api/server/{server_name}/update",
     response_model=ActionResponse,
@@ -250,7 +358,7 @@ async def send_command_route(
     summary="Update a server instance to the latest version",
     tags=["Server Actions API"],
 )
-async def update_server_route(
+def update_server_route(
     server_name: str,
     current_user: User = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
@@ -276,6 +384,45 @@ async def update_server_route(
     )
 
 
+@router.post(
+    "/api/servers/update",
+    response_model=ActionResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Update several server instances to their target versions",
+    tags=["Server Actions API"],
+)
+def update_servers_route(
+    payload: FleetUpdatePayload,
+    current_user: User = Depends(get_admin_user),
+    app_context: AppContext = Depends(get_app_context),
+):
+    """
+    Initiates updating several (or all) Bedrock server instances in the background.
+
+    Each target version is downloaded once and the servers are updated with
+    bounded concurrency. Per-server progress is reported in the ``progress``
+    field of the task status. This endpoint immediately returns a 202 Accepted
+    response.
+    """
+    identity = current_user.username
+    logger.info(
+        f"API: Fleet update request for {payload.server_names or 'all servers'} by user '{identity}'."
+    )
+    task_id = app_context.task_manager.run_task(
+        server_install_config.update_servers,
+        server_names=payload.server_names,
+        max_concurrency=payload.max_concurrency,
+        app_context=app_context,
+        report_progress=True,
+    )
+
+    return ActionResponse(
+        status="pending",
+        message="Update operation for the servers initiated in background.",
+        task_id=task_id,
+    )
+
+
 @router.delete(
     "/api/server/{server_name}/delete",
     response_model=ActionResponse,
@@ -283,7 +430,7 @@ async def update_server_route(
     summary="Delete a server instance and its data",
     tags=["Server Actions API"],
 )
-async def delete_server_route(
+def delete_server_route(
     server_name: str,
     current_user: User = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
@@ -159,7 +159,7 @@ class ServiceUpdatePayload(BaseModel):
     "/api/downloads/list",
     tags=["Server Installation API"],
 )
-async def get_custom_zips(
+def get_custom_zips(
     current_user: User = Depends(get_moderator_user),
     app_context: AppContext = Depends(get_app_context),
 ):
@@ -189,7 +189,7 @@ async def get_custom_zips(
     name="install_server_page",
     include_in_schema=False,
 )
-async def install_server_page(
+def install_server_page(
     request: Request,
     current_user: User = Depends(get_admin_user),
     templates: Jinja2Templates = Depends(get_templates),
@@ -210,7 +210,7 @@ async def install_server_page(
     response_model=InstallServerResponse,
     tags=["Server Installation API"],
 )
-async def install_server_api_route(
+def install_server_api_route(
     payload: InstallServerPayload,
     current_user: User = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
@@ -326,7 +326,7 @@ async def install_server_api_route(
     name="configure_properties_page",
     include_in_schema=False,
 )
-async def configure_properties_page(
+def configure_properties_page(
     request: Request,
     new_install: bool = False,
     server_name: str = Depends(validate_server_exists),
@@ -358,7 +358,7 @@ async def configure_properties_page(
     name="configure_allowlist_page",
     include_in_schema=False,
 )
-async def configure_allowlist_page(
+def configure_allowlist_page(
     request: Request,
     new_install: bool = False,
     server_name: str = Depends(validate_server_exists),
@@ -390,7 +390,7 @@ async def configure_allowlist_page(
     name="configure_permissions_page",
     include_in_schema=False,
 )
-async def configure_permissions_page(
+def configure_permissions_page(
     request: Request,
     new_install: bool = False,
     server_name: str = Depends(validate_server_exists),
@@ -422,7 +422,7 @@ async def configure_permissions_page(
     name="configure_service_page",
     include_in_schema=False,
 )
-async def configure_service_page(
+def configure_service_page(
     request: Request,
     new_install: bool = False,
     server_name: str = Depends(validate_server_exists),
@@ -453,7 +453,7 @@ async def configure_service_page(
     status_code=status.HTTP_200_OK,
     tags=["Server Configuration API"],
 )
-async def configure_properties_api_route(
+def configure_properties_api_route(
     payload: PropertiesPayload,
     server_name: str = Depends(validate_server_exists),
     current_user: Dict[str, Any] = Depends(get_moderator_user),
@@ -516,7 +516,7 @@ async def configure_properties_api_route(
 @router.get(
     "/api/server/{server_name}/properties/get", tags=["Server Configuration API"]
 )
-async def get_server_properties_api_route(
+def get_server_properties_api_route(
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_moderator_user),
     app_context: AppContext = Depends(get_app_context),
@@ -551,7 +551,7 @@ async def get_server_properties_api_route(
     status_code=status.HTTP_200_OK,
     tags=["Server Configuration API"],
 )
-async def add_to_allowlist_api_route(
+def add_to_allowlist_api_route(
     payload: AllowlistAddPayload,
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_moderator_user),
@@ -603,7 +603,7 @@ async def add_to_allowlist_api_route(
 @router.get(
     "/api/server/{server_name}/allowlist/get", tags=["Server Configuration API"]
 )
-async def get_allowlist_api_route(
+def get_allowlist_api_route(
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_moderator_user),
     app_context: AppContext = Depends(get_app_context),
@@ -636,7 +636,7 @@ async def get_allowlist_api_route(
     status_code=status.HTTP_200_OK,
     tags=["Server Configuration API"],
 )
-async def remove_allowlist_players_api_route(
+def remove_allowlist_players_api_route(
     payload: AllowlistRemovePayload,
     server_name: str = Depends(validate_server_exists),
     current_user: Dict[str, Any] = Depends(get_moderator_user),
@@ -691,7 +691,7 @@ async def remove_allowlist_players_api_route(
     status_code=status.HTTP_200_OK,
     tags=["Server Configuration API"],
 )
-async def configure_permissions_api_route(
+def configure_permissions_api_route(
     payload: PermissionsSetPayload,
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_moderator_user),
@@ -789,7 +789,7 @@ async def configure_permissions_api_route(
 @router.get(
     "/api/server/{server_name}/permissions/get", tags=["Server Configuration API"]
 )
-async def get_server_permissions_api_route(
+def get_server_permissions_api_route(
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_moderator_user),
     app_context: AppContext = Depends(get_app_context),
@@ -824,7 +824,7 @@ async def get_server_permissions_api_route(
     status_code=status.HTTP_200_OK,
     tags=["Server Configuration API"],
 )
-async def configure_service_api_route(
+def configure_service_api_route(
     server_name: str = Depends(validate_server_exists),
     payload: ServiceUpdatePayload = Body(...),
     current_user: User = Depends(get_admin_user),
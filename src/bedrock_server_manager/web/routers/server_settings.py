@@ -54,7 +54,7 @@ class ServerSettingsResponse(BaseApiResponse):
     response_model=ServerSettingsResponse,
     tags=["Server Settings API"],
 )
-async def get_server_settings_api_route(
+def get_server_settings_api_route(
     server_name: str = Path(..., description="The name of the server."),
     current_user: User = Depends(get_current_user),
     app_context: AppContext = Depends(get_app_context),
@@ -93,7 +93,7 @@ async def get_server_settings_api_route(
     response_model=ServerSettingsResponse,
     tags=["Server Settings API"],
 )
-async def set_server_setting_api_route(
+def set_server_setting_api_route(
     payload: ServerSettingItem,
     server_name: str = Path(..., description="The name of the server."),
     current_user: User = Depends(get_admin_user),
@@ -10,6 +10,7 @@ It includes:
 - API endpoints to:
     - Retrieve all current global settings (:func:`~.get_all_settings_api_route`).
     - Set a specific global setting by its key (:func:`~.set_setting_api_route`).
+    - Set several global settings in one transaction (:func:`~.set_settings_batch_api_route`).
     - Trigger a reload of settings from the configuration file
       (:func:`~.reload_settings_api_route`).
 
@@ -50,6 +51,16 @@ class SettingItem(BaseModel):
     value: Any = Field(..., description="The new value for the setting.")
 
 
+class SettingsBatchPayload(BaseModel):
+    """Request model for setting several settings at once."""
+
+    settings: Dict[str, Any] = Field(
+        ...,
+        min_length=1,
+        description="Mapping of dot-notation keys to their new values.",
+    )
+
+
 class SettingsResponse(BaseApiResponse):
     """Response model for settings operations."""
 
@@ -70,7 +81,7 @@ class SettingsResponse(BaseApiResponse):
     name="manage_settings_page",
     include_in_schema=False,
 )
-async def manage_settings_page_route(
+def manage_settings_page_route(
     request: Request,
     current_user: User = Depends(get_admin_user),
     templates: Jinja2Templates = Depends(get_templates),
@@ -89,7 +100,7 @@ async def manage_settings_page_route(
 
 # --- API Route: Get All Global Settings ---
 @router.get("/api/settings", response_model=SettingsResponse, tags=["Settings API"])
-async def get_all_settings_api_route(
+def get_all_settings_api_route(
     current_user: User = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
 ):
@@ -122,7 +133,7 @@ async def get_all_settings_api_route(
 
 # --- API Route: Set a Global Setting ---
 @router.post("/api/settings", response_model=SettingsResponse, tags=["Settings API"])
-async def set_setting_api_route(
+def set_setting_api_route(
     payload: SettingItem,
     current_user: User = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
@@ -181,9 +192,58 @@ async def set_setting_api_route(
         )
 
 
+# --- API Route: Set Several Global Settings ---
+@router.post(
+    "/api/settings/batch", response_model=SettingsResponse, tags=["Settings API"]
+)
+def set_settings_batch_api_route(
+    payload: SettingsBatchPayload,
+    current_user: User = Depends(get_admin_user),
+    app_context: AppContext = Depends(get_app_context),
+):
+    """
+    Sets several global application settings in a single transaction.
+    """
+    identity = current_user.username
+    logger.info(
+        f"API: Set global settings request for keys {list(payload.settings)} by '{identity}'."
+    )
+    try:
+        result = settings_api.set_global_settings(
+            values=payload.settings, app_context=app_context
+        )
+        if result.get("status") == "success":
+            return SettingsResponse(
+                status="success",
+                message=result.get("message", "Settings updated successfully."),
+                settings={key: payload.settings[key] for key in result["changed"]},
+            )
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=result.get("message", "Failed to set settings."),
+            )
+    except (UserInputError, MissingArgumentError) as e:
+        logger.warning(f"API Set Settings: Input error. {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except BSMError as e:
+        logger.error(f"API Set Settings: BSMError. {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"API Set Settings: Unexpected error. {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while setting the values.",
+        )
+
+
 # --- API Route: Get Available Themes ---
 @router.get("/api/themes", response_model=Dict[str, str], tags=["Settings API"])
-async def get_themes_api_route(
+def get_themes_api_route(
     current_user: User = Depends(get_current_user),
     app_context: AppContext = Depends(get_app_context),
 ):
@@ -227,7 +287,7 @@ async def get_themes_api_route(
 @router.post(
     "/api/settings/reload", response_model=SettingsResponse, tags=["Settings API"]
 )
-async def reload_settings_api_route(
+def reload_settings_api_route(
     current_user: User = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
 ):
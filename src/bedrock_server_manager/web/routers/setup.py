@@ -28,7 +28,7 @@ router = APIRouter(
 
 
 @router.get("", response_class=HTMLResponse, include_in_schema=False)
-async def setup_page(
+def setup_page(
     request: Request,
     current_user: UserSchema = Depends(get_current_user_optional),
     app_context: AppContext = Depends(get_app_context),
@@ -55,7 +55,7 @@ class CreateFirstUserRequest(BaseModel):
 
 
 @router.post("/create-first-user", include_in_schema=False)
-async def create_first_user(
+def create_first_user(
     data: CreateFirstUserRequest,
     app_context: AppContext = Depends(get_app_context),
 ):
@@ -11,7 +11,7 @@ router = APIRouter()
 
 
 @router.get("/api/tasks/status/{task_id}", tags=["Tasks"])
-async def get_task_status(
+def get_task_status(
     task_id: str,
     current_user: User = Depends(get_current_user),
     app_context: AppContext = Depends(get_app_context),
@@ -12,6 +12,7 @@ from ..dependencies import get_templates, get_app_context
 from ..auth_utils import get_current_user, pwd_context
 from ..schemas import User as UserSchema
 from ..auth_utils import get_admin_user, get_moderator_user
+from ..auth_cache import invalidate_user
 from .audit_log import create_audit_log
 from ...context import AppContext
 
@@ -24,7 +25,7 @@ router = APIRouter(
 
 
 @router.get("", response_class=HTMLResponse, include_in_schema=False)
-async def users_page(
+def users_page(
     request: Request,
     current_user: UserSchema = Depends(get_moderator_user),
     app_context: AppContext = Depends(get_app_context),
@@ -55,7 +56,7 @@ class UpdateUserRoleRequest(BaseModel):
 
 
 @router.post("/create", include_in_schema=False)
-async def create_user(
+def create_user(
     data: CreateUserRequest,
     current_user: UserSchema = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
@@ -94,8 +95,9 @@ async def create_user(
 
 
 @router.post("/{user_id}/delete", include_in_schema=False)
-async def delete_user(
+def delete_user(
     user_id: int,
+    request: Request,
     current_user: UserSchema = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
 ):
@@ -113,6 +115,10 @@ async def delete_user(
             )
             db.delete(user)
             db.commit()
+            invalidate_user(user.username)
+            last_seen_buffer = getattr(request.app.state, "last_seen_buffer", None)
+            if last_seen_buffer is not None:
+                last_seen_buffer.discard(user_id)
             logger.info(f"User '{user.username}' deleted by '{current_user.username}'.")
             return {"status": "success"}
 
@@ -123,7 +129,7 @@ async def delete_user(
 
 
 @router.post("/{user_id}/disable", include_in_schema=False)
-async def disable_user(
+def disable_user(
     user_id: int,
     current_user: UserSchema = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
@@ -148,6 +154,7 @@ async def disable_user(
 
             user.is_active = False
             db.commit()
+            invalidate_user(user.username)
             create_audit_log(
                 app_context,
                 current_user.id,
@@ -166,7 +173,7 @@ async def disable_user(
 
 
 @router.post("/{user_id}/enable", include_in_schema=False)
-async def enable_user(
+def enable_user(
     user_id: int,
     current_user: UserSchema = Depends(get_admin_user),
     app_context: AppContext = Depends(get_app_context),
@@ -179,6 +186,7 @@ async def enable_user(
         if user:
             user.is_active = True
             db.commit()
+            invalidate_user(user.username)
             create_audit_log(
                 app_context,
                 current_user.id,
@@ -195,7 +203,7 @@ async def enable_user(
 
 
 @router.post("/{user_id}/role", include_in_schema=False)
-async def update_user_role(
+def update_user_role(
     user_id: int,
     data: UpdateUserRoleRequest,
     current_user: UserSchema = Depends(get_admin_user),
@@ -221,6 +229,7 @@ async def update_user_role(
             original_role = user.role
             user.role = data.role
             db.commit()
+            invalidate_user(user.username)
             create_audit_log(
                 app_context,
                 current_user.id,
@@ -40,7 +40,7 @@ router = APIRouter()
 
 # --- Route: Serve Custom Panorama ---
 @router.get("/api/panorama", response_class=FileResponse, tags=["Global Info API"])
-async def serve_custom_panorama_api(
+def serve_custom_panorama_api(
     app_context: AppContext = Depends(get_app_context),
 ):
     """Serves a custom `panorama.jpeg` background image if available, otherwise a default.
@@ -91,7 +91,7 @@ async def serve_custom_panorama_api(
     response_class=FileResponse,
     tags=["Server Info API"],
 )
-async def serve_world_icon_api(
+def serve_world_icon_api(
     server_name: str = Depends(validate_server_exists),
     current_user: User = Depends(get_current_user),
     app_context: AppContext = Depends(get_app_context),
@@ -159,7 +159,7 @@ async def serve_world_icon_api(
 
 
 @router.get("/favicon.ico", include_in_schema=False)
-async def get_root_favicon():
+def get_root_favicon():
     """Serves the `favicon.ico` file from the static directory."""
     favicon_path = os.path.join(STATIC_DIR, "image", "icon", "favicon.ico")
     if not os.path.exists(favicon_path):
@@ -177,7 +177,7 @@ from typing import Optional
 
 
 @router.get("/{full_path:path}", name="catch_all_route", include_in_schema=False)
-async def catch_all_api_route(
+def catch_all_api_route(
     request: Request,
     full_path: str,
     current_user: Optional[User] = Depends(get_current_user_optional),
@@ -27,6 +27,17 @@ class TaskManager:
             if result is not None:
                 self.tasks[task_id]["result"] = result
 
+    def update_progress(self, task_id: str, progress: Any):
+        """Stores the latest progress report of a running task.
+
+        Args:
+            task_id: The ID of the task.
+            progress: A JSON-serializable description of the task's progress,
+                returned as the task's ``"progress"`` field.
+        """
+        if task_id in self.tasks:
+            self.tasks[task_id]["progress"] = progress
+
     def _task_done_callback(self, task_id: str, future: Future):
         """Callback function executed when a task completes."""
         try:
@@ -42,13 +53,23 @@ class TaskManager:
             if task_id in self.futures:
                 del self.futures[task_id]
 
-    def run_task(self, target_function: Callable, *args: Any, **kwargs: Any) -> str:
+    def run_task(
+        self,
+        target_function: Callable,
+        *args: Any,
+        report_progress: bool = False,
+        **kwargs: Any,
+    ) -> str:
         """
         Submits a function to be run in the background.
 
         Args:
             target_function: The function to execute.
             *args: Positional arguments for the target function.
+            report_progress: If True, the target function is passed a
+                ``progress_callback`` keyword argument, a callable taking one
+                argument that it can call to publish its progress (see
+                :meth:`update_progress`).
             **kwargs: Keyword arguments for the target function.
 
         Returns:
@@ -67,8 +88,13 @@ class TaskManager:
             "status": "in_progress",
             "message": "Task is running.",
             "result": None,
+            "progress": None,
         }
 
+        if report_progress:
+            kwargs["progress_callback"] = lambda progress: self.update_progress(
+                task_id, progress
+            )
         future = self.executor.submit(target_function, *args, **kwargs)
         self.futures[task_id] = future
         future.add_done_callback(lambda f: self._task_done_callback(task_id, f))
@@ -10,6 +10,7 @@ from bedrock_server_manager.api.backup_restore import (
     restore_world,
     restore_config_file,
     prune_old_backups,
+    export_world_backup,
 )
 from bedrock_server_manager.error import AppFileNotFoundError, MissingArgumentError
 
@@ -125,7 +126,25 @@ class TestBackupRestore:
         with patch.object(server, "prune_server_backups") as mock_prune:
             result = prune_old_backups("test_server", app_context=app_context)
             assert result["status"] == "success"
-            assert mock_prune.call_count == 4
+            assert mock_prune.call_count == 5
+
+    def test_export_world_backup(self, app_context, tmp_path):
+        server = app_context.get_server("test_server")
+        app_context.settings.set("backup.incremental_enabled", True)
+        world_dir = os.path.join(server.server_dir, "worlds", "world")
+        os.makedirs(world_dir)
+        (Path(world_dir) / "level.dat").write_bytes(b"level")
+        manifest_path = server._backup_world_data_internal()
+
+        result = export_world_backup(
+            "test_server",
+            manifest_path,
+            export_dir=str(tmp_path),
+            app_context=app_context,
+        )
+        assert result["status"] == "success"
+        assert result["export_file"].endswith(".mcworld")
+        assert os.path.isfile(result["export_file"])
 
     def test_prune_old_backups_no_dir(self, app_context):
         result = prune_old_backups("test_server", app_context=app_context)
@@ -139,3 +158,38 @@ class TestBackupRestore:
             mock_lock.acquire.return_value = False
             result = backup_world("test_server", app_context=app_context)
             assert result["status"] == "skipped"
+
+    def test_backup_world_hot(self, app_context):
+        server = app_context.get_server("test_server")
+        with (
+            patch.object(server, "can_hot_backup", return_value=True),
+            patch.object(
+                server, "_backup_world_data_internal", return_value="/b/w.mcworld"
+            ) as mock_backup,
+            patch(
+                "bedrock_server_manager.api.backup_restore.server_lifecycle_manager"
+            ) as mock_lifecycle,
+        ):
+            result = backup_world(
+                "test_server", hot_backup=True, app_context=app_context
+            )
+        assert result["status"] == "success"
+        mock_backup.assert_called_once_with(hot=True)
+        mock_lifecycle.assert_not_called()
+
+    def test_backup_world_hot_falls_back_without_process(self, app_context):
+        server = app_context.get_server("test_server")
+        with (
+            patch.object(
+                server, "_backup_world_data_internal", return_value="/b/w.mcworld"
+            ) as mock_backup,
+            patch(
+                "bedrock_server_manager.api.backup_restore.server_lifecycle_manager"
+            ) as mock_lifecycle,
+        ):
+            result = backup_world(
+                "test_server", hot_backup=True, app_context=app_context
+            )
+        assert result["status"] == "success"
+        mock_backup.assert_called_once_with()
+        mock_lifecycle.assert_called_once()
@@ -71,6 +71,26 @@ class TestGetAllServersData:
         assert result["status"] == "success"
         assert len(result["servers"]) == 1
 
+    def test_get_all_servers_data_not_modified(self, app_context, real_bedrock_server):
+        first = get_all_servers_data(app_context=app_context)
+        assert "revision" in first
+
+        result = get_all_servers_data(
+            since_revision=first["revision"], app_context=app_context
+        )
+        assert result == {
+            "status": "success",
+            "not_modified": True,
+            "revision": first["revision"],
+        }
+
+        real_bedrock_server.set_status_in_config("RUNNING")
+        result = get_all_servers_data(
+            since_revision=first["revision"], app_context=app_context
+        )
+        assert result["revision"] > first["revision"]
+        assert result["servers"][0]["status"] == "RUNNING"
+
     def test_get_all_servers_data_partial_success(self, real_manager):
         with patch.object(
             real_manager,
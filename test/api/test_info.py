@@ -1,12 +1,14 @@
 import pytest
+import time
 from unittest.mock import patch, MagicMock
 
 from bedrock_server_manager.api.info import (
     get_server_running_status,
     get_server_config_status,
     get_server_installed_version,
+    get_server_resource_history,
 )
-from bedrock_server_manager.error import BSMError
+from bedrock_server_manager.error import BSMError, UserInputError
 
 
 class TestServerInfo:
@@ -46,3 +48,25 @@ class TestServerInfo:
             result = get_server_running_status("test_server", app_context=app_context)
             assert result["status"] == "error"
             assert "Test error" in result["message"]
+
+    def test_get_server_resource_history(self, app_context):
+        history = app_context.resource_history.get_history("test_server")
+        start = (int(time.time()) // 5) * 5 - 20
+        history.record({"cpu_percent": 10, "memory_mb": 200}, timestamp=start)
+        history.record({"cpu_percent": 20, "memory_mb": 200}, timestamp=start + 5)
+
+        result = get_server_resource_history(
+            "test_server", start=start - 1, end=start + 10, app_context=app_context
+        )
+        app_context.resource_history.shutdown()
+
+        assert result["status"] == "success"
+        points = result["data"]["points"]
+        assert [point[0] for point in points] == [start]
+        assert points[0][1] == 10
+
+    def test_get_server_resource_history_invalid_range(self, app_context):
+        with pytest.raises(UserInputError):
+            get_server_resource_history(
+                "test_server", start=20, end=10, app_context=app_context
+            )
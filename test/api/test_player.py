@@ -5,6 +5,8 @@ from bedrock_server_manager.api.player import (
     add_players_manually_api,
     get_all_known_players_api,
     scan_and_update_player_db_api,
+    get_online_players_api,
+    get_player_sessions_api,
 )
 from bedrock_server_manager.error import UserInputError, BSMError
 
@@ -73,3 +75,48 @@ class TestPlayerManagement:
             result = scan_and_update_player_db_api(app_context=app_context)
             assert result["status"] == "error"
             assert "Test error" in result["message"]
+
+
+class TestPlayerSessions:
+    def test_get_online_players_api(self, app_context):
+        app_context.player_session_tracker.process_events(
+            "test_server",
+            [
+                {
+                    "event": "connected",
+                    "name": "player1",
+                    "xuid": "123",
+                    "timestamp": None,
+                }
+            ],
+        )
+        result = get_online_players_api("test_server", app_context=app_context)
+        assert result["status"] == "success"
+        assert [p["xuid"] for p in result["players"]] == ["123"]
+        assert get_online_players_api("other", app_context=app_context)["players"] == []
+
+    def test_get_player_sessions_api(self, app_context):
+        app_context.player_session_tracker.process_events(
+            "test_server",
+            [
+                {
+                    "event": "connected",
+                    "name": "player1",
+                    "xuid": "123",
+                    "timestamp": None,
+                }
+            ],
+        )
+        result = get_player_sessions_api(xuid="123", app_context=app_context)
+        assert result["status"] == "success"
+        assert result["sessions"][0]["server_name"] == "test_server"
+        assert result["sessions"][0]["leave_time"] is None
+
+    def test_get_player_sessions_api_invalid_range(self, app_context):
+        from datetime import datetime, timedelta
+
+        now = datetime.now()
+        result = get_player_sessions_api(
+            start=now, end=now - timedelta(hours=1), app_context=app_context
+        )
+        assert result["status"] == "error"
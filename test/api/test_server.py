@@ -9,9 +9,11 @@ from bedrock_server_manager.api.server import (
     set_server_custom_value,
     get_all_server_settings,
     start_server,
+    start_servers,
     stop_server,
     restart_server,
     send_command,
+    send_command_and_wait,
     delete_server_data,
 )
 from bedrock_server_manager.error import (
@@ -88,6 +90,49 @@ class TestServerLifecycle:
             assert result["status"] == "error"
             assert "already running" in result["message"]
 
+    @patch("bedrock_server_manager.api.server.start_server")
+    def test_start_servers(self, mock_start_server, app_context):
+        mock_start_server.side_effect = lambda name, app_context: (
+            {"status": "success"}
+            if name != "broken"
+            else {"status": "error", "message": "Failed."}
+        )
+        snapshots = []
+
+        result = start_servers(
+            ["server1", "server2", "broken"],
+            max_concurrency=2,
+            stagger_sec=0,
+            progress_callback=snapshots.append,
+            app_context=app_context,
+        )
+
+        assert result["status"] == "error"
+        assert result["started"] == ["server1", "server2"]
+        assert result["failed"] == ["broken"]
+        assert mock_start_server.call_count == 3
+        assert snapshots[-1]["completed"] == 3
+
+    @patch("bedrock_server_manager.api.server.time.sleep")
+    @patch("bedrock_server_manager.api.server.start_server")
+    def test_start_servers_staggers_launches(
+        self, mock_start_server, mock_sleep, app_context
+    ):
+        mock_start_server.return_value = {"status": "success"}
+
+        result = start_servers(
+            ["server1", "server2", "server3"],
+            max_concurrency=3,
+            stagger_sec=5,
+            app_context=app_context,
+        )
+
+        assert result["status"] == "success"
+        delays = sorted(call.args[0] for call in mock_sleep.call_args_list)
+        assert delays[0] == pytest.approx(0, abs=1)
+        assert delays[1] == pytest.approx(5, abs=1)
+        assert delays[2] == pytest.approx(10, abs=1)
+
     @patch("bedrock_server_manager.core.bedrock_server.BedrockServer.stop")
     @patch(
         "bedrock_server_manager.core.bedrock_process_manager.BedrockProcessManager.remove_server"
@@ -143,6 +188,27 @@ class TestSendCommand:
             with pytest.raises(ServerNotRunningError):
                 send_command("test_server", "say hello", app_context=app_context)
 
+    @patch(
+        "bedrock_server_manager.core.bedrock_server.BedrockServer.send_command_and_wait"
+    )
+    def test_send_command_and_wait(self, mock_send, app_context):
+        mock_send.return_value = ["There are 0/10 players online:"]
+        result = send_command_and_wait(
+            "test_server",
+            " list ",
+            pattern="players online",
+            timeout=5,
+            app_context=app_context,
+        )
+        assert result["status"] == "success"
+        assert result["output"] == ["There are 0/10 players online:"]
+        mock_send.assert_called_once_with("list", pattern="players online", timeout=5)
+
+    def test_send_command_and_wait_blocked(self, app_context):
+        with patch("bedrock_server_manager.api.server.API_COMMAND_BLACKLIST", ["stop"]):
+            with pytest.raises(BlockedCommandError):
+                send_command_and_wait("test_server", "stop", app_context=app_context)
+
 
 class TestDeleteServer:
     def test_delete_server_data(self, app_context):
@@ -12,6 +12,7 @@ from bedrock_server_manager.api.server_install_config import (
     modify_server_properties,
     install_new_server,
     update_server,
+    update_servers,
 )
 from bedrock_server_manager.error import UserInputError
 
@@ -165,3 +166,53 @@ class TestInstallUpdate:
                     mock_lifecycle.assert_called_once()
                     mock_backup.assert_called_once()
                     mock_install.assert_called_once()
+
+    @patch("bedrock_server_manager.api.server_install_config.update_server")
+    @patch("bedrock_server_manager.api.server_install_config.BedrockDownloader")
+    def test_update_servers_downloads_once_per_target(
+        self, mock_downloader_cls, mock_update, app_context
+    ):
+        server = app_context.get_server("test_server")
+        other_server = app_context.get_server("other_server")
+        mock_downloader = mock_downloader_cls.return_value
+        mock_downloader.get_actual_version.return_value = "1.21.0"
+        mock_update.return_value = {
+            "status": "success",
+            "updated": True,
+            "message": "Updated.",
+            "stats": {"extracted_files": 3},
+        }
+        snapshots = []
+
+        with (
+            patch.object(server, "get_target_version", return_value="LATEST"),
+            patch.object(other_server, "get_target_version", return_value="latest"),
+        ):
+            result = update_servers(
+                ["test_server", "other_server"],
+                max_concurrency=2,
+                progress_callback=snapshots.append,
+                app_context=app_context,
+            )
+
+        assert result["status"] == "success"
+        mock_downloader.prepare_download_assets.assert_called_once()
+        assert mock_update.call_count == 2
+        for call in mock_update.call_args_list:
+            assert call.kwargs["prepared_downloader"] is mock_downloader
+        assert snapshots[-1]["completed"] == snapshots[-1]["total"]
+        assert result["updated"] == ["test_server", "other_server"]
+
+    @patch("bedrock_server_manager.api.server_install_config.update_server")
+    @patch("bedrock_server_manager.api.server_install_config.BedrockDownloader")
+    def test_update_servers_skips_custom_target(
+        self, mock_downloader_cls, mock_update, app_context
+    ):
+        server = app_context.get_server("test_server")
+        with patch.object(server, "get_target_version", return_value="CUSTOM"):
+            result = update_servers(["test_server"], app_context=app_context)
+
+        assert result["status"] == "success"
+        assert result["servers"]["test_server"]["status"] == "skipped"
+        mock_downloader_cls.assert_not_called()
+        mock_update.assert_not_called()
@@ -29,6 +29,19 @@ class TestSystemAPI:
             assert result["process_info"] is None
             mock_get_info.assert_called_once()
 
+    def test_get_bedrock_process_info_from_sampler(self, app_context):
+        server = app_context.get_server("test_server")
+        with patch.object(
+            server, "get_process_info", return_value={"pid": 123}
+        ) as mock_get_info:
+            for _ in range(2):
+                result = get_bedrock_process_info(
+                    "test_server", app_context=app_context, use_sampler=True
+                )
+                assert result["process_info"]["pid"] == 123
+            app_context.resource_sampler.shutdown()
+            mock_get_info.assert_called_once()
+
     def test_set_autoupdate_true(self, app_context):
         server = app_context.get_server("test_server")
         with patch.object(server, "set_autoupdate") as mock_set_autoupdate:
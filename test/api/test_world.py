@@ -1,9 +1,11 @@
 import pytest
 from unittest.mock import patch, MagicMock
 
+from bedrock_server_manager.api import world as world_api
 from bedrock_server_manager.api.world import (
     get_world_name,
     export_world,
+    stream_world_export,
     import_world,
     reset_world,
 )
@@ -41,6 +43,56 @@ class TestWorldAPI:
                 mock_lifecycle.assert_called_once()
                 mock_export.assert_called_once()
 
+    @patch("bedrock_server_manager.api.world.server_lifecycle_manager")
+    def test_stream_world_export_holds_lock_until_closed(
+        self, mock_lifecycle, app_context
+    ):
+        server = app_context.get_server("test_server")
+        archive = MagicMock()
+        with patch.object(
+            server, "iter_world_directory_as_mcworld", return_value=archive
+        ):
+            result = stream_world_export("test_server", app_context=app_context)
+            assert result["status"] == "success"
+            # The lock is taken before the stream is read, so a second export
+            # is refused right away.
+            assert world_api._world_lock.locked()
+            second = stream_world_export("test_server", app_context=app_context)
+            assert second["status"] == "skipped"
+
+            # Closing an unread stream releases the lock and the archive.
+            result["stream"].close()
+            result["stream"].close()
+            assert not world_api._world_lock.locked()
+            archive.close.assert_called_once()
+            mock_lifecycle.assert_not_called()
+
+    @patch("bedrock_server_manager.api.world.server_lifecycle_manager")
+    def test_stream_world_export_releases_lock_when_exhausted(
+        self, mock_lifecycle, app_context
+    ):
+        server = app_context.get_server("test_server")
+        with patch.object(
+            server,
+            "iter_world_directory_as_mcworld",
+            return_value=(c for c in [b"a", b"b"]),
+        ):
+            result = stream_world_export("test_server", app_context=app_context)
+            assert list(result["stream"]) == [b"a", b"b"]
+            assert not world_api._world_lock.locked()
+            mock_lifecycle.assert_called_once()
+
+    def test_stream_world_export_error_releases_lock(self, app_context):
+        server = app_context.get_server("test_server")
+        with patch.object(
+            server,
+            "iter_world_directory_as_mcworld",
+            side_effect=FileOperationError("no world"),
+        ):
+            result = stream_world_export("test_server", app_context=app_context)
+            assert result["status"] == "error"
+            assert not world_api._world_lock.locked()
+
     @patch("bedrock_server_manager.api.world.server_lifecycle_manager")
     def test_import_world(self, mock_lifecycle, app_context, tmp_path):
         server = app_context.get_server("test_server")
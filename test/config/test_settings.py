@@ -7,6 +7,7 @@ from bedrock_server_manager.config.const import package_name, env_name
 from bedrock_server_manager.config.settings import (
     Settings,
     CONFIG_SCHEMA_VERSION,
+    SETTINGS_REVISION_KEY,
     deep_merge,
 )
 from bedrock_server_manager.db.database import Base
@@ -131,6 +132,38 @@ def test_write_config_error(settings, db_session, monkeypatch):
         settings._write_config(db_session)
 
 
+def test_set_many_writes_only_changed_sections(settings, db_session):
+    """Test that set_many saves only the sections containing changed values."""
+    retention_before = db_session.query(Setting).filter_by(key="retention").one()
+    retention_before_value = dict(retention_before.value)
+
+    changed = settings.set_many({"web.port": 8123, "web.host": "0.0.0.0"})
+
+    assert sorted(changed) == ["web.host", "web.port"]
+    db_session.expire_all()
+    web = db_session.query(Setting).filter_by(key="web").one()
+    assert web.value["port"] == 8123
+    assert web.value["host"] == "0.0.0.0"
+    retention = db_session.query(Setting).filter_by(key="retention").one()
+    assert retention.value == retention_before_value
+
+    revision = db_session.query(Setting).filter_by(key=SETTINGS_REVISION_KEY).one()
+    assert revision.value["sections"]["web"] == revision.value["revision"]
+    assert settings.set_many({"web.port": 8123}) == []
+
+
+def test_refresh_if_changed_reloads_sections_from_other_process(settings):
+    """Test that changes saved by another Settings instance are picked up."""
+    other = Settings(db=settings.db)
+    other.load()
+
+    other.set("retention.backups", 9)
+
+    assert settings.refresh_if_changed() == ["retention"]
+    assert settings.get("retention.backups") == 9
+    assert settings.refresh_if_changed() == []
+
+
 def test_deep_merge():
     """Test the deep_merge function."""
     source = {"a": 1, "b": {"c": 2, "d": 3}}
@@ -1,5 +1,6 @@
 import pytest
 import os
+import threading
 import shutil
 import zipfile
 import tempfile
@@ -13,7 +14,11 @@ from bedrock_server_manager.core.server.config_management_mixin import (
     ServerConfigManagementMixin,
 )
 from bedrock_server_manager.config.settings import Settings
-from bedrock_server_manager.error import UserInputError, AppFileNotFoundError
+from bedrock_server_manager.error import (
+    UserInputError,
+    AppFileNotFoundError,
+    BackupRestoreError,
+)
 
 
 def test_backup_all_data(real_bedrock_server):
@@ -97,3 +102,161 @@ def test_restore_all_data_from_latest_no_backups(real_bedrock_server):
     server = real_bedrock_server
     results = server.restore_all_data_from_latest()
     assert results == {}
+
+
+def test_parse_save_query_output():
+    output = (
+        "[2024-01-01 12:00:00:000 INFO] Saving...\n"
+        "[2024-01-01 12:00:01:000 INFO] Data saved. Files are now ready to be copied.\n"
+        "world/db/000005.ldb:1234, world/db/CURRENT:16, world/level.dat:2345\n"
+    )
+    assert ServerBackupMixin._parse_save_query_output(output) == [
+        ("world/db/000005.ldb", 1234),
+        ("world/db/CURRENT", 16),
+        ("world/level.dat", 2345),
+    ]
+
+
+def test_parse_save_query_output_not_ready():
+    assert (
+        ServerBackupMixin._parse_save_query_output(
+            "A previous save has not been completed.\n"
+        )
+        is None
+    )
+    assert (
+        ServerBackupMixin._parse_save_query_output(
+            "Data saved. Files are now ready to be copied.\n"
+        )
+        is None
+    )
+
+
+def test_hot_backup_world_data_internal(real_bedrock_server):
+    server = real_bedrock_server
+    world_dir = os.path.join(server.server_dir, "worlds", "world")
+    os.makedirs(os.path.join(world_dir, "db"), exist_ok=True)
+    with open(os.path.join(world_dir, "db", "000001.log"), "wb") as f:
+        f.write(b"abcdef")
+    with open(os.path.join(world_dir, "level.dat"), "wb") as f:
+        f.write(b"level")
+
+    sent_commands = []
+    lock_held = []
+
+    def lock_is_held():
+        # Another thread cannot take the console lock while the backup runs.
+        result = []
+
+        def try_acquire():
+            acquired = server._command_lock.acquire(blocking=False)
+            if acquired:
+                server._command_lock.release()
+            result.append(not acquired)
+
+        thread = threading.Thread(target=try_acquire)
+        thread.start()
+        thread.join()
+        return result[0]
+
+    def fake_send_command(command):
+        sent_commands.append(command)
+        lock_held.append(lock_is_held())
+        if command == "save query":
+            with open(server.server_log_path, "a") as log:
+                log.write(
+                    "Data saved. Files are now ready to be copied.\n"
+                    "world/db/000001.log:3, world/level.dat:5\n"
+                )
+
+    with (
+        patch.object(server, "can_hot_backup", return_value=True),
+        patch.object(server, "send_command", side_effect=fake_send_command),
+    ):
+        backup_path = server._backup_world_data_internal(hot=True)
+
+    assert sent_commands == ["save hold", "save query", "save resume"]
+    assert lock_held == [True, True, True]
+    with zipfile.ZipFile(backup_path) as zf:
+        assert zf.read("db/000001.log") == b"abc"
+        assert zf.read("level.dat") == b"level"
+
+
+def test_hot_backup_resumes_on_timeout(real_bedrock_server):
+    server = real_bedrock_server
+    os.makedirs(os.path.join(server.server_dir, "worlds", "world"), exist_ok=True)
+    server.settings.set("backup.hot_backup_timeout_sec", 0.3)
+
+    with (
+        patch.object(server, "can_hot_backup", return_value=True),
+        patch.object(server, "send_command") as mock_send,
+    ):
+        with pytest.raises(BackupRestoreError):
+            server._backup_world_data_internal(hot=True)
+
+    assert mock_send.call_args_list[-1].args == ("save resume",)
+
+
+def test_incremental_backup_and_restore(real_bedrock_server):
+    server = real_bedrock_server
+    server.settings.set("backup.incremental_enabled", True)
+    world_dir = os.path.join(server.server_dir, "worlds", "world")
+    os.makedirs(os.path.join(world_dir, "db"), exist_ok=True)
+    with open(os.path.join(world_dir, "db", "000005.ldb"), "wb") as f:
+        f.write(b"table")
+    with open(os.path.join(world_dir, "level.dat"), "wb") as f:
+        f.write(b"level")
+
+    manifest_path = server._backup_world_data_internal()
+    assert manifest_path.endswith(".manifest")
+    assert server.list_backups("world") == [manifest_path]
+
+    with open(os.path.join(world_dir, "level.dat"), "wb") as f:
+        f.write(b"modified")
+
+    results = server.restore_all_data_from_latest()
+    assert results["world"] == world_dir
+    with open(os.path.join(world_dir, "level.dat"), "rb") as f:
+        assert f.read() == b"level"
+
+
+def test_incremental_backup_prune_collects_garbage(real_bedrock_server):
+    server = real_bedrock_server
+    server.settings.set("backup.incremental_enabled", True)
+    server.settings.set("retention.backups", 1)
+    world_dir = os.path.join(server.server_dir, "worlds", "world")
+    os.makedirs(world_dir, exist_ok=True)
+
+    with open(os.path.join(world_dir, "level.dat"), "wb") as f:
+        f.write(b"first")
+    first = server._backup_world_data_internal()
+    os.utime(first, (time.time() - 10, time.time() - 10))
+    with open(os.path.join(world_dir, "level.dat"), "wb") as f:
+        f.write(b"second")
+
+    with patch(
+        "bedrock_server_manager.core.backup_store.WorldBackupStore.garbage_collect"
+    ) as mock_gc:
+        with patch(
+            "bedrock_server_manager.core.server.backup_restore_mixin.get_timestamp",
+            return_value="20990101_000000",
+        ):
+            second = server._backup_world_data_internal()
+        mock_gc.assert_called_once()
+
+    assert server.list_backups("world") == [second]
+
+
+def test_export_world_backup_to_mcworld(real_bedrock_server, tmp_path):
+    server = real_bedrock_server
+    server.settings.set("backup.incremental_enabled", True)
+    world_dir = os.path.join(server.server_dir, "worlds", "world")
+    os.makedirs(world_dir, exist_ok=True)
+    with open(os.path.join(world_dir, "level.dat"), "wb") as f:
+        f.write(b"level")
+    manifest_path = server._backup_world_data_internal()
+
+    target = str(tmp_path / "export.mcworld")
+    assert server.export_world_backup_to_mcworld(manifest_path, target) == target
+    with zipfile.ZipFile(target) as zf:
+        assert zf.read("level.dat") == b"level"
@@ -426,3 +426,52 @@ def test_get_server_property_missing_file(real_bedrock_server):
     os.remove(properties_path)
     value = server.get_server_property("key1", default="default_value")
     assert value == "default_value"
+
+
+def test_get_server_properties_parses_only_after_change(real_bedrock_server):
+    server = real_bedrock_server
+    properties_path = server.server_properties_path
+    with open(properties_path, "w") as f:
+        f.write("key1=value1\n")
+    assert server.get_server_properties() == {"key1": "value1"}
+
+    # An unchanged file is served from the cache without being read.
+    with patch("builtins.open", side_effect=AssertionError("file was re-read")):
+        assert server.get_server_property("key1") == "value1"
+
+    with open(properties_path, "w") as f:
+        f.write("key1=changed\n")
+    assert server.get_server_property("key1") == "changed"
+
+
+def test_set_server_properties_writes_all_keys_at_once(real_bedrock_server):
+    server = real_bedrock_server
+    properties_path = server.server_properties_path
+    with open(properties_path, "w") as f:
+        f.write("# comment\nkey1=value1\nkey2=value2\nkey1=duplicate\n")
+
+    server.set_server_properties({"key1": "new1", "key3": 3})
+
+    with open(properties_path, "r") as f:
+        assert f.read() == (
+            "# comment\nkey1=new1\nkey2=value2\n"
+            "# DUPLICATE IGNORED: key1=duplicate\nkey3=3\n"
+        )
+    assert server.get_server_properties() == {
+        "key1": "new1",
+        "key2": "value2",
+        "key3": "3",
+    }
+    assert not [name for name in os.listdir(server.server_dir) if name.endswith(".tmp")]
+
+
+def test_allowlist_cache_is_refreshed_by_writes(real_bedrock_server):
+    server = real_bedrock_server
+    server.add_to_allowlist([{"name": "player1", "xuid": "12345"}])
+    allowlist = server.get_allowlist()
+    # Callers get their own copy, so changing it does not change the cache.
+    allowlist.append({"name": "not_saved"})
+
+    server.remove_from_allowlist("player1")
+
+    assert server.get_allowlist() == []
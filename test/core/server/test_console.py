@@ -0,0 +1,104 @@
+# Test cases for bedrock_server_manager.core.server.console
+import re
+import time
+
+import pytest
+
+from bedrock_server_manager.core.server.console import ServerConsole
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = tmp_path / "server_output.txt"
+    path.write_bytes(b"before start\n")
+    return path
+
+
+def make_console(log_path, **kwargs):
+    console = ServerConsole(
+        str(log_path),
+        offset=log_path.stat().st_size,
+        poll_interval=0.01,
+        **kwargs,
+    )
+    console.start()
+    return console
+
+
+def append(log_path, data):
+    with open(log_path, "ab") as f:
+        f.write(data)
+
+
+def test_console_follows_new_output(log_path):
+    console = make_console(log_path, capacity=2)
+    append(log_path, b"first\nsecond\r\nthi")
+    append(log_path, b"rd\npartial")
+    console.close()
+    console._thread.join(timeout=5)
+
+    assert console.closed
+    # Output from before the start and the unfinished last line are skipped,
+    # and only the newest lines are kept in memory.
+    assert console.position == 3
+    assert console.lines_since(0) == ["second", "third"]
+
+
+def test_console_restarts_after_truncation(log_path):
+    console = make_console(log_path)
+    log_path.write_bytes(b"new\n")
+    lines, completed = console.wait_for(0, re.compile("new"), timeout=5)
+    console.close()
+
+    assert completed
+    assert lines == ["new"]
+
+
+def test_wait_for_returns_lines_up_to_pattern(log_path):
+    console = make_console(log_path)
+    append(log_path, b"old line\n")
+    console.wait_for(0, re.compile("old line"), timeout=5)
+    position = console.position
+
+    append(log_path, b"There are 1/10 players online:\nSteve\nunrelated\n")
+    lines, completed = console.wait_for(position, re.compile(r"players online"), 5)
+    console.close()
+
+    assert completed
+    assert lines == ["There are 1/10 players online:"]
+
+
+def test_wait_for_without_pattern_waits_for_quiet_output(log_path):
+    console = make_console(log_path)
+    position = console.position
+    append(log_path, b"a\nb\n")
+
+    lines, completed = console.wait_for(position, timeout=5, quiet_period=0.2)
+    console.close()
+
+    assert completed
+    assert lines == ["a", "b"]
+
+
+def test_wait_for_times_out(log_path):
+    console = make_console(log_path)
+    append(log_path, b"something else\n")
+
+    started = time.monotonic()
+    lines, completed = console.wait_for(0, re.compile("never"), timeout=0.2)
+    console.close()
+
+    assert not completed
+    assert lines == ["something else"]
+    assert time.monotonic() - started < 2
+
+
+def test_wait_for_stops_when_console_closes(log_path):
+    console = make_console(log_path)
+    console.close()
+
+    lines, completed = console.wait_for(0, re.compile("never"), timeout=5)
+
+    assert not completed
+    assert lines == []
+    assert console.closed
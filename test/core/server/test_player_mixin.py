@@ -58,3 +58,124 @@ def test_scan_log_for_players_malformed_entries(real_bedrock_server):
         f.write("Player connected: , xuid: 123\n")  # malformed
     players = server.scan_log_for_players()
     assert players == []
+
+
+def _append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+def test_scan_log_for_players_does_not_move_cursor(real_bedrock_server):
+    server = real_bedrock_server
+    log_path = server.server_log_path
+    _append(log_path, "Player connected: Player1, xuid: 123\n")
+    assert server.scan_log_for_players() == [{"name": "Player1", "xuid": "123"}]
+    assert server.scan_log_for_players() == [{"name": "Player1", "xuid": "123"}]
+
+    # The session tracking still sees the event.
+    assert [e["xuid"] for e in server.scan_log_for_player_events()] == ["123"]
+
+
+def test_scan_log_for_players_incremental_peeks_after_cursor(real_bedrock_server):
+    server = real_bedrock_server
+    log_path = server.server_log_path
+    _append(log_path, "Player connected: Player1, xuid: 123\n")
+    server.scan_log_for_player_events()
+    _append(log_path, "Player connected: Player2, xuid: 456\n")
+
+    expected = [{"name": "Player2", "xuid": "456"}]
+    assert server.scan_log_for_players(incremental=True) == expected
+    assert server.scan_log_for_players(incremental=True) == expected
+    assert [e["xuid"] for e in server.scan_log_for_player_events()] == ["456"]
+
+
+def test_scan_log_for_player_events(real_bedrock_server):
+    server = real_bedrock_server
+    _append(
+        server.server_log_path,
+        "[2024-01-01 12:00:00:123 INFO] Player connected: Player One, xuid: 123, pfid: abc\n"
+        "[2024-01-01 12:30:00:456 INFO] Player disconnected: Player One, xuid: 123, pfid: abc\n",
+    )
+
+    events = server.scan_log_for_player_events()
+
+    assert events == [
+        {
+            "event": "connected",
+            "name": "Player One",
+            "xuid": "123",
+            "timestamp": "2024-01-01 12:00:00",
+        },
+        {
+            "event": "disconnected",
+            "name": "Player One",
+            "xuid": "123",
+            "timestamp": "2024-01-01 12:30:00",
+        },
+    ]
+
+
+def test_scan_log_for_player_events_server_started(real_bedrock_server):
+    server = real_bedrock_server
+    _append(
+        server.server_log_path,
+        "[2024-01-01 12:00:00:123 INFO] Server started.\n"
+        "[2024-01-01 12:00:05:000 INFO] Player connected: Player1, xuid: 123\n",
+    )
+
+    events = server.scan_log_for_player_events()
+
+    assert [e["event"] for e in events] == ["server_started", "connected"]
+    assert events[0]["xuid"] is None
+    assert events[0]["timestamp"] == "2024-01-01 12:00:00"
+    # Restarts are not reported as players.
+    _append(server.server_log_path, "Server started.\n")
+    assert server.scan_log_for_players(incremental=True) == []
+
+
+def test_scan_log_for_player_events_defers_partial_line(real_bedrock_server):
+    server = real_bedrock_server
+    _append(server.server_log_path, "Player connected: Play")
+    assert server.scan_log_for_player_events() == []
+
+    _append(server.server_log_path, "er1, xuid: 123\n")
+    events = server.scan_log_for_player_events()
+    assert [(e["name"], e["xuid"]) for e in events] == [("Player1", "123")]
+
+
+def test_scan_log_for_player_events_cursor_survives_new_instance(
+    real_bedrock_server, app_context
+):
+    server = real_bedrock_server
+    _append(server.server_log_path, "Player connected: Player1, xuid: 123\n")
+    server.scan_log_for_player_events()
+
+    del app_context._servers[server.server_name]
+    new_instance = app_context.get_server(server.server_name)
+    assert new_instance is not server
+    assert new_instance.scan_log_for_player_events() == []
+
+
+def test_scan_log_for_player_events_detects_truncation(real_bedrock_server):
+    server = real_bedrock_server
+    _append(server.server_log_path, "Player connected: Player1, xuid: 123\n" * 3)
+    server.scan_log_for_player_events()
+
+    with open(server.server_log_path, "w") as f:
+        f.write("Player connected: Player2, xuid: 456\n")
+
+    events = server.scan_log_for_player_events()
+    assert [e["xuid"] for e in events] == ["456"]
+
+
+def test_scan_log_for_player_events_detects_rewrite(real_bedrock_server):
+    server = real_bedrock_server
+    _append(server.server_log_path, "Player connected: Player1, xuid: 123\n")
+    server.scan_log_for_player_events()
+
+    # Same size and inode, different content.
+    with open(server.server_log_path, "r+") as f:
+        f.write("Player connected: Player9, xuid: 999\n")
+
+    events = server.scan_log_for_player_events()
+    assert [e["xuid"] for e in events] == ["999"]
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import ANY, patch, MagicMock, mock_open
 
 from bedrock_server_manager.core.server.process_mixin import ServerProcessMixin
 from bedrock_server_manager.core.server.base_server_mixin import BedrockServerBaseMixin
@@ -9,6 +9,7 @@ from bedrock_server_manager.error import (
     MissingArgumentError,
     SendCommandError,
     ServerStopError,
+    CommandTimeoutError,
 )
 
 
@@ -71,6 +72,10 @@ def test_start(mock_file_open, mock_write_pid, mock_popen, app_context):
     with (
         patch.object(server, "is_running", return_value=False),
         patch.object(server, "set_status_in_config") as mock_set_status,
+        patch.object(server, "_watch_process") as mock_watch,
+        patch(
+            "bedrock_server_manager.core.server.process_mixin.ServerConsole"
+        ) as mock_console,
     ):
 
         server.start()
@@ -80,6 +85,11 @@ def test_start(mock_file_open, mock_write_pid, mock_popen, app_context):
             server.get_pid_file_path(), mock_process.pid
         )
         assert server._process is mock_process
+        mock_watch.assert_called_once_with(mock_process)
+        mock_console.assert_called_once_with(
+            server.server_log_path, offset=ANY, name=server.server_name
+        )
+        mock_console.return_value.start.assert_called_once()
         mock_set_status.assert_any_call("STARTING")
         mock_set_status.assert_any_call("RUNNING")
 
@@ -109,6 +119,82 @@ def test_stop(mock_remove_pid, app_context):
         assert server._process is None
 
 
+def test_send_command_and_wait_returns_reply(app_context):
+    server = app_context.get_server("test_server")
+    mock_process = MagicMock()
+    mock_process.poll.return_value = None
+    server._process = mock_process
+    server._console = MagicMock(position=7)
+    server._console.wait_for.return_value = (
+        ["There are 0/10 players online:"],
+        True,
+    )
+
+    with patch.object(server, "is_running", return_value=True):
+        lines = server.send_command_and_wait(
+            "list", pattern="players online", timeout=2
+        )
+
+    assert lines == ["There are 0/10 players online:"]
+    mock_process.stdin.write.assert_called_once_with(b"list\n")
+    position, pattern, timeout = server._console.wait_for.call_args.args
+    assert position == 7
+    assert pattern.pattern == "players online"
+    assert timeout == 2
+
+
+def test_send_command_and_wait_times_out(app_context):
+    server = app_context.get_server("test_server")
+    mock_process = MagicMock()
+    mock_process.poll.return_value = None
+    server._process = mock_process
+    server._console = MagicMock(position=0)
+    server._console.wait_for.return_value = ([], False)
+
+    with patch.object(server, "is_running", return_value=True):
+        with pytest.raises(CommandTimeoutError):
+            server.send_command_and_wait("list", pattern="never", timeout=0.1)
+
+
+def test_send_command_and_wait_requires_console(app_context):
+    server = app_context.get_server("test_server")
+    with patch.object(server, "is_running", return_value=True):
+        with pytest.raises(SendCommandError):
+            server.send_command_and_wait("list")
+
+
+def test_watch_process_reports_unexpected_exit(app_context):
+    server = app_context.get_server("test_server")
+    mock_process = MagicMock()
+    mock_process.wait.return_value = -11
+    server._process = mock_process
+    server._console = MagicMock()
+    server.intentionally_stopped = False
+    server.on_process_exit = MagicMock()
+
+    server._watch_process(mock_process)
+
+    server._console.close.assert_called_once()
+    server.on_process_exit.assert_called_once_with(server, -11)
+    assert server.last_exit_code == -11
+    assert server.last_exit_signal == "SIGSEGV"
+    assert server.describe_last_exit() == "killed by SIGSEGV"
+
+
+def test_watch_process_ignores_intentional_stop(app_context):
+    server = app_context.get_server("test_server")
+    mock_process = MagicMock()
+    mock_process.wait.return_value = 0
+    server._process = mock_process
+    server.intentionally_stopped = True
+    server.on_process_exit = MagicMock()
+
+    server._watch_process(mock_process)
+
+    server.on_process_exit.assert_not_called()
+    assert server.describe_last_exit() == "exit code 0"
+
+
 @patch("bedrock_server_manager.core.system.process.get_verified_bedrock_process")
 def test_get_process_info(mock_get_verified_process, app_context):
     server = app_context.get_server("test_server")
@@ -123,3 +209,24 @@ def test_get_process_info(mock_get_verified_process, app_context):
             server.server_name, server.server_dir, server.app_config_dir
         )
         mock_monitor.get_stats.assert_called_once_with(mock_process)
+
+
+@patch("bedrock_server_manager.core.system.process.get_verified_bedrock_process")
+def test_get_process_info_reuses_verified_process(
+    mock_get_verified_process, app_context
+):
+    server = app_context.get_server("test_server")
+    mock_process = MagicMock()
+    mock_process.is_running.return_value = True
+    mock_get_verified_process.return_value = mock_process
+    with patch.object(server, "_resource_monitor") as mock_monitor:
+        mock_monitor.get_stats.return_value = {"cpu": 50}
+
+        server.get_process_info()
+        server.get_process_info()
+        mock_get_verified_process.assert_called_once()
+
+        # Once the process has exited, it is looked up again.
+        mock_process.is_running.return_value = False
+        server.get_process_info()
+        assert mock_get_verified_process.call_count == 2
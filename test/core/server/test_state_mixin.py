@@ -90,3 +90,84 @@ def test_get_world_name_no_level_name(real_bedrock_server):
         f.write("other-setting=value\n")
     with pytest.raises(ConfigParseError):
         server.get_world_name()
+
+
+def test_config_cache_serves_repeated_reads(real_bedrock_server):
+    server = real_bedrock_server
+    server.set_version("1.2.3")
+    server.config_cache_hits = server.config_cache_misses = 0
+
+    with patch.object(
+        server, "_read_server_config_from_db", wraps=server._read_server_config_from_db
+    ) as mock_read:
+        for _ in range(5):
+            assert server.get_version() == "1.2.3"
+        mock_read.assert_not_called()
+
+    stats = server.get_config_cache_stats()
+    assert stats["hits"] == 5
+    assert stats["misses"] == 0
+    assert stats["hit_rate"] == 1.0
+
+
+def test_config_cache_detects_external_change(real_bedrock_server, db_session):
+    server = real_bedrock_server
+    from bedrock_server_manager.db.models import Server
+
+    server.set_version("1.2.3")
+    assert server.get_version() == "1.2.3"
+
+    # Simulate another process updating the row.
+    db_server = db_session.query(Server).filter_by(server_name=server.server_name).one()
+    config = dict(db_server.config)
+    config["server_info"] = {**config["server_info"], "installed_version": "9.9.9"}
+    db_server.config = config
+    db_session.commit()
+
+    assert server.get_version() == "9.9.9"
+
+
+def test_config_cache_skips_unchanged_write(real_bedrock_server):
+    server = real_bedrock_server
+    server.set_version("1.2.3")
+    with patch.object(server, "_save_server_config") as mock_save:
+        server.set_version("1.2.3")
+        mock_save.assert_not_called()
+
+
+def test_config_cache_returns_copies(real_bedrock_server):
+    server = real_bedrock_server
+    custom = server._manage_json_config("custom", "read")
+    custom["injected"] = True
+    assert "injected" not in server._manage_json_config("custom", "read")
+
+    config = server._load_server_config()
+    config["server_info"]["status"] = "MUTATED"
+    assert server.get_status_from_config() != "MUTATED"
+
+
+def test_status_changes_are_published_to_registry(real_bedrock_server, app_context):
+    registry = app_context.status_registry
+    assert real_bedrock_server.status_registry is registry
+
+    real_bedrock_server.set_status_in_config("RUNNING")
+    real_bedrock_server.set_version("1.20.0")
+    real_bedrock_server.player_count = 4
+
+    _, servers = registry.snapshot()
+    assert servers == [
+        {
+            "name": "test_server",
+            "status": "RUNNING",
+            "version": "1.20.0",
+            "player_count": 4,
+        }
+    ]
+
+
+def test_status_not_published_for_uninstalled_server(real_bedrock_server, mocker):
+    mocker.patch.object(real_bedrock_server, "is_installed", return_value=False)
+
+    real_bedrock_server.set_status_in_config("INSTALLING")
+
+    assert not real_bedrock_server.status_registry.contains("test_server")
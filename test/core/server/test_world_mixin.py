@@ -64,6 +64,25 @@ def test_extract_mcworld_to_directory_invalid_zip(real_bedrock_server, tmp_path)
         server.extract_mcworld_to_directory(str(invalid_zip_path), "world")
 
 
+def test_extract_mcworld_to_directory_keeps_world_on_failure(
+    real_bedrock_server, tmp_path
+):
+    server = real_bedrock_server
+    world_dir = os.path.join(server.server_dir, "worlds", "world")
+    os.makedirs(world_dir, exist_ok=True)
+    with open(os.path.join(world_dir, "level.dat"), "w") as f:
+        f.write("original")
+    invalid_zip_path = tmp_path / "invalid.mcworld"
+    invalid_zip_path.write_text("not a zip")
+
+    with pytest.raises(ExtractError):
+        server.extract_mcworld_to_directory(str(invalid_zip_path), "world")
+
+    with open(os.path.join(world_dir, "level.dat")) as f:
+        assert f.read() == "original"
+    assert os.listdir(os.path.join(server.server_dir, "worlds")) == ["world"]
+
+
 def test_export_world_directory_to_mcworld_no_source(real_bedrock_server, tmp_path):
     server = real_bedrock_server
     with pytest.raises(AppFileNotFoundError):
@@ -0,0 +1,195 @@
+# Test cases for bedrock_server_manager.core.backup_store
+import os
+import json
+import subprocess
+import sys
+import threading
+import zipfile
+
+import pytest
+
+from bedrock_server_manager.core.backup_store import (
+    WorldBackupStore,
+    is_manifest_file,
+)
+from bedrock_server_manager.error import BackupRestoreError
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+@pytest.fixture
+def world(tmp_path):
+    world_dir = tmp_path / "worlds" / "world"
+    _write(str(world_dir / "db" / "000005.ldb"), b"a" * 10)
+    _write(str(world_dir / "db" / "000006.log"), b"log data")
+    _write(str(world_dir / "level.dat"), b"level")
+    return str(world_dir)
+
+
+@pytest.fixture
+def store(tmp_path):
+    backup_dir = tmp_path / "backups"
+    (backup_dir / "server1").mkdir(parents=True)
+    return WorldBackupStore(str(backup_dir), chunk_size=4)
+
+
+def _blob_count(store):
+    return sum(len(files) for _, _, files in os.walk(store.objects_dir))
+
+
+def test_is_manifest_file():
+    assert is_manifest_file("/b/world_backup_20240101_000000.manifest")
+    assert not is_manifest_file("/b/world_backup_20240101_000000.mcworld")
+
+
+def test_create_snapshot_deduplicates_chunks(store, world):
+    manifest_path = os.path.join(store.backup_base_dir, "server1", "w1.manifest")
+    stats = store.create_snapshot(world, manifest_path)
+
+    assert stats["files"] == 3
+    assert stats["total_bytes"] == 23
+    # "aaaa" and "aaaa" from the .ldb file are stored once.
+    assert stats["new_blobs"] == _blob_count(store)
+    assert stats["new_bytes"] < stats["total_bytes"]
+
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    assert sorted(e["path"] for e in manifest["files"]) == [
+        "db/000005.ldb",
+        "db/000006.log",
+        "level.dat",
+    ]
+
+
+def test_create_snapshot_reuses_unchanged_files(store, world):
+    first = os.path.join(store.backup_base_dir, "server1", "w1.manifest")
+    second = os.path.join(store.backup_base_dir, "server1", "w2.manifest")
+    store.create_snapshot(world, first)
+
+    with open(os.path.join(world, "db", "000006.log"), "ab") as f:
+        f.write(b" more")
+    stats = store.create_snapshot(world, second, previous_manifest_path=first)
+
+    assert stats["files_reused"] == 2
+    assert stats["new_bytes"] > 0
+
+
+def test_create_snapshot_respects_lengths(store, world, tmp_path):
+    manifest_path = os.path.join(store.backup_base_dir, "server1", "w1.manifest")
+    store.create_snapshot(
+        world, manifest_path, files=[("db/000006.log", 3), ("level.dat", None)]
+    )
+
+    target = str(tmp_path / "restored")
+    store.restore_snapshot(manifest_path, target)
+    assert sorted(os.listdir(target)) == ["db", "level.dat"]
+    with open(os.path.join(target, "db", "000006.log"), "rb") as f:
+        assert f.read() == b"log"
+
+
+def test_create_snapshot_rejects_paths_outside_world(store, world):
+    manifest_path = os.path.join(store.backup_base_dir, "server1", "w1.manifest")
+    with pytest.raises(BackupRestoreError):
+        store.create_snapshot(world, manifest_path, files=[("../other/file", None)])
+    assert not os.path.exists(manifest_path)
+
+
+def test_restore_snapshot_replaces_world(store, world):
+    manifest_path = os.path.join(store.backup_base_dir, "server1", "w1.manifest")
+    store.create_snapshot(world, manifest_path)
+    _write(os.path.join(world, "stray.txt"), b"not in backup")
+
+    store.restore_snapshot(manifest_path, world)
+
+    assert not os.path.exists(os.path.join(world, "stray.txt"))
+    with open(os.path.join(world, "db", "000005.ldb"), "rb") as f:
+        assert f.read() == b"a" * 10
+
+
+def test_restore_snapshot_detects_corruption(store, world):
+    manifest_path = os.path.join(store.backup_base_dir, "server1", "w1.manifest")
+    store.create_snapshot(world, manifest_path)
+    for root, _, files in os.walk(store.objects_dir):
+        for name in files:
+            with open(os.path.join(root, name), "wb") as f:
+                f.write(b"garbage")
+
+    with pytest.raises(BackupRestoreError):
+        store.restore_snapshot(manifest_path, world)
+    # The existing world is left untouched.
+    with open(os.path.join(world, "level.dat"), "rb") as f:
+        assert f.read() == b"level"
+
+
+def test_export_snapshot_to_mcworld(store, world, tmp_path):
+    manifest_path = os.path.join(store.backup_base_dir, "server1", "w1.manifest")
+    store.create_snapshot(world, manifest_path)
+    target = str(tmp_path / "export.mcworld")
+
+    store.export_snapshot_to_mcworld(manifest_path, target)
+
+    with zipfile.ZipFile(target) as zf:
+        assert zf.read("db/000006.log") == b"log data"
+        assert zf.read("level.dat") == b"level"
+
+
+def test_garbage_collect_removes_unreferenced_blobs(store, world):
+    first = os.path.join(store.backup_base_dir, "server1", "w1.manifest")
+    second = os.path.join(store.backup_base_dir, "server1", "w2.manifest")
+    store.create_snapshot(world, first)
+    _write(os.path.join(world, "level.dat"), b"changed")
+    store.create_snapshot(world, second, previous_manifest_path=first)
+    blobs_before = _blob_count(store)
+
+    assert store.garbage_collect() == (0, 0)
+
+    os.remove(first)
+    removed_count, removed_bytes = store.garbage_collect()
+    assert removed_count > 0
+    assert removed_bytes > 0
+    assert _blob_count(store) == blobs_before - removed_count
+    # The remaining snapshot is still complete.
+    store.restore_snapshot(second, world)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Uses fcntl in the helper process.")
+def test_garbage_collect_waits_for_other_process(store, world):
+    store.create_snapshot(
+        world, os.path.join(store.backup_base_dir, "server1", "w1.manifest")
+    )
+    lock_path = os.path.join(store.backup_base_dir, ".store", "lock")
+    # Another process (e.g. the CLI) holds the store lock mid-snapshot.
+    holder = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import fcntl, sys\n"
+            f"f = open({lock_path!r}, 'a+b')\n"
+            "fcntl.flock(f.fileno(), fcntl.LOCK_EX)\n"
+            "print('locked', flush=True)\n"
+            "sys.stdin.read()\n",
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    try:
+        assert holder.stdout.readline().strip() == b"locked"
+        collector = threading.Thread(target=store.garbage_collect)
+        collector.start()
+        collector.join(timeout=0.5)
+        assert collector.is_alive()
+    finally:
+        holder.communicate()
+    collector.join(timeout=5)
+    assert not collector.is_alive()
+
+
+def test_load_manifest_invalid(store, tmp_path):
+    bad = tmp_path / "bad.manifest"
+    bad.write_text("{}")
+    with pytest.raises(BackupRestoreError):
+        store.load_manifest(str(bad))
@@ -1,5 +1,6 @@
 import time
 import pytest
+from concurrent.futures import Future
 from unittest.mock import MagicMock, patch
 
 from bedrock_server_manager.core.bedrock_process_manager import BedrockProcessManager
@@ -116,3 +117,73 @@ def test_monitor_respects_max_retries(manager):
         mock_start.assert_not_called()  # Should not be called because 4 > 3
         mock_write_error.assert_called_once_with("test_server")
         assert "test_server" not in manager.servers
+
+
+def test_ping_server_records_latency(manager):
+    server = manager.app_context.get_server("test_server")
+    with patch("bedrock_server_manager.core.bedrock_process_manager.mc") as mock_mc:
+        status = mock_mc.lookup.return_value.status.return_value
+        status.players.online = 2
+        status.latency = 12.5
+        manager._ping_server(server, 1.5)
+
+    assert mock_mc.lookup.call_args.kwargs["timeout"] == 1.5
+    assert server.player_count == 2
+    assert server.ping_latency_ms == 12.5
+    stats = manager.get_ping_stats()["test_server"]
+    assert stats["pings"] == 1
+    assert stats["failures"] == 0
+    assert stats["latency_ms"] == 12.5
+
+
+def test_ping_server_records_failure(manager):
+    server = manager.app_context.get_server("test_server")
+    with patch("bedrock_server_manager.core.bedrock_process_manager.mc") as mock_mc:
+        mock_mc.lookup.return_value.status.side_effect = TimeoutError("timed out")
+        manager._ping_server(server, 1.5)
+
+    assert server.player_count == 0
+    assert server.ping_latency_ms is None
+    stats = manager.get_ping_stats()["test_server"]
+    assert stats["failures"] == 1
+    assert stats["latency_ms"] is None
+
+
+def test_ping_servers_skips_servers_with_pending_ping(manager):
+    manager._ping_executor = MagicMock()
+    slow_server = MagicMock(server_name="slow")
+    other_server = MagicMock(server_name="other")
+    # The previous ping of the slow server has not answered yet.
+    manager._pings_in_flight["slow"] = Future()
+
+    manager._ping_servers([slow_server, other_server], 3.0)
+
+    manager._ping_executor.submit.assert_called_once_with(
+        manager._ping_server, other_server, 3.0
+    )
+
+
+def test_server_exit_restarts_immediately(manager):
+    server = manager.app_context.get_server("test_server")
+    server.intentionally_stopped = False
+    manager.add_server(server)
+    assert server.on_process_exit == manager._on_server_exit
+
+    with (
+        patch.object(server, "is_running", return_value=False),
+        patch.object(server, "start") as mock_start,
+    ):
+        server.on_process_exit(server, 1)
+
+    mock_start.assert_called_once()
+    assert server.failure_count == 1
+
+    manager.remove_server("test_server")
+    assert server.on_process_exit is None
+
+
+def test_restart_delay_backs_off_exponentially(manager):
+    assert manager._restart_delay(1) == 0
+    assert manager._restart_delay(2) == 2
+    assert manager._restart_delay(3) == 4
+    assert manager._restart_delay(20) == 60
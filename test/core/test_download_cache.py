@@ -0,0 +1,124 @@
+import pytest
+import requests
+
+from bedrock_server_manager.core.download_cache import DownloadCache
+from bedrock_server_manager.error import InternetConnectivityError
+
+URL = "http://example.com/bedrock-server-1.20.0.zip"
+
+
+def _mock_response(mocker, status_code, chunks, content_length=None):
+    response = mocker.Mock(spec=requests.Response)
+    response.status_code = status_code
+    response.raise_for_status = mocker.Mock()
+    size = sum(len(c) for c in chunks) if content_length is None else content_length
+    response.headers = {"content-length": str(size)}
+    response.iter_content.return_value = chunks
+    response.__enter__ = mocker.Mock(return_value=response)
+    response.__exit__ = mocker.Mock(return_value=None)
+    return response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DownloadCache(str(tmp_path))
+
+
+def test_download_records_digest(cache, tmp_path, mocker):
+    target = tmp_path / "stable" / "bedrock-server-1.20.0.zip"
+    target.parent.mkdir()
+    mocker.patch(
+        "requests.get", return_value=_mock_response(mocker, 200, [b"abc", b"def"])
+    )
+
+    result = cache.download(URL, str(target))
+
+    assert target.read_bytes() == b"abcdef"
+    assert result["resumed_from"] == 0
+    assert cache.get_entry(str(target))["sha256"] == result["sha256"]
+    assert cache.is_cached(str(target))
+    assert cache.verify(str(target))
+
+
+def test_download_resumes_partial_file(cache, tmp_path, mocker):
+    target = tmp_path / "bedrock-server-1.20.0.zip"
+    (tmp_path / "bedrock-server-1.20.0.zip.part").write_bytes(b"abc")
+    mock_get = mocker.patch(
+        "requests.get", return_value=_mock_response(mocker, 206, [b"def"])
+    )
+
+    result = cache.download(URL, str(target))
+
+    assert mock_get.call_args.kwargs["headers"]["Range"] == "bytes=3-"
+    assert target.read_bytes() == b"abcdef"
+    assert result["resumed_from"] == 3
+    assert result["bytes_downloaded"] == 3
+
+
+def test_download_finalizes_complete_partial_file_on_416(cache, tmp_path, mocker):
+    target = tmp_path / "bedrock-server-1.20.0.zip"
+    (tmp_path / "bedrock-server-1.20.0.zip.part").write_bytes(b"abcdef")
+    response = _mock_response(mocker, 416, [])
+    response.headers = {"content-range": "bytes */6"}
+    mocker.patch("requests.get", return_value=response)
+
+    result = cache.download(URL, str(target))
+
+    assert target.read_bytes() == b"abcdef"
+    assert not (tmp_path / "bedrock-server-1.20.0.zip.part").exists()
+    assert result["bytes_downloaded"] == 0
+    assert cache.verify(str(target))
+
+
+def test_download_restarts_on_416_for_mismatched_partial_file(cache, tmp_path, mocker):
+    target = tmp_path / "bedrock-server-1.20.0.zip"
+    (tmp_path / "bedrock-server-1.20.0.zip.part").write_bytes(b"abcdefgh")
+    rejected = _mock_response(mocker, 416, [])
+    rejected.headers = {}
+    head = mocker.Mock(status_code=200, headers={"content-length": "6"})
+    mock_head = mocker.patch("requests.head", return_value=head)
+    mock_get = mocker.patch(
+        "requests.get",
+        side_effect=[rejected, _mock_response(mocker, 200, [b"abcdef"])],
+    )
+
+    result = cache.download(URL, str(target))
+
+    mock_head.assert_called_once()
+    assert "Range" not in mock_get.call_args.kwargs["headers"]
+    assert target.read_bytes() == b"abcdef"
+    assert result["resumed_from"] == 0
+
+
+def test_download_keeps_truncated_file_for_resume(cache, tmp_path, mocker):
+    target = tmp_path / "bedrock-server-1.20.0.zip"
+    mocker.patch(
+        "requests.get",
+        return_value=_mock_response(mocker, 200, [b"abc"], content_length=6),
+    )
+
+    with pytest.raises(InternetConnectivityError):
+        cache.download(URL, str(target))
+
+    assert not target.exists()
+    assert (tmp_path / "bedrock-server-1.20.0.zip.part").read_bytes() == b"abc"
+
+
+def test_verify_detects_corruption(cache, tmp_path, mocker):
+    target = tmp_path / "bedrock-server-1.20.0.zip"
+    mocker.patch("requests.get", return_value=_mock_response(mocker, 200, [b"abc"]))
+    cache.download(URL, str(target))
+
+    target.write_bytes(b"abd")
+
+    assert cache.is_cached(str(target))
+    assert not cache.verify(str(target))
+
+
+def test_unindexed_file_is_trusted(cache, tmp_path):
+    legacy = tmp_path / "bedrock-server-1.19.0.zip"
+    legacy.write_bytes(b"old download")
+
+    assert cache.get_entry(str(legacy)) is None
+    assert cache.is_cached(str(legacy))
+    assert cache.verify(str(legacy))
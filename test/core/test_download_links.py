@@ -0,0 +1,116 @@
+import json
+import time
+
+import pytest
+import requests
+
+from bedrock_server_manager.core import download_links
+from bedrock_server_manager.core.download_links import (
+    LINKS_FILENAME,
+    DownloadLinksCache,
+    get_cache,
+    get_stats,
+)
+from bedrock_server_manager.error import InternetConnectivityError
+
+API_DATA = {
+    "result": {
+        "links": [
+            {
+                "downloadType": "serverBedrockLinux",
+                "downloadUrl": "https://example.com/bedrock-server-1.21.0.03.zip",
+            }
+        ]
+    }
+}
+
+
+def make_response(mocker, status_code=200, api_data=API_DATA, headers=None):
+    response = mocker.Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = api_data
+    response.raise_for_status = mocker.Mock()
+    return response
+
+
+@pytest.fixture
+def mock_get(mocker):
+    return mocker.patch("requests.get")
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return str(tmp_path / LINKS_FILENAME)
+
+
+def test_get_links_caches_within_ttl(mocker, mock_get, state_path):
+    mock_get.return_value = make_response(mocker)
+    cache = DownloadLinksCache(state_path)
+    stats_before = get_stats()
+
+    first = cache.get_links(ttl_sec=60)
+    second = cache.get_links(ttl_sec=60)
+
+    assert (
+        first
+        == second
+        == {"serverBedrockLinux": "https://example.com/bedrock-server-1.21.0.03.zip"}
+    )
+    mock_get.assert_called_once()
+    stats = get_stats()
+    assert stats["misses"] - stats_before["misses"] == 1
+    assert stats["hits"] - stats_before["hits"] == 1
+
+
+def test_get_links_refreshes_conditionally(mocker, mock_get, state_path):
+    mock_get.return_value = make_response(mocker, headers={"ETag": '"abc"'})
+    cache = DownloadLinksCache(state_path)
+    cache.get_links(ttl_sec=0)
+
+    mock_get.return_value = make_response(mocker, status_code=304, api_data=None)
+    links = cache.get_links(ttl_sec=0)
+
+    assert "serverBedrockLinux" in links
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+
+
+def test_get_links_falls_back_to_saved_answer(mocker, mock_get, state_path):
+    mock_get.return_value = make_response(mocker)
+    DownloadLinksCache(state_path).get_links(ttl_sec=0)
+    with open(state_path, encoding="utf-8") as f:
+        assert "serverBedrockLinux" in json.load(f)["links"]
+
+    # A new process has no answer in memory and cannot reach the API.
+    mock_get.side_effect = requests.exceptions.ConnectionError("offline")
+    stats_before = get_stats()
+    links = DownloadLinksCache(state_path).get_links(ttl_sec=0)
+
+    assert "serverBedrockLinux" in links
+    assert get_stats()["stale_fallbacks"] - stats_before["stale_fallbacks"] == 1
+
+
+def test_get_links_raises_without_saved_answer(mock_get, state_path):
+    mock_get.side_effect = requests.exceptions.ConnectionError("offline")
+    with pytest.raises(InternetConnectivityError, match="offline"):
+        DownloadLinksCache(state_path).get_links()
+
+
+def test_get_links_uses_saved_answer_within_ttl(mock_get, state_path):
+    with open(state_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"links": {"serverBedrockLinux": "url"}, "fetched_at": time.time()}, f
+        )
+
+    assert DownloadLinksCache(state_path).get_links(ttl_sec=60) == {
+        "serverBedrockLinux": "url"
+    }
+    mock_get.assert_not_called()
+
+
+def test_get_cache_is_shared_per_directory(tmp_path):
+    cache = get_cache(str(tmp_path))
+    assert get_cache(str(tmp_path)) is cache
+    assert get_cache(str(tmp_path / "other")) is not cache
+    assert cache.state_path == str(tmp_path / LINKS_FILENAME)
+    download_links._caches.clear()
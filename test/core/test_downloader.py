@@ -14,6 +14,7 @@ from unittest import (
 
 # Imports from the application
 from bedrock_server_manager.core.downloader import (
+    INSTALL_MANIFEST_FILENAME,
     BedrockDownloader,
     prune_old_downloads,
 )
@@ -669,6 +670,26 @@ def test_lookup_fail_to_construct_specific_url(
         downloader.get_version_for_target_spec()
 
 
+def test_lookup_is_shared_between_downloaders(
+    downloader_instance, mock_requests_get, mocker
+):
+    """Test that downloaders share the cached API answer within its TTL."""
+    mock_response = mocker.Mock()
+    mock_response.json.return_value = common_api_response_data(
+        "serverBedrockLinux", "serverBedrockWindows"
+    )
+    mock_response.raise_for_status = mocker.Mock()
+    mock_requests_get.return_value = mock_response
+
+    for _ in range(3):
+        downloader = BedrockDownloader(
+            downloader_instance.settings, downloader_instance.server_dir, "LATEST"
+        )
+        assert downloader.get_version_for_target_spec() == "1.20.0.1"
+
+    mock_requests_get.assert_called_once()
+
+
 def test_get_version_from_url_fail(downloader_instance):
     """Test _get_version_from_url when URL format is unexpected."""
     downloader_instance.resolved_download_url = "https://example.com/invalid-format.zip"
@@ -687,7 +708,7 @@ def mock_successful_requests_get_stream(mocker):
     mock_response = mocker.Mock(spec=requests.Response)
     mock_response.raise_for_status = mocker.Mock()
     mock_response.status_code = 200  # Add status_code
-    mock_response.headers = {"content-length": "100"}  # Dummy size
+    mock_response.headers = {"content-length": "22"}  # Size of the chunks below
     mock_response.iter_content.return_value = [
         b"chunk1_data",
         b"chunk2_data",
@@ -809,14 +830,51 @@ def test_prepare_download_assets_file_already_exists(
 def test_prepare_download_assets_internet_connectivity_error(
     downloader_instance, mocker
 ):
-    """Test prepare_download_assets when internet check fails."""
+    """Test prepare_download_assets when the link lookup cannot reach the API."""
+    mock_check = mocker.patch(
+        "bedrock_server_manager.core.system.base.check_internet_connectivity"
+    )
     mocker.patch(
-        "bedrock_server_manager.core.system.base.check_internet_connectivity",
+        "bedrock_server_manager.core.downloader.download_links.get_download_links",
         side_effect=InternetConnectivityError("No internet"),
     )
 
     with pytest.raises(InternetConnectivityError, match="No internet"):
         downloader_instance.prepare_download_assets()
+    # Failures come from the requests themselves; there is no separate probe.
+    mock_check.assert_not_called()
+
+
+def test_prepare_download_assets_offline_uses_cached_links(downloader_instance, mocker):
+    """Test prepare_download_assets works offline from cached links and ZIP."""
+    mocker.patch(
+        "bedrock_server_manager.core.system.base.check_internet_connectivity",
+        side_effect=InternetConnectivityError("No internet"),
+    )
+    mocker.patch(
+        "bedrock_server_manager.core.downloader.download_links.get_download_links",
+        return_value={
+            "serverBedrockLinux": "https://example.com/bedrock-server-1.20.0.zip",
+            "serverBedrockWindows": "https://example.com/bedrock-server-1.20.0.zip",
+        },
+    )
+    mock_download = mocker.patch.object(
+        downloader_instance, "_download_server_zip_file"
+    )
+    mocker.patch("bedrock_server_manager.core.downloader.prune_old_downloads")
+    zip_path = (
+        Path(downloader_instance.base_download_dir)
+        / "stable"
+        / "bedrock-server-1.20.0.zip"
+    )
+    zip_path.parent.mkdir(parents=True, exist_ok=True)
+    zip_path.write_text("cached")
+
+    actual_version, zip_file_path, _ = downloader_instance.prepare_download_assets()
+
+    assert actual_version == "1.20.0"
+    assert zip_file_path == str(zip_path)
+    mock_download.assert_not_called()
 
 
 def test_download_server_zip_file_request_exception(
@@ -983,6 +1041,50 @@ def test_extract_server_files_update_mode(
     assert (temp_server_dir / "other_file.txt").read_bytes() == b"new_zip_other_data"
 
 
+def test_extract_server_files_update_skips_unchanged_files(
+    downloader_instance, temp_server_dir, temp_download_base_dir
+):
+    """Test that an update only rewrites changed files and removes dropped ones."""
+    old_zip = temp_download_base_dir / "old_server.zip"
+    create_dummy_zip(
+        old_zip,
+        {
+            "bedrock_server": b"binary_v1",
+            "same.txt": b"unchanged",
+            "dropped.txt": b"gone in v2",
+            "server.properties": b"props",
+        },
+    )
+    downloader_instance.zip_file_path = str(old_zip)
+    downloader_instance.extract_server_files(is_update=False)
+    assert (temp_server_dir / INSTALL_MANIFEST_FILENAME).exists()
+    same_mtime = (temp_server_dir / "same.txt").stat().st_mtime_ns
+
+    new_zip = temp_download_base_dir / "new_server.zip"
+    create_dummy_zip(
+        new_zip,
+        {
+            "bedrock_server": b"binary_v2",
+            "same.txt": b"unchanged",
+            "added.txt": b"new in v2",
+            "server.properties": b"new props",
+        },
+    )
+    downloader_instance.zip_file_path = str(new_zip)
+    downloader_instance.extract_server_files(is_update=True)
+
+    stats = downloader_instance.last_extract_stats
+    assert stats["extracted_files"] == 2
+    assert stats["unchanged_files"] == 1
+    assert stats["removed_files"] == 1
+    assert stats["bytes_skipped"] == len(b"unchanged")
+    assert (temp_server_dir / "bedrock_server").read_bytes() == b"binary_v2"
+    assert (temp_server_dir / "added.txt").read_bytes() == b"new in v2"
+    assert (temp_server_dir / "same.txt").stat().st_mtime_ns == same_mtime
+    assert not (temp_server_dir / "dropped.txt").exists()
+    assert (temp_server_dir / "server.properties").read_bytes() == b"props"
+
+
 def test_extract_bad_zip_file(
     downloader_instance, temp_server_dir, temp_download_base_dir
 ):
@@ -206,6 +206,46 @@ def test_save_player_data_update_existing_db(app_context):
     assert {"name": "UpdatedName", "xuid": "222"} in players
 
 
+def test_upsert_players_counts(app_context):
+    """Test upsert_players reporting inserted, updated and unchanged rows."""
+    manager = app_context.manager
+    manager.save_player_data(
+        [{"name": "Same", "xuid": "1"}, {"name": "OldName", "xuid": "2"}]
+    )
+
+    counts = manager.upsert_players(
+        [
+            {"name": "Same", "xuid": "1"},
+            {"name": "NewName", "xuid": "2"},
+            {"name": "First", "xuid": "3"},
+            {"name": "Last", "xuid": "3"},  # Later duplicates win
+        ]
+    )
+
+    assert counts == {"inserted": 1, "updated": 1, "unchanged": 1}
+    players = manager.get_known_players()
+    assert {"name": "NewName", "xuid": "2"} in players
+    assert {"name": "Last", "xuid": "3"} in players
+
+
+def test_upsert_players_spans_query_chunks(app_context, mocker):
+    """Test upsert_players with more XUIDs than fit in one IN query."""
+    from bedrock_server_manager.core.manager_mixins import player_mixin
+
+    mocker.patch.object(player_mixin, "PLAYER_QUERY_CHUNK_SIZE", 3)
+    manager = app_context.manager
+    manager.save_player_data(
+        [{"name": f"P{i}", "xuid": str(i)} for i in range(0, 10, 2)]
+    )
+
+    counts = manager.upsert_players(
+        [{"name": f"P{i}", "xuid": str(i)} for i in range(10)]
+    )
+
+    assert counts == {"inserted": 5, "updated": 0, "unchanged": 5}
+    assert len(manager.get_known_players()) == 10
+
+
 def test_save_player_data_invalid_input(app_context):
     """Test save_player_data with invalid input types."""
     manager = app_context.manager
@@ -272,6 +312,29 @@ def test_discover_and_store_players_from_all_server_logs(app_context, mocker):
     assert {"name": "Beta", "xuid": "2"} in players
 
 
+def test_discover_players_uses_process_pool(app_context):
+    """Test discovery fanning out over worker processes and reporting timings."""
+    manager = app_context.manager
+    app_context.settings.set("server_monitoring.player_discovery_workers", 2)
+    source = app_context.get_server("test_server")
+    other_dir = os.path.join(os.path.dirname(source.server_dir), "other_server")
+    os.makedirs(other_dir)
+    shutil.copy2(os.path.join(source.server_dir, "bedrock_server"), other_dir)
+    with open(source.server_log_path, "w") as f:
+        f.write("Player connected: Alpha, xuid: 1\n")
+    with open(os.path.join(other_dir, "server_output.txt"), "w") as f:
+        f.write("Player connected: Alpha, xuid: 1\nPlayer connected: Beta, xuid: 2\n")
+
+    results = manager.discover_and_store_players_from_all_server_logs(app_context)
+
+    assert results["workers"] == 2
+    assert results["scan_errors"] == []
+    assert set(results["server_timings"]) == {"test_server", "other_server"}
+    assert results["server_timings"]["other_server"]["players"] == 2
+    assert results["total_entries_in_logs"] == 3
+    assert results["inserted_in_db"] == 2
+
+
 def test_discover_players_base_dir_not_exist(app_context, mocker):
     """Test discover_players if base server directory doesn't exist."""
     manager = app_context.manager
@@ -1027,3 +1090,32 @@ def test_get_servers_data_with_non_installed_server(app_context, mocker):
 
     assert len(servers_data) == 0
     assert len(error_messages) == 0
+
+
+def test_get_servers_data_served_from_status_registry(app_context, mocker):
+    """Test get_servers_data returns the registry snapshot once populated."""
+    app_context.manager.get_servers_data(app_context=app_context)
+    assert app_context.status_registry.is_populated
+
+    listdir = mocker.patch("os.listdir")
+    app_context.get_server("test_server").set_status_in_config("RUNNING")
+    servers_data, error_messages = app_context.manager.get_servers_data(
+        app_context=app_context
+    )
+
+    listdir.assert_not_called()
+    assert servers_data[0]["status"] == "RUNNING"
+    assert error_messages == []
+
+
+def test_get_servers_data_refresh_resyncs_registry(app_context):
+    """Test get_servers_data with refresh=True rescans and resynchronizes the registry."""
+    registry = app_context.status_registry
+    registry.replace_all([{"name": "stale_server", "status": "RUNNING"}])
+
+    servers_data, _ = app_context.manager.get_servers_data(
+        app_context=app_context, refresh=True
+    )
+
+    assert [s["name"] for s in servers_data] == ["test_server"]
+    assert not registry.contains("stale_server")
@@ -0,0 +1,136 @@
+# Test cases for bedrock_server_manager.core.player_sessions
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from bedrock_server_manager.core.player_sessions import PlayerSessionTracker
+from bedrock_server_manager.db.models import PlayerSession
+
+
+def _ts(dt):
+    """Formats an aware datetime as a server log timestamp (local time)."""
+    return dt.astimezone().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _event(kind, name, xuid, at):
+    return {"event": kind, "name": name, "xuid": xuid, "timestamp": _ts(at)}
+
+
+@pytest.fixture
+def plugin_manager(app_context):
+    mock = MagicMock()
+    app_context._plugin_manager = mock
+    return mock
+
+
+@pytest.fixture
+def tracker(app_context, plugin_manager):
+    return PlayerSessionTracker(app_context)
+
+
+def test_join_and_leave_record_session(tracker, plugin_manager, db_session):
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    tracker.process_events(
+        "server1", [_event("connected", "Steve", "111", now - timedelta(seconds=30))]
+    )
+
+    online = tracker.get_online_players("server1")
+    assert [(p["name"], p["xuid"]) for p in online] == [("Steve", "111")]
+    assert online[0]["session_id"] is not None
+
+    changes = tracker.process_events(
+        "server1", [_event("disconnected", "Steve", "111", now)]
+    )
+    assert [c["event"] for c in changes] == ["player_leave"]
+    assert tracker.get_online_players() == []
+
+    session = db_session.query(PlayerSession).one()
+    assert session.server_name == "server1"
+    assert session.leave_time is not None
+
+    events = [c.args[0] for c in plugin_manager.trigger_guarded_event.call_args_list]
+    assert events == ["player_join", "player_leave"]
+    assert plugin_manager.trigger_guarded_event.call_args.kwargs["xuid"] == "111"
+
+
+def test_historical_events_do_not_notify(tracker, plugin_manager):
+    old = datetime.now(timezone.utc) - timedelta(days=1)
+    tracker.process_events("server1", [_event("connected", "Steve", "111", old)])
+
+    assert len(tracker.get_online_players("server1")) == 1
+    plugin_manager.trigger_guarded_event.assert_not_called()
+
+
+def test_rejoin_without_leave_closes_previous_session(tracker):
+    now = datetime.now(timezone.utc)
+    tracker.process_events(
+        "server1",
+        [
+            _event("connected", "Steve", "111", now - timedelta(minutes=5)),
+            _event("connected", "Steve", "111", now),
+        ],
+    )
+
+    sessions = tracker.get_sessions(xuid="111")
+    assert len(sessions) == 2
+    assert sessions[0]["leave_time"] is None
+    assert sessions[1]["leave_time"] is not None
+    assert len(tracker.get_online_players("server1")) == 1
+
+
+def test_server_started_ends_open_sessions(tracker):
+    now = datetime.now(timezone.utc)
+    tracker.process_events(
+        "server1",
+        [
+            _event("connected", "Steve", "111", now - timedelta(minutes=5)),
+            _event("connected", "Alex", "222", now - timedelta(minutes=4)),
+            {"event": "server_started", "name": None, "xuid": None, "timestamp": None},
+        ],
+    )
+    assert tracker.get_online_players("server1") == []
+    assert all(s["leave_time"] for s in tracker.get_sessions(server_name="server1"))
+
+
+def test_end_all_sessions_only_affects_server(tracker):
+    now = datetime.now(timezone.utc)
+    tracker.process_events("server1", [_event("connected", "Steve", "111", now)])
+    tracker.process_events("server2", [_event("connected", "Alex", "222", now)])
+
+    changes = tracker.end_all_sessions("server1")
+
+    assert [c["xuid"] for c in changes] == ["111"]
+    assert [p["server_name"] for p in tracker.get_online_players()] == ["server2"]
+
+
+def test_open_sessions_are_reloaded(app_context, tracker, plugin_manager):
+    tracker.process_events(
+        "server1", [_event("connected", "Steve", "111", datetime.now(timezone.utc))]
+    )
+
+    reloaded = PlayerSessionTracker(app_context)
+    assert [p["xuid"] for p in reloaded.get_online_players("server1")] == ["111"]
+
+    reloaded.end_all_sessions("server1")
+    assert tracker.get_sessions(xuid="111")[0]["leave_time"] is not None
+
+
+def test_get_sessions_time_range(tracker):
+    now = datetime.now(timezone.utc)
+    tracker.process_events(
+        "server1",
+        [
+            _event("connected", "Steve", "111", now - timedelta(hours=3)),
+            _event("disconnected", "Steve", "111", now - timedelta(hours=2)),
+            _event("connected", "Steve", "111", now - timedelta(minutes=10)),
+        ],
+    )
+
+    recent = tracker.get_sessions(xuid="111", start=now - timedelta(hours=1))
+    assert len(recent) == 1
+    assert recent[0]["leave_time"] is None
+
+    earlier = tracker.get_sessions(server_name="server1", end=now - timedelta(hours=1))
+    assert len(earlier) == 1
+    assert earlier[0]["duration_sec"] == 3600
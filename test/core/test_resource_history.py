@@ -0,0 +1,125 @@
+# Test cases for bedrock_server_manager.core.resource_history
+import math
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from bedrock_server_manager.core.resource_history import (
+    ResourceHistoryRecorder,
+    RingBufferFile,
+    ServerResourceHistory,
+    Tier,
+)
+
+
+def record(ts, value=1.0):
+    return [ts, value, value, value, value]
+
+
+def test_ring_buffer_overwrites_oldest_records(tmp_path):
+    ring = RingBufferFile(str(tmp_path / "ring"), capacity=3)
+    for ts in range(5):
+        ring.append(record(float(ts), ts))
+
+    assert len(ring) == 3
+    assert [r[0] for r in ring.read_range(0, 10)] == [2.0, 3.0, 4.0]
+    assert [r[0] for r in ring.read_range(2.5, 3.5)] == [3.0]
+    ring.close()
+
+
+def test_ring_buffer_reopens_existing_file(tmp_path):
+    path = str(tmp_path / "ring")
+    ring = RingBufferFile(path, capacity=4)
+    ring.append(record(1.0))
+    ring.append(record(2.0))
+    ring.close()
+
+    ring = RingBufferFile(path, capacity=4)
+    assert [r[0] for r in ring.read_range(0, 10)] == [1.0, 2.0]
+    ring.close()
+
+    # A different layout is not misread; the file starts over.
+    ring = RingBufferFile(path, capacity=8)
+    assert len(ring) == 0
+    ring.close()
+
+
+def test_history_averages_samples_per_tier(tmp_path):
+    tiers = [Tier("10s", 10, 3600), Tier("1m", 60, 86400)]
+    history = ServerResourceHistory(str(tmp_path / "history"), tiers)
+    base = (int(time.time()) // 60 - 2) * 60
+    for offset in range(0, 60, 5):
+        history.record(
+            {"cpu_percent": offset, "memory_mb": 100, "player_count": 1},
+            timestamp=base + offset,
+        )
+    # A sample in the next minute completes the buckets of the first one.
+    history.record({"cpu_percent": 0, "memory_mb": 100}, timestamp=base + 60)
+
+    fine = history.query(base, base + 59)
+    assert fine["resolution_sec"] == 10
+    assert fine["fields"][0] == "timestamp"
+    assert [point[0] for point in fine["points"]] == [
+        base + offset for offset in range(0, 60, 10)
+    ]
+    assert fine["points"][0][1] == pytest.approx(2.5)  # mean of 0 and 5
+    assert fine["points"][0][4] is None  # latency was never measured
+
+    coarse = history.query(base, base + 59, resolution_sec=60)
+    assert coarse["resolution_sec"] == 60
+    assert len(coarse["points"]) == 1
+    assert coarse["points"][0][1] == pytest.approx(27.5)
+    assert coarse["points"][0][2] == pytest.approx(100)
+    history.close()
+
+
+def test_history_uses_coarse_tier_for_old_ranges(tmp_path):
+    tiers = [Tier("10s", 10, 3600), Tier("1m", 60, 86400)]
+    history = ServerResourceHistory(str(tmp_path / "history"), tiers)
+    assert history.select_tier(time.time() - 60).name == "10s"
+    assert history.select_tier(time.time() - 7200).name == "1m"
+    history.close()
+
+
+def test_history_close_flushes_pending_buckets(tmp_path):
+    directory = str(tmp_path / "history")
+    tiers = [Tier("10s", 10, 3600)]
+    history = ServerResourceHistory(directory, tiers)
+    now = time.time()
+    history.record({"cpu_percent": 50}, timestamp=now)
+    history.close()
+
+    history = ServerResourceHistory(directory, tiers)
+    points = history.query(now - 20, now)["points"]
+    assert len(points) == 1
+    assert points[0][1] == pytest.approx(50)
+    assert not math.isnan(points[0][0])
+    history.close()
+
+
+def test_recorder_reads_the_shared_sampler():
+    server = MagicMock(player_count=2, ping_latency_ms=12.5)
+    app_context = MagicMock()
+    app_context.bedrock_process_manager.servers = {"test_server": server}
+    app_context.resource_sampler.get_latest.return_value = {
+        "cpu_percent": 40.0,
+        "memory_mb": 512.0,
+    }
+    recorder = ResourceHistoryRecorder(app_context)
+    history = MagicMock()
+    recorder._histories["test_server"] = history
+
+    recorder.sample_now()
+
+    # The process is sampled once, by the shared sampler, not again here.
+    app_context.resource_sampler.get_latest.assert_called_once_with("test_server")
+    server.get_process_info.assert_not_called()
+    history.record.assert_called_once_with(
+        {
+            "cpu_percent": 40.0,
+            "memory_mb": 512.0,
+            "player_count": 2,
+            "latency_ms": 12.5,
+        }
+    )
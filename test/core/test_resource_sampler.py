@@ -0,0 +1,87 @@
+# Test cases for bedrock_server_manager.core.resource_sampler
+import time
+
+import pytest
+
+from bedrock_server_manager.core.resource_sampler import ServerResourceSampler
+
+
+@pytest.fixture
+def sampler(app_context, mocker):
+    server = app_context.get_server("test_server")
+    mocker.patch.object(
+        server, "get_process_info", return_value={"pid": 1, "cpu_percent": 5.0}
+    )
+    sampler = ServerResourceSampler(app_context, interval_sec=60)
+    yield sampler
+    sampler.shutdown()
+
+
+def test_sample_now_samples_subscribed_servers_once(sampler, app_context):
+    sampler._subscribers["test_server"] = 3  # Subscribe without starting the thread.
+
+    sampler.sample_now()
+
+    server = app_context.get_server("test_server")
+    server.get_process_info.assert_called_once()
+    assert sampler.get_sample("test_server") == (1, {"pid": 1, "cpu_percent": 5.0})
+
+    sampler.sample_now()
+    assert sampler.get_sample("test_server")[0] == 2
+
+
+def test_get_sample_unknown_server(sampler):
+    assert sampler.get_sample("other") == (0, None)
+
+
+def test_subscribe_starts_thread_and_samples(sampler):
+    sampler.subscribe("test_server")
+    sampler.subscribe("test_server")
+    try:
+        assert sampler.subscriber_count("test_server") == 2
+        for _ in range(100):
+            if sampler.get_sample("test_server")[0]:
+                break
+            time.sleep(0.01)
+        assert sampler.get_sample("test_server")[1] == {"pid": 1, "cpu_percent": 5.0}
+    finally:
+        sampler.unsubscribe("test_server")
+        sampler.unsubscribe("test_server")
+
+    assert sampler.subscriber_count("test_server") == 0
+    assert sampler.get_sample("test_server") == (0, None)
+
+
+def test_sampling_errors_are_reported_as_no_info(app_context, mocker):
+    server = app_context.get_server("test_server")
+    mocker.patch.object(server, "get_process_info", side_effect=RuntimeError("boom"))
+    sampler = ServerResourceSampler(app_context, interval_sec=60)
+    sampler._subscribers["test_server"] = 1
+
+    sampler.sample_now()
+
+    assert sampler.get_sample("test_server") == (1, None)
+
+
+def test_get_latest_samples_once_per_interval(sampler, app_context):
+    server = app_context.get_server("test_server")
+
+    assert sampler.get_latest("test_server") == {"pid": 1, "cpu_percent": 5.0}
+    assert sampler.get_latest("test_server") == {"pid": 1, "cpu_percent": 5.0}
+
+    # The second call is answered from the sample taken by the first one.
+    server.get_process_info.assert_called_once()
+
+
+def test_poll_lease_expires(app_context, mocker):
+    server = app_context.get_server("test_server")
+    mocker.patch.object(server, "get_process_info", return_value=None)
+    sampler = ServerResourceSampler(app_context, interval_sec=60, poll_lease_sec=0)
+    mocker.patch.object(sampler, "_ensure_thread")
+
+    sampler.get_latest("test_server")
+    time.sleep(0.01)
+    sampler.sample_now()
+
+    assert "test_server" not in sampler._polled
+    assert sampler.get_sample("test_server") == (0, None)
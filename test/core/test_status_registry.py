@@ -0,0 +1,90 @@
+# Test cases for bedrock_server_manager.core.status_registry
+import threading
+
+from bedrock_server_manager.core.status_registry import ServerStatusRegistry
+
+
+def test_update_bumps_revision_only_on_change():
+    registry = ServerStatusRegistry()
+    assert registry.revision == 0
+
+    assert registry.update("server1", status="RUNNING")
+    assert registry.revision == 1
+    assert not registry.update("server1", status="RUNNING")
+    assert registry.revision == 1
+
+    assert registry.update("server1", player_count=3)
+    assert registry.revision == 2
+
+
+def test_update_ignores_unknown_fields():
+    registry = ServerStatusRegistry()
+    registry.update("server1", status="RUNNING")
+
+    assert not registry.update("server1", foo="bar")
+    _, servers = registry.snapshot()
+    assert "foo" not in servers[0]
+
+
+def test_snapshot_is_sorted_and_complete():
+    registry = ServerStatusRegistry()
+    registry.update("beta", status="STOPPED")
+    registry.update("Alpha", version="1.20.0", player_count=2)
+
+    revision, servers = registry.snapshot()
+
+    assert revision == 2
+    assert servers == [
+        {"name": "Alpha", "status": "UNKNOWN", "version": "1.20.0", "player_count": 2},
+        {"name": "beta", "status": "STOPPED", "version": "UNKNOWN", "player_count": 0},
+    ]
+
+
+def test_snapshot_is_not_changed_by_later_updates():
+    registry = ServerStatusRegistry()
+    registry.update("server1", status="STOPPED")
+    _, before = registry.snapshot()
+
+    registry.update("server1", status="RUNNING")
+
+    assert before[0]["status"] == "STOPPED"
+    assert registry.snapshot()[1][0]["status"] == "RUNNING"
+
+
+def test_remove():
+    registry = ServerStatusRegistry()
+    registry.update("server1", status="RUNNING")
+
+    assert registry.remove("server1")
+    assert not registry.contains("server1")
+    assert registry.revision == 2
+    assert not registry.remove("server1")
+    assert registry.revision == 2
+
+
+def test_replace_all_populates_and_detects_no_change():
+    registry = ServerStatusRegistry()
+    assert not registry.is_populated
+
+    servers = [{"name": "server1", "status": "RUNNING", "version": "1.0"}]
+    assert registry.replace_all(servers)
+    assert registry.is_populated
+    revision = registry.revision
+
+    assert not registry.replace_all(servers)
+    assert registry.revision == revision
+
+    registry.invalidate()
+    assert not registry.is_populated
+
+
+def test_wait_for_change():
+    registry = ServerStatusRegistry()
+    assert registry.wait_for_change(0, timeout=0.01) == 0
+
+    timer = threading.Timer(0.05, registry.update, args=("server1",))
+    timer.start()
+    try:
+        assert registry.wait_for_change(0, timeout=5) == 1
+    finally:
+        timer.join()
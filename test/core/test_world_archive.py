@@ -0,0 +1,153 @@
+import os
+import zipfile
+
+import pytest
+
+from bedrock_server_manager.core.world_archive import (
+    extract_archive,
+    iter_world_archive,
+    make_staging_directory,
+    replace_directory,
+    write_world_archive,
+)
+from bedrock_server_manager.error import AppFileNotFoundError
+
+
+@pytest.fixture
+def world_dir(tmp_path):
+    world = tmp_path / "world"
+    (world / "db").mkdir(parents=True)
+    (world / "level.dat").write_bytes(b"level" * 1000)
+    (world / "db" / "000005.ldb").write_bytes(os.urandom(4096))
+    (world / "db" / "CURRENT").write_text("MANIFEST-000001\n")
+    (world / "db" / "empty.log").write_bytes(b"")
+    return world
+
+
+def test_write_world_archive_round_trip(world_dir, tmp_path):
+    target = tmp_path / "out.mcworld"
+
+    stats = write_world_archive(str(world_dir), str(target), workers=2)
+
+    with zipfile.ZipFile(target) as zf:
+        assert zf.testzip() is None
+        infos = {info.filename: info for info in zf.infolist()}
+        assert sorted(infos) == [
+            "db/000005.ldb",
+            "db/CURRENT",
+            "db/empty.log",
+            "level.dat",
+        ]
+        assert zf.read("level.dat") == b"level" * 1000
+        # Already-compressed LevelDB tables are stored, the rest deflated.
+        assert infos["db/000005.ldb"].compress_type == zipfile.ZIP_STORED
+        assert infos["level.dat"].compress_type == zipfile.ZIP_DEFLATED
+
+    assert stats["files"] == 4
+    assert stats["bytes_in"] == 5000 + 4096 + len("MANIFEST-000001\n")
+    assert stats["bytes_out"] == os.path.getsize(target)
+    assert stats["throughput_mb_s"] >= 0
+    assert not os.path.exists(str(target) + ".tmp")
+
+
+def test_compression_level_zero_stores_everything(world_dir, tmp_path):
+    target = tmp_path / "out.mcworld"
+
+    stats = write_world_archive(str(world_dir), str(target), compression_level=0)
+
+    assert stats["stored_files"] == stats["files"]
+    with zipfile.ZipFile(target) as zf:
+        assert zf.read("level.dat") == b"level" * 1000
+
+
+def test_iter_world_archive_streams_same_bytes(world_dir, tmp_path):
+    target = tmp_path / "out.mcworld"
+    write_world_archive(str(world_dir), str(target), workers=1)
+
+    streamed = b"".join(iter_world_archive(str(world_dir), workers=3))
+
+    assert streamed == target.read_bytes()
+
+
+def test_iter_world_archive_missing_source(tmp_path):
+    with pytest.raises(AppFileNotFoundError):
+        next(iter_world_archive(str(tmp_path / "missing")))
+
+
+def test_extract_archive_round_trip(world_dir, tmp_path):
+    archive = tmp_path / "out.mcworld"
+    write_world_archive(str(world_dir), str(archive))
+    target = tmp_path / "extracted"
+    target.mkdir()
+
+    stats = extract_archive(str(archive), str(target), workers=3)
+
+    assert stats["files"] == 4
+    for name in ("level.dat", "db/000005.ldb", "db/CURRENT", "db/empty.log"):
+        assert (target / name).read_bytes() == (world_dir / name).read_bytes()
+
+
+def test_extract_archive_detects_bad_crc(tmp_path):
+    archive = tmp_path / "bad.mcworld"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr("level.dat", b"A" * 100)
+    data = archive.read_bytes()
+    archive.write_bytes(data.replace(b"A" * 100, b"A" * 99 + b"B", 1))
+
+    with pytest.raises(zipfile.BadZipFile):
+        extract_archive(str(archive), str(tmp_path / "out"), workers=2)
+
+
+def test_extract_archive_rejects_path_traversal(tmp_path):
+    archive = tmp_path / "evil.mcworld"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("../outside.txt", b"x")
+
+    with pytest.raises(zipfile.BadZipFile):
+        extract_archive(str(archive), str(tmp_path / "out"))
+    assert not (tmp_path / "outside.txt").exists()
+
+
+def test_replace_directory_swaps_and_deletes_old(tmp_path):
+    worlds = tmp_path / "worlds"
+    target = worlds / "world"
+    target.mkdir(parents=True)
+    (target / "old.txt").write_text("old")
+    # A copy left behind by a run that was killed before deleting it.
+    (worlds / ".world.old-deadbeef").mkdir()
+    staging = make_staging_directory(str(target))
+    with open(os.path.join(staging, "new.txt"), "w") as f:
+        f.write("new")
+
+    thread = replace_directory(staging, str(target))
+    assert not thread.daemon
+    thread.join()
+
+    assert sorted(os.listdir(worlds)) == ["world"]
+    assert sorted(os.listdir(target)) == ["new.txt"]
+
+
+def test_replace_directory_removes_leftover_copies(tmp_path):
+    worlds = tmp_path / "worlds"
+    target = worlds / "world"
+    target.mkdir(parents=True)
+    staging = worlds / "new"
+    staging.mkdir()
+    (worlds / ".world.old-deadbeef").mkdir()
+
+    replace_directory(str(staging), str(target), background_delete=False)
+
+    assert sorted(os.listdir(worlds)) == ["world"]
+
+
+def test_replace_directory_rolls_back_on_failure(tmp_path):
+    worlds = tmp_path / "worlds"
+    target = worlds / "world"
+    target.mkdir(parents=True)
+    (target / "old.txt").write_text("old")
+
+    with pytest.raises(OSError):
+        replace_directory(str(worlds / "missing"), str(target))
+
+    assert sorted(os.listdir(worlds)) == ["world"]
+    assert (target / "old.txt").read_text() == "old"
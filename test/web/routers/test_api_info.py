@@ -209,6 +209,18 @@ def test_get_servers_list_api_route_success(
     assert len(response.json()["servers"]) == 1
 
 
+def test_get_servers_list_api_route_not_modified(
+    authenticated_client, app_context, real_bedrock_server
+):
+    """Test the get_servers_list_api_route with an unchanged revision."""
+    revision = authenticated_client.get("/api/servers").json()["revision"]
+
+    response = authenticated_client.get(f"/api/servers?revision={revision}")
+    assert response.status_code == 200
+    assert response.json()["not_modified"] is True
+    assert response.json()["servers"] is None
+
+
 @patch("bedrock_server_manager.web.routers.api_info.app_api.get_all_servers_data")
 def test_get_servers_list_api_route_failure(mock_get_servers, authenticated_client):
     """Test the get_servers_list_api_route with a failed retrieval."""
@@ -278,3 +290,15 @@ def test_add_players_api_route_failure(mock_add_players, authenticated_client):
         "A critical unexpected server error occurred while adding players."
         in response.json()["detail"]
     )
+
+
+def test_get_web_metrics_api_route(authenticated_client):
+    """Test that request latencies are recorded per route template."""
+    authenticated_client.get("/api/server/test_server/status")
+    response = authenticated_client.get("/api/info/web_metrics")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    route = data["routes"]["GET /api/server/{server_name}/status"]
+    assert route["count"] == 1
+    assert sum(route["buckets"].values()) == 1
+    assert "event_loop_lag" in data
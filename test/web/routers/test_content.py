@@ -207,3 +207,30 @@ def test_install_addon_api_route_not_found(
     )
     assert response.status_code == 404
     assert "not found for import" in response.json()["detail"]
+
+
+@patch("bedrock_server_manager.api.world.server_lifecycle_manager")
+def test_export_world_api_route_streams_archive(
+    mock_lifecycle, authenticated_client, real_bedrock_server
+):
+    """Test that stream=true returns the .mcworld archive as the response body."""
+    import io
+    import zipfile
+
+    world_dir = os.path.join(real_bedrock_server.server_dir, "worlds", "world")
+    os.makedirs(world_dir, exist_ok=True)
+    with open(os.path.join(world_dir, "level.dat"), "wb") as f:
+        f.write(b"level")
+
+    response = authenticated_client.post(
+        f"/api/server/{real_bedrock_server.server_name}/world/export?stream=true"
+    )
+
+    assert response.status_code == 200
+    assert "attachment" in response.headers["content-disposition"]
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
+        assert zf.read("level.dat") == b"level"
+    mock_lifecycle.assert_called_once()
+    from bedrock_server_manager.api import world as world_api
+
+    assert not world_api._world_lock.locked()
@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock, patch
+
+import json
+
+from bedrock_server_manager.web.routers.events import (
+    format_sse,
+    server_event_stream,
+)
+
+
+def _fake_request(connected_checks):
+    """Returns a request that reports a disconnect after `connected_checks` checks."""
+    request = MagicMock()
+    calls = {"count": 0}
+
+    async def is_disconnected():
+        calls["count"] += 1
+        return calls["count"] > connected_checks
+
+    request.is_disconnected = is_disconnected
+    return request
+
+
+def _parse(messages):
+    events = []
+    for message in messages:
+        if message.startswith(":"):
+            continue
+        lines = message.strip().split("\n")
+        events.append(
+            (lines[0][len("event: ") :], json.loads(lines[1][len("data: ") :]))
+        )
+    return events
+
+
+def test_format_sse():
+    assert format_sse("servers", {"a": 1}) == 'event: servers\ndata: {"a": 1}\n\n'
+
+
+async def test_stream_sends_servers_on_connect_and_on_change(app_context):
+    registry = app_context.status_registry
+    registry.replace_all([{"name": "test_server", "status": "STOPPED"}])
+    request = _fake_request(connected_checks=3)
+
+    messages = []
+    async for message in server_event_stream(request, app_context, poll_interval=0):
+        messages.append(message)
+        if len(messages) == 1:
+            registry.update("test_server", status="RUNNING")
+
+    events = _parse(messages)
+    assert [name for name, _ in events] == ["servers", "servers"]
+    assert events[0][1]["servers"][0]["status"] == "STOPPED"
+    assert events[1][1]["servers"][0]["status"] == "RUNNING"
+    assert events[1][1]["revision"] == registry.revision
+
+
+async def test_stream_sends_process_info_and_unsubscribes(app_context):
+    app_context.status_registry.replace_all([])
+    sampler = MagicMock()
+    sampler.get_sample.return_value = (1, {"pid": 123})
+    app_context._resource_sampler = sampler
+    request = _fake_request(connected_checks=2)
+
+    messages = [
+        m
+        async for m in server_event_stream(
+            request, app_context, server_name="test_server", poll_interval=0
+        )
+    ]
+
+    events = _parse(messages)
+    assert (
+        "process_info",
+        {"server_name": "test_server", "process_info": {"pid": 123}},
+    ) in events
+    # The unchanged sample is only sent once.
+    assert len([e for e in events if e[0] == "process_info"]) == 1
+    sampler.subscribe.assert_called_once_with("test_server")
+    sampler.unsubscribe.assert_called_once_with("test_server")
+
+
+def test_server_events_route_unknown_server(authenticated_client):
+    response = authenticated_client.get("/api/events?server_name=missing_server")
+    assert response.status_code == 404
+
+
+@patch("bedrock_server_manager.web.routers.events.server_event_stream")
+def test_server_events_route_streams(mock_stream, authenticated_client):
+    async def fake_stream(*args, **kwargs):
+        yield format_sse("servers", {"revision": 1, "servers": []})
+
+    mock_stream.side_effect = fake_stream
+    response = authenticated_client.get("/api/events")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert "event: servers" in response.text
@@ -25,6 +25,17 @@ def test_set_setting_api_route(authenticated_client, app_context):
     assert response.json()["status"] == "success"
 
 
+def test_set_settings_batch_api_route(authenticated_client, app_context):
+    """Test setting several settings in one request."""
+    response = authenticated_client.post(
+        "/api/settings/batch",
+        json={"settings": {"retention.backups": 7, "retention.logs": 3}},
+    )
+    assert response.status_code == 200
+    assert response.json()["settings"] == {"retention.backups": 7}
+    assert app_context.settings.get("retention.backups") == 7
+
+
 import os
 
 
@@ -0,0 +1,116 @@
+import datetime
+import time
+
+from bedrock_server_manager.db.models import User as UserModel
+from bedrock_server_manager.web.auth_cache import (
+    MAX_LAST_SEEN_FLUSH_ATTEMPTS,
+    IdentityCache,
+    LastSeenBuffer,
+)
+from bedrock_server_manager.web.schemas import User
+
+
+def make_user(username="alice", user_id=1):
+    return User(
+        id=user_id,
+        username=username,
+        identity_type="jwt",
+        role="admin",
+        is_active=True,
+    )
+
+
+def test_identity_cache_expires_entries():
+    cache = IdentityCache(ttl_sec=60)
+    cache.put("token", make_user(), token_expires_at=None)
+    assert cache.get("token").username == "alice"
+
+    # An entry never outlives the token it was resolved from.
+    cache.put("expired", make_user(), token_expires_at=time.time() - 1)
+    assert cache.get("expired") is None
+
+    cache.ttl_sec = 0
+    cache.put("uncached", make_user(), token_expires_at=None)
+    assert cache.get("uncached") is None
+
+
+def test_identity_cache_invalidates_user():
+    cache = IdentityCache()
+    cache.put("token-a1", make_user("alice"), None)
+    cache.put("token-a2", make_user("alice"), None)
+    cache.put("token-b", make_user("bob", 2), None)
+
+    cache.invalidate_user("alice")
+
+    assert cache.get("token-a1") is None
+    assert cache.get("token-a2") is None
+    assert cache.get("token-b").username == "bob"
+
+
+def test_last_seen_buffer_writes_in_batches(app_context, db_session):
+    users = [
+        UserModel(
+            username=name,
+            hashed_password="x",
+            role="user",
+            last_seen=datetime.datetime(2000, 1, 1),
+        )
+        for name in ("alice", "bob")
+    ]
+    db_session.add_all(users)
+    db_session.commit()
+
+    buffer = LastSeenBuffer(app_context.db, flush_interval_sec=3600)
+    for user in users:
+        buffer.touch(user.id)
+    assert not buffer.flush_due()
+
+    assert buffer.flush() == 2
+    assert buffer.flush() == 0
+    db_session.expire_all()
+    assert all(user.last_seen.year > 2000 for user in users)
+
+
+def test_last_seen_buffer_flush_due_after_interval(app_context):
+    buffer = LastSeenBuffer(app_context.db, flush_interval_sec=0)
+    assert not buffer.flush_due()
+    buffer.touch(1)
+    assert buffer.flush_due()
+
+
+def test_last_seen_buffer_skips_deleted_users(app_context, db_session):
+    user = UserModel(username="alice", hashed_password="x", role="user")
+    db_session.add(user)
+    db_session.commit()
+
+    buffer = LastSeenBuffer(app_context.db, flush_interval_sec=3600)
+    buffer.touch(user.id)
+    buffer.touch(user.id + 1000)
+
+    assert buffer.flush() == 2
+    assert not buffer.flush_due()
+    db_session.expire_all()
+    assert user.last_seen is not None
+
+
+def test_last_seen_buffer_discard(app_context):
+    buffer = LastSeenBuffer(app_context.db, flush_interval_sec=0)
+    buffer.touch(1)
+    buffer.discard(1)
+
+    assert not buffer.flush_due()
+    assert buffer.flush() == 0
+
+
+def test_last_seen_buffer_drops_values_after_repeated_failures(app_context, mocker):
+    buffer = LastSeenBuffer(app_context.db, flush_interval_sec=0)
+    mocker.patch.object(
+        app_context.db, "session_manager", side_effect=RuntimeError("db down")
+    )
+    buffer.touch(1)
+
+    for _ in range(MAX_LAST_SEEN_FLUSH_ATTEMPTS - 1):
+        assert buffer.flush() == 0
+        assert buffer.flush_due()
+    assert buffer.flush() == 0
+    assert not buffer.flush_due()
@@ -0,0 +1,40 @@
+import asyncio
+
+from bedrock_server_manager.web.metrics import (
+    EventLoopLagMonitor,
+    LatencyHistogram,
+    RequestMetrics,
+)
+
+
+def test_latency_histogram_buckets():
+    histogram = LatencyHistogram(buckets_ms=(1, 10))
+    for duration in (0.5, 1, 5, 50):
+        histogram.observe(duration)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 4
+    assert snapshot["max_ms"] == 50
+    assert snapshot["buckets"] == {"1": 2, "10": 1, "+Inf": 1}
+
+
+def test_request_metrics_per_route():
+    metrics = RequestMetrics()
+    metrics.observe_request("GET /api/servers", 3)
+    metrics.observe_request("GET /api/servers", 7)
+    metrics.observe_request("POST /api/server/{server_name}/start", 20)
+
+    routes = metrics.snapshot()["routes"]
+    assert routes["GET /api/servers"]["count"] == 2
+    assert routes["GET /api/servers"]["mean_ms"] == 5
+    assert routes["POST /api/server/{server_name}/start"]["count"] == 1
+
+
+async def test_event_loop_lag_monitor_records_lag():
+    metrics = RequestMetrics()
+    monitor = EventLoopLagMonitor(metrics, interval_sec=0.01)
+    monitor.start()
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    assert metrics.event_loop_lag.snapshot()["count"] > 0
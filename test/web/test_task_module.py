@@ -80,3 +80,18 @@ def test_run_task_after_shutdown_fails(task_manager):
         RuntimeError, match="Cannot start new tasks after shutdown has been initiated."
     ):
         task_manager.run_task(target_function)
+
+
+def test_run_task_reports_progress(task_manager):
+    """Test that a task started with report_progress can publish its progress."""
+
+    def target_function(progress_callback=None):
+        progress_callback({"completed": 1, "total": 2})
+        return {"status": "success"}
+
+    task_id = task_manager.run_task(target_function, report_progress=True)
+    task_manager.executor.shutdown(wait=True)
+
+    status = task_manager.get_task(task_id)
+    assert status["status"] == "success"
+    assert status["progress"] == {"completed": 1, "total": 2}